@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Measure the throughput of the log streaming pipeline used by `briefcase run`.
+
+Run this when changing `LogFilter`, a platform's log cleaning filter, or the way
+the console prints streamed output. It feeds a synthetic test suite log through
+the log filter for each platform's log format, and through the console, and
+reports the number of lines processed per second.
+
+Usage:
+    python scripts/benchmark_log_filter.py [--lines N] [--batch N]
+
+The console is measured printing one line per call (as output is printed by
+`stream_output_non_blocking()`), and printing batches of `--batch` lines (as
+output is printed by `stream_output()`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from unittest.mock import MagicMock
+
+from briefcase.commands.run import LogFilter
+from briefcase.console import Console
+from briefcase.platforms.android.gradle import android_log_clean_filter
+from briefcase.platforms.macOS.filters import macOS_log_clean_filter
+
+#: The log formats to benchmark: a name, a template for each line of test suite
+#: output in that format, and the clean filter for that format.
+LOG_FORMATS = [
+    ("plain", "{line}", None),
+    ("Android", "I/python.stdout: {line}", android_log_clean_filter),
+    (
+        "macOS",
+        "2022-11-14 13:21:15.341 Df Hello World[59290:bb5f] (Python) {line}",
+        macOS_log_clean_filter,
+    ),
+]
+
+
+def test_suite_log(template: str, lines: int) -> list[str]:
+    """Generate the log of a test suite that passes, in a given log format.
+
+    :param template: The template for each line of the log.
+    :param lines: The number of lines of test output to generate.
+    :returns: The lines of the log.
+    """
+    log = [
+        template.format(line=f"tests/test_app.py::test_case_{i} PASSED")
+        for i in range(lines)
+    ]
+    log.append(template.format(line=">>>>>>>>>> EXIT 0 <<<<<<<<<<"))
+    return log
+
+
+def benchmark_filter(template: str, clean_filter, lines: int) -> float:
+    """Measure the throughput of the log filter.
+
+    :param template: The template for each line of the log.
+    :param clean_filter: The clean filter for the log format.
+    :param lines: The number of lines of test output to filter.
+    :returns: The number of lines processed per second.
+    """
+    log = test_suite_log(template, lines)
+    log_filter = LogFilter(
+        MagicMock(),
+        clean_filter=clean_filter,
+        clean_output=True,
+        exit_filter=LogFilter.test_filter(
+            LogFilter.DEFAULT_EXIT_REGEX,
+            marker=LogFilter.DEFAULT_EXIT_MARKER,
+        ),
+    )
+
+    start = time.perf_counter()
+    for line in log[:-1]:
+        for _ in log_filter(line):
+            pass
+    duration = time.perf_counter() - start
+
+    if log_filter.returncode is not None:
+        raise RuntimeError("Exit condition detected before the end of the log.")
+
+    return lines / duration
+
+
+def benchmark_console(lines: int, batch: int) -> float:
+    """Measure the throughput of printing streamed output to the console.
+
+    :param lines: The number of lines to print.
+    :param batch: The number of lines to print with each call.
+    :returns: The number of lines printed per second.
+    """
+    log = test_suite_log("{line}", lines)[:-1]
+    console = Console()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for i in range(0, lines, batch):
+                console.info("".join(f"{line}\n" for line in log[i : i + batch]))
+            return lines / (time.perf_counter() - start)
+    finally:
+        console.close()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command-line arguments for this script.
+
+    :param argv: The argument list to parse (excluding the program name).
+    :returns: The parsed arguments, with `.lines` (`int`) and `.batch` (`int`)
+        attributes.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the briefcase run log pipeline.",
+    )
+    parser.add_argument(
+        "--lines",
+        type=int,
+        default=100_000,
+        help="The number of lines of log output to process (default: 100000).",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1000,
+        help="The number of lines in each batch of console output (default: 1000).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+
+    print(f"Filtering {args.lines} lines of log output...")
+    for name, template, clean_filter in LOG_FORMATS:
+        rate = benchmark_filter(template, clean_filter, args.lines)
+        print(f"  {name}: {rate:,.0f} lines/s")
+
+    # Printing to the console is much slower than filtering; use fewer lines.
+    console_lines = min(args.lines, 20_000)
+    print(f"\nPrinting {console_lines} lines of output...")
+    for batch in [1, args.batch]:
+        rate = benchmark_console(console_lines, batch)
+        print(f"  {batch} line(s) per call: {rate:,.0f} lines/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
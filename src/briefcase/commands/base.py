@@ -51,6 +51,7 @@ from briefcase.exceptions import (
     UnsupportedPythonVersion,
 )
 from briefcase.integrations.base import ToolCache
+from briefcase.integrations.executor import Executor
 from briefcase.integrations.file import File
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.integrations.virtual_environment import VirtualEnvironmentManager
@@ -101,6 +102,17 @@ def split_passthrough(args: list[str]) -> tuple[list[str], list[str]]:
         return args[:pos], args[pos + 1 :]
 
 
+def positive_int(value: str) -> int:
+    """An argparse type for an integer that must be 1 or greater."""
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive integer")
+    return result
+
+
 def parse_config_overrides(config_overrides: list[str] | None) -> dict[str, Any]:
     """Parse command line -C/--config option overrides.
 
@@ -192,6 +204,7 @@ class BaseCommand(ABC):
         Subprocess.verify(tools=self.tools)
         VirtualEnvironmentManager.verify(tools=self.tools)
         File.verify(tools=self.tools)
+        Executor.verify(tools=self.tools)
 
         if not is_clone:
             self.validate_locale()
@@ -1009,6 +1022,8 @@ any compatibility problems, and then add the compatibility declaration.
         self.console.input_enabled = options.pop("input_enabled")
         self.console.verbosity = options.pop("verbosity")
         self.console.save_log = options.pop("save_log")
+        self.console.plain = options.pop("plain")
+        self.tools.executor.jobs = options.pop("jobs")
 
         # Parse the configuration overrides
         overrides = parse_config_overrides(options.pop("config_overrides"))
@@ -1065,6 +1080,24 @@ any compatibility problems, and then add the compatibility declaration.
                 "By default, this log file is only created for critical errors"
             ),
         )
+        parser.add_argument(
+            "--plain",
+            action="store_true",
+            default=None,
+            help=(
+                "Write console output as plain text. By default, plain text is only "
+                "used when output is not being written to a terminal"
+            ),
+        )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=positive_int,
+            help=(
+                "The maximum number of tasks to run concurrently. Defaults to the "
+                "value of BRIEFCASE_JOBS, or the number of CPUs available"
+            ),
+        )
 
     def _add_update_options(
         self,
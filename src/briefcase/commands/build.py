@@ -1,16 +1,44 @@
 from __future__ import annotations
 
 import argparse
+import configparser
+import csv
+import json
+import os
+import re
+import subprocess
+import sys
+from fnmatch import fnmatchcase
+from pathlib import Path
 
+import briefcase
 from briefcase.config import AppConfig, FinalizedAppConfig
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.subprocess import Subprocess
 
 from .base import BaseCommand, full_options
 
+# Native libraries and extension modules, including versioned ELF libraries.
+NATIVE_LIBRARY = re.compile(r"\.(so|dylib|dll|pyd)(\.\d+)*$", re.IGNORECASE)
+
 
 class BuildCommand(BaseCommand):
     command = "build"
     description = "Build an app for a target platform."
+    # Does the app bundle contain the Python code that will be shipped? If so, it
+    # can be precompiled to bytecode.
+    supports_precompile = False
+
+    # The script that records the modules and files used by an app, so that unused
+    # content can be pruned. It runs in the app's Python, so it is passed as source.
+    IMPORT_TRACE_SCRIPT = (
+        Path(briefcase.__file__).parent / "tracers/briefcase_import_trace.py"
+    )
+    # Folders that contain test suites and translations. They are pruned unless the
+    # app uses them, even if they aren't Python packages.
+    PRUNE_FOLDERS = frozenset({"test", "tests", "locale", "locales"})
+    # Entry point groups that describe commands, rather than plugins.
+    SCRIPT_ENTRY_POINTS = frozenset({"console_scripts", "gui_scripts"})
 
     def add_options(self, parser):
         self._add_update_options(parser, context_label=" before building")
@@ -34,6 +62,399 @@ class BuildCommand(BaseCommand):
         """
         # Default implementation; nothing to build.
 
+    def requirements_paths(self, app: FinalizedAppConfig) -> list[Path]:
+        """The paths in the bundle where the app's requirements are installed.
+
+        :param app: The config object for the app
+        :returns: The paths where requirements are installed; empty if the
+            requirements aren't installed into the bundle.
+        """
+        try:
+            return [self.app_packages_path(app)]
+        except KeyError:
+            return []
+
+    def precompile_paths(self, app: FinalizedAppConfig) -> list[Path]:
+        """The paths in the bundle that contain Python code to precompile.
+
+        :param app: The config object for the app
+        :returns: The paths containing the app's code and requirements.
+        """
+        return [self.app_path(app), *self.requirements_paths(app)]
+
+    def precompile_context(self, app: FinalizedAppConfig) -> Subprocess:
+        """The context in which the bundled Python can be invoked.
+
+        By default, the bundled Python is the same version as the Python running
+        Briefcase.
+
+        :param app: The config object for the app
+        :returns: A subprocess runner that will run ``sys.executable`` as the
+            bundled Python.
+        """
+        return self.tools.subprocess
+
+    def precompile_app(self, app: FinalizedAppConfig):
+        """Compile the Python code in the app bundle to bytecode.
+
+        The code is compiled in parallel to unchecked-hash ``.pyc`` files. These
+        files are never validated against their source, so the code must be
+        compiled again whenever the bundle is updated. If requested (and the app
+        isn't being tested or debugged), the ``.py`` sources that have been compiled
+        are then removed from the bundle.
+
+        :param app: The config object for the app
+        """
+        paths = [path for path in self.precompile_paths(app) if path.is_dir()]
+        remove_sources = getattr(app, "precompile_remove_sources", False) and not (
+            app.test_mode or app.debugger
+        )
+
+        try:
+            self.precompile_context(app).run(
+                [
+                    sys.executable,
+                    "-m",
+                    "compileall",
+                    "-q",
+                    # Use a worker for every CPU
+                    "-j",
+                    "0",
+                    "--invalidation-mode",
+                    "unchecked-hash",
+                    # Don't encode the location of the build in the bytecode
+                    "-s",
+                    self.bundle_path(app),
+                    # Sourceless modules can only be imported from "legacy" .pyc
+                    # files that sit next to where the source would be.
+                    *(["-b"] if remove_sources else []),
+                    *paths,
+                ],
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            # Some packages contain .py files that aren't valid Python (e.g.,
+            # templates and test data). These files won't be precompiled, and their
+            # sources won't be removed.
+            self.console.warning(
+                "Some Python files in the app could not be compiled to bytecode."
+            )
+
+        if remove_sources:
+
+            def remove_compiled_source(relative_path, entry):
+                if (
+                    entry.name.endswith(".py")
+                    and entry.is_file(follow_symlinks=False)
+                    and os.path.exists(f"{entry.path}c")
+                ):
+                    self.console.verbose(f"Removing {Path(relative_path)}")
+                    os.unlink(entry.path)
+                    return True
+                return False
+
+            with self.console.wait_bar("Removing compiled Python sources..."):
+                for path in paths:
+                    self.tools.file.walk(path, [remove_compiled_source])
+
+    def trace_imports(
+        self,
+        app: FinalizedAppConfig,
+        requirements_paths: list[Path],
+    ) -> tuple[set[str], list[set[str]]]:
+        """Record the modules and requirement files that are used by the app.
+
+        The app is run by the bundled Python, under an audit hook. If the app defines
+        a ``prune_entry_point``, that module is run as ``__main__``; otherwise, every
+        module of the app is imported.
+
+        :param app: The config object for the app
+        :param requirements_paths: The requirements folders to record files from.
+        :returns: The names of the modules that were imported, including their
+            parent packages; and for each requirements folder, the relative paths
+            (using ``/``) of the files that were opened, and the folders containing
+            them.
+        """
+        trace_path = self.bundle_path(app) / "briefcase-import-trace.json"
+        try:
+            self.precompile_context(app).run(
+                [
+                    sys.executable,
+                    # Isolate the app from the environment running Briefcase, and
+                    # don't write bytecode into the bundle.
+                    "-I",
+                    "-S",
+                    "-B",
+                    "-c",
+                    self.IMPORT_TRACE_SCRIPT.read_text(encoding="utf-8"),
+                    trace_path,
+                    app.module_name,
+                    getattr(app, "prune_entry_point", ""),
+                    self.app_path(app),
+                    *requirements_paths,
+                ],
+                check=True,
+            )
+            with trace_path.open(encoding="utf-8") as f:
+                trace = json.load(f)
+        except subprocess.CalledProcessError as e:
+            raise BriefcaseCommandError(
+                "Unable to determine the modules used by the app."
+            ) from e
+        finally:
+            trace_path.unlink(missing_ok=True)
+
+        modules = set()
+        for name in trace["modules"]:
+            parts = name.split(".")
+            modules.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        used_paths = []
+        for files in trace["files"]:
+            paths = set()
+            for relative_path in files:
+                parts = relative_path.split("/")
+                paths.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+            used_paths.append(paths)
+
+        return modules, used_paths
+
+    def plugin_modules(self, requirements_path: Path) -> set[str]:
+        """The top-level modules of the distributions that declare plugins.
+
+        Plugins (such as Toga backends) are loaded dynamically through entry points,
+        so an app may use them even if they weren't used when imports were traced.
+
+        :param requirements_path: The folder where requirements are installed.
+        :returns: The names of the top-level modules of each distribution that
+            declares an entry point that isn't a script.
+        """
+        modules = set()
+        for distinfo in sorted(requirements_path.glob("*.dist-info")):
+            entry_points = configparser.ConfigParser(
+                delimiters=("=",), interpolation=None, strict=False
+            )
+            entry_points.read(distinfo / "entry_points.txt", encoding="utf-8")
+            if not set(entry_points.sections()) - self.SCRIPT_ENTRY_POINTS:
+                continue
+
+            try:
+                with (distinfo / "RECORD").open(encoding="utf-8", newline="") as f:
+                    for row in csv.reader(f):
+                        name = row[0].split("/")[0].split(".")[0]
+                        if name.isidentifier():
+                            modules.add(name)
+            except FileNotFoundError:
+                self.console.warning(
+                    f"{distinfo.name} doesn't have a RECORD file; "
+                    "its modules may be pruned."
+                )
+        return modules
+
+    def prune_requirements(
+        self,
+        requirements_path: Path,
+        modules: set[str],
+        used_paths: set[str],
+        keep: list[str],
+        prune_modules: bool = True,
+    ) -> int:
+        """Remove the content of a requirements folder that the app doesn't use.
+
+        :param requirements_path: The folder where requirements are installed.
+        :param modules: The names of the modules that the app imported.
+        :param used_paths: The relative paths (using ``/``) of the files in the folder
+            that the app opened, and the folders containing them.
+        :param keep: Patterns matching the names of modules that must be retained.
+        :param prune_modules: Should packages and modules that weren't imported be
+            removed? If False, only test and translation folders are removed.
+        :returns: The number of files and folders that were removed.
+        """
+        plugins = self.plugin_modules(requirements_path)
+
+        def kept(name):
+            # A module is kept if it, or a package that contains it, matches a
+            # pattern.
+            parts = name.split(".")
+            return any(
+                fnmatchcase(".".join(parts[:i]), pattern)
+                for pattern in keep
+                for i in range(1, len(parts) + 1)
+            )
+
+        removed = 0
+
+        def prune(relative_path, entry):
+            nonlocal removed
+            name = relative_path.replace("/", ".")
+            top_level = "/" not in relative_path
+
+            if entry.is_dir(follow_symlinks=False):
+                if kept(name) or (top_level and name in plugins):
+                    return True
+                if not (
+                    entry.name in self.PRUNE_FOLDERS
+                    or (
+                        prune_modules
+                        and entry.name.isidentifier()
+                        and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+                    )
+                ):
+                    # Folders of data, metadata and libraries are retained; but
+                    # they may contain tests and translations.
+                    return False
+            elif prune_modules and top_level and entry.name.endswith(".py"):
+                name = name[:-3]
+                if kept(name) or name in plugins:
+                    return True
+            else:
+                return False
+
+            if (
+                name in modules
+                or relative_path in used_paths
+                # A package containing a module that must be kept
+                or any(pattern.startswith(f"{name}.") for pattern in keep)
+            ):
+                return False
+
+            if entry.is_dir(follow_symlinks=False):
+                self.tools.shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+            self.console.verbose(f"Removed unused {Path(relative_path)}")
+            removed += 1
+            return True
+
+        self.tools.file.walk(requirements_path, [prune])
+        return removed
+
+    def prune_app(self, app: FinalizedAppConfig):
+        """Remove the content of the app's requirements that the app doesn't use.
+
+        The modules and files used by the app are traced; then test and translation
+        folders in each requirements folder that weren't used are removed. If the app
+        defines a ``prune_entry_point`` that exercises the app, packages that weren't
+        imported by the entry point are also removed. Packages matching
+        ``prune_keep``, and the packages of distributions that declare plugins, are
+        always retained.
+
+        Once pruned, the app is traced again; if the app no longer runs, or no
+        longer imports a module it imported before pruning, an error is raised.
+
+        :param app: The config object for the app
+        """
+        requirements_paths = [
+            path for path in self.requirements_paths(app) if path.is_dir()
+        ]
+        if not requirements_paths:
+            return
+
+        # Importing the app's modules doesn't import the modules that the app only
+        # imports when it runs, so unused packages are only removed if an entry point
+        # exercises the app.
+        prune_modules = bool(getattr(app, "prune_entry_point", None))
+        if not prune_modules:
+            self.console.warning(
+                f"{app.app_name} doesn't define a prune_entry_point; "
+                "only unused test and translation folders will be removed."
+            )
+
+        with self.console.wait_bar("Tracing the modules used by the app..."):
+            modules, used_paths = self.trace_imports(app, requirements_paths)
+
+        removed = 0
+        for requirements_path, used in zip(requirements_paths, used_paths, strict=True):
+            with self.console.wait_bar(f"Pruning {requirements_path.name}..."):
+                removed += self.prune_requirements(
+                    requirements_path,
+                    modules,
+                    used,
+                    keep=getattr(app, "prune_keep", []),
+                    prune_modules=prune_modules,
+                )
+
+        self.console.info(f"Removed {removed} unused modules and folders.")
+
+        with self.console.wait_bar("Verifying the pruned app..."):
+            try:
+                pruned_modules, _ = self.trace_imports(app, requirements_paths)
+            except BriefcaseCommandError as e:
+                raise BriefcaseCommandError(
+                    f"{app.app_name} can't be run after its requirements were "
+                    "pruned. Add the packages that it needs to prune_keep."
+                ) from e
+
+        if missing := modules - pruned_modules:
+            raise BriefcaseCommandError(
+                f"{app.app_name} can no longer import some modules after its "
+                "requirements were pruned:\n\n"
+                + "\n".join(f"    {name}" for name in sorted(missing))
+                + "\n\nAdd the packages that it needs to prune_keep."
+            )
+
+    def link_duplicate(self, original: Path, duplicate: Path) -> bool:
+        """Replace a file with a link to an identical file.
+
+        A hard link is used if possible, as it can't be distinguished from the file
+        it replaces. If the file system doesn't support hard links, a relative
+        symbolic link is used.
+
+        :param original: The file to keep.
+        :param duplicate: The file to replace with a link to ``original``.
+        :returns: True if the file was replaced; False if no link could be created.
+        """
+        link = duplicate.with_name(f"{duplicate.name}.briefcase-link")
+        try:
+            os.link(original, link)
+        except OSError:
+            try:
+                link.symlink_to(os.path.relpath(original, duplicate.parent))
+            except OSError:
+                return False
+        os.replace(link, duplicate)
+        return True
+
+    def dedupe_libraries(self, app: FinalizedAppConfig):
+        """Replace identical copies of the native libraries vendored by the app's
+        requirements with links to a single copy.
+
+        Only the libraries in the ``.libs`` folders created by wheel repair tools
+        (such as ``auditwheel`` and ``delvewheel``) are considered. The extension
+        modules of a wheel find these libraries by name, through a search path
+        relative to the extension module; and identical libraries have the same
+        name, so the loader already treats every copy as the same library. Linking
+        the copies preserves the path of every library, so each wheel's search path
+        is unaffected. Extension modules are always left as separate files, as each
+        one is loaded by path as a distinct module.
+
+        :param app: The config object for the app
+        """
+        # Only files with the same permissions can share an inode.
+        libraries = {}
+
+        def find_libraries(relative_path, entry):
+            folder, _, name = relative_path.rpartition("/")
+            if (
+                entry.is_file(follow_symlinks=False)
+                and NATIVE_LIBRARY.search(name)
+                and any(part.endswith(".libs") for part in folder.split("/"))
+            ):
+                mode = entry.stat(follow_symlinks=False).st_mode
+                libraries.setdefault(mode, []).append(Path(entry.path))
+
+        for requirements_path in self.requirements_paths(app):
+            self.tools.file.walk(requirements_path, [find_libraries])
+
+        linked = 0
+        with self.console.wait_bar("Finding duplicated native libraries..."):
+            for paths in libraries.values():
+                for original, *duplicates in self.tools.file.find_duplicates(paths):
+                    for duplicate in duplicates:
+                        linked += self.link_duplicate(original, duplicate)
+
+        self.console.info(f"Linked {linked} duplicated native libraries.")
+
     def _build_app(
         self,
         app: FinalizedAppConfig,
@@ -43,6 +464,8 @@ class BuildCommand(BaseCommand):
         update_support: bool,
         update_stub: bool,
         no_update: bool,
+        prune: bool = False,
+        dedupe_libraries: bool = False,
         **options,
     ) -> dict | None:
         """Internal method to invoke a build on a single app. Ensures the app exists,
@@ -58,6 +481,10 @@ class BuildCommand(BaseCommand):
         :param update_support: Should the application support be updated?
         :param update_stub: Should the stub binary be updated?
         :param no_update: Should automated updates be disabled?
+        :param prune: Should the content of the requirements that the app doesn't use
+            be removed?
+        :param dedupe_libraries: Should identical copies of the native libraries
+            vendored by the app's requirements be replaced by links?
         """
         if app.external_package_path:
             raise BriefcaseCommandError(
@@ -89,6 +516,21 @@ class BuildCommand(BaseCommand):
 
         self.verify_app(app)
 
+        if self.supports_precompile:
+            if prune:
+                self.console.info("Pruning unused modules...", prefix=app.app_name)
+                self.prune_app(app)
+
+            if getattr(app, "precompile", False):
+                self.console.info("Compiling Python bytecode...", prefix=app.app_name)
+                self.precompile_app(app)
+
+            if dedupe_libraries:
+                self.console.info(
+                    "Linking duplicated native libraries...", prefix=app.app_name
+                )
+                self.dedupe_libraries(app)
+
         state = self.build_app(app, **full_options(state, options))
 
         qualifier = " (test mode)" if app.test_mode else ""
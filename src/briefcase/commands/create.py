@@ -5,7 +5,7 @@ import hashlib
 import os
 import platform
 import shutil
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from datetime import date, datetime
 from pathlib import Path
 from typing import Literal
@@ -25,6 +25,7 @@ from briefcase.exceptions import (
 from briefcase.integrations.git import Git
 from briefcase.integrations.subprocess import NativeAppContext
 from briefcase.integrations.virtual_environment import VirtualEnvironment
+from briefcase.integrations.virtual_environment.lock import RequirementsLock
 
 from .base import BaseCommand, full_options
 
@@ -679,6 +680,73 @@ class CreateCommand(BaseCommand):
                     f"{pip_args}\n", encoding="utf-8"
                 )
 
+    def requirements_lock_path(self, app: FinalizedAppConfig) -> Path:
+        """The path of the requirements lockfile for the app.
+
+        :param app: The config object for the app
+        """
+        return self.base_path / f"briefcase-{app.app_name}.lock"
+
+    def lock_app_requirements(
+        self,
+        app: FinalizedAppConfig,
+        venv: VirtualEnvironment,
+        requires: list[str],
+        **install_kwargs,
+    ) -> tuple[list[str], dict]:
+        """Pin an install of app requirements to the versions in the app's lockfile.
+
+        If the app doesn't use a lockfile, the install is unchanged. Otherwise, the
+        requirements are resolved if the lockfile doesn't contain pinned
+        requirements for the environment, or the requirements have changed since
+        they were pinned. The pinned requirements are written to a requirements
+        file, which is installed without resolving dependencies.
+
+        :param app: The config object for the app
+        :param venv: The virtual environment that will install the requirements.
+        :param requires: The requirements to install.
+        :param install_kwargs: The other arguments for `install_requirements()`.
+        :returns: The requirements and keyword arguments to pass to
+            `install_requirements()`.
+        """
+        if not getattr(app, "lock_requirements", False):
+            return requires, install_kwargs
+
+        resolve_kwargs = {
+            "require_binary": install_kwargs.get("require_binary", False),
+            "min_os_version": install_kwargs.get("min_os_version"),
+            "extra_installer_args": install_kwargs.get("extra_installer_args"),
+        }
+        lock = RequirementsLock(self.requirements_lock_path(app))
+        target = venv.lock_target
+        inputs = lock.inputs_hash(requires, **resolve_kwargs)
+        packages = lock.pinned(target, inputs)
+        if packages is None:
+            with self.console.wait_bar(f"Resolving app requirements for {target}..."):
+                packages = venv.resolve_requirements(
+                    requires,
+                    install_hint=install_kwargs.get("install_hint", ""),
+                    **resolve_kwargs,
+                )
+            lock.update(target, inputs, packages)
+
+        requirements_path = self.bundle_path(app) / f"requirements-{target}.txt"
+        requirements_path.write_text(
+            "".join(
+                f"{line}\n" for line in lock.requirements(packages, self.base_path)
+            ),
+            encoding="utf-8",
+        )
+        return [], {
+            **install_kwargs,
+            "include_deps": False,
+            "extra_installer_args": [
+                *(install_kwargs.get("extra_installer_args") or []),
+                "-r",
+                os.fspath(requirements_path),
+            ],
+        }
+
     def _install_app_requirements(
         self,
         app: FinalizedAppConfig,
@@ -694,17 +762,21 @@ class CreateCommand(BaseCommand):
         :param app_packages_path: The full path of the app_packages folder into which
             requirements should be installed.
         """
+        requires, install_kwargs = self.lock_app_requirements(
+            app,
+            venv,
+            requires,
+            allow_editable=False,
+            require_binary=self.require_binary_installs,
+            install_path=app_packages_path,
+            extra_installer_args=app.requirement_installer_args,
+        )
+
         # Install requirements
         with (
             self.console.wait_bar("Installing app requirements..."),
         ):
-            venv.install_requirements(
-                requires,
-                allow_editable=False,
-                require_binary=self.require_binary_installs,
-                install_path=app_packages_path,
-                extra_installer_args=app.requirement_installer_args,
-            )
+            venv.install_requirements(requires, **install_kwargs)
 
     def install_app_requirements(
         self,
@@ -799,6 +871,41 @@ class CreateCommand(BaseCommand):
             / f"{app.module_name}-{app.version}.dist-info",
         )
 
+    def sync_app_code(self, app: FinalizedAppConfig, changes: Iterable[str]) -> bool:
+        """Copy changes to the application code into the bundle.
+
+        This is a faster alternative to ``install_app_code()`` for when the files that
+        have changed are known.
+
+        :param app: The config object for the app
+        :param changes: The paths of files that have been added, modified or deleted.
+            Paths that aren't part of the app's sources are ignored.
+        :returns: True if any files were added to the bundle.
+        """
+        app_path = self.app_path(app)
+        sources = [self.base_path / src for src in app.all_sources()]
+
+        added = False
+        for change in sorted(changes):
+            path = Path(change)
+            for original in sources:
+                if path != original and original not in path.parents:
+                    continue
+
+                target = app_path / original.name / path.relative_to(original)
+                relative_path = target.relative_to(app_path)
+                if path.is_file():
+                    self.console.verbose(f"Updating {relative_path}")
+                    added = added or not target.exists()
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    self.tools.shutil.copy(path, target)
+                elif target.is_file():
+                    self.console.verbose(f"Removing {Path(relative_path)}")
+                    target.unlink()
+                break
+
+        return added
+
     def install_image(self, role, variant, size, source, target):
         """Install an icon/image of the requested size at a target location, using the
         source images defined by the app config.
@@ -942,18 +1049,25 @@ class CreateCommand(BaseCommand):
         # corrupting any app bundle signatures.
         paths_to_remove.append("**/__pycache__")
 
+        # Evaluate all the globs in a single walk of the bundle. Once a directory has
+        # been removed, there's no need to look at its content.
+        matches = self.tools.file.glob_matcher(paths_to_remove)
+
+        def remove(relative_path, entry):
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if not matches(relative_path, is_dir):
+                return False
+
+            if is_dir:
+                self.console.verbose(f"Removing directory {Path(relative_path)}")
+                self.tools.shutil.rmtree(entry.path)
+            else:
+                self.console.verbose(f"Removing {Path(relative_path)}")
+                os.unlink(entry.path)
+            return True
+
         with self.console.wait_bar("Removing unneeded app bundle content..."):
-            for glob in paths_to_remove:
-                # Expand each glob into a full list of files that actually exist
-                # on the file system.
-                for path in self.bundle_path(app).glob(glob):
-                    relative_path = path.relative_to(self.bundle_path(app))
-                    if path.is_dir() and not path.is_symlink():
-                        self.console.verbose(f"Removing directory {relative_path}")
-                        self.tools.shutil.rmtree(path)
-                    else:
-                        self.console.verbose(f"Removing {relative_path}")
-                        path.unlink()
+            self.tools.file.walk(self.bundle_path(app), [remove])
 
     def create_app(self, app: FinalizedAppConfig, **options):
         """Create an application bundle.
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
 import importlib.machinery
+import json
 import os
 import subprocess
 import sys
-from collections.abc import Mapping
+import uuid
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+import briefcase
 from briefcase.commands.run import RunAppMixin
 from briefcase.config import FinalizedAppConfig
-from briefcase.exceptions import BriefcaseCommandError
+from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.integrations.file_watcher import FileWatcher
 from briefcase.integrations.subprocess import NativeAppContext
 from briefcase.integrations.virtual_environment import VirtualEnvironment
 
@@ -17,11 +26,235 @@ from .base import BaseCommand
 from .create import write_dist_info
 
 
+class ChangedTestSelection:
+    """Select the tests of an app that are affected by the files that have changed
+    since the test suite last ran.
+
+    A pytest plugin running in the app's environment records the files used by each
+    test. Before each run, the app's files are compared with a snapshot taken before
+    the last run that was recorded; the plugin then only runs the tests that used a
+    changed file, along with new tests and tests that failed last time.
+    """
+
+    # The pytest plugin that selects and records the tests; it lives in a directory
+    # that can be added to the app's PYTHONPATH.
+    PLUGIN_PATH = Path(briefcase.__file__).parent / "pytest_plugins"
+    PLUGIN_MODULE = "briefcase_changed_tests"
+    CONFIG_ENV_VAR = "BRIEFCASE_CHANGED_TESTS"
+    # The version of the map of tests that the plugin writes.
+    MAP_VERSION = 1
+    STATE_VERSION = 1
+    # Directories that never contain files of interest.
+    IGNORED_DIRS = frozenset({"__pycache__"})
+
+    def __init__(self, paths: Iterable[Path], pyproject_path: Path, data_path: Path):
+        """
+        :param paths: The source files and directories of the app, including tests.
+        :param pyproject_path: The path to the project's ``pyproject.toml``.
+        :param data_path: The directory where the record of test runs is stored.
+        """
+        self.paths = list(paths)
+        self.pyproject_path = pyproject_path
+        self.map_path = data_path / "map.json"
+        self.state_path = data_path / "state.json"
+        self.config_path = data_path / "config.json"
+
+    @staticmethod
+    def _load(path: Path, version: int) -> dict | None:
+        """Load a JSON record.
+
+        :param path: The path to the record.
+        :param version: The version of the record that is expected.
+        :returns: The record; or None if it doesn't exist, or can't be used.
+        """
+        try:
+            with path.open(encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("version") != version:
+            return None
+        return record
+
+    @staticmethod
+    def _save(path: Path, record: dict):
+        """Save a JSON record.
+
+        :param path: The path where the record will be saved.
+        :param record: The record to save.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(record, f)
+        temp_path.replace(path)
+
+    def _ignored(self, name: str) -> bool:
+        """Should a file or directory be ignored?
+
+        :param name: The name of the file or directory.
+        """
+        return name.startswith(".") or name in self.IGNORED_DIRS
+
+    def _snapshot(self, previous: dict[str, list]) -> dict[str, list]:
+        """Take a snapshot of the app's files.
+
+        Files are only hashed if their modification time or size differs from the
+        previous snapshot.
+
+        :param previous: The previous snapshot.
+        :returns: The modification time, size and SHA-256 hash of every file, keyed
+            by canonical path.
+        """
+        filenames = []
+        for path in [self.pyproject_path, *self.paths]:
+            path = os.path.realpath(path)
+            if os.path.isfile(path):
+                filenames.append(path)
+            for dirpath, dirnames, names in os.walk(path):
+                dirnames[:] = [name for name in dirnames if not self._ignored(name)]
+                filenames.extend(
+                    os.path.join(dirpath, name)
+                    for name in names
+                    if not self._ignored(name)
+                )
+
+        snapshot = {}
+        for filename in filenames:
+            try:
+                stat = os.stat(filename)
+                entry = previous.get(filename)
+                if entry and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+                    digest = entry[2]
+                else:
+                    file_hash = hashlib.sha256()
+                    with open(filename, "rb") as f:
+                        while chunk := f.read(65536):
+                            file_hash.update(chunk)
+                    digest = file_hash.hexdigest()
+            except OSError:
+                # The file was deleted while taking the snapshot
+                continue
+            snapshot[filename] = [stat.st_mtime_ns, stat.st_size, digest]
+        return snapshot
+
+    def _requires_full_run(self, path: str) -> bool:
+        """Does a change to a file mean every test must be run?
+
+        The plugin can only attribute Python code to tests, and code in a
+        ``conftest.py`` can affect every test.
+
+        :param path: The canonical path of the changed file.
+        """
+        return (
+            path == os.path.realpath(self.pyproject_path)
+            or not path.endswith(".py")
+            or os.path.basename(path) == "conftest.py"
+        )
+
+    def select(self, console) -> bool:
+        """Select the tests that will be run next.
+
+        :param console: The console used to report warnings.
+        :returns: True if the test suite needs to be run; False if no tests are
+            affected by changes since the test suite last passed.
+        """
+        test_map = self._load(self.map_path, self.MAP_VERSION)
+        state = self._load(self.state_path, self.STATE_VERSION) or {}
+        baseline = state.get("baseline")
+        pending = state.get("pending")
+
+        # If the last run recorded a map, the snapshot taken before that run is the
+        # baseline for changes. Otherwise, the map (if any) still describes the
+        # baseline.
+        if pending:
+            if test_map and test_map.get("token") == pending["token"]:
+                baseline = pending["snapshot"]
+            elif test_map is None:
+                console.warning(
+                    "The last test run didn't record the files used by each test, so "
+                    "every test will be run. Tests can only be selected if the test "
+                    "suite is run by pytest."
+                )
+        if test_map is None:
+            baseline = None
+
+        snapshot = self._snapshot(baseline or {})
+        if baseline is None:
+            changed = None
+        else:
+            changed = {
+                path
+                for path in baseline.keys() | snapshot.keys()
+                if baseline.get(path, [None] * 3)[2]
+                != snapshot.get(path, [None] * 3)[2]
+            }
+            if any(self._requires_full_run(path) for path in changed):
+                changed = None
+
+        if changed is not None and not changed and not test_map.get("failed"):
+            # Nothing has changed since the test suite last passed. The snapshot is
+            # saved so that files that have only been touched aren't hashed again.
+            self._save(
+                self.state_path,
+                {"version": self.STATE_VERSION, "baseline": snapshot, "pending": None},
+            )
+            return False
+
+        token = uuid.uuid4().hex
+        self._save(
+            self.config_path,
+            {
+                "map_path": os.fspath(self.map_path),
+                "token": token,
+                "roots": [os.path.realpath(path) for path in self.paths],
+                "changed": None if changed is None else sorted(changed),
+            },
+        )
+        self._save(
+            self.state_path,
+            {
+                "version": self.STATE_VERSION,
+                "baseline": baseline,
+                "pending": {"token": token, "snapshot": snapshot},
+            },
+        )
+        return True
+
+    def environment(
+        self, env: Mapping[str, str], host_env: Mapping[str, str]
+    ) -> dict[str, str]:
+        """The environment variables that enable the test selection plugin.
+
+        :param env: The environment variables the app will be run with.
+        :param host_env: The environment variables of the host.
+        """
+        return {
+            "PYTHONPATH": os.pathsep.join(
+                path
+                for path in [os.fspath(self.PLUGIN_PATH), env.get("PYTHONPATH")]
+                if path
+            ),
+            "PYTEST_PLUGINS": ",".join(
+                plugin
+                for plugin in [host_env.get("PYTEST_PLUGINS"), self.PLUGIN_MODULE]
+                if plugin
+            ),
+            self.CONFIG_ENV_VAR: os.fspath(self.config_path),
+        }
+
+
 class DevCommand(RunAppMixin, BaseCommand):
     cmd_line = "briefcase dev"
     command = "dev"
     output_format = ""
     description = "Run a Briefcase project in the dev environment."
+    supports_test_shards = True
+    supports_profile_app = True
+    supports_benchmark_startup = True
+    supports_watch = True
+    # The selection of tests affected by changes, if it has been requested
+    changed_tests: ChangedTestSelection | None = None
 
     # On macOS CoreFoundation/NSApplication will do its own independent parsing of
     # argc/argv. This means that whatever we pass to the Python interpreter on start-up
@@ -82,12 +315,100 @@ class DevCommand(RunAppMixin, BaseCommand):
             action="store_true",
             help="Run the app in test mode",
         )
+        parser.add_argument(
+            "--changed",
+            dest="changed_tests",
+            action="store_true",
+            help=(
+                "Only run the tests affected by changes since the test suite last ran "
+                "(requires --test)"
+            ),
+            default=argparse.SUPPRESS,
+        )
+        self._add_test_shards_option(parser)
+        self._add_profile_app_option(parser)
+        self._add_benchmark_startup_options(parser)
+        if self.supports_watch:
+            self._add_watch_option(parser)
 
     def verify_app_tools(self, app: FinalizedAppConfig):
         """Verify that tools needed to run the command for this app exist."""
         super().verify_app_tools(app)
         NativeAppContext.verify(tools=self.tools, app=app)
 
+    @staticmethod
+    def _dev_requirement_list(app: FinalizedAppConfig) -> list[str]:
+        """The requirements of the app in the dev environment.
+
+        :param app: The config object for the app
+        :returns: The requirements of the app, followed by its test requirements.
+        """
+        return [*(app.requires or []), *(app.test_requires or [])]
+
+    def _installed_requirements_path(self, venv: VirtualEnvironment) -> Path:
+        """The file recording the requirements installed in a dev environment.
+
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        """
+        return venv.venv_path / "briefcase-requirements.json"
+
+    def _installed_requirements(self, venv: VirtualEnvironment) -> dict | None:
+        """Read the record of the requirements installed in a dev environment.
+
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        :returns: A dictionary with the ``requires`` that were installed, and the
+            ``installer_args`` that were used to install them; or None if there is
+            no usable record.
+        """
+        try:
+            with self._installed_requirements_path(venv).open(encoding="utf-8") as f:
+                installed = json.load(f)
+            return {
+                "requires": list(installed["requires"]),
+                "installer_args": list(installed["installer_args"]),
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _record_installed_requirements(
+        self,
+        app: FinalizedAppConfig,
+        venv: VirtualEnvironment,
+    ):
+        """Record the requirements that are installed in a dev environment.
+
+        :param app: The config object for the app
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        """
+        path = self._installed_requirements_path(venv)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "requires": self._dev_requirement_list(app),
+                    "installer_args": list(app.requirement_installer_args or []),
+                },
+                f,
+                indent=4,
+            )
+
+    def _requirement_name(self, requirement: str) -> str | None:
+        """Determine the name of the package a requirement installs.
+
+        :param requirement: The requirement.
+        :returns: The canonical name of the package; or None if the name can't be
+            determined without installing the requirement (e.g., a local path).
+        """
+        if self.tools.file.is_local_path(requirement):
+            return None
+        try:
+            return canonicalize_name(Requirement(requirement).name)
+        except InvalidRequirement:
+            return None
+
     def install_dev_requirements(
         self,
         app: FinalizedAppConfig,
@@ -97,25 +418,103 @@ class DevCommand(RunAppMixin, BaseCommand):
         """Install the requirements for the app dev.
 
         This will always include test requirements, if specified. Local dependencies are
-        installed editable.
+        installed editable. The installed requirements are recorded, so that the
+        environment can be updated when the requirements change.
 
         :param app: The config object for the app
         :param venv: The context object used to run commands inside the virtual
             environment.
         """
-        requires = app.requires or []
-        if app.test_requires:
-            requires.extend(app.test_requires)
+        requires = self._dev_requirement_list(app)
         if not requires:
             self.console.info("No application requirements")
-            return
+        else:
+            with self.console.wait_bar("Installing dev requirements..."):
+                venv.install_requirements(
+                    requires,
+                    allow_editable=True,
+                    extra_installer_args=app.requirement_installer_args,
+                )
+
+        self._record_installed_requirements(app, venv)
+
+    def update_dev_requirements(
+        self,
+        app: FinalizedAppConfig,
+        venv: VirtualEnvironment,
+        update_requirements: bool = False,
+        **options,
+    ):
+        """Bring the requirements installed in an existing dev environment up to date.
+
+        The requirements of the app are compared with the requirements that were
+        installed in the environment. Requirements that have been added or changed
+        are installed, and packages whose requirements have been removed are
+        uninstalled; requirements that haven't changed (including editable installs
+        of local paths) are left as they are. If a removed requirement doesn't name
+        a package (e.g., it is a local path), the environment is re-created.
 
-        with self.console.wait_bar("Installing dev requirements..."):
-            venv.install_requirements(
-                requires,
-                allow_editable=True,
-                extra_installer_args=app.requirement_installer_args,
+        :param app: The config object for the app
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        :param update_requirements: Should every requirement be re-installed (and
+            upgraded, if a newer version is available)?
+        """
+        installed = self._installed_requirements(venv)
+        if installed is None:
+            if not update_requirements:
+                # The environment was created before its requirements were recorded;
+                # there's nothing to compare with, so assume it is up to date.
+                self._record_installed_requirements(app, venv)
+                return
+            installed = {"requires": [], "installer_args": []}
+
+        if installed["installer_args"] != list(app.requirement_installer_args or []):
+            update_requirements = True
+
+        requires = self._dev_requirement_list(app)
+        removed = [req for req in installed["requires"] if req not in requires]
+        removed_names = {self._requirement_name(req) for req in removed}
+        if None in removed_names:
+            self.console.info(
+                "Requirements have been removed; re-creating dev environment...",
+                prefix=app.app_name,
             )
+            venv.prepare(recreate=True)
+            try:
+                self.install_dev_requirements(app, venv, **options)
+            except Exception:
+                # The venv will need to be re-created on the next run.
+                venv.clean()
+                raise
+            return
+
+        # A package whose requirement has changed will be re-installed, rather than
+        # uninstalled.
+        uninstall = sorted(
+            removed_names - {self._requirement_name(req) for req in requires}
+        )
+        if update_requirements:
+            install = requires
+        else:
+            install = [req for req in requires if req not in installed["requires"]]
+
+        if not (install or uninstall):
+            return
+
+        if uninstall:
+            with self.console.wait_bar("Uninstalling removed requirements..."):
+                venv.uninstall_requirements(uninstall)
+
+        if install:
+            with self.console.wait_bar("Installing dev requirements..."):
+                venv.install_requirements(
+                    install,
+                    allow_editable=True,
+                    extra_installer_args=app.requirement_installer_args,
+                )
+
+        self._record_installed_requirements(app, venv)
 
     def run_dev_app(
         self,
@@ -123,6 +522,7 @@ class DevCommand(RunAppMixin, BaseCommand):
         env: dict,
         venv: VirtualEnvironment,
         passthrough: list[str],
+        test_shards: int = 1,
         **options,
     ):
         """Run the app in the dev environment.
@@ -130,14 +530,30 @@ class DevCommand(RunAppMixin, BaseCommand):
         :param app: The config object for the app
         :param env: environment dictionary for sub command
         :param passthrough: A list of arguments to pass to the app
+        :param test_shards: The number of shards to run the test suite as
         """
         main_module = app.main_module()
 
+        if self.changed_tests:
+            if not self.changed_tests.select(self.console):
+                self.console.info(
+                    "No changes since the test suite last passed; skipping tests.",
+                    prefix=app.app_name,
+                )
+                return
+            env.update(self.changed_tests.environment(env, self.tools.os.environ))
+
         # Add in the environment settings to get Python in the state we want.
         # If an environment variable is already defined, don't overwrite it.
         for env_key, env_value in self.DEV_ENVIRONMENT.items():
             env[env_key] = self.tools.os.environ.get(env_key, env_value)
 
+        if self.app_profiler:
+            # Start the app's main module through the profiler
+            main_module = self.app_profiler.main_module(app)
+            passthrough = [*self.app_profiler.arguments(app), *passthrough]
+            env.update(self.app_profiler.environment())
+
         cmdline = [
             # Do not add additional switches for sys.executable; see DEV_ENVIRONMENT
             sys.executable,
@@ -153,9 +569,12 @@ class DevCommand(RunAppMixin, BaseCommand):
         ]
 
         # Console apps must operate in non-streaming mode so that console input can
-        # be handled correctly. However, if we're in test mode, we *must* stream so
-        # that we can see the test exit sentinel
-        if app.console_app and not app.test_mode:
+        # be handled correctly. However, if we're in test mode, benchmarking startup,
+        # or watching for changes, we *must* stream so that we can see the test exit
+        # sentinel or startup marker, or stop the app when its code changes.
+        if app.console_app and not (
+            app.test_mode or self.startup_benchmark or self.file_watcher
+        ):
             self.console.info("=" * 75)
             venv.run(
                 cmdline,
@@ -165,6 +584,22 @@ class DevCommand(RunAppMixin, BaseCommand):
                 bufsize=1,
                 stream_output=False,
             )
+        elif test_shards > 1:
+            # Start each shard of the test suite, and stream the logs of all shards.
+            self._stream_test_shards(
+                app,
+                test_shards=test_shards,
+                start_shard=lambda shard_env: venv.Popen(
+                    cmdline,
+                    env={**env, **shard_env},
+                    encoding="UTF-8",
+                    cwd=self.tools.home_path,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                ),
+                clean_output=False,
+            )
         else:
             app_popen = venv.Popen(
                 cmdline,
@@ -183,6 +618,107 @@ class DevCommand(RunAppMixin, BaseCommand):
                 clean_output=False,
             )
 
+    def _update_dev_requirements(
+        self,
+        app: FinalizedAppConfig,
+        venv: VirtualEnvironment,
+        requirements: tuple[list[str], list[str]] | None,
+        **options,
+    ) -> tuple[list[str], list[str]] | None:
+        """Re-install the requirements of an app, if they have changed.
+
+        :param app: The config object for the app
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        :param requirements: The requirements and test requirements that are
+            currently installed.
+        :returns: The requirements and test requirements that are now installed.
+        """
+        new_requirements = self._project_requirements(app)
+        if new_requirements is None or new_requirements == requirements:
+            return requirements
+
+        self.console.info(
+            "Requirements have changed; installing requirements...",
+            prefix=app.app_name,
+        )
+        app.requires, app.test_requires = (list(r) for r in new_requirements)
+        try:
+            self.update_dev_requirements(app, venv, **options)
+        except BriefcaseCommandError as e:
+            # Installation will be retried the next time pyproject.toml changes.
+            self.console.error(str(e), prefix=app.app_name)
+            return requirements
+
+        return new_requirements
+
+    def watch_dev_app(
+        self,
+        app: FinalizedAppConfig,
+        venv: VirtualEnvironment,
+        passthrough: list[str],
+        **options,
+    ):
+        """Run the app in the dev environment, restarting the app whenever the code
+        of the app changes.
+
+        The app's sources, test sources and ``pyproject.toml`` are watched. If the
+        requirements of the app change, they are re-installed before the app is
+        restarted. Watching continues until the user presses Ctrl-C.
+
+        :param app: The config object for the app
+        :param venv: The context object used to run commands inside the virtual
+            environment.
+        :param passthrough: A list of arguments to pass to the app
+        """
+        pyproject_path = self.base_path / "pyproject.toml"
+        requirements = self._project_requirements(app)
+        self.file_watcher = FileWatcher(
+            [
+                pyproject_path,
+                *(
+                    self.base_path / source
+                    for source in [*app.sources, *(app.test_sources or [])]
+                ),
+            ]
+        )
+        try:
+            while True:
+                try:
+                    self.run_dev_app(
+                        app,
+                        env=self.get_environment(app),
+                        venv=venv,
+                        passthrough=passthrough,
+                        **options,
+                    )
+                except BriefcaseTestSuiteFailure:
+                    # The failure has already been reported.
+                    pass
+                except BriefcaseCommandError as e:
+                    self.console.error(str(e), prefix=app.app_name)
+
+                if not self.file_watcher.pending:
+                    self.console.info(
+                        "Waiting for changes (press Ctrl-C to stop)...",
+                        prefix=app.app_name,
+                    )
+                changes = self.file_watcher.wait()
+
+                if os.fspath(pyproject_path) in changes:
+                    requirements = self._update_dev_requirements(
+                        app, venv, requirements, **options
+                    )
+
+                self.console.info(
+                    "Changes detected; restarting app...", prefix=app.app_name
+                )
+        except KeyboardInterrupt:
+            pass  # Catch CTRL-C to exit normally
+        finally:
+            self.file_watcher.close()
+            self.file_watcher = None
+
     def get_environment(self, app: FinalizedAppConfig):
         """Create a shell environment where PYTHONPATH points to the source directories
         described by the app config.
@@ -230,8 +766,42 @@ class DevCommand(RunAppMixin, BaseCommand):
         test_mode: bool | None = False,
         isolated: bool | None = True,
         passthrough: list[str] | None = None,
+        profile_app: str | None = None,
+        benchmark_startup: int | None = None,
+        startup_marker: str | None = None,
+        drop_caches: bool = False,
+        watch: bool = False,
+        changed_tests: bool = False,
         **options,
     ):
+        self._verify_test_shards(test_mode, options.get("test_shards"))
+        self._verify_profile_app(profile_app, options.get("test_shards"))
+        self._verify_benchmark_startup(
+            test_mode,
+            benchmark_startup,
+            startup_marker,
+            drop_caches,
+            profile_app=profile_app,
+            test_shards=options.get("test_shards"),
+        )
+        self._verify_watch(
+            watch,
+            profile_app=profile_app,
+            benchmark_startup=benchmark_startup,
+            test_shards=options.get("test_shards"),
+        )
+        if watch and not run_app:
+            raise BriefcaseCommandError("--watch can't be used with --no-run.")
+        if changed_tests:
+            if not test_mode:
+                raise BriefcaseCommandError(
+                    "--changed can only be used when running in test mode."
+                )
+            if benchmark_startup is not None or options.get("test_shards") is not None:
+                raise BriefcaseCommandError(
+                    "--changed can't be used with --benchmark-startup or --test-shards."
+                )
+
         # Which app should we run? If there's only one defined
         # in pyproject.toml, then we can use it as a default;
         # otherwise look for a -a/--app option.
@@ -305,7 +875,7 @@ class DevCommand(RunAppMixin, BaseCommand):
             arch=self.tools.host_arch,
             base_path=self.base_path,
         )
-        created = venv.prepare(recreate=update_requirements)
+        created = venv.prepare(recreate=False)
 
         if created:
             self.console.info("Installing requirements...", prefix=app.app_name)
@@ -316,7 +886,12 @@ class DevCommand(RunAppMixin, BaseCommand):
                 # venv; it will need to be re-created on the next run.
                 venv.clean()
                 raise
+        else:
+            self.update_dev_requirements(
+                app, venv, update_requirements=update_requirements, **options
+            )
 
+        if created or update_requirements:
             write_dist_info(
                 app,
                 self.app_module_path(app).parent / app.dist_info_name,
@@ -329,10 +904,53 @@ class DevCommand(RunAppMixin, BaseCommand):
                 )
             else:
                 self.console.info("Starting in dev mode...", prefix=app.app_name)
-            return self.run_dev_app(
-                app,
-                env=self.get_environment(app),
-                venv=venv,
-                passthrough=[] if passthrough is None else passthrough,
-                **options,
-            )
+
+            if changed_tests:
+                self.changed_tests = ChangedTestSelection(
+                    [
+                        self.base_path / source
+                        for source in [*app.sources, *(app.test_sources or [])]
+                    ],
+                    pyproject_path=self.base_path / "pyproject.toml",
+                    data_path=(
+                        self.base_path / ".briefcase" / app.app_name / "changed-tests"
+                    ),
+                )
+
+            if benchmark_startup:
+                return self._benchmark_startup(
+                    app,
+                    run_app=lambda: self.run_dev_app(
+                        app,
+                        env=self.get_environment(app),
+                        venv=venv,
+                        passthrough=[] if passthrough is None else passthrough,
+                        **options,
+                    ),
+                    benchmark_startup=benchmark_startup,
+                    startup_marker=startup_marker,
+                    drop_caches=drop_caches,
+                )
+
+            if watch:
+                return self.watch_dev_app(
+                    app,
+                    venv=venv,
+                    passthrough=[] if passthrough is None else passthrough,
+                    **options,
+                )
+
+            if profile_app:
+                self._start_profiling(app, profile_app)
+
+            try:
+                return self.run_dev_app(
+                    app,
+                    env=self.get_environment(app),
+                    venv=venv,
+                    passthrough=[] if passthrough is None else passthrough,
+                    **options,
+                )
+            finally:
+                if self.app_profiler:
+                    self._summarize_profile(app)
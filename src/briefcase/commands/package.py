@@ -1,18 +1,323 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import json
+import os
+import struct
 from abc import abstractmethod
+from pathlib import Path
 
 from briefcase.config import AppConfig, FinalizedAppConfig
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.file import File
 
 from .base import BaseCommand, full_options
+from .build import NATIVE_LIBRARY
+
+# The type of an ELF section that occupies no space in the file.
+ELF_SECTION_NOBITS = 8
+
+
+def elf_debug_size(path: Path) -> int:
+    """The size of the debug information and symbol tables in an ELF binary.
+
+    This is the content that would be removed by stripping the binary.
+
+    :param path: The binary to inspect.
+    :returns: The size of the debug sections of the binary, or 0 if the file isn't
+        an ELF binary that can be read.
+    """
+    with path.open("rb") as f:
+        header = f.read(64)
+        if header[:4] != b"\x7fELF" or len(header) < 52:
+            return 0
+
+        order = ">" if header[5] == 2 else "<"
+        try:
+            if header[4] == 2:
+                shoff, shentsize, shnum, shstrndx = struct.unpack(
+                    f"{order}Q10xHHH", header[40:64]
+                )
+                section_format = f"{order}II16xQQ"
+            else:
+                shoff, shentsize, shnum, shstrndx = struct.unpack(
+                    f"{order}I10xHHH", header[32:52]
+                )
+                section_format = f"{order}II8xII"
+
+            f.seek(shoff)
+            data = f.read(shentsize * shnum)
+            # Each section is described by its name, type, offset and size.
+            sections = [
+                struct.unpack_from(section_format, data, i * shentsize)
+                for i in range(shnum)
+            ]
+            _, _, names_offset, names_size = sections[shstrndx]
+        except (struct.error, IndexError):
+            return 0
+
+        f.seek(names_offset)
+        names = f.read(names_size)
+
+    size = 0
+    for name_offset, section_type, _, section_size in sections:
+        name = names[name_offset : names.find(b"\0", name_offset)]
+        # Sections that have been stripped into a separate file have no content.
+        if section_type != ELF_SECTION_NOBITS and (
+            name.startswith(b".debug") or name in {b".symtab", b".strtab"}
+        ):
+            size += section_size
+    return size
+
+
+class SizeReport:
+    """Analyse the content of an app bundle, to show where its size comes from."""
+
+    # The number of entries to display in each list of the summary.
+    SUMMARY_LENGTH = 10
+    PYTHON_SUFFIXES = (".py", ".pyc", ".pyi")
+    DEBUG_SUFFIXES = (".pdb", ".debug")
+
+    def __init__(self, root: Path, areas: dict[str, list[Path]]):
+        """
+        :param root: The content to analyse.
+        :param areas: The folders that make up each area of the bundle (e.g., the
+            app's code), keyed by area name. Content that isn't in any area is
+            reported as ``other``. The content of the ``requirements`` area is
+            attributed to the distributions that installed it.
+        """
+        self.root = root
+        self.areas = areas
+
+        self.files = {}
+        self.area_sizes = dict.fromkeys([*areas, "other"], 0)
+        self.distribution_sizes = {}
+        self.native_libraries = []
+        self.debug_files = []
+        self.data_files = []
+        self.duplicates = []
+
+    def distributions(self, requirements_path: Path) -> tuple[dict, dict]:
+        """Determine the distribution that installed each file in a requirements
+        folder.
+
+        :param requirements_path: The folder where requirements are installed.
+        :returns: A map of the relative paths recorded in each ``RECORD`` file to the
+            name of its distribution; and a map of top-level names that belong to a
+            single distribution to the name of that distribution. The second map is
+            used for files created after installation, such as bytecode.
+        """
+        files = {}
+        top_level = {}
+        for distinfo in sorted(requirements_path.glob("*.dist-info")):
+            name = distinfo.name.split("-")[0]
+            top_level[distinfo.name] = name
+            try:
+                with (distinfo / "RECORD").open(encoding="utf-8", newline="") as f:
+                    for row in csv.reader(f):
+                        relative_path = os.path.normpath(row[0]).replace(os.sep, "/")
+                        files[relative_path] = name
+                        # Names shared by several distributions are ambiguous.
+                        top = relative_path.split("/")[0]
+                        if top_level.setdefault(top, name) != name:
+                            top_level[top] = None
+            except FileNotFoundError:
+                pass
+        return files, top_level
+
+    def scan(self, file: File):
+        """Walk the content, and measure every file.
+
+        :param file: The File tool, used to walk the content.
+        """
+        area_paths = [
+            (name, os.path.join(os.fspath(path), ""))
+            for name, paths in self.areas.items()
+            for path in paths
+        ]
+        attribution = [
+            (os.path.join(os.fspath(path), ""), *self.distributions(path))
+            for path in self.areas.get("requirements", [])
+        ]
+        inodes = set()
+
+        def measure(relative_path, entry):
+            if not entry.is_file(follow_symlinks=False):
+                return False
+
+            stat = entry.stat(follow_symlinks=False)
+            # Hard links only occupy space once.
+            if (stat.st_dev, stat.st_ino) in inodes:
+                return False
+            inodes.add((stat.st_dev, stat.st_ino))
+
+            self.files[relative_path] = stat.st_size
+            area = next(
+                (name for name, path in area_paths if entry.path.startswith(path)),
+                "other",
+            )
+            self.area_sizes[area] += stat.st_size
+
+            for path, files, top_level in attribution:
+                if entry.path.startswith(path):
+                    installed_path = entry.path[len(path) :].replace(os.sep, "/")
+                    name = files.get(installed_path) or top_level.get(
+                        installed_path.split("/")[0]
+                    )
+                    name = name or "(unknown)"
+                    self.distribution_sizes[name] = (
+                        self.distribution_sizes.get(name, 0) + stat.st_size
+                    )
+
+            if NATIVE_LIBRARY.search(entry.name):
+                self.native_libraries.append(
+                    (relative_path, stat.st_size, elf_debug_size(Path(entry.path)))
+                )
+            elif entry.name.endswith(self.DEBUG_SUFFIXES) or ".dSYM/" in relative_path:
+                self.debug_files.append((relative_path, stat.st_size))
+            elif not entry.name.endswith(self.PYTHON_SUFFIXES):
+                self.data_files.append((relative_path, stat.st_size))
+            return False
+
+        file.walk(self.root, [measure])
+
+        for group in file.find_duplicates(
+            self.root / relative_path for relative_path in self.files
+        ):
+            self.duplicates.append(
+                [path.relative_to(self.root).as_posix() for path in group]
+            )
+
+    def results(self) -> dict:
+        """The results of the analysis, in a form that can be serialized as JSON."""
+
+        def by_size(items):
+            return sorted(items, key=lambda item: (-item[1], item[0]))
+
+        return {
+            "total": {
+                "size": sum(self.files.values()),
+                "files": len(self.files),
+            },
+            "areas": self.area_sizes,
+            "distributions": dict(by_size(self.distribution_sizes.items())),
+            "native_libraries": {
+                "size": sum(size for _, size, _ in self.native_libraries),
+                "debug_size": sum(debug for _, _, debug in self.native_libraries)
+                + sum(size for _, size in self.debug_files),
+                "files": [
+                    {"path": path, "size": size, "debug_size": debug}
+                    for path, size, debug in by_size(self.native_libraries)
+                ],
+                "debug_files": [
+                    {"path": path, "size": size}
+                    for path, size in by_size(self.debug_files)
+                ],
+            },
+            "duplicates": sorted(
+                (
+                    {"size": self.files[group[0]], "paths": group}
+                    for group in self.duplicates
+                ),
+                key=lambda duplicate: (
+                    -duplicate["size"] * (len(duplicate["paths"]) - 1),
+                    duplicate["paths"],
+                ),
+            ),
+            "data_files": [
+                {"path": path, "size": size}
+                for path, size in by_size(self.data_files)[: self.SUMMARY_LENGTH * 5]
+            ],
+        }
+
+    @staticmethod
+    def format_size(size: int) -> str:
+        """Describe a size in bytes, in the largest unit that is appropriate."""
+        if size < 1000:
+            return f"{size} B"
+        for unit in ["KB", "MB"]:
+            size /= 1000
+            if size < 1000:
+                return f"{size:.1f} {unit}"
+        return f"{size / 1000:.1f} GB"
+
+    def summary(self) -> list[str]:
+        """Summarize the results of the analysis.
+
+        :returns: The lines of a text summary of the results.
+        """
+        results = self.results()
+        size = self.format_size
+
+        total = results["total"]
+        lines = [f"Total: {size(total['size'])} in {total['files']} files"]
+        for name, area_size in results["areas"].items():
+            lines.append(f"    {name + ':':16}{size(area_size):>10}")
+
+        if results["distributions"]:
+            lines.extend(["", "Requirements by distribution:"])
+            for name, dist_size in list(results["distributions"].items())[
+                : self.SUMMARY_LENGTH
+            ]:
+                lines.append(f"    {size(dist_size):>10}  {name}")
+
+        native = results["native_libraries"]
+        lines.extend(
+            [
+                "",
+                (
+                    f"Native libraries: {size(native['size'])} "
+                    f"in {len(native['files'])} files; "
+                    f"{size(native['debug_size'])} of debug symbols"
+                ),
+            ]
+        )
+        for library in native["files"][: self.SUMMARY_LENGTH]:
+            debug = (
+                f" ({size(library['debug_size'])} debug)"
+                if library["debug_size"]
+                else ""
+            )
+            lines.append(f"    {size(library['size']):>10}  {library['path']}{debug}")
+
+        if results["duplicates"]:
+            wasted = sum(
+                duplicate["size"] * (len(duplicate["paths"]) - 1)
+                for duplicate in results["duplicates"]
+            )
+            lines.extend(
+                [
+                    "",
+                    (
+                        f"Duplicate files: {size(wasted)} in "
+                        f"{len(results['duplicates'])} sets of identical files"
+                    ),
+                ]
+            )
+            for duplicate in results["duplicates"][: self.SUMMARY_LENGTH]:
+                lines.append(
+                    f"    {size(duplicate['size']):>10}  "
+                    + ", ".join(duplicate["paths"])
+                )
+
+        if results["data_files"]:
+            lines.extend(["", "Largest data files:"])
+            for data_file in results["data_files"][: self.SUMMARY_LENGTH]:
+                lines.append(f"    {size(data_file['size']):>10}  {data_file['path']}")
+
+        return lines
 
 
 class PackageCommand(BaseCommand):
     command = "package"
     description = "Package an app for distribution."
     supports_external_packaging = False
+    # Can the requirements of the app be pruned of content that the app doesn't use?
+    supports_prune = False
+    # Can duplicated native libraries in the requirements of the app be replaced by
+    # links, and the links be preserved by the packaging format?
+    supports_dedupe_libraries = False
 
     ADHOC_SIGN_HELP = "Ignored; signing is not supported"
     IDENTITY_HELP = "Ignored; signing is not supported"
@@ -93,6 +398,7 @@ class PackageCommand(BaseCommand):
         app: FinalizedAppConfig,
         update: bool,
         packaging_format: str,
+        size_report: bool = False,
         **options,
     ) -> dict | None:
         """Internal method to invoke packaging on a single app. Ensures the app exists,
@@ -102,6 +408,8 @@ class PackageCommand(BaseCommand):
         :param app: The application to package
         :param update: Should the application be updated (and rebuilt) first?
         :param packaging_format: The format of the packaging artefact to create.
+        :param size_report: Should a report of the size of the app's content be
+            generated once the app has been packaged?
         """
         # Annotate the packaging format onto the app so that distribution path
         # resolution works correctly during the resume check.
@@ -147,7 +455,12 @@ class PackageCommand(BaseCommand):
                     **options,
                 )
                 state = self.build_command(app, **full_options(state, options))
-            elif not binary_file.exists():
+            elif (
+                options.get("prune")
+                or options.get("dedupe_libraries")
+                or not binary_file.exists()
+            ):
+                # Pruning and deduplication are performed as part of the build.
                 state = self.build_command(app, **options)
             else:
                 state = None
@@ -163,8 +476,66 @@ class PackageCommand(BaseCommand):
 
         filename = self.distribution_path(app).relative_to(self.base_path)
         self.console.info(f"Packaged {filename}", prefix=app.app_name)
+
+        if size_report:
+            self.report_size(app)
         return state
 
+    def size_report_areas(self, app: FinalizedAppConfig) -> dict[str, list[Path]]:
+        """The folders that make up each area of the app's content.
+
+        :param app: The app being analysed.
+        :returns: The folders containing the app's code, its requirements, and the
+            Python support package, keyed by area name. Areas that the app's template
+            doesn't define are omitted.
+        """
+        areas = {
+            "app": [self.app_path(app)],
+            "requirements": self.build_command.requirements_paths(app),
+        }
+        try:
+            areas["support"] = [self.support_path(app)]
+        except KeyError:
+            pass
+        return {name: paths for name, paths in areas.items() if paths}
+
+    def report_size(self, app: FinalizedAppConfig):
+        """Analyse the content of a packaged app; display a summary of where its size
+        comes from, and save the full results to a file.
+
+        :param app: The app that was packaged.
+        """
+        try:
+            root = self.package_path(app)
+        except NotImplementedError:
+            root = self.bundle_path(app)
+
+        report = SizeReport(root, self.size_report_areas(app))
+        with self.console.wait_bar("Analysing app size..."):
+            report.scan(self.tools.file)
+
+        self.console.info("Size report:", prefix=app.app_name)
+        for line in report.summary():
+            self.console.info(line)
+
+        results_path = self.base_path / "logs" / f"{app.app_name}.size-report.json"
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with results_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "app_name": app.app_name,
+                    "version": str(app.version),
+                    "platform": self.platform,
+                    "output_format": self.output_format,
+                    "packaging_format": app.packaging_format,
+                    **report.results(),
+                },
+                f,
+                indent=4,
+            )
+        self.console.info()
+        self.console.info(f"The size report has been saved to {results_path}")
+
     def add_options(self, parser):
         parser.add_argument(
             "-a",
@@ -189,6 +560,32 @@ class PackageCommand(BaseCommand):
             choices=self.packaging_formats,
         )
 
+        if self.supports_prune:
+            parser.add_argument(
+                "--prune",
+                action="store_true",
+                help=(
+                    "Remove the modules in the app's requirements that the app "
+                    "doesn't use"
+                ),
+            )
+
+        if self.supports_dedupe_libraries:
+            parser.add_argument(
+                "--dedupe-libraries",
+                action="store_true",
+                help=(
+                    "Replace identical copies of the native libraries in the app's "
+                    "requirements with links to a single copy"
+                ),
+            )
+
+        parser.add_argument(
+            "--size-report",
+            action="store_true",
+            help="Report where the size of the packaged app comes from",
+        )
+
         # --adhoc-sign and --identity are mutually exclusive
         signing_group = parser.add_mutually_exclusive_group()
         signing_group.add_argument(
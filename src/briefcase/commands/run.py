@@ -1,24 +1,40 @@
 from __future__ import annotations
 
+import argparse
+import json
+import os
 import re
 import subprocess
+import time
 from abc import abstractmethod
-from contextlib import suppress
+from collections import deque
+from collections.abc import Callable
+from contextlib import ExitStack, suppress
 from pathlib import Path
 
-from briefcase.config import FinalizedAppConfig
+from briefcase.config import FinalizedAppConfig, parse_config
 from briefcase.debuggers.base import (
     AppPackagesPathMappings,
     AppPathMappings,
 )
-from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    BriefcaseConfigError,
+    BriefcaseTestSuiteFailure,
+)
+from briefcase.integrations.file_watcher import FileWatcher
 from briefcase.integrations.subprocess import StopStreaming
+from briefcase.profiling import AppProfiler, StartupBenchmark
 
-from .base import BaseCommand, full_options
+from .base import BaseCommand, full_options, positive_int
 
 
 class LogFilter:
     DEFAULT_EXIT_REGEX = r"^>>>>>>>>>> EXIT (?P<returncode>.*) <<<<<<<<<<$"
+    # A literal that appears in every line matched by the default exit regex
+    DEFAULT_EXIT_MARKER = ">>>>>>>>>> EXIT "
+    # The number of lines of recent "clean" content that the exit filter inspects
+    HISTORY_LENGTH = 10
 
     def __init__(
         self,
@@ -37,15 +53,21 @@ class LogFilter:
         :param exit_filter: A function that will operate on a string containing the last
             10 lines of "clean" (i.e., preamble filtered) logs, returning the integer
             exit status of the process if an exit condition has been detected, or None
-            if the log stream should continue.
+            if the log stream should continue. If the function has a ``marker``
+            attribute, it is a literal string that must appear in the recent lines for
+            an exit condition to be detected; the exit filter will only be invoked when
+            the marker has been seen in the last 10 lines.
         """
         self.log_popen = log_popen
         self.returncode = None
         self.clean_filter = clean_filter
         self.clean_output = clean_output
 
-        self.recent_history = []
+        self.recent_history = deque(maxlen=self.HISTORY_LENGTH)
         self.exit_filter = exit_filter
+        self.exit_marker = getattr(exit_filter, "marker", None)
+        # The number of lines of recent history since the exit marker was seen.
+        self.lines_since_marker = self.HISTORY_LENGTH
 
     def __call__(self, line):
         """Filter a single line of a log.
@@ -75,37 +97,45 @@ class LogFilter:
         else:
             display_line = line
 
-        # If the line is Python content, append the new line, then clip the
-        # recent history to the most recent 10 clean lines, and build a single
-        # string that is the tail of the recent clean lines.
+        # If the line is Python content, append the new line to the recent history
+        # (which only retains the most recent 10 clean lines).
         if included:
             self.recent_history.append(clean_line)
-            self.recent_history = self.recent_history[-10:]
-            tail = "\n".join(self.recent_history)
 
-            # Look for the exit condition in the tail
+            # Look for the exit condition in the tail of the recent history. This is
+            # only possible if the exit marker is in the recent history.
             if self.exit_filter:
-                self.returncode = self.exit_filter(tail)
-                if self.returncode is not None:
-                    # This returncode is captured from output from the app and does not
-                    # necessarily mean the app has already exited. However, once
-                    # StopStreaming is raised, the output streamer sends a signal to
-                    # the app to exit immediately and that may result in the app
-                    # exiting with a non-zero returncode. Therefore, wait for the app
-                    # to close normally before raising StopStreaming.
-                    with suppress(subprocess.TimeoutExpired):
-                        self.log_popen.wait(timeout=3)
-                    raise StopStreaming()
+                if self.exit_marker is None or self.exit_marker in clean_line:
+                    self.lines_since_marker = 0
+                else:
+                    self.lines_since_marker += 1
+
+                if self.lines_since_marker < self.HISTORY_LENGTH:
+                    self.returncode = self.exit_filter("\n".join(self.recent_history))
+                    if self.returncode is not None:
+                        # This returncode is captured from output from the app and
+                        # does not necessarily mean the app has already exited.
+                        # However, once StopStreaming is raised, the output streamer
+                        # sends a signal to the app to exit immediately and that may
+                        # result in the app exiting with a non-zero returncode.
+                        # Therefore, wait for the app to close normally before
+                        # raising StopStreaming.
+                        with suppress(subprocess.TimeoutExpired):
+                            self.log_popen.wait(timeout=3)
+                        raise StopStreaming()
 
         # Return the display line
         yield display_line
 
     @staticmethod
-    def test_filter(pattern):
+    def test_filter(pattern, marker=None):
         """A factory method for producing filter functions.
 
         :param pattern: The multiline regex pattern that identifies content of interest
             in a log (e.g., success/failure conditions)
+        :param marker: A literal string that appears in any line matched by the
+            pattern, or None if there is no such literal. If provided, the pattern is
+            only searched for when the marker has been seen recently.
         :returns: A log filter function that returns True if the pattern was found
         """
 
@@ -122,15 +152,424 @@ class LogFilter:
                     return -999
             return None
 
-        # Annotate the function with the regex that will be used in the function.
+        # Annotate the function with the regex that will be used in the function, and
+        # the literal that must be present for the regex to match.
         filter_func.regex = re.compile(pattern, flags=re.MULTILINE)
+        filter_func.marker = marker
         return filter_func
 
+    @classmethod
+    def exit_filter(cls, app: FinalizedAppConfig):
+        """Create the filter that detects the exit of an app.
+
+        :param app: The app whose output is being filtered.
+        :returns: A log filter function for the exit regex of the app.
+        """
+        exit_regex = getattr(app, "exit_regex", cls.DEFAULT_EXIT_REGEX)
+        # Only the default exit regex is known to contain a marker.
+        return cls.test_filter(
+            exit_regex,
+            marker=(
+                cls.DEFAULT_EXIT_MARKER
+                if exit_regex == cls.DEFAULT_EXIT_REGEX
+                else None
+            ),
+        )
+
 
 class RunAppMixin:
     """A mixin that captures the logic of starting an app and streaming the app logs."""
 
     allows_passthrough = True
+    # supports running the test suite as multiple parallel shards
+    supports_test_shards = False
+    # supports profiling the app while it runs
+    supports_profile_app = False
+    # The profiler for the app being run, if profiling has been requested
+    app_profiler: AppProfiler | None = None
+    # supports benchmarking the startup time of the app
+    supports_benchmark_startup = False
+    # The startup benchmark being run, if benchmarking has been requested
+    startup_benchmark: StartupBenchmark | None = None
+    # supports restarting the app when its code changes
+    supports_watch = False
+    # The watcher that restarts the app when its code changes, if watching has been
+    # requested
+    file_watcher: FileWatcher | None = None
+
+    # The file that can be written to drop the filesystem caches on Linux
+    DROP_CACHES_PATH = Path("/proc/sys/vm/drop_caches")
+
+    # The environment variables that tell each shard of a test suite which subset
+    # of the tests it should run.
+    TEST_SHARD_INDEX_ENV_VAR = "BRIEFCASE_TEST_SHARD_INDEX"
+    TEST_SHARD_COUNT_ENV_VAR = "BRIEFCASE_TEST_SHARD_COUNT"
+
+    def _add_test_shards_option(self, parser):
+        """Internal utility method for adding the option to shard a test suite.
+
+        :param parser: The parser to which options should be added.
+        """
+        parser.add_argument(
+            "--test-shards",
+            type=positive_int,
+            metavar="N",
+            help="Run the test suite as N shards in parallel",
+            default=argparse.SUPPRESS,
+        )
+
+    def _add_profile_app_option(self, parser):
+        """Internal utility method for adding the option to profile an app.
+
+        :param parser: The parser to which options should be added.
+        """
+        parser.add_argument(
+            "--profile-app",
+            nargs="?",
+            const=AppProfiler.CPROFILE,
+            choices=AppProfiler.MODES,
+            metavar="MODE",
+            help=(
+                "Profile the app while it runs; MODE is one of "
+                f"{', '.join(AppProfiler.MODES)} (default: {AppProfiler.CPROFILE})"
+            ),
+            default=argparse.SUPPRESS,
+        )
+
+    def _verify_profile_app(self, profile_app: str | None, test_shards: int | None):
+        """Confirm that the app can be profiled, if profiling was requested.
+
+        :param profile_app: The profiling mode requested, or None if profiling wasn't
+            requested.
+        :param test_shards: The number of test shards requested, or None if sharding
+            wasn't requested.
+        """
+        if profile_app is not None:
+            if not self.supports_profile_app:
+                raise BriefcaseCommandError(
+                    f"{self.description.rstrip('.')} doesn't support --profile-app."
+                )
+            if test_shards is not None:
+                raise BriefcaseCommandError(
+                    "--profile-app can't be used with --test-shards."
+                )
+
+    def profile_path(self, app: FinalizedAppConfig) -> Path:
+        """The path where the cProfile profile of an app will be written.
+
+        :param app: The app being profiled.
+        """
+        return self.base_path / "logs" / f"{app.app_name}.prof"
+
+    def _start_profiling(self, app: FinalizedAppConfig, profile_app: str):
+        """Prepare to profile an app.
+
+        :param app: The app to profile.
+        :param profile_app: The profiling mode to use.
+        """
+        profile_path = self.profile_path(app)
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure a stale profile can't be mistaken for the profile of this run.
+        profile_path.unlink(missing_ok=True)
+
+        self.app_profiler = AppProfiler(profile_app, profile_path)
+
+    def _summarize_profile(self, app: FinalizedAppConfig):
+        """Display a summary of the profile of an app that has exited.
+
+        :param app: The app that was profiled.
+        """
+        summary = self.app_profiler.summary()
+        if summary is None:
+            self.console.warning(
+                "No profiling information was captured for the app.",
+                prefix=app.app_name,
+            )
+        else:
+            self.console.info("App profile:", prefix=app.app_name)
+            self.console.info(summary)
+            if self.app_profiler.mode == AppProfiler.CPROFILE:
+                self.console.info()
+                self.console.info(
+                    "The full profile has been saved to "
+                    f"{self.app_profiler.profile_path}"
+                )
+
+    def _add_watch_option(self, parser):
+        """Internal utility method for adding the option to restart an app when its
+        code changes.
+
+        :param parser: The parser to which options should be added.
+        """
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Restart the app whenever its code changes",
+            default=argparse.SUPPRESS,
+        )
+
+    def _project_requirements(
+        self,
+        app: FinalizedAppConfig,
+    ) -> tuple[list[str], list[str]] | None:
+        """Read the requirements of an app from the project's ``pyproject.toml``.
+
+        :param app: The config object for the app
+        :returns: The requirements and test requirements of the app; or None if the
+            requirements couldn't be read (e.g., because ``pyproject.toml`` is being
+            edited, and isn't currently valid).
+        """
+        try:
+            _, app_configs = parse_config(
+                self.base_path / "pyproject.toml",
+                platform=self.platform,
+                output_format=self.output_format,
+                console=self.console,
+            )
+            app_config = app_configs[app.app_name]
+        except (BriefcaseConfigError, OSError, KeyError):
+            return None
+
+        return (
+            list(app_config.get("requires") or []),
+            list(app_config.get("test_requires") or []),
+        )
+
+    def _verify_watch(
+        self,
+        watch: bool,
+        profile_app: str | None,
+        benchmark_startup: int | None,
+        test_shards: int | None,
+    ):
+        """Confirm that the app can be watched for changes, if watching was requested.
+
+        :param watch: Should the app be restarted when its code changes?
+        :param profile_app: The profiling mode requested, or None if profiling wasn't
+            requested.
+        :param benchmark_startup: The number of startup benchmark runs requested, or
+            None if benchmarking wasn't requested.
+        :param test_shards: The number of test shards requested, or None if sharding
+            wasn't requested.
+        """
+        if watch:
+            if not self.supports_watch:
+                raise BriefcaseCommandError(
+                    f"{self.description.rstrip('.')} doesn't support --watch."
+                )
+            if not (
+                profile_app is None
+                and benchmark_startup is None
+                and test_shards is None
+            ):
+                raise BriefcaseCommandError(
+                    "--watch can't be used with --profile-app, --benchmark-startup "
+                    "or --test-shards."
+                )
+
+    def _add_benchmark_startup_options(self, parser):
+        """Internal utility method for adding the options to benchmark app startup.
+
+        :param parser: The parser to which options should be added.
+        """
+        parser.add_argument(
+            "--benchmark-startup",
+            type=positive_int,
+            metavar="N",
+            help="Start the app N times, and report how long it takes to start",
+            default=argparse.SUPPRESS,
+        )
+        parser.add_argument(
+            "--startup-marker",
+            metavar="REGEX",
+            help=(
+                "A regular expression matching the log output that indicates the "
+                "app has started (default: the test suite result, in test mode)"
+            ),
+            default=argparse.SUPPRESS,
+        )
+        parser.add_argument(
+            "--drop-caches",
+            action="store_true",
+            help="Drop filesystem caches before each startup benchmark run",
+            default=argparse.SUPPRESS,
+        )
+
+    def _verify_benchmark_startup(
+        self,
+        test_mode: bool,
+        benchmark_startup: int | None,
+        startup_marker: str | None,
+        drop_caches: bool,
+        profile_app: str | None,
+        test_shards: int | None,
+    ):
+        """Confirm that app startup can be benchmarked, if benchmarking was requested.
+
+        :param test_mode: Is the app being run in test mode?
+        :param benchmark_startup: The number of times the app should be started, or
+            None if benchmarking wasn't requested.
+        :param startup_marker: The regex matching the log output that indicates the
+            app has started, or None if no marker was provided.
+        :param drop_caches: Should filesystem caches be dropped before each run?
+        :param profile_app: The profiling mode requested, or None if profiling wasn't
+            requested.
+        :param test_shards: The number of test shards requested, or None if sharding
+            wasn't requested.
+        """
+        if benchmark_startup is None:
+            if startup_marker is not None or drop_caches:
+                raise BriefcaseCommandError(
+                    "--startup-marker and --drop-caches can only be used with "
+                    "--benchmark-startup."
+                )
+            return
+
+        if not self.supports_benchmark_startup:
+            raise BriefcaseCommandError(
+                f"{self.description.rstrip('.')} doesn't support --benchmark-startup."
+            )
+        if profile_app is not None or test_shards is not None:
+            raise BriefcaseCommandError(
+                "--benchmark-startup can't be used with --profile-app or --test-shards."
+            )
+        if startup_marker is None:
+            if not test_mode:
+                raise BriefcaseCommandError(
+                    "--benchmark-startup requires a --startup-marker, "
+                    "unless the app is running in test mode."
+                )
+        else:
+            try:
+                re.compile(startup_marker)
+            except re.error as e:
+                raise BriefcaseCommandError(
+                    f"--startup-marker {startup_marker!r} isn't a valid "
+                    f"regular expression: {e}"
+                ) from e
+
+    def _drop_caches(self) -> bool:
+        """Drop the filesystem caches of the host, so that the app starts "cold".
+
+        This is only possible on Linux, and requires root privileges.
+
+        :returns: True if the caches were dropped.
+        """
+        if self.tools.host_os != "Linux":
+            return False
+
+        try:
+            # Write any dirty pages so that they can be dropped.
+            self.tools.os.sync()
+            self.DROP_CACHES_PATH.write_text("3\n", encoding="ascii")
+        except OSError:
+            return False
+        return True
+
+    def _benchmark_startup(
+        self,
+        app: FinalizedAppConfig,
+        run_app: Callable[[], dict | None],
+        benchmark_startup: int,
+        startup_marker: str | None = None,
+        drop_caches: bool = False,
+    ) -> dict | None:
+        """Start an app multiple times, and report how long the app takes to start.
+
+        :param app: The app to benchmark.
+        :param run_app: A function that starts the app, and streams its logs until
+            the app has exited or has been stopped.
+        :param benchmark_startup: The number of times to start the app.
+        :param startup_marker: The regex matching the log output that indicates the
+            app has started; or None if the app has started when it reports the
+            result of its test suite.
+        :param drop_caches: Should filesystem caches be dropped before each run?
+        :returns: The state returned by the final run of the app.
+        """
+        self.startup_benchmark = StartupBenchmark(
+            runs=benchmark_startup,
+            startup_marker=startup_marker,
+            drop_caches=drop_caches,
+        )
+
+        state = None
+        for run in range(1, benchmark_startup + 1):
+            if self.startup_benchmark.drop_caches and not self._drop_caches():
+                self.console.warning(
+                    "Unable to drop filesystem caches; startup will be "
+                    "benchmarked with warm caches.",
+                    prefix=app.app_name,
+                )
+                self.startup_benchmark.drop_caches = False
+
+            self.console.info(
+                f"Startup benchmark run {run} of {benchmark_startup}...",
+                prefix=app.app_name,
+            )
+            self.startup_benchmark.start()
+            state = run_app()
+
+            if self.startup_benchmark.running:
+                raise BriefcaseCommandError(
+                    f"Startup benchmark run {run} didn't detect that the app "
+                    "had started."
+                )
+
+        self._report_startup_benchmark(app)
+        return state
+
+    def _report_startup_benchmark(self, app: FinalizedAppConfig):
+        """Display the results of a startup benchmark, and save them to a file.
+
+        :param app: The app that was benchmarked.
+        """
+        benchmark = self.startup_benchmark
+        results = benchmark.results()
+        caches = "cold" if benchmark.drop_caches else "warm"
+
+        self.console.info(
+            f"Startup time over {benchmark.runs} runs ({caches}):",
+            prefix=app.app_name,
+        )
+        for name, duration in results.items():
+            self.console.info(f"    {name + ':':8}{duration:.3f}s")
+
+        results_path = self.base_path / "logs" / f"{app.app_name}.startup.json"
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with results_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "app_name": app.app_name,
+                    "version": str(app.version),
+                    "platform": self.platform,
+                    "output_format": self.output_format,
+                    "startup_marker": benchmark.startup_marker,
+                    "cold": benchmark.drop_caches,
+                    "durations": benchmark.durations,
+                    **results,
+                },
+                f,
+                indent=4,
+            )
+        self.console.info()
+        self.console.info(f"The benchmark results have been saved to {results_path}")
+
+    def _verify_test_shards(self, test_mode: bool, test_shards: int | None):
+        """Confirm that the requested number of test shards can be used.
+
+        :param test_mode: Is the app being run in test mode?
+        :param test_shards: The number of test shards requested, or None if sharding
+            wasn't requested.
+        """
+        if test_shards is not None:
+            if not self.supports_test_shards:
+                raise BriefcaseCommandError(
+                    f"{self.description.rstrip('.')} doesn't support --test-shards."
+                )
+            if not test_mode:
+                raise BriefcaseCommandError(
+                    "--test-shards can only be used when running in test mode."
+                )
 
     def _stream_app_logs(
         self,
@@ -160,9 +599,16 @@ class RunAppMixin:
             is of the log, not the app itself.
         """
         try:
-            exit_filter = LogFilter.test_filter(
-                getattr(app, "exit_regex", LogFilter.DEFAULT_EXIT_REGEX)
-            )
+            exit_filter = LogFilter.exit_filter(app)
+            if self.startup_benchmark:
+                exit_filter = self.startup_benchmark.exit_filter(exit_filter)
+
+            if self.file_watcher:
+                # Stop the app as soon as its code changes.
+                app_stop_func = stop_func
+
+                def stop_func():
+                    return app_stop_func() or self.file_watcher.changed()
 
             log_filter = LogFilter(
                 popen,
@@ -170,6 +616,10 @@ class RunAppMixin:
                 clean_output=clean_output,
                 exit_filter=exit_filter,
             )
+            if self.app_profiler:
+                filter_func = self.app_profiler.filter(log_filter)
+            else:
+                filter_func = log_filter
 
             # Start streaming logs for the app.
             self.console.info("=" * 75)
@@ -178,9 +628,19 @@ class RunAppMixin:
                     label="log stream" if log_stream else app.app_name,
                     popen_process=popen,
                     stop_func=stop_func,
-                    filter_func=log_filter,
+                    filter_func=filter_func,
                 )
 
+            # If the app was stopped as soon as its startup marker was seen,
+            # there's no test result or exit status to check.
+            if self.startup_benchmark and self.startup_benchmark.marker_seen:
+                return
+
+            # If the app was stopped because its code changed, it will be restarted;
+            # the outcome of this run isn't relevant.
+            if self.file_watcher and self.file_watcher.pending:
+                return
+
             # If we're in test mode, and log streaming ends,
             # check for the status of the test suite.
             if app.test_mode:
@@ -214,9 +674,121 @@ class RunAppMixin:
                         f"(return code {status_code})."
                     )
 
+        except KeyboardInterrupt:
+            # Catch CTRL-C to exit normally; unless a benchmark is running, or the app
+            # is being watched, in which case the app must not be started again.
+            if self.startup_benchmark or self.file_watcher:
+                raise
+
+    def _stream_test_shards(
+        self,
+        app: FinalizedAppConfig,
+        test_shards: int,
+        start_shard: Callable[[dict[str, str]], subprocess.Popen],
+        clean_filter=None,
+        clean_output=False,
+    ):
+        """Run an app's test suite as multiple shards in parallel, streaming the logs
+        of every shard, and combining the results.
+
+        Each shard is started with the environment variables named by
+        ``TEST_SHARD_INDEX_ENV_VAR`` (the zero-based index of the shard) and
+        ``TEST_SHARD_COUNT_ENV_VAR`` (the total number of shards). The test suite is
+        responsible for using these values to select the subset of tests to run. Every
+        line of output is prefixed with the shard that produced it.
+
+        Catches and cleans up after any Ctrl-C interrupts.
+
+        :param app: The app to be tested
+        :param test_shards: The number of shards to run.
+        :param start_shard: A function that starts a shard of the test suite. It is
+            passed the environment variables that identify the shard, and returns the
+            Popen object for the shard; every shard process will be closed after log
+            streaming completes.
+        :param clean_filter: The log cleaning filter to use; see ``LogFilter``
+            for details.
+        :param clean_output: Should the cleaned output be presented to the user?
+        """
+        shards = []
+        try:
+            with ExitStack() as stack:
+                self.console.info("=" * 75)
+                try:
+                    for index in range(test_shards):
+                        label = f"shard {index + 1}/{test_shards}"
+                        popen = start_shard(
+                            {
+                                self.TEST_SHARD_INDEX_ENV_VAR: str(index),
+                                self.TEST_SHARD_COUNT_ENV_VAR: str(test_shards),
+                            }
+                        )
+                        stack.enter_context(popen)
+                        log_filter = LogFilter(
+                            popen,
+                            clean_filter=clean_filter,
+                            clean_output=clean_output,
+                            exit_filter=LogFilter.exit_filter(app),
+                        )
+                        streamer = self.tools.subprocess.stream_output_non_blocking(
+                            label=f"{app.app_name} {label}",
+                            popen_process=popen,
+                            filter_func=self._shard_filter(label, log_filter),
+                        )
+                        shards.append((label, popen, log_filter, streamer))
+
+                    # joining the threads is avoided due to demonstrated
+                    # instability of thread interruption via CTRL+C (#809)
+                    while any(streamer.is_alive() for *_, streamer in shards):
+                        time.sleep(0.1)
+                except KeyboardInterrupt:
+                    self.console.info("Stopping...")
+                    # allow time for CTRL+C to propagate to the child processes
+                    time.sleep(0.25)
+                    raise
+                finally:
+                    for label, popen, _, _ in shards:
+                        self.tools.subprocess.cleanup(f"{app.app_name} {label}", popen)
+
+            failed = []
+            unreported = []
+            for label, _, log_filter, _ in shards:
+                if log_filter.returncode is None:
+                    unreported.append(label)
+                elif log_filter.returncode != 0:
+                    self.console.error(
+                        f"Test suite {label} failed! "
+                        f"(return code {log_filter.returncode})",
+                        prefix=app.app_name,
+                    )
+                    failed.append(label)
+
+            if unreported:
+                raise BriefcaseCommandError(
+                    f"Test suite {', '.join(unreported)} didn't report a result."
+                )
+            elif failed:
+                raise BriefcaseTestSuiteFailure()
+            else:
+                self.console.info("Test suite passed!", prefix=app.app_name)
+
         except KeyboardInterrupt:
             pass  # Catch CTRL-C to exit normally
 
+    @staticmethod
+    def _shard_filter(label: str, log_filter: LogFilter):
+        """Wrap a log filter so that every line of output is prefixed with the shard
+        that produced it.
+
+        :param label: The label for the shard.
+        :param log_filter: The log filter for the shard.
+        """
+
+        def filter_func(line):
+            for filtered in log_filter(line):
+                yield f"[{label}] {filtered}"
+
+        return filter_func
+
 
 class RunCommand(RunAppMixin, BaseCommand):
     command = "run"
@@ -232,6 +804,14 @@ class RunCommand(RunAppMixin, BaseCommand):
 
         self._add_update_options(parser, context_label=" before running")
         self._add_test_options(parser, context_label="Run")
+        if self.supports_test_shards:
+            self._add_test_shards_option(parser)
+        if self.supports_profile_app:
+            self._add_profile_app_option(parser)
+        if self.supports_benchmark_startup:
+            self._add_benchmark_startup_options(parser)
+        if self.supports_watch:
+            self._add_watch_option(parser)
 
         if self.supports_debugger:
             self._add_debug_options(parser, context_label="Run", run_cmd=True)
@@ -298,12 +878,135 @@ class RunCommand(RunAppMixin, BaseCommand):
         else:
             self.console.info("Starting app...", prefix=app.app_name)
 
+        if self.app_profiler:
+            # Start the app's main module through the profiler
+            env["BRIEFCASE_MAIN_MODULE"] = self.app_profiler.main_module(app)
+            env.update(self.app_profiler.environment())
+
         # If we need any environment variables, add them to the arguments.
         if env:
             args["env"] = env
 
         return args
 
+    def _resource_paths(self, app: FinalizedAppConfig) -> set[str]:
+        """Find the image files that the app's resources are generated from.
+
+        :param app: The config object for the app
+        :returns: The paths of the image files.
+        """
+        sources = []
+        for source in [
+            app.icon,
+            *(doctype.get("icon") for doctype in app.document_types.values()),
+        ]:
+            if isinstance(source, dict):
+                sources.extend(source.values())
+            elif source:
+                sources.append(source)
+
+        paths = set()
+        for source in sources:
+            source_path = self.base_path / source
+            # Images are named after their source, with a size and/or variant suffix
+            # (e.g., ``icon-256.png``).
+            paths.update(
+                os.fspath(path)
+                for path in source_path.parent.glob(f"{source_path.name}*")
+                if path.is_file()
+            )
+        return paths
+
+    def watch_app(
+        self,
+        app: FinalizedAppConfig,
+        passthrough: list[str],
+        **options,
+    ) -> dict | None:
+        """Run the app, rebuilding and restarting the app whenever the code of the app
+        changes.
+
+        The app's sources, the images used to generate its resources, and
+        ``pyproject.toml`` are watched. When they change, only the affected parts of
+        the bundle are updated: changed source files are copied into the bundle,
+        resources are re-installed if their images have changed, and requirements are
+        re-installed if the requirements of the app have changed. The app is then
+        rebuilt and restarted. Watching continues until the user presses Ctrl-C.
+
+        :param app: The config object for the app
+        :param passthrough: A list of arguments to pass to the app
+        """
+        pyproject_path = self.base_path / "pyproject.toml"
+        requirements = self._project_requirements(app)
+        resource_paths = self._resource_paths(app)
+        self.file_watcher = FileWatcher(
+            [
+                pyproject_path,
+                *(self.base_path / source for source in app.all_sources()),
+                *(Path(path) for path in sorted(resource_paths)),
+            ]
+        )
+        state = None
+        changes = set()
+        update_requirements = False
+        try:
+            while True:
+                try:
+                    if changes:
+                        self.console.info(
+                            "Changes detected; rebuilding app...", prefix=app.app_name
+                        )
+                        state = self.update_command(
+                            app,
+                            changes=changes,
+                            update_requirements=update_requirements,
+                            update_resources=bool(changes & resource_paths),
+                            **full_options(state, options),
+                        )
+                        update_requirements = False
+                        state = self.build_command(
+                            app,
+                            no_update=True,
+                            **full_options(state, options),
+                        )
+
+                    state = self.run_app(
+                        app,
+                        passthrough=passthrough,
+                        **full_options(state, options),
+                    )
+                except BriefcaseTestSuiteFailure:
+                    # The failure has already been reported.
+                    pass
+                except BriefcaseCommandError as e:
+                    self.console.error(str(e), prefix=app.app_name)
+
+                if not self.file_watcher.pending:
+                    self.console.info(
+                        "Waiting for changes (press Ctrl-C to stop)...",
+                        prefix=app.app_name,
+                    )
+                changes = self.file_watcher.wait()
+
+                if os.fspath(pyproject_path) in changes:
+                    new_requirements = self._project_requirements(app)
+                    if (
+                        new_requirements is not None
+                        and new_requirements != requirements
+                    ):
+                        app.requires, app.test_requires = (
+                            list(r) for r in new_requirements
+                        )
+                        requirements = new_requirements
+                        update_requirements = True
+        except KeyboardInterrupt:
+            pass  # Catch CTRL-C to exit normally
+        finally:
+            self.file_watcher.close()
+            self.file_watcher = None
+
+        return state
+
     @abstractmethod
     def run_app(
         self,
@@ -332,8 +1035,30 @@ class RunCommand(RunAppMixin, BaseCommand):
         debugger_host: str | None = None,
         debugger_port: int | None = None,
         passthrough: list[str] | None = None,
+        profile_app: str | None = None,
+        benchmark_startup: int | None = None,
+        startup_marker: str | None = None,
+        drop_caches: bool = False,
+        watch: bool = False,
         **options,
     ) -> dict | None:
+        self._verify_test_shards(test_mode, options.get("test_shards"))
+        self._verify_profile_app(profile_app, options.get("test_shards"))
+        self._verify_benchmark_startup(
+            test_mode,
+            benchmark_startup,
+            startup_marker,
+            drop_caches,
+            profile_app=profile_app,
+            test_shards=options.get("test_shards"),
+        )
+        self._verify_watch(
+            watch,
+            profile_app=profile_app,
+            benchmark_startup=benchmark_startup,
+            test_shards=options.get("test_shards"),
+        )
+
         # Which app should we run? If there's only one defined
         # in pyproject.toml, then we can use it as a default;
         # otherwise look for a -a/--app option.
@@ -422,10 +1147,39 @@ class RunCommand(RunAppMixin, BaseCommand):
                 "(apps defining 'external_package_path') cannot be run."
             )
 
-        state = self.run_app(
-            app,
-            passthrough=[] if passthrough is None else passthrough,
-            **full_options(state, options),
-        )
+        passthrough = [] if passthrough is None else passthrough
+        if watch:
+            return self.watch_app(
+                app,
+                passthrough=passthrough,
+                **full_options(state, options),
+            )
+
+        if profile_app:
+            self._start_profiling(app, profile_app)
+            passthrough = [*self.app_profiler.arguments(app), *passthrough]
+
+        if benchmark_startup:
+            return self._benchmark_startup(
+                app,
+                run_app=lambda: self.run_app(
+                    app,
+                    passthrough=passthrough,
+                    **full_options(state, options),
+                ),
+                benchmark_startup=benchmark_startup,
+                startup_marker=startup_marker,
+                drop_caches=drop_caches,
+            )
+
+        try:
+            state = self.run_app(
+                app,
+                passthrough=passthrough,
+                **full_options(state, options),
+            )
+        finally:
+            if self.app_profiler:
+                self._summarize_profile(app)
 
         return state
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterable
 
 from briefcase.config import AppConfig, FinalizedAppConfig
 from briefcase.exceptions import BriefcaseCommandError
@@ -114,6 +115,57 @@ class UpdateCommand(CreateCommand):
 
         self.console.info("Application updated.", prefix=app.app_name)
 
+    def update_app_changes(
+        self,
+        app: FinalizedAppConfig,
+        changes: Iterable[str],
+        update_requirements: bool,
+        update_resources: bool,
+        **options,
+    ) -> dict | None:
+        """Update an existing application bundle to reflect changes to specific files.
+
+        Only the source files that have changed are copied into (or removed from) the
+        bundle; the rest of the update is only performed if requested.
+
+        :param app: The config object for the app
+        :param changes: The paths of files that have been added, modified or deleted.
+        :param update_requirements: Should requirements be updated?
+        :param update_resources: Should extra resources be updated?
+        """
+        self.verify_app(app)
+
+        self.console.info("Updating application code...", prefix=app.app_name)
+        added = self.sync_app_code(app=app, changes=changes)
+
+        if update_requirements:
+            venv = self.create_app_environment(
+                app=app,
+                platform=self.platform,
+                arch=self.tools.host_arch,
+                recreate=True,
+            )
+
+            self.console.info("Updating requirements...", prefix=app.app_name)
+            self.install_app_requirements(app=app, venv=venv)
+
+            if venv.provides_python:
+                self.console.info(
+                    "Updating managed Python environment...", prefix=app.app_name
+                )
+                self.install_managed_python_env(app=app, venv=venv)
+
+        if update_resources:
+            self.console.info("Updating application resources...", prefix=app.app_name)
+            self.install_app_resources(app=app)
+
+        # Content that was already in the bundle has already been cleaned up.
+        if added or update_requirements:
+            self.console.info("Removing unneeded app content...", prefix=app.app_name)
+            self.cleanup_app_content(app=app)
+
+        self.console.info("Application updated.", prefix=app.app_name)
+
     def __call__(
         self,
         app: AppConfig | None = None,
@@ -124,6 +176,7 @@ class UpdateCommand(CreateCommand):
         update_stub: bool = False,
         test_mode: bool = False,
         debugger: str | None = None,
+        changes: Iterable[str] | None = None,
         **options,
     ) -> dict | None:
         apps_to_update = self.resolve_apps(app=app, app_name=app_name)
@@ -138,13 +191,23 @@ class UpdateCommand(CreateCommand):
 
         state = None
         for _, app_obj in sorted(finalized_apps.items()):
-            state = self.update_app(
-                app_obj,
-                update_requirements=update_requirements,
-                update_resources=update_resources,
-                update_support=update_support,
-                update_stub=update_stub,
-                **full_options(state, options),
-            )
+            if changes is None:
+                state = self.update_app(
+                    app_obj,
+                    update_requirements=update_requirements,
+                    update_resources=update_resources,
+                    update_support=update_support,
+                    update_stub=update_stub,
+                    **full_options(state, options),
+                )
+            else:
+                # Only the changes to specific files need to be applied.
+                state = self.update_app_changes(
+                    app_obj,
+                    changes=changes,
+                    update_requirements=update_requirements,
+                    update_resources=update_resources,
+                    **full_options(state, options),
+                )
 
         return state
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import codecs
+import gzip
 import logging
 import os
 import platform
 import re
 import shutil
 import sys
+import tempfile
 import textwrap
+import threading
 import time
 import traceback
 from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
@@ -20,6 +24,7 @@ from rich.console import Console as RichConsole
 from rich.control import strip_control_codes
 from rich.highlighter import RegexHighlighter
 from rich.markup import escape
+from rich.markup import render as render_markup
 from rich.progress import (
     BarColumn,
     Progress,
@@ -94,6 +99,325 @@ class RichLoggingHandler(logging.StreamHandler):
         self.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
 
 
+class LogSegment:
+    def __init__(self, compress: bool = False, spool_size: int = 1024 * 1024):
+        """A single segment of recorded log content.
+
+        Content is held in memory until it exceeds ``spool_size`` bytes; after that,
+        it is transparently rolled over to a temporary file on disk.
+
+        :param compress: Should the content of the segment be gzip-compressed?
+        :param spool_size: The number of bytes to hold in memory before spilling
+            the segment to disk.
+        """
+        self.compress = compress
+        self.file = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=spool_size, mode="w+b"
+        )
+        self._writer = self._open_writer()
+        # The number of (uncompressed) bytes written to the segment
+        self.size = 0
+
+    def _open_writer(self):
+        if self.compress:
+            # Every writer adds a new member to the gzip stream; concatenated
+            # members are decompressed as a single stream when read.
+            return gzip.GzipFile(fileobj=self.file, mode="ab", compresslevel=1)
+        return self.file
+
+    def write(self, data: bytes):
+        self._writer.write(data)
+        self.size += len(data)
+
+    def chunks(self, chunk_size: int) -> Generator[bytes]:
+        """Yield the (uncompressed) content of the segment in chunks.
+
+        Once the content has been read, the segment can continue to be written.
+        """
+        if self.compress:
+            # Closing the gzip writer finalizes the current member, but doesn't
+            # close the underlying file.
+            self._writer.close()
+        self.file.flush()
+        self.file.seek(0)
+        try:
+            reader = (
+                gzip.GzipFile(fileobj=self.file, mode="rb")
+                if self.compress
+                else self.file
+            )
+            while chunk := reader.read(chunk_size):
+                yield chunk
+        finally:
+            self.file.seek(0, os.SEEK_END)
+            if self.compress:
+                self._writer = self._open_writer()
+
+    def close(self):
+        if self.compress:
+            self._writer.close()
+        self.file.close()
+
+
+class LogRecorder:
+    # Number of bytes of log content that will be held in memory before spooling
+    # the log to a temporary file.
+    SPOOL_SIZE = 1024 * 1024
+    # Size of the chunks used when reading the log back.
+    CHUNK_SIZE = 64 * 1024
+
+    encoding = "utf-8"
+
+    def __init__(self, max_size: int | None = None, compress: bool = False):
+        """A write-only text stream that records log content outside of memory.
+
+        Log content is spooled to a temporary file, so the memory used by the log
+        doesn't grow with the length of the session.
+
+        If a maximum size is provided, the log behaves as a ring buffer. Content is
+        written to segments that are half the maximum size; when a new segment is
+        started, any segment older than the previous one is discarded. This means the
+        log will retain at least the most recent ``max_size / 2`` bytes of content,
+        and at most ``max_size`` bytes.
+
+        :param max_size: The maximum number of (uncompressed) bytes of log content to
+            retain. If ``None``, all content is retained.
+        :param compress: Should recorded log content be gzip-compressed?
+        """
+        if max_size is not None and max_size < 2:
+            raise ValueError("Maximum log size must be at least 2 bytes.")
+
+        self.max_size = max_size
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._segments: list[LogSegment] = []
+        # The number of bytes discarded by the ring buffer.
+        self.discarded = 0
+        self._start_segment()
+
+    def _start_segment(self):
+        self._segments.append(
+            LogSegment(compress=self.compress, spool_size=self.SPOOL_SIZE)
+        )
+        if len(self._segments) > 2:
+            oldest = self._segments.pop(0)
+            self.discarded += oldest.size
+            oldest.close()
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        data = text.encode(self.encoding, errors="backslashreplace")
+        with self._lock:
+            self._segments[-1].write(data)
+            if self.max_size and self._segments[-1].size >= self.max_size // 2:
+                self._start_segment()
+        return len(text)
+
+    def flush(self):
+        pass
+
+    @property
+    def size(self) -> int:
+        """The number of (uncompressed) bytes currently retained by the log."""
+        with self._lock:
+            return sum(segment.size for segment in self._segments)
+
+    def _chunks(self) -> Generator[str]:
+        """Yield the retained text of the log in chunks, oldest first."""
+        if self.discarded:
+            yield f"... {self.discarded} bytes of earlier log output discarded ...\n"
+
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        for segment in self._segments:
+            for chunk in segment.chunks(self.CHUNK_SIZE):
+                yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    def copy_to(self, log_file):
+        """Copy the retained text of the log to a text file.
+
+        The log is streamed in chunks, so the full log is never held in memory.
+
+        :param log_file: An open, writable text file.
+        """
+        with self._lock:
+            for text in self._chunks():
+                log_file.write(text)
+
+    def export_text(self) -> str:
+        """Export the retained text of the log; the log is also cleared."""
+        with self._lock:
+            text = "".join(self._chunks())
+            self._clear()
+        return text
+
+    def _clear(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+        self.discarded = 0
+        self._start_segment()
+
+    def close(self):
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+
+
+class PlainTextConsole:
+    # The minimum number of seconds between flushes of the output stream.
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self):
+        """A minimal console that writes plain text lines to stdout.
+
+        Rich's rendering machinery is relatively expensive; when output isn't being
+        displayed in a terminal (e.g., in CI), that machinery provides no benefit.
+        This console writes text directly to ``sys.stdout``, producing the same
+        content Rich would produce without color. Output is buffered, and flushed
+        periodically, rather than after every line; output that hasn't been flushed
+        is flushed by a timer, so it is never held back for longer than the flush
+        interval.
+        """
+        self._last_flush = 0.0
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    # The keyword arguments to ``RichConsole.print()`` that can be honored (or
+    # safely ignored) when writing plain text.
+    SUPPORTED_KWARGS = frozenset(
+        {"end", "sep", "markup", "style", "highlight", "emoji", "soft_wrap"}
+    )
+
+    @classmethod
+    def can_print(cls, messages: Sequence[object], kwargs: Mapping[str, Any]) -> bool:
+        """Can the given messages be rendered as plain text?"""
+        return all(isinstance(message, str) for message in messages) and all(
+            kwarg in cls.SUPPORTED_KWARGS for kwarg in kwargs
+        )
+
+    def print(self, *messages: str, sep=" ", end="\n", markup=None, **kwargs):
+        """Print messages as plain text.
+
+        This mirrors the behavior of Rich when printing strings without color: markup
+        (which is enabled by default) is removed, control codes are stripped, and tabs
+        are expanded.
+
+        :param messages: The strings to print.
+        :param sep: The separator between messages.
+        :param end: The string to append after the last message.
+        :param markup: Should Rich markup in the messages be interpreted?
+        """
+        if markup is not False:
+            messages = tuple(render_markup(message).plain for message in messages)
+        text = strip_control_codes(sep.join(messages)).expandtabs(8)
+
+        stream = sys.stdout
+        stream.write(f"{text}{end}")
+        with self._lock:
+            if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+                self._flush()
+            elif self._flush_timer is None:
+                # Ensure the output is flushed, even if nothing else is printed.
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
+
+
+class PlainProgress:
+    def __init__(self, console: Console, interval_sec: float = 5.0):
+        """A progress bar that reports progress as periodic lines of plain text.
+
+        This provides the subset of the ``rich.progress.Progress`` API that is used
+        by Briefcase. The percentage complete of a task is printed if it has changed,
+        and at least ``interval_sec`` seconds have passed since progress was last
+        reported; short tasks don't produce any output.
+
+        :param console: The console to which progress should be reported.
+        :param interval_sec: The minimum interval between progress reports.
+        """
+        self.console = console
+        self.interval_sec = interval_sec
+        self.tasks: dict[int, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def add_task(
+        self,
+        description: str,
+        total: float | None = 100.0,
+        completed: float = 0,
+        **fields,
+    ) -> int:
+        with self._lock:
+            task_id = len(self.tasks)
+            self.tasks[task_id] = {
+                "description": description,
+                "total": total,
+                "completed": completed,
+                "reported": None,
+                "report_time": time.monotonic() + self.interval_sec,
+            }
+        return task_id
+
+    def update(
+        self,
+        task_id: int,
+        *,
+        total: float | None = None,
+        completed: float | None = None,
+        advance: float | None = None,
+        description: str | None = None,
+        **fields,
+    ):
+        with self._lock:
+            task = self.tasks[task_id]
+            if total is not None:
+                task["total"] = total
+            if description is not None:
+                task["description"] = description
+            if completed is not None:
+                task["completed"] = completed
+            if advance is not None:
+                task["completed"] += advance
+
+            if not task["total"] or time.monotonic() < task["report_time"]:
+                return
+
+            percentage = int(min(100.0, 100.0 * task["completed"] / task["total"]))
+            if percentage != task["reported"]:
+                task["reported"] = percentage
+                task["report_time"] = time.monotonic() + self.interval_sec
+                self.console.to_console(
+                    f"  {task['description']}: {percentage}%", markup=False
+                )
+
+
 class LogLevel(IntEnum):
     INFO = 0
     VERBOSE = 1
@@ -132,12 +456,18 @@ class NotDeadYet:
 class Console:
     # subdirectory of command.base_path to store log files
     LOG_DIR = "logs"
+    # The environment variables that can be used to configure log recording
+    LOG_MAX_SIZE_ENV_VAR = "BRIEFCASE_LOG_MAX_SIZE"
+    LOG_COMPRESS_ENV_VAR = "BRIEFCASE_LOG_COMPRESS"
 
     def __init__(
         self,
         input_enabled: bool = True,
         verbosity: LogLevel = LogLevel.INFO,
         log_width: int = 180,
+        log_max_size: int | None = None,
+        log_compress: bool | None = None,
+        plain: bool | None = None,
     ):
         """Interface for printing and managing output to the console and/or log.
 
@@ -146,6 +476,18 @@ class Console:
         :param log_width: The width at which content should be wrapped in the log file.
             The default width is wide enough to render the output of ``sdkmanager
             --list_installed`` in the log file without line wrapping.
+        :param log_max_size: The maximum number of bytes of log content to retain. If
+            the log grows beyond this size, the oldest content is discarded. If
+            ``None`` (the default), the value of the ``BRIEFCASE_LOG_MAX_SIZE``
+            environment variable is used; if that isn't defined, all log content is
+            retained.
+        :param log_compress: Should log content be compressed while it is recorded?
+            If ``None`` (the default), the value of the ``BRIEFCASE_LOG_COMPRESS``
+            environment variable is used; if that isn't defined, the log is not
+            compressed.
+        :param plain: Should console output be written as plain text? If ``None``
+            (the default), plain text will be used for non-interactive sessions that
+            aren't using color.
         """
         self.log_width = log_width
 
@@ -155,16 +497,43 @@ class Console:
             emoji=False,
             soft_wrap=True,
         )
-
-        # Rich only records what's being logged if it is actually written somewhere;
-        # writing to /dev/null allows Rich to do so without needing to print the
-        # logs in the console or save them to file before it is known a file is wanted.
-        self._dev_null = open(  # noqa: SIM115 (can't use context manager here)
-            os.devnull, "w", encoding="utf-8", errors="ignore"
-        )
+        # A lightweight alternative to Rich for non-interactive sessions
+        self._plain_impl = PlainTextConsole()
+        self.plain = plain
+
+        # The log is rendered into a recorder that spools content to a temporary file,
+        # rather than being recorded in memory; it is only saved to a permanent file
+        # once it is known that a log file is wanted. Invalid log settings in the
+        # environment are reported once the console is ready, and otherwise ignored.
+        config_warnings = []
+        if log_max_size is None and (
+            env_max_size := os.environ.get(self.LOG_MAX_SIZE_ENV_VAR)
+        ):
+            try:
+                log_max_size = int(env_max_size)
+            except ValueError:
+                log_max_size = 0
+            if log_max_size < 2:
+                config_warnings.append(
+                    f"The value of {self.LOG_MAX_SIZE_ENV_VAR} ({env_max_size!r}) "
+                    "is not an integer of at least 2; the log size will not be limited."
+                )
+                log_max_size = None
+        if log_compress is None:
+            try:
+                log_compress = parse_boolean(
+                    os.environ.get(self.LOG_COMPRESS_ENV_VAR) or "false"
+                )
+            except ValueError:
+                config_warnings.append(
+                    f"The value of {self.LOG_COMPRESS_ENV_VAR} "
+                    f"({os.environ[self.LOG_COMPRESS_ENV_VAR]!r}) is not a boolean; "
+                    "the log will not be compressed."
+                )
+                log_compress = False
+        self._log_recorder = LogRecorder(max_size=log_max_size, compress=log_compress)
         self._log_impl = RichConsole(
-            file=self._dev_null,
-            record=True,
+            file=self._log_recorder,
             width=self.log_width,
             force_interactive=False,
             force_terminal=False,
@@ -206,13 +575,17 @@ class Console:
         # dynamic elements like the Wait Bar.
         self.is_console_controlled = False
 
+        for message in config_warnings:
+            self.warning(message)
+
     def close(self):
-        if self._dev_null:
-            self._dev_null.close()
-            self._dev_null = None
+        self.flush()
+        if self._log_recorder:
+            self._log_recorder.close()
+            self._log_recorder = None
 
     def __del__(self):
-        if self._dev_null:
+        if getattr(self, "_log_recorder", None):
             self.close()
 
     #################################################################
@@ -239,7 +612,15 @@ class Console:
 
     def to_console(self, *messages, **kwargs):
         """Write only to the console and skip writing to the log."""
-        self._console_impl.print(*messages, **kwargs)
+        if self.is_plain and PlainTextConsole.can_print(messages, kwargs):
+            self._plain_impl.print(*messages, **kwargs)
+        else:
+            self._console_impl.print(*messages, **kwargs)
+
+    def flush(self):
+        """Flush any console output that has been buffered."""
+        if self.is_plain:
+            self._plain_impl.flush()
 
     def to_log(self, *messages, stack_offset=5, **kwargs):
         """Write only to the log and skip writing to the console."""
@@ -249,7 +630,7 @@ class Console:
 
     def export_log(self):
         """Export the text of the entire log; the log is also cleared."""
-        return self._log_impl.export_text()
+        return self._log_recorder.export_text()
 
     @staticmethod
     def dedent_and_wrap(text, wrap_width=80, border=0):
@@ -429,13 +810,17 @@ class Console:
                     )
                 prefix = f"[dim]\\[{prefix}][/dim] "
                 markup = True
-            for line in message.splitlines():
-                self.print(
-                    f"{self._context}{preface}{prefix}{line}",
-                    show=show,
-                    markup=markup,
-                    style=style,
-                )
+            # Print all the lines of the message with a single call; the cost of
+            # rendering to the console and log is largely per call, not per line.
+            self.print(
+                "\n".join(
+                    f"{self._context}{preface}{prefix}{line}"
+                    for line in message.splitlines()
+                ),
+                show=show,
+                markup=markup,
+                style=style,
+            )
 
     def debug(self, message="", *, preface="", prefix="", markup=False):
         """Log messages at debug level; included if verbosity >= 2."""
@@ -575,15 +960,22 @@ class Console:
                 with open(
                     log_filepath, "w", encoding="utf-8", errors="backslashreplace"
                 ) as log_file:
-                    log_file.write(self._build_log(command))
+                    self._write_log(command, log_file)
             except OSError as e:
                 self.error(f"Failed to save log to {log_filepath}: {e}")
             else:
                 self.warning(f"Log saved to {log_filepath}")
             self.to_console()
 
-    def _build_log(self, command) -> str:
-        """Accumulate all information to include in the log file."""
+    def _write_log(self, command, log_file):
+        """Write all information to include in the log file.
+
+        The content recorded by the log is streamed into the file, rather than being
+        accumulated in memory.
+
+        :param command: The command that was executed.
+        :param log_file: An open, writable text file.
+        """
         # Add the exception stacktraces to end of log if any were captured
         if self.stacktraces:
             # using print() instead of to_log() to avoid
@@ -631,9 +1023,9 @@ class Console:
         except OSError as e:
             pyproject_toml = str(e)
 
-        # Build log with buffered log from Rich
+        # Build log with recorded log from Rich
         uname = platform.uname()
-        return (
+        log_file.write(
             f"Date/Time:       {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
             f"Command line:    {' '.join(sys.argv)}\n"
             "\n"
@@ -666,8 +1058,8 @@ class Console:
             f"{pyproject_toml}\n"
             "\n"
             "Briefcase Log:\n"
-            f"{self.export_log()}"
         )
+        self._log_recorder.copy_to(log_file)
 
     #################################################################
     # Console controls
@@ -688,6 +1080,18 @@ class Console:
         # `sys.__stdout__` is used because Rich captures and redirects `sys.stdout`
         return sys.__stdout__ is not None and os.isatty(sys.__stdout__.fileno())
 
+    @property
+    def is_plain(self):
+        """Is console output being written as plain text?
+
+        Plain text output can be explicitly requested (e.g., with ``--plain``).
+        Otherwise, it is used when the session is non-interactive, and color isn't
+        being used, as there is no benefit to rendering output with Rich.
+        """
+        if self.plain is not None:
+            return self.plain
+        return not self.is_interactive and not self.is_color_enabled
+
     @property
     def is_color_enabled(self):
         """Is the underlying Rich console using color?
@@ -703,7 +1107,14 @@ class Console:
             return self._console_impl.color_system is not None
 
     def progress_bar(self):
-        """Returns a progress bar as a context manager."""
+        """Returns a progress bar as a context manager.
+
+        If console output is plain text, progress is reported as periodic lines of
+        text, rather than as a dynamic progress bar.
+        """
+        if self.is_plain:
+            return PlainProgress(console=self)
+
         return Progress(
             TextColumn("  "),
             SpinnerColumn("line", speed=1.5, style="default"),
@@ -739,7 +1150,7 @@ class Console:
             the message must already be escaped; defaults False.
         :returns:  Keep-alive spinner to notify user Briefcase is still waiting
         """
-        is_wait_bar_disabled = not self.is_interactive
+        is_wait_bar_disabled = not self.is_interactive or self.is_plain
         show_outcome_message = message and (is_wait_bar_disabled or not transient)
 
         if self._wait_bar is None:
@@ -805,6 +1216,7 @@ class Console:
         # Stop any active dynamic console elements
         if is_wait_bar_running:
             self._wait_bar.stop()
+        self.flush()
 
         self.is_console_controlled = False
         try:
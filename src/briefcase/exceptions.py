@@ -264,6 +264,7 @@ class MissingStubBinary(MissingPlatformSupport):
 
 class RequirementsInstallError(BriefcaseCommandError):
     def __init__(self, install_hint=""):
+        self.install_hint = install_hint
         super().__init__(
             f"""\
 Unable to install requirements. This may be because one of your
@@ -273,6 +274,13 @@ to the PyPI server.{install_hint}
         )
 
 
+class RequirementsUninstallError(BriefcaseCommandError):
+    def __init__(self):
+        super().__init__(
+            "Unable to uninstall requirements that have been removed from the app."
+        )
+
+
 class UnsupportedPythonVersion(BriefcaseCommandError):
     def __init__(self, version_specifier, running_version):
         super().__init__(
@@ -2,7 +2,9 @@ from . import (
     android_sdk,
     cookiecutter,
     docker,
+    executor,
     file,
+    file_watcher,
     flatpak,
     git,
     gnupg,
@@ -21,7 +23,9 @@ __all__ = [
     "android_sdk",
     "cookiecutter",
     "docker",
+    "executor",
     "file",
+    "file_watcher",
     "flatpak",
     "git",
     "gnupg",
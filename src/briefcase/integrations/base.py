@@ -31,6 +31,7 @@ if TYPE_CHECKING:
 
     from briefcase.integrations.android_sdk import AndroidSDK
     from briefcase.integrations.docker import Docker, DockerAppContext
+    from briefcase.integrations.executor import Executor
     from briefcase.integrations.file import File
     from briefcase.integrations.flatpak import Flatpak
     from briefcase.integrations.gnupg import GnuPG
@@ -156,6 +157,7 @@ class ToolCache(Mapping):
     android_sdk: AndroidSDK
     app_context: Subprocess | DockerAppContext
     docker: Docker
+    executor: Executor
     file: File
     flatpak: Flatpak
     gnupg: GnuPG
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import concurrent.futures
+import math
+import threading
+from pathlib import Path
+
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.base import Tool, ToolCache
+
+
+class Executor(Tool):
+    """A shared pool of worker threads for all the concurrent work Briefcase performs.
+
+    Work is submitted to one of two lanes. The CPU lane is for work that occupies a
+    CPU for the duration of the task (e.g., invoking a compiler, linker or code
+    signing tool, or hashing files); it is sized to the number of jobs. The I/O lane
+    is for work that spends most of its time waiting (e.g., network or filesystem
+    access); it is allowed to have more tasks in flight than there are CPUs.
+
+    A task running in a lane must not block waiting for other tasks submitted to the
+    same lane, as the lane may not have a free worker to run them.
+    """
+
+    name = "executor"
+    full_name = "Executor"
+
+    CPU = "cpu"
+    IO = "io"
+
+    # The environment variable that can be used to configure the number of jobs
+    JOBS_ENV_VAR = "BRIEFCASE_JOBS"
+    # The root of the cgroup filesystem on Linux
+    CGROUP_PATH = Path("/sys/fs/cgroup")
+
+    def __init__(self, tools: ToolCache, jobs: int | None = None, **kwargs):
+        super().__init__(tools=tools, **kwargs)
+        self.jobs = jobs
+        self._lanes: dict[str, tuple[int, concurrent.futures.ThreadPoolExecutor]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def verify_install(cls, tools: ToolCache, **kwargs) -> Executor:
+        """Make Executor available in tool cache."""
+        # short circuit since already verified and available
+        if hasattr(tools, "executor"):
+            return tools.executor
+
+        tools.executor = Executor(tools=tools)
+        return tools.executor
+
+    def cpu_count(self) -> int:
+        """Determine the number of CPUs that are available to this process.
+
+        This takes into account the CPU affinity of the process and, on Linux, any
+        CPU quota that has been imposed by the cgroup of the process (e.g., when
+        running in a container on a CI service).
+
+        :returns: The number of CPUs available; always at least 1.
+        """
+        if hasattr(self.tools.os, "process_cpu_count"):
+            count = self.tools.os.process_cpu_count()
+        elif hasattr(self.tools.os, "sched_getaffinity"):
+            count = len(self.tools.os.sched_getaffinity(0))
+        else:
+            count = self.tools.os.cpu_count()
+        count = count or 1
+
+        if self.tools.host_os == "Linux":
+            quota = self._cgroup_cpu_quota()
+            if quota is not None:
+                count = min(count, quota)
+
+        return max(count, 1)
+
+    def _cgroup_cpu_quota(self) -> int | None:
+        """Determine the CPU quota imposed by the cgroup of the current process.
+
+        :returns: The number of CPUs allowed by the quota (rounded up), or None if
+            no quota is in effect.
+        """
+        try:
+            # cgroup v2; the quota is "max" if the cgroup is unlimited.
+            quota, period = (self.CGROUP_PATH / "cpu.max").read_text().split()[:2]
+            if quota == "max":
+                return None
+        except (OSError, ValueError):
+            try:
+                # cgroup v1; the quota is -1 if the cgroup is unlimited.
+                quota = (self.CGROUP_PATH / "cpu/cpu.cfs_quota_us").read_text()
+                period = (self.CGROUP_PATH / "cpu/cpu.cfs_period_us").read_text()
+            except OSError:
+                return None
+
+        try:
+            quota = int(quota)
+            period = int(period)
+        except ValueError:
+            return None
+
+        if quota <= 0 or period <= 0:
+            return None
+        return max(math.ceil(quota / period), 1)
+
+    @property
+    def max_jobs(self) -> int:
+        """The maximum number of CPU-bound tasks that can run concurrently.
+
+        This is the number of jobs requested with ``--jobs``; or the value of the
+        ``BRIEFCASE_JOBS`` environment variable; or the number of CPUs available to
+        the process. In deep debug mode, all work is performed serially.
+        """
+        if self.tools.console.is_deep_debug:
+            return 1
+
+        if self.jobs is not None:
+            jobs = self.jobs
+        elif env_jobs := self.tools.os.environ.get(self.JOBS_ENV_VAR):
+            try:
+                jobs = int(env_jobs)
+            except ValueError:
+                jobs = 0
+            if jobs < 1:
+                raise BriefcaseCommandError(
+                    f"The value of {self.JOBS_ENV_VAR} ({env_jobs!r}) "
+                    "is not a positive integer."
+                )
+        else:
+            jobs = self.cpu_count()
+
+        return jobs
+
+    def lane_size(self, lane: str) -> int:
+        """The number of workers in a lane.
+
+        :param lane: The lane; one of ``Executor.CPU`` or ``Executor.IO``.
+        """
+        if lane == self.CPU:
+            return self.max_jobs
+        elif lane == self.IO:
+            # Use the same allowance for I/O-bound work as ThreadPoolExecutor,
+            # unless all work has been forced to be serial.
+            if self.tools.console.is_deep_debug:
+                return 1
+            return min(32, self.max_jobs + 4)
+        else:
+            raise ValueError(f"Unknown executor lane {lane!r}")
+
+    def lane(self, lane: str = CPU) -> concurrent.futures.ThreadPoolExecutor:
+        """Obtain the thread pool for a lane.
+
+        The pool is created on first use, and shared by all subsequent users. If the
+        size of the lane has changed since the pool was created (e.g., because the
+        verbosity has changed), a new pool is created.
+
+        :param lane: The lane; one of ``Executor.CPU`` or ``Executor.IO``.
+        :returns: The thread pool for the lane.
+        """
+        size = self.lane_size(lane)
+        with self._lock:
+            pool_size, pool = self._lanes.get(lane, (None, None))
+            if pool_size != size:
+                if pool is not None:
+                    pool.shutdown(wait=False)
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=size,
+                    thread_name_prefix=f"briefcase-{lane}",
+                )
+                self._lanes[lane] = (size, pool)
+        return pool
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Submit a CPU-bound task to the executor.
+
+        :param fn: The callable to invoke.
+        :param args: The positional arguments for the callable.
+        :param kwargs: The keyword arguments for the callable.
+        :returns: The future representing the task.
+        """
+        return self.lane(self.CPU).submit(fn, *args, **kwargs)
+
+    def submit_io(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        """Submit an I/O-bound task to the executor.
+
+        :param fn: The callable to invoke.
+        :param args: The positional arguments for the callable.
+        :param kwargs: The keyword arguments for the callable.
+        :returns: The future representing the task.
+        """
+        return self.lane(self.IO).submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down all lanes of the executor.
+
+        :param wait: Should the shutdown wait for running tasks to complete?
+        """
+        with self._lock:
+            for _, pool in self._lanes.values():
+                pool.shutdown(wait=wait)
+            self._lanes = {}
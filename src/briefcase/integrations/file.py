@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import hashlib
-import itertools
 import os
 import re
 import shutil
 import ssl
 import sys
 import tempfile
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from contextlib import suppress
 from email.message import Message
-from pathlib import Path
+from pathlib import Path, PurePath
 
 import httpx
 import truststore
@@ -31,6 +30,9 @@ RELATIVE_PATH_RE = re.compile(r"^\.{1,2}[\\/]")
 # We allow any fixed-length hash; SHAKE is variable length.
 SUPPORTED_HASH_ALGORITHMS = hashlib.algorithms_guaranteed - {"shake_128", "shake_256"}
 
+# The wildcard tokens in a single component of a glob pattern.
+GLOB_TOKENS = re.compile(r"\*+|\?|\[!?\]?[^\]]*\]")
+
 
 class File(Tool):
     name = "file"
@@ -73,38 +75,148 @@ class File(Tool):
         return sorted(paths, key=lambda p: (p.parent, p.is_dir(), p), reverse=True)
 
     @classmethod
-    def sorted_depth_first_groups(
-        cls,
-        paths: Sequence[Path],
-    ) -> Iterable[Iterable[Path]]:
-        """Convert a list of paths into a collection of groups that are all at the same
-        "level", grouped depth-first.
-
-        Subfolders in a folder will be in a separate group, returned *before* files in
-        the same folder.
-
-        :param paths: The list of paths return grouped.
-        :returns: A generator returning a iterable groups of paths that are all at the
-            same sorting level.
+    def _glob_part_regex(cls, part: str) -> str:
+        """Convert a single component of a glob pattern into a regular expression.
+
+        :param part: The path component, which may contain ``*``, ``?`` and
+            ``[...]`` wildcards.
+        :returns: A regular expression that matches the component, but won't match
+            across a path separator.
         """
-        # The sort function guarantees depth first ordering, with folders before files
-        # at the same level.
-        #
-        # The grouping key is based on the parent of the path (so that all objects in
-        # the same folder group together), with an additional discriminator to ensure
-        # that subfolders are in a different group to files.
-        #
-        # itertools.groupby guarantees a new group whenever the key changes; and the
-        # input sort order guarantees that directories come before files, so we get
-        # our desired sort grouping and ordering.
-        return (
-            group_paths
-            for _, group_paths in itertools.groupby(
-                cls.sorted_depth_first(paths),
-                lambda path: (path.parent, path.is_dir()),
+        regex = ""
+        position = 0
+        for match in GLOB_TOKENS.finditer(part):
+            regex += re.escape(part[position : match.start()])
+            token = match.group()
+            if token[0] == "*":
+                regex += "[^/]*"
+            elif token == "?":
+                regex += "[^/]"
+            else:
+                chars = token[1:-1]
+                negate = chars.startswith("!")
+                if negate:
+                    chars = chars[1:]
+                # Escape everything except ranges, so that no character in the
+                # set is interpreted as regular expression syntax.
+                chars = "".join(c if c == "-" else re.escape(c) for c in chars)
+                regex += f"(?!/)[{'^' if negate else ''}{chars}]"
+            position = match.end()
+        return regex + re.escape(part[position:])
+
+    @classmethod
+    def glob_matcher(cls, patterns: Iterable[str]) -> Callable[[str, bool], bool]:
+        """Compile a collection of glob patterns into a single matcher.
+
+        The patterns use the same syntax as :meth:`pathlib.Path.glob`; a pattern that
+        ends with ``**`` only matches directories.
+
+        :param patterns: The glob patterns, relative to the root of a tree.
+        :returns: A callable that accepts a path relative to the root of the tree
+            (using ``/`` as a separator), and whether that path is a directory; and
+            returns True if the path matches any of the patterns.
+        """
+        file_regexes = []
+        directory_regexes = []
+        for pattern in patterns:
+            parts = PurePath(pattern).parts
+            regex = "".join(
+                "(?:/[^/]+)*" if part == "**" else f"/{cls._glob_part_regex(part)}"
+                for part in parts
             )
+            if parts and parts[-1] == "**":
+                directory_regexes.append(regex)
+            else:
+                file_regexes.append(regex)
+
+        # Windows filesystems are case insensitive.
+        flags = re.IGNORECASE if sys.platform == "win32" else 0
+        file_match = (
+            re.compile("|".join(file_regexes), flags).fullmatch
+            if file_regexes
+            else lambda path: None
+        )
+        directory_match = (
+            re.compile("|".join(directory_regexes), flags).fullmatch
+            if directory_regexes
+            else lambda path: None
         )
 
+        def matcher(relative_path: str, is_dir: bool) -> bool:
+            path = f"/{relative_path}"
+            return bool(file_match(path) or (is_dir and directory_match(path)))
+
+        return matcher
+
+    def walk(
+        self,
+        root: Path,
+        visitors: Sequence[Callable[[str, os.DirEntry], bool | None]],
+    ):
+        """Visit every file and directory in a tree, in a single pass.
+
+        The tree is walked top-down, in lexical order, without following symbolic
+        links. Each path in the tree is passed to each visitor in turn, as a path
+        relative to the root (using ``/`` as a separator), and the
+        :class:`os.DirEntry` describing the path. If a visitor returns True, the path
+        has been removed; it isn't passed to any later visitors, and if it was a
+        directory, its content isn't visited.
+
+        :param root: The root of the tree. The root itself isn't visited.
+        :param visitors: The callables to invoke on each path in the tree.
+        """
+        pending = [("", root)]
+        while pending:
+            prefix, directory = pending.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                relative_path = f"{prefix}{entry.name}"
+                if any(visitor(relative_path, entry) for visitor in visitors):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((f"{relative_path}/", entry.path))
+
+            # Reverse the subdirectories, so they are descended in lexical order.
+            pending.extend(reversed(subdirectories))
+
+    @classmethod
+    def find_duplicates(cls, paths: Iterable[Path]) -> list[list[Path]]:
+        """Find the files that have identical content.
+
+        Files are grouped by size, and then by the SHA-256 digest of their content;
+        only files that have the same size as another file are read. Empty files, and
+        hard links to a file that has already been seen, are ignored.
+
+        :param paths: The regular files to compare.
+        :returns: The groups of files with identical content. Each group is in the
+            order in which the files were provided.
+        """
+        by_size = {}
+        inodes = set()
+        for path in paths:
+            stat = os.stat(path, follow_symlinks=False)
+            if stat.st_size and (stat.st_dev, stat.st_ino) not in inodes:
+                inodes.add((stat.st_dev, stat.st_ino))
+                by_size.setdefault(stat.st_size, []).append(path)
+
+        by_digest = {}
+        for size, candidates in by_size.items():
+            if len(candidates) > 1:
+                for path in candidates:
+                    digest = hashlib.sha256()
+                    with Path(path).open("rb") as f:
+                        while chunk := f.read(1024 * 1024):
+                            digest.update(chunk)
+                    by_digest.setdefault((size, digest.digest()), []).append(path)
+
+        return [group for group in by_digest.values() if len(group) > 1]
+
     @property
     def ssl_context(self):
         """The SSL context to use for downloads."""
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import sys
+import time
+from collections.abc import Iterable
+from contextlib import suppress
+from pathlib import Path
+
+
+class Inotify:
+    """A minimal interface to the Linux inotify API.
+
+    This is only used to be notified that *something* has changed in a watched
+    directory; the events themselves aren't interpreted.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+
+    MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+    )
+
+    def __init__(self, libc, fd: int):
+        self.libc = libc
+        self.fd = fd
+
+    @classmethod
+    def create(cls) -> Inotify | None:
+        """Create an inotify instance.
+
+        :returns: The inotify instance, or None if inotify isn't available.
+        """
+        if sys.platform != "linux":
+            return None
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def add_watch(self, path: Path) -> bool:
+        """Watch a file or directory for changes.
+
+        :param path: The path to watch.
+        :returns: True if the watch was added.
+        """
+        return self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK) >= 0
+
+    def wait(self, timeout: float | None) -> bool:
+        """Wait for a change to be reported.
+
+        Any events that have been reported are discarded.
+
+        :param timeout: The maximum time to wait, in seconds; or None to wait
+            indefinitely.
+        :returns: True if a change was reported.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+
+        with suppress(BlockingIOError):
+            while os.read(self.fd, 65536):
+                pass
+        return True
+
+    def close(self):
+        """Stop watching for changes."""
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Detect changes to the files in a collection of paths.
+
+    Changes are detected by comparing the modification time and size of every file
+    with a snapshot. On Linux, inotify is used to avoid taking a snapshot until there
+    is some activity in the watched paths; elsewhere, a snapshot is taken
+    periodically.
+    """
+
+    # How often to look for changes when polling, in seconds.
+    POLL_INTERVAL = 0.5
+    # How long the watched paths must be free of changes before a change is
+    # reported, in seconds; this turns a burst of changes into a single change.
+    DEBOUNCE_INTERVAL = 0.2
+    # Directories that never contain files of interest.
+    IGNORED_DIRS = frozenset({"__pycache__"})
+
+    def __init__(self, paths: Iterable[Path], use_inotify: bool = True):
+        """
+        :param paths: The files and directories to watch.
+        :param use_inotify: Should inotify be used, if it is available?
+        """
+        self.paths = list(paths)
+        # Has a change been detected that hasn't been reported by ``wait()``?
+        self.pending = False
+        self._last_poll = 0.0
+
+        self.inotify = Inotify.create() if use_inotify else None
+        self.snapshot = self._scan()
+
+    def _ignored(self, name: str) -> bool:
+        """Should a file or directory be ignored?
+
+        Hidden files (e.g., editor swap files) and cache directories are ignored.
+
+        :param name: The name of the file or directory.
+        """
+        return name.startswith(".") or name in self.IGNORED_DIRS
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Take a snapshot of the watched paths.
+
+        If inotify is in use, every directory that is found is watched; watching a
+        directory that is already being watched has no effect.
+
+        :returns: The modification time and size of every file, keyed by path.
+        """
+        snapshot = {}
+        directories = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_dir():
+                directories.append(os.fspath(path))
+            else:
+                snapshot[os.fspath(path)] = (stat.st_mtime_ns, stat.st_size)
+                if self.inotify:
+                    self._add_watch(path)
+
+        while directories:
+            directory = directories.pop()
+            if self.inotify:
+                self._add_watch(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if self._ignored(entry.name):
+                            continue
+                        try:
+                            if entry.is_dir():
+                                directories.append(entry.path)
+                            else:
+                                stat = entry.stat()
+                                snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                        except OSError:
+                            # The entry was deleted while scanning
+                            pass
+            except OSError:
+                pass
+
+        return snapshot
+
+    def _add_watch(self, path):
+        """Watch a path with inotify; falling back to polling if that isn't possible.
+
+        :param path: The path to watch.
+        """
+        if not self.inotify.add_watch(path):
+            # The most likely cause is running out of inotify watches.
+            self.inotify.close()
+            self.inotify = None
+
+    def changed(self) -> bool:
+        """Determine whether the watched paths have changed, without blocking.
+
+        :returns: True if a change has been detected since the last change was
+            reported by ``wait()``.
+        """
+        if not self.pending:
+            if self.inotify:
+                if not self.inotify.wait(timeout=0):
+                    return False
+            else:
+                now = time.monotonic()
+                if now - self._last_poll < self.POLL_INTERVAL:
+                    return False
+                self._last_poll = now
+
+            self.pending = self._scan() != self.snapshot
+
+        return self.pending
+
+    def wait(self) -> set[str]:
+        """Wait for the watched paths to change.
+
+        Once a change has been detected, this waits until the watched paths have been
+        free of changes for ``DEBOUNCE_INTERVAL``.
+
+        :returns: The paths that have been added, modified or deleted.
+        """
+        while True:
+            if not self.pending:
+                if self.inotify:
+                    self.inotify.wait(timeout=None)
+                else:
+                    time.sleep(self.POLL_INTERVAL)
+
+            # Wait for the burst of changes to end.
+            if self.inotify:
+                while self.inotify.wait(timeout=self.DEBOUNCE_INTERVAL):
+                    pass
+                snapshot = self._scan()
+            else:
+                snapshot = self._scan()
+                while True:
+                    time.sleep(self.DEBOUNCE_INTERVAL)
+                    previous, snapshot = snapshot, self._scan()
+                    if snapshot == previous:
+                        break
+
+            self.pending = False
+            changes = {
+                path
+                for path in self.snapshot.keys() | snapshot.keys()
+                if self.snapshot.get(path) != snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if changes:
+                return changes
+
+    def close(self):
+        """Stop watching for changes."""
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
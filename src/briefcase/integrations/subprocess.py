@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import json
 import operator
@@ -120,6 +121,10 @@ def ensure_console_is_safe(sub_method):
         :param args: command line to run in subprocess
         :returns: the return value for the Subprocess method
         """
+        # Ensure any buffered console output is written before the command can
+        # write to the console itself.
+        sub.tools.console.flush()
+
         # Just run the command if no dynamic elements are active
         if not sub.tools.console.is_console_controlled:
             return sub_method(sub, args, *wrapped_args, **wrapped_kwargs)
@@ -148,6 +153,9 @@ def ensure_console_is_safe(sub_method):
 
 
 class PopenOutputStreamer(threading.Thread):
+    # The maximum number of lines of output that will be batched before printing
+    BATCH_SIZE = 1000
+
     def __init__(
         self,
         label: str,
@@ -155,6 +163,7 @@ class PopenOutputStreamer(threading.Thread):
         console: Console,
         capture_output: bool = False,
         filter_func: Callable[[str], Iterator[str]] | None = None,
+        batch_interval: float | None = None,
     ):
         """Thread for streaming stdout for a Popen process.
 
@@ -165,6 +174,12 @@ class PopenOutputStreamer(threading.Thread):
             ``queue.Queue`` instead of printing to console
         :param filter_func: a callable that will be invoked on every line of output
             that is streamed; see ``Subprocess.stream_output`` for details
+        :param batch_interval: If provided, output lines are accumulated and printed
+            as a single batch at most every ``batch_interval`` seconds (or when
+            ``BATCH_SIZE`` lines have accumulated). The owner of the streamer is
+            responsible for calling ``flush()`` periodically so that output isn't
+            held back while the process is idle. By default, every line is printed
+            as soon as it is read.
         """
         super().__init__(name=f"{label} output streamer", daemon=True)
 
@@ -172,11 +187,16 @@ class PopenOutputStreamer(threading.Thread):
         self.console = console
         self.capture_output = capture_output
         self.filter_func = filter_func
+        self.batch_interval = batch_interval
 
         # arbitrarily large maxsize to prevent unbounded memory use if things go south
         self.output_queue = queue.Queue(maxsize=10_000_000)
         self.stop_flag = threading.Event()
 
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
     def run(self):
         """Stream output for a Popen process."""
         try:
@@ -192,8 +212,10 @@ class PopenOutputStreamer(threading.Thread):
                     for filtered_line in filtered_output:
                         if self.capture_output:
                             self.output_queue.put_nowait(filtered_line)
-                        else:
+                        elif self.batch_interval is None:
                             self.console.info(filtered_line)
+                        else:
+                            self._batch(filtered_line)
 
                     if stop_streaming:
                         self.stop_flag.set()
@@ -202,8 +224,41 @@ class PopenOutputStreamer(threading.Thread):
                     break
         except Exception as e:  # noqa: BLE001
             # Report *any* error in the process.
+            self.flush()
             self.console.error(f"Error while streaming output: {type(e).__name__}: {e}")
             self.console.capture_stacktrace("Output thread")
+        finally:
+            self.flush()
+
+    def _batch(self, line: str):
+        """Add a line of output to the pending batch, printing the batch if it is
+        large enough, or old enough.
+
+        :param line: The line of output to print.
+        """
+        with self._pending_lock:
+            self._pending.append(line.removesuffix("\n"))
+            flush = (
+                len(self._pending) >= self.BATCH_SIZE
+                or time.monotonic() - self._last_flush >= self.batch_interval
+            )
+        if flush:
+            self.flush()
+
+    def flush(self):
+        """Print any batched output that hasn't been printed yet.
+
+        Printing a batch of lines with a single call to the console is much faster
+        than printing each line individually, as the cost of rendering output to the
+        console and log is largely per call, rather than per line.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            # The batch is printed while holding the lock so that concurrent flushes
+            # can't reorder output.
+            if pending:
+                self.console.info("".join(f"{line}\n" for line in pending))
 
     def request_stop(self):
         """Set the stop flag to cause the streamer to exit.
@@ -674,6 +729,199 @@ class Subprocess(Tool):
             self._log_return_code(0)
         return cmd_output
 
+    def run_many(
+        self,
+        commands: Sequence[SubprocessArgsT],
+        *,
+        check: bool = False,
+        fail_fast: bool = True,
+        quiet: int = 0,
+        max_workers: int | None = None,
+        progress: str | None = None,
+        on_complete: Callable[[int, CompletedProcess], None] | None = None,
+        **kwargs,
+    ) -> list[CompletedProcess]:
+        """Run a collection of independent commands concurrently.
+
+        Each command is run as if by ``subprocess.run()``, using the same keyword
+        arguments. The output of each command is always captured; if ``stderr`` isn't
+        explicitly redirected, it is sent to ``stdout``. The command line, output and
+        return code of each command are logged in the order the commands were
+        provided, regardless of the order in which they complete. If a command can't be
+        run at all (e.g., because the executable doesn't exist), the error is raised
+        regardless of ``check``, once every command that completed has been logged.
+
+        The commands are run in the CPU lane of the shared executor, so the number of
+        commands that run at the same time is limited by the number of jobs (see
+        ``--jobs``). In deep debug mode, commands are always run one at a time.
+
+        :param commands: The command lines to run.
+        :param check: Should a non-zero return code raise ``CalledProcessError``? If
+            True, the error for the first failing command (in the order the commands
+            were provided) is raised once no commands are running.
+        :param fail_fast: If ``check`` is True, should a failure stop any commands
+            that haven't started yet? If False, all commands are run to completion
+            before the error is raised.
+        :param quiet: The quietness level of the commands, as for ``check_output()``.
+        :param max_workers: An additional limit on the number of commands from this
+            batch that can run concurrently.
+        :param progress: If provided, a progress bar will be displayed with this
+            description while the commands run.
+        :param on_complete: A callable that will be invoked (in the calling thread)
+            with the index and result of each command as it completes.
+        :param kwargs: keyword args for ``subprocess.run()``
+        :returns: A ``CompletedProcess`` for each command, in the order the commands
+            were provided. If a failure stops commands from starting, the result for
+            those commands will be ``None``.
+        """
+        kwargs["stdout"] = subprocess.PIPE
+        # if stderr isn't explicitly redirected, then send it to stdout.
+        kwargs.setdefault("stderr", subprocess.STDOUT)
+        final_kwargs = self.final_kwargs(**kwargs)
+
+        results: list[CompletedProcess | None] = [None] * len(commands)
+        # Commands that couldn't be run (e.g., because the executable doesn't
+        # exist), keyed by the index of the command.
+        errors: dict[int, OSError | subprocess.SubprocessError] = {}
+        logged = 0
+
+        def log_completed(force: bool = False):
+            # Log results in the order commands were provided; unless forced, stop
+            # at the first command that hasn't completed.
+            nonlocal logged
+            while logged < len(commands):
+                result = results[logged]
+                if result is not None:
+                    self._log_result(commands[logged], result, quiet=quiet, **kwargs)
+                elif logged in errors:
+                    # As for run(), log the command that couldn't be run.
+                    if quiet < 2:
+                        self._log_command(commands[logged])
+                        self._log_cwd(kwargs.get("cwd"))
+                        self._log_environment(kwargs.get("env"))
+                elif not force:
+                    break
+                logged += 1
+
+        def collect(future: concurrent.futures.Future, index: int) -> bool:
+            # Record the outcome of a command; returns True if it failed.
+            try:
+                results[index] = future.result()
+            except (OSError, subprocess.SubprocessError) as e:
+                errors[index] = e
+                return True
+            return bool(results[index].returncode)
+
+        # Submit commands to the shared executor, keeping no more than max_workers
+        # of this batch in flight at any one time.
+        pending = iter(enumerate(commands))
+        running: dict[concurrent.futures.Future, int] = {}
+
+        def submit_next():
+            for index, args in pending:
+                future = self.tools.executor.submit(
+                    self._subprocess.run, [str(arg) for arg in args], **final_kwargs
+                )
+                running[future] = index
+                break
+
+        progress_bar = self.tools.console.progress_bar() if progress else None
+        task_id = (
+            progress_bar.add_task(progress, total=len(commands)) if progress else 0
+        )
+        with progress_bar or contextlib.nullcontext():
+            try:
+                for _ in range(max_workers or len(commands)):
+                    submit_next()
+
+                stopped = False
+                while running and not stopped:
+                    done, _ = concurrent.futures.wait(
+                        running, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        index = running.pop(future)
+                        failed = collect(future, index)
+                        if progress_bar:
+                            progress_bar.update(task_id, advance=1)
+                        if on_complete and index not in errors:
+                            on_complete(index, results[index])
+                        # A command that couldn't be run is always an error.
+                        if fail_fast and failed and (check or index in errors):
+                            stopped = True
+                        # Other commands in the same batch of completions mustn't
+                        # start new commands once the batch has been stopped.
+                        if not stopped:
+                            submit_next()
+                    log_completed()
+            finally:
+                # Don't start anything new if there has been a failure; but wait for
+                # any commands that have already started.
+                for future in running:
+                    future.cancel()
+                concurrent.futures.wait(running)
+
+        # Retain the results of commands that were already running when a failure
+        # stopped the batch.
+        for future, index in running.items():
+            if not future.cancelled():
+                collect(future, index)
+        log_completed(force=True)
+
+        # Raise the first error, in the order the commands were provided.
+        for index, (args, result) in enumerate(zip(commands, results, strict=True)):
+            if index in errors:
+                raise errors[index]
+            if check and result is not None and result.returncode:
+                error = subprocess.CalledProcessError(
+                    result.returncode,
+                    args,
+                    output=result.stdout,
+                    stderr=result.stderr,
+                )
+                if quiet == 0 and self.tools.console.verbosity < LogLevel.DEBUG:
+                    self.output_error(error)
+                raise error
+
+        return results
+
+    def check_output_many(
+        self,
+        commands: Sequence[SubprocessArgsT],
+        *,
+        fail_fast: bool = True,
+        quiet: int = 0,
+        max_workers: int | None = None,
+        progress: str | None = None,
+        **kwargs,
+    ) -> list[str]:
+        """Run a collection of independent commands concurrently, returning the output
+        of each command.
+
+        This is the concurrent analog of ``check_output()``; see ``run_many()`` for
+        details of how the commands are run and logged.
+
+        :param commands: The command lines to run.
+        :param fail_fast: Should a failure stop any commands that haven't started yet?
+        :param quiet: The quietness level of the commands, as for ``check_output()``.
+        :param max_workers: The maximum number of commands to run concurrently.
+        :param progress: If provided, a progress bar will be displayed with this
+            description while the commands run.
+        :param kwargs: keyword args for ``subprocess.run()``
+        :raises CalledProcessError: if any command returns a non-zero return code.
+        :returns: The output of each command, in the order the commands were provided.
+        """
+        results = self.run_many(
+            commands,
+            check=True,
+            fail_fast=fail_fast,
+            quiet=quiet,
+            max_workers=max_workers,
+            progress=progress,
+            **kwargs,
+        )
+        return [result.stdout for result in results]
+
     def parse_output(
         self,
         output_parser: Callable[[str], ParserOutputT],
@@ -763,6 +1011,7 @@ class Subprocess(Tool):
             popen_process=popen_process,
             console=self.tools.console,
             filter_func=filter_func,
+            batch_interval=0.1,
         )
         try:
             output_streamer.start()
@@ -770,7 +1019,10 @@ class Subprocess(Tool):
             # instability of thread interruption via CTRL+C (#809)
             while not stop_func() and output_streamer.is_alive():
                 time.sleep(0.1)
+                # Print any output that has been batched by the streamer.
+                output_streamer.flush()
         except KeyboardInterrupt:
+            output_streamer.flush()
             self.tools.console.info("Stopping...")
             # allow time for CTRL+C to propagate to the child process
             time.sleep(0.25)
@@ -781,6 +1033,7 @@ class Subprocess(Tool):
             streamer_deadline = time.time() + 3
             while output_streamer.is_alive() and time.time() < streamer_deadline:
                 time.sleep(0.1)
+            output_streamer.flush()
             if output_streamer.is_alive():
                 self.tools.console.error(
                     "Log stream hasn't terminated; log output may be corrupted."
@@ -884,6 +1137,17 @@ class Subprocess(Tool):
             for line in ensure_str(stderr).splitlines():
                 handler(f"    {line}")
 
+    def _log_result(
+        self, args: SubprocessArgsT, result: CompletedProcess, quiet=0, **kwargs
+    ):
+        """Log the details of a command that has been executed."""
+        if quiet < 2:
+            self._log_command(args)
+            self._log_cwd(kwargs.get("cwd"))
+            self._log_environment(kwargs.get("env"))
+            self._log_output(result.stdout, result.stderr)
+            self._log_return_code(result.returncode)
+
     def _log_return_code(self, return_code: int | str, handler=None):
         """Log the output value of the executed command."""
         if handler is None:
@@ -1,17 +1,58 @@
+import hashlib
+import json
+import os
+import shutil
 import subprocess
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
 
 from briefcase.config import FinalizedAppConfig
-from briefcase.exceptions import RequirementsInstallError
+from briefcase.exceptions import RequirementsInstallError, RequirementsUninstallError
 from briefcase.integrations.base import ToolCache
 from briefcase.integrations.subprocess import SubprocessArgsT
 
 
+def link_or_copy(src, dst):
+    """Hard link a file; or copy it if a link can't be created.
+
+    Links can't be created between filesystems, or on filesystems that don't support
+    them.
+
+    :param src: The file to link.
+    :param dst: The path of the link.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def output_kwargs(output_prefix: str | None) -> dict:
+    """The keyword arguments that label each line of the streamed output of a command.
+
+    :param output_prefix: The label for the output; or `None` if the output shouldn't
+        be labeled.
+    :returns: The keyword arguments to pass to `Subprocess.run()`.
+    """
+    if output_prefix is None:
+        return {}
+
+    def filter_func(line):
+        yield f"[{output_prefix}] {line}"
+
+    return {"filter_func": filter_func}
+
+
 class VirtualEnvironment(ABC):
     """A managed Python environment."""
 
+    # The file in an environment template that describes the template.
+    TEMPLATE_MARKER = "briefcase-template.json"
+    TEMPLATE_VERSION = 1
+
     env_type: str = "?"
     provides_python: bool = False
 
@@ -99,6 +140,172 @@ class VirtualEnvironment(ABC):
     def clean(self) -> None:
         """Remove the on-disk state associated with this environment."""
 
+    # -- Environment templates ----------------------------------------------
+
+    @property
+    def template_path(self) -> Path:
+        """The template that new environments are cloned from.
+
+        Templates are cached in the Briefcase data directory. There is a template for
+        each type of environment and each Python interpreter that runs Briefcase.
+        """
+        interpreter = hashlib.sha256(
+            f"{sys.executable}\n{sys.version}".encode()
+        ).hexdigest()[:16]
+        return self.tools.base_path / "environments" / f"{self.env_type}-{interpreter}"
+
+    @abstractmethod
+    def create(self, path: Path):
+        """Create a new environment from scratch.
+
+        This is used to create environment templates, and environments that can't be
+        cloned from a template.
+
+        :param path: The path where the environment should be created.
+        :raises BriefcaseCommandError: if the environment can't be created.
+        """
+
+    def template_relocations(self, path: Path) -> list[str] | None:
+        """Find the files in a new template that must be updated when the template is
+        cloned.
+
+        :param path: The path of the template.
+        :returns: The paths, relative to the template, of the text files that contain
+            the path of the template; or `None` if the template can't be cloned,
+            because the path of the template is referenced in a way that can't be
+            updated.
+        """
+        origin = os.fsencode(path)
+        relocations = []
+        for dir_path, dir_names, file_names in os.walk(path):
+            # Bytecode isn't cloned; it is regenerated as needed.
+            dir_names[:] = [name for name in dir_names if name != "__pycache__"]
+            for name in dir_names + file_names:
+                file_path = Path(dir_path) / name
+                if file_path.is_symlink():
+                    if origin in os.fsencode(os.readlink(file_path)):
+                        return None
+                elif name in file_names:
+                    content = file_path.read_bytes()
+                    if origin in content:
+                        if b"\0" in content:
+                            return None
+                        relocations.append(file_path.relative_to(path).as_posix())
+        return sorted(relocations)
+
+    def template(self) -> dict | None:
+        """Ensure the template for the environment exists.
+
+        The template is created in a temporary location, and then moved into place,
+        so that Briefcase processes running in parallel don't use an incomplete
+        template.
+
+        :returns: The description of the template; or `None` if environments can't
+            be cloned from the template.
+        :raises BriefcaseCommandError: if the template can't be created.
+        :raises OSError: if the template can't be written.
+        """
+        template_path = self.template_path
+        marker_path = template_path / self.TEMPLATE_MARKER
+        retry = False
+        while True:
+            try:
+                with marker_path.open(encoding="utf-8") as f:
+                    template = json.load(f)
+                if template["version"] == self.TEMPLATE_VERSION:
+                    return template if template["relocate"] is not None else None
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+            # The template doesn't exist, or is incomplete.
+            if template_path.exists():
+                shutil.rmtree(template_path)
+
+            if retry:
+                # Another process created a template that can't be read.
+                return None
+
+            template_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = template_path.with_name(f"{template_path.name}.{os.getpid()}")
+            if temp_path.exists():
+                shutil.rmtree(temp_path)
+            try:
+                self.create(temp_path)
+                template = {
+                    "version": self.TEMPLATE_VERSION,
+                    "origin": os.fspath(temp_path),
+                    "relocate": self.template_relocations(temp_path),
+                }
+                (temp_path / self.TEMPLATE_MARKER).write_text(
+                    json.dumps(template, indent=4), encoding="utf-8"
+                )
+                try:
+                    temp_path.rename(template_path)
+                except OSError:
+                    # Another process created the template first; use that template.
+                    retry = True
+                    continue
+                return template if template["relocate"] is not None else None
+            finally:
+                if temp_path.exists():
+                    shutil.rmtree(temp_path, ignore_errors=True)
+
+    def clone(self, template: dict):
+        """Create the environment as a copy of the template.
+
+        Files are hard linked to the template where possible. Files that reference
+        the location of the template are copied, and updated to reference the
+        location of the environment.
+
+        :param template: The description of the template.
+        :raises OSError: if the template can't be copied.
+        """
+        template_path = self.template_path
+        shutil.copytree(
+            template_path,
+            self.venv_path,
+            symlinks=True,
+            ignore=shutil.ignore_patterns(self.TEMPLATE_MARKER, "__pycache__"),
+            copy_function=link_or_copy,
+        )
+
+        origin = os.fsencode(template["origin"])
+        target = os.fsencode(self.venv_path)
+        for name in template["relocate"]:
+            path = self.venv_path / name
+            content = (template_path / name).read_bytes().replace(origin, target)
+            # The file is a link to the template, which mustn't be modified.
+            path.unlink()
+            path.write_bytes(content)
+            shutil.copymode(template_path / name, path)
+
+    def create_environment(self):
+        """Create the environment.
+
+        The environment is cloned from the template for the environment type; the
+        template is created if it doesn't exist. If the template can't be used, the
+        environment is created from scratch.
+
+        :raises BriefcaseCommandError: if the environment can't be created.
+        """
+        self.venv_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            template = self.template()
+        except OSError as e:
+            self.tools.console.debug(f"Unable to create environment template: {e}")
+            template = None
+
+        if template is not None:
+            try:
+                self.clone(template)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                self.tools.console.debug(f"Unable to clone environment template: {e}")
+
+        if self.venv_path.exists():
+            shutil.rmtree(self.venv_path)
+        self.create(self.venv_path)
+
     def platform_tag(self, min_os_version: str | None):
         if self.platform == "macOS":
             min_os_tag = (min_os_version or "11.0").replace(".", "_")
@@ -120,6 +327,7 @@ class VirtualEnvironment(ABC):
         min_os_version: str | None = None,
         extra_installer_args: list[str] | None = None,
         install_hint: str = "",
+        output_prefix: str | None = None,
     ):
         """Install requirements into the environment with pip.
 
@@ -136,6 +344,8 @@ class VirtualEnvironment(ABC):
             installer.
         :param install_hint: If an install fails, an additional context-specific hint
             that can be displayed to the user.
+        :param output_prefix: If provided, each line of output from the installer is
+            labeled with this prefix.
         """
         install_reqs = []
         for req in requires:
@@ -219,10 +429,183 @@ class VirtualEnvironment(ABC):
                 check=True,
                 encoding="UTF-8",
                 env=env,
+                **output_kwargs(output_prefix),
             )
         except subprocess.CalledProcessError as e:
             raise RequirementsInstallError(install_hint=install_hint) from e
 
+    @property
+    def lock_target(self) -> str:
+        """The name used for installs into this environment in a requirements
+        lockfile."""
+        return (
+            f"cp{sys.version_info.major}{sys.version_info.minor}"
+            f"-{self.platform or self.tools.host_os}"
+            f"-{self.arch or self.tools.host_arch}"
+        )
+
+    def direct_reference(self, url: str) -> dict:
+        """Describe the location of a package that was resolved from a direct
+        reference.
+
+        Local paths are recorded relative to the root of the project, so that the
+        pinned requirements can be used in any checkout of the project.
+
+        :param url: The URL of the package.
+        :returns: The keys to add to the pinned requirement: a ``path`` relative to
+            the project (using ``/``) for a local file or directory; or the ``url``
+            for anything else.
+        """
+        if urlsplit(url).scheme == "file":
+            path = Path(url2pathname(urlsplit(url).path))
+            try:
+                return {
+                    "path": os.path.relpath(path, self.base_path).replace(os.sep, "/")
+                }
+            except ValueError:
+                # The path is on a different drive to the project.
+                pass
+        return {"url": url}
+
+    def resolve_requirements(
+        self,
+        requires: list[str],
+        require_binary: bool = False,
+        min_os_version: str | None = None,
+        extra_installer_args: list[str] | None = None,
+        install_hint: str = "",
+    ) -> list[dict]:
+        """Resolve requirements into the exact packages that would be installed.
+
+        The requirements are resolved with `pip install --dry-run --report`, targeting
+        the platform of the environment. Nothing is installed.
+
+        This should be overridden by subclasses if the environment uses a tool
+        other than `pip` to install requirements.
+
+        :param requires: The list of requirements to resolve.
+        :param require_binary: Should binary wheels be required?
+        :param min_os_version: The minimum OS version to enforce on packages.
+        :param extra_installer_args: A list of additional arguments to pass to the
+            installer.
+        :param install_hint: If the requirements can't be resolved, an additional
+            context-specific hint that can be displayed to the user.
+        :returns: The pinned requirements, in the format used by `RequirementsLock`.
+        """
+        resolve_args = []
+        if platform_tag := self.platform_tag(min_os_version):
+            resolve_args.extend(["--platform", platform_tag])
+
+        if require_binary:
+            resolve_args.extend(["--only-binary", ":all:"])
+
+        if self.platform in {"iphoneos", "iphonesimulator"}:
+            resolve_args.extend(
+                [
+                    "--extra-index-url",
+                    "https://pypi.anaconda.org/beeware/simple",
+                ]
+            )
+            env = {"PYTHONPATH": str(self.platform_path)}
+        else:
+            env = None
+
+        if extra_installer_args:
+            resolve_args.extend(
+                self.tools.file.resolve_relative_args(
+                    extra_installer_args,
+                    self.base_path,
+                )
+            )
+
+        try:
+            report = json.loads(
+                self.tools[self.app].app_context.check_output(
+                    [
+                        sys.executable,
+                        "-u",
+                        "-X",
+                        "utf8",
+                        "-m",
+                        "pip",
+                        "--python",
+                        self.executable,
+                        "install",
+                        "--disable-pip-version-check",
+                        "--no-user",
+                        "--dry-run",
+                        "--ignore-installed",
+                        "--quiet",
+                        "--report",
+                        "-",
+                        *resolve_args,
+                        *requires,
+                    ],
+                    encoding="UTF-8",
+                    env=env,
+                )
+            )
+        except (subprocess.CalledProcessError, ValueError) as e:
+            raise RequirementsInstallError(install_hint=install_hint) from e
+
+        packages = []
+        for item in report["install"]:
+            package = {
+                "name": item["metadata"]["name"],
+                "version": item["metadata"]["version"],
+            }
+
+            download_info = item["download_info"]
+            if item.get("is_direct"):
+                if vcs_info := download_info.get("vcs_info"):
+                    package["url"] = (
+                        f"{vcs_info['vcs']}+{download_info['url']}"
+                        f"@{vcs_info['commit_id']}"
+                    )
+                else:
+                    package.update(self.direct_reference(download_info["url"]))
+
+            # Local directories and repositories can't be hashed.
+            if hashes := download_info.get("archive_info", {}).get("hashes"):
+                package["hashes"] = [
+                    f"{name}:{value}" for name, value in sorted(hashes.items())
+                ]
+
+            packages.append(package)
+
+        return sorted(packages, key=lambda package: package["name"].lower())
+
+    def uninstall_requirements(self, names: list[str]):
+        """Uninstall packages from the environment with pip.
+
+        This should be overridden by subclasses if the environment uses a tool
+        other than `pip` to install requirements.
+
+        :param names: The names of the packages to uninstall.
+        """
+        try:
+            self.tools[self.app].app_context.run(
+                [
+                    sys.executable,
+                    "-u",
+                    "-X",
+                    "utf8",
+                    "-m",
+                    "pip",
+                    "--python",
+                    self.executable,
+                    "uninstall",
+                    "--disable-pip-version-check",
+                    "--yes",
+                    *(["-vv"] if self.tools.console.is_deep_debug else []),
+                    *names,
+                ],
+                check=True,
+                encoding="UTF-8",
+            )
+        except subprocess.CalledProcessError as e:
+            raise RequirementsUninstallError() from e
+
     # -- Process management -------------------------------------------------
 
     @abstractmethod
@@ -6,10 +6,17 @@ from pathlib import Path
 
 from packaging.version import Version
 
-from briefcase.exceptions import BriefcaseCommandError, RequirementsInstallError
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    RequirementsInstallError,
+    RequirementsUninstallError,
+)
 from briefcase.integrations.base import ToolCache
 from briefcase.integrations.subprocess import SubprocessArgsT
-from briefcase.integrations.virtual_environment.base import VirtualEnvironment
+from briefcase.integrations.virtual_environment.base import (
+    VirtualEnvironment,
+    output_kwargs,
+)
 
 
 class CondaVirtualEnvironment(VirtualEnvironment):
@@ -102,26 +109,7 @@ active Conda environment.
             if recreate:
                 self.clean()
 
-            self.venv_path.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                self.tools.subprocess.run(
-                    [
-                        self.conda_exe,
-                        "create",
-                        "--prefix",
-                        self.venv_path,
-                        "--yes",
-                        *(["--quiet"] if not self.tools.console.is_verbose else []),
-                        f"python={self.python_version}",
-                        "pip",
-                    ],
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                raise BriefcaseCommandError(
-                    f"Failed to create Conda environment at {self.venv_path}"
-                ) from e
+            self.create_environment()
 
             try:
                 self.tools.subprocess.run(
@@ -144,6 +132,78 @@ active Conda environment.
 
         return True
 
+    def create(self, path: Path):
+        """Create a new conda environment.
+
+        :param path: The path where the environment should be created.
+        :raises BriefcaseCommandError: if the environment can't be created.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.tools.subprocess.run(
+                [
+                    self.conda_exe,
+                    "create",
+                    "--prefix",
+                    path,
+                    "--yes",
+                    *(["--quiet"] if not self.tools.console.is_verbose else []),
+                    f"python={self.python_version}",
+                    "pip",
+                ],
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise BriefcaseCommandError(
+                f"Failed to create Conda environment at {path}"
+            ) from e
+
+    @property
+    def template_path(self) -> Path:
+        """The template that new environments are cloned from.
+
+        Conda provides the Python interpreter, so there is a template for each
+        version of Python.
+        """
+        return self.tools.base_path / "environments" / f"conda-{self.python_version}"
+
+    def template_relocations(self, path: Path) -> list[str]:
+        """Conda updates references to the location of the environment when an
+        environment is cloned, so no files need to be updated by Briefcase.
+
+        :param path: The path of the template.
+        :returns: An empty list.
+        """
+        return []
+
+    def clone(self, template: dict):
+        """Create the environment as a copy of the template with `conda create
+        --clone`.
+
+        Conda links packages from its package cache, so the template can only be
+        cloned if the packages in the template are still in the cache.
+
+        :param template: The description of the template.
+        :raises subprocess.CalledProcessError: if the template can't be cloned.
+        """
+        self.tools.subprocess.run(
+            [
+                self.conda_exe,
+                "create",
+                "--prefix",
+                self.venv_path,
+                "--clone",
+                self.template_path,
+                "--offline",
+                "--yes",
+                *(["--quiet"] if not self.tools.console.is_verbose else []),
+            ],
+            check=True,
+        )
+        # Conda copies files that don't belong to a package, including the
+        # description of the template.
+        (self.venv_path / self.TEMPLATE_MARKER).unlink(missing_ok=True)
+
     def clean(self) -> None:
         """Remove the conda environment directory tree if it exists."""
         if self.exists():
@@ -159,6 +219,7 @@ active Conda environment.
         min_os_version: str | None = None,
         extra_installer_args: list[str] | None = None,
         install_hint: str = "",
+        output_prefix: str | None = None,
     ):
         """Install requirements into the environment with `conda install`.
 
@@ -175,6 +236,8 @@ active Conda environment.
             installer.
         :param install_hint: If an install fails, an additional context-specific hint
             that can be displayed to the user.
+        :param output_prefix: If provided, each line of output from the installer is
+            labeled with this prefix.
         """
         if not requires:
             return
@@ -224,6 +287,7 @@ active Conda environment.
                         *conda_requires,
                     ],
                     check=True,
+                    **output_kwargs(output_prefix),
                 )
             except subprocess.CalledProcessError as e:
                 raise RequirementsInstallError(install_hint=install_hint) from e
@@ -247,10 +311,51 @@ active Conda environment.
                     env={
                         "PIP_REQUIRE_VIRTUALENV": None,
                     },
+                    **output_kwargs(output_prefix),
                 )
             except subprocess.CalledProcessError as e:
                 raise RequirementsInstallError(install_hint=install_hint) from e
 
+    def resolve_requirements(
+        self,
+        requires: list[str],
+        require_binary: bool = False,
+        min_os_version: str | None = None,
+        extra_installer_args: list[str] | None = None,
+        install_hint: str = "",
+    ) -> list[dict]:
+        """Conda environments manage their own package pins, so requirements can't
+        be locked by Briefcase."""
+        raise BriefcaseCommandError(
+            "Requirements installed into a conda environment can't be locked.\n"
+            "\n"
+            "Remove the `lock_requirements` setting from the configuration of your app."
+        )
+
+    def uninstall_requirements(self, names: list[str]):
+        """Uninstall packages from the environment with `conda remove`.
+
+        Requirements that have a name are installed by conda, so they are removed
+        by conda.
+
+        :param names: The names of the packages to uninstall.
+        """
+        try:
+            self.tools.subprocess.run(
+                [
+                    self.conda_exe,
+                    "remove",
+                    "--prefix",
+                    self.venv_path,
+                    "--yes",
+                    *(["--quiet"] if not self.tools.console.is_verbose else []),
+                    *names,
+                ],
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RequirementsUninstallError() from e
+
     def rewrite_args(self, args: SubprocessArgsT) -> SubprocessArgsT:
         """Run the command in a conda environment.
 
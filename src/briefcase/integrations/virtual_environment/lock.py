@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import tomli_w
+
+from briefcase.exceptions import BriefcaseCommandError
+
+if sys.version_info >= (3, 11):  # pragma: no-cover-if-lt-py311
+    import tomllib
+else:  # pragma: no-cover-if-gte-py311
+    import tomli as tomllib
+
+
+class RequirementsLock:
+    """A file of the exact requirements to install for an app.
+
+    The lockfile contains a set of pinned requirements for each target that the app's
+    requirements are installed for. A target is identified by the Python version and
+    platform tag of the install. Each set of pinned requirements records a hash of the
+    inputs that were resolved to produce it; if the inputs change, the requirements
+    for that target must be resolved again.
+
+    Each pinned requirement is a table with the keys:
+
+    * ``name``: the name of the package;
+    * ``version``: the version of the package, if it is known;
+    * ``url``: the URL of the package, if it was installed from a direct reference
+      (e.g., a URL or a repository), rather than from an index;
+    * ``path``: the path of the package, relative to the root of the project (using
+      ``/``), if it was installed from a local file or directory;
+    * ``hashes``: the hashes of the file that was resolved, if the file could be
+      hashed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        """
+        :param path: The path of the lockfile.
+        """
+        self.path = path
+        try:
+            with self.path.open("rb") as f:
+                data = tomllib.load(f)
+        except FileNotFoundError:
+            data = {"version": self.VERSION}
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise BriefcaseCommandError(
+                f"Unable to read requirements lockfile {self.path}: {e}"
+            ) from e
+
+        if data.get("version") != self.VERSION:
+            raise BriefcaseCommandError(
+                f"The requirements lockfile {self.path} was written by an "
+                "incompatible version of Briefcase. Delete the lockfile, and "
+                "Briefcase will create a new one."
+            )
+        self.targets = data.get("targets", {})
+
+    @staticmethod
+    def inputs_hash(requires: list[str], **options) -> str:
+        """Compute a hash of the inputs to a resolution of requirements.
+
+        :param requires: The requirements that are resolved.
+        :param options: Any other options that affect the resolution.
+        :returns: The hash of the inputs.
+        """
+        return hashlib.sha256(
+            json.dumps(
+                {"requires": list(requires), **options},
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def pinned(self, target: str, inputs: str) -> list[dict] | None:
+        """Find the pinned requirements for a target.
+
+        :param target: The target of the install.
+        :param inputs: The hash of the inputs to the resolution.
+        :returns: The pinned requirements; or None if the target hasn't been
+            resolved, or was resolved with different inputs.
+        """
+        locked = self.targets.get(target, {})
+        if locked.get("inputs") == inputs:
+            return locked.get("packages", [])
+        return None
+
+    def update(self, target: str, inputs: str, packages: list[dict]):
+        """Record the pinned requirements for a target, and save the lockfile.
+
+        :param target: The target of the install.
+        :param inputs: The hash of the inputs to the resolution.
+        :param packages: The pinned requirements.
+        """
+        self.targets[target] = {"inputs": inputs, "packages": packages}
+
+        # Write the lockfile in a stable order, so that changes are easy to review.
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with temp_path.open("wb") as f:
+            tomli_w.dump(
+                {
+                    "version": self.VERSION,
+                    "targets": {
+                        name: self.targets[name] for name in sorted(self.targets)
+                    },
+                },
+                f,
+            )
+        temp_path.replace(self.path)
+
+    @staticmethod
+    def requirements(packages: list[dict], base_path: Path) -> list[str]:
+        """Convert pinned requirements into the lines of a requirements file.
+
+        Hashes are only included if every requirement has a hash, as installers
+        require a hash for every requirement if any requirement has a hash.
+
+        :param packages: The pinned requirements.
+        :param base_path: The root of the project, which local paths are relative to.
+        :returns: The lines of a requirements file.
+        """
+        use_hashes = all(package.get("hashes") for package in packages)
+        lines = []
+        for package in packages:
+            if url := package.get("url"):
+                line = f"{package['name']} @ {url}"
+            elif path := package.get("path"):
+                line = f"{package['name']} @ {(base_path / path).resolve().as_uri()}"
+            else:
+                line = f"{package['name']}=={package['version']}"
+
+            if use_hashes:
+                line += "".join(f" --hash={hash}" for hash in package["hashes"])
+            lines.append(line)
+        return lines
@@ -42,6 +42,14 @@ class NoOpVirtualEnvironment(VirtualEnvironment):
         """Always `True` — the ambient interpreter is always present."""
         return True
 
+    def create(self, path: Path):
+        """Record the active interpreter in a marker file.
+
+        :param path: The path where the environment should be created.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        (path / self.marker_path.name).write_text(sys.executable, encoding="utf-8")
+
     def prepare(self, recreate=False) -> bool:
         """Prepare a venv at the given environment.
 
@@ -51,16 +59,15 @@ class NoOpVirtualEnvironment(VirtualEnvironment):
         :returns: `True` if the environment was created (or re-created).
         :raises BriefcaseCommandError: if venv creation or pip upgrade fails.
         """
-        self.marker_path.parent.mkdir(parents=True, exist_ok=True)
         try:
             existing = self.marker_path.read_text(encoding="utf-8").strip()
             if existing != sys.executable or recreate:
-                self.marker_path.write_text(sys.executable, encoding="utf-8")
+                self.create(self.venv_path)
                 created = True
             else:
                 created = False
         except (OSError, UnicodeDecodeError):
-            self.marker_path.write_text(sys.executable, encoding="utf-8")
+            self.create(self.venv_path)
             return True
 
         return created
@@ -70,6 +77,15 @@ class NoOpVirtualEnvironment(VirtualEnvironment):
         if self.marker_path.exists():
             self.marker_path.unlink()
 
+    def uninstall_requirements(self, names: list[str]):
+        """Do nothing.
+
+        The ambient environment is shared with Briefcase (and anything else the user
+        has installed), so packages are never removed from it.
+
+        :param names: The names of the packages that would be uninstalled.
+        """
+
     def rewrite_args(self, args: SubprocessArgsT) -> SubprocessArgsT:
         """Return `args` as-is."""
         return args
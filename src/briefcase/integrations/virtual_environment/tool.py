@@ -1,4 +1,8 @@
+import concurrent.futures
+from typing import Any
+
 from briefcase.config import EnvManagerT
+from briefcase.exceptions import RequirementsInstallError
 from briefcase.integrations.base import Tool, ToolCache
 from briefcase.integrations.virtual_environment.base import VirtualEnvironment
 from briefcase.integrations.virtual_environment.conda import CondaVirtualEnvironment
@@ -44,3 +48,51 @@ class VirtualEnvironmentManager(Tool):
         EnvManagerClass.verify(self.tools)
 
         return EnvManagerClass
+
+    def install_requirements_many(
+        self,
+        installs: dict[str, tuple[VirtualEnvironment, list[str], dict[str, Any]]],
+    ):
+        """Install requirements into several targets concurrently.
+
+        Each install is an independent installer run into its own target directory.
+        The output of each install is labeled with the name of its target. Every
+        install is run to completion, even if another install fails; if any installs
+        fail, the errors are reported together.
+
+        :param installs: The installs to run, keyed by the name of the target. Each
+            install is the environment that will run the installer, the requirements
+            to install, and any other keyword arguments for `install_requirements()`.
+        :raises RequirementsInstallError: if any of the installs fail.
+        """
+        futures = {
+            target: self.tools.executor.submit_io(
+                venv.install_requirements,
+                requires,
+                output_prefix=target,
+                **kwargs,
+            )
+            for target, (venv, requires, kwargs) in installs.items()
+        }
+        concurrent.futures.wait(futures.values())
+
+        errors = {
+            target: future.exception()
+            for target, future in futures.items()
+            if future.exception() is not None
+        }
+        if len(errors) == 1:
+            raise next(iter(errors.values()))
+        elif errors:
+            # Any failure other than a failed install is unexpected; raise it as-is.
+            for error in errors.values():
+                if not isinstance(error, RequirementsInstallError):
+                    raise error
+
+            raise RequirementsInstallError(
+                install_hint="".join(
+                    f"\n\nUnable to install requirements for {target}."
+                    f"{error.install_hint.rstrip()}"
+                    for target, error in errors.items()
+                )
+            )
@@ -4,10 +4,17 @@ import subprocess
 import sys
 from pathlib import Path
 
-from briefcase.exceptions import BriefcaseCommandError, RequirementsInstallError
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    RequirementsInstallError,
+    RequirementsUninstallError,
+)
 from briefcase.integrations.base import ToolCache
 from briefcase.integrations.subprocess import SubprocessArgsT
-from briefcase.integrations.virtual_environment.base import VirtualEnvironment
+from briefcase.integrations.virtual_environment.base import (
+    VirtualEnvironment,
+    output_kwargs,
+)
 
 
 class UvVirtualEnvironment(VirtualEnvironment):
@@ -63,26 +70,27 @@ Ensure that you have installed `uv`, and that it is on your path.
             if recreate:
                 self.clean()
 
-            try:
-                self.venv_path.parent.mkdir(parents=True, exist_ok=True)
-                self.tools.subprocess.run(
-                    [
-                        "uv",
-                        "venv",
-                        "--python",
-                        sys.executable,
-                        "--seed",
-                        self.venv_path,
-                    ],
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                raise BriefcaseCommandError(
-                    f"Failed to create uv environment at {self.venv_path}"
-                ) from e
+            self.create_environment()
 
         return True
 
+    def create(self, path: Path):
+        """Create a new uv venv.
+
+        :param path: The path where the venv should be created.
+        :raises BriefcaseCommandError: if the venv can't be created.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.tools.subprocess.run(
+                ["uv", "venv", "--python", sys.executable, "--seed", path],
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise BriefcaseCommandError(
+                f"Failed to create uv environment at {path}"
+            ) from e
+
     def clean(self) -> None:
         """Remove the venv directory tree if it exists."""
         if self.exists():
@@ -154,6 +162,7 @@ Ensure that you have installed `uv`, and that it is on your path.
         min_os_version: str | None = None,
         extra_installer_args: list[str] | None = None,
         install_hint: str = "",
+        output_prefix: str | None = None,
     ):
         """Install requirements into the environment with `uv pip`.
 
@@ -167,6 +176,8 @@ Ensure that you have installed `uv`, and that it is on your path.
             installer.
         :param install_hint: If an install fails, an additional context-specific hint
             that can be displayed to the user.
+        :param output_prefix: If provided, each line of output from the installer is
+            labeled with this prefix.
         """
         uv_deps = []
         has_source_deps = False
@@ -240,6 +251,126 @@ Ensure that you have installed `uv`, and that it is on your path.
                 check=True,
                 encoding="UTF-8",
                 env=env,
+                **output_kwargs(output_prefix),
+            )
+        except subprocess.CalledProcessError as e:
+            raise RequirementsInstallError(install_hint=install_hint) from e
+
+    def resolve_requirements(
+        self,
+        requires: list[str],
+        require_binary: bool = False,
+        min_os_version: str | None = None,
+        extra_installer_args: list[str] | None = None,
+        install_hint: str = "",
+    ) -> list[dict]:
+        """Resolve requirements into the exact packages that would be installed.
+
+        The requirements are resolved with `uv pip compile`, targeting the platform
+        of the environment. Nothing is installed.
+
+        :param requires: The list of requirements to resolve.
+        :param require_binary: Should binary wheels be required?
+        :param min_os_version: The minimum OS version to enforce on packages.
+        :param extra_installer_args: A list of additional arguments to pass to the
+            installer.
+        :param install_hint: If the requirements can't be resolved, an additional
+            context-specific hint that can be displayed to the user.
+        :returns: The pinned requirements, in the format used by `RequirementsLock`.
+        """
+        env = None
+        resolve_args = []
+        if platform_tag := self.platform_tag:
+            resolve_args.extend(["--python-platform", platform_tag])
+
+            if min_os_version:
+                if self.platform == "macOS":
+                    env = {"MACOSX_DEPLOYMENT_TARGET": min_os_version}
+                elif self.platform in {"iphoneos", "iphonesimulator"}:
+                    env = {"IPHONEOS_DEPLOYMENT_TARGET": min_os_version}
+
+        # uv can't resolve a local directory if `--only-binary` is specified.
+        if require_binary and not any(
+            self.tools.file.is_local_path(req)
+            and not self.tools.file.is_archive(req)
+            and Path(req).suffix != ".whl"
+            for req in requires
+        ):
+            resolve_args.extend(["--only-binary", ":all:"])
+
+        if extra_installer_args:
+            resolve_args.extend(
+                self.tools.file.resolve_relative_args(
+                    extra_installer_args,
+                    self.base_path,
+                )
+            )
+
+        try:
+            output = self.check_output(
+                [
+                    "uv",
+                    "pip",
+                    "compile",
+                    "-",
+                    "--generate-hashes",
+                    "--no-header",
+                    "--no-annotate",
+                    "--quiet",
+                    *resolve_args,
+                ],
+                input="\n".join(requires),
+                encoding="UTF-8",
+                env=env,
             )
         except subprocess.CalledProcessError as e:
             raise RequirementsInstallError(install_hint=install_hint) from e
+
+        # The output is a requirements file, with a line for each package, followed
+        # by the hashes of the package.
+        packages = []
+        for line in output.replace("\\\n", " ").splitlines():
+            tokens = line.split()
+            if not tokens or tokens[0].startswith(("#", "-")):
+                continue
+
+            requirement = " ".join(
+                token for token in tokens if not token.startswith("--")
+            )
+            if " @ " in requirement:
+                name, url = requirement.split(" @ ", 1)
+                package = {"name": name, **self.direct_reference(url)}
+            else:
+                name, version = requirement.split("==", 1)
+                package = {"name": name, "version": version}
+
+            if hashes := [
+                token.removeprefix("--hash=")
+                for token in tokens
+                if token.startswith("--hash=")
+            ]:
+                package["hashes"] = hashes
+
+            packages.append(package)
+
+        return sorted(packages, key=lambda package: package["name"].lower())
+
+    def uninstall_requirements(self, names: list[str]):
+        """Uninstall packages from the environment with `uv pip uninstall`.
+
+        :param names: The names of the packages to uninstall.
+        """
+        try:
+            self.run(
+                [
+                    "uv",
+                    "pip",
+                    "uninstall",
+                    *(["-vv"] if self.tools.console.is_deep_debug else []),
+                    *names,
+                ],
+                check=True,
+                encoding="UTF-8",
+            )
+        except subprocess.CalledProcessError as e:
+            raise RequirementsUninstallError() from e
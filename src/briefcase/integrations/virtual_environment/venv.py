@@ -2,6 +2,7 @@ import os
 import shutil
 import subprocess
 import sys
+from pathlib import Path
 
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.base import ToolCache
@@ -45,21 +46,29 @@ class VenvVirtualEnvironment(VirtualEnvironment):
             if recreate:
                 self.clean()
 
-            try:
-                # Create the venv, but *don't* install pip. We'll use
-                # pip from the environment that is running Briefcase.
-                self.venv_path.parent.mkdir(parents=True, exist_ok=True)
-                self.tools.subprocess.run(
-                    [sys.executable, "-m", "venv", "--without-pip", self.venv_path],
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                raise BriefcaseCommandError(
-                    f"Failed to create virtual environment at {self.venv_path}"
-                ) from e
+            self.create_environment()
 
         return True
 
+    def create(self, path: Path):
+        """Create a new venv.
+
+        :param path: The path where the venv should be created.
+        :raises BriefcaseCommandError: if the venv can't be created.
+        """
+        try:
+            # Create the venv, but *don't* install pip. We'll use
+            # pip from the environment that is running Briefcase.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.tools.subprocess.run(
+                [sys.executable, "-m", "venv", "--without-pip", path],
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise BriefcaseCommandError(
+                f"Failed to create virtual environment at {path}"
+            ) from e
+
     def clean(self) -> None:
         """Remove the venv directory tree if it exists."""
         if self.exists():
@@ -403,42 +403,37 @@ class iOSXcodeCreateCommand(iOSXcodePassiveMixin, CreateCommand):
                 f"but the support package only supports {support_min_version}"
             )
 
-        # Perform the initial install pass targeting the "iphoneos" platform
-        with (
-            self.console.wait_bar("Installing app requirements for iPhone device..."),
-        ):
-            venv.install_requirements(
+        # Install requirements for the "iphoneos" platform, and for the iOS simulator
+        # platform for the current architecture. The two installs are independent, so
+        # they can be performed concurrently.
+        sim_venv = self.create_app_environment(
+            app,
+            platform="iphonesimulator",
+            arch=self.tools.host_arch,
+        )
+        install_kwargs = {
+            "allow_editable": False,
+            "require_binary": self.require_binary_installs,
+            "min_os_version": ios_min_version,
+            "extra_installer_args": app.requirement_installer_args,
+        }
+        installs = {
+            "iphoneos": self.lock_app_requirements(
+                app,
+                venv,
                 requires,
-                allow_editable=False,
-                require_binary=self.require_binary_installs,
-                min_os_version=ios_min_version,
-                extra_installer_args=app.requirement_installer_args,
                 install_path=app_packages_path.parent / "app_packages.iphoneos",
                 install_hint=f"""
 
 This may be because the `iphoneos` wheels that are available are not compatible
 with Python {self.python_version_tag} and a minimum iOS version of {ios_min_version}.
 """,
-            )
-
-        # Perform a second install pass targeting the iOS simulator platform for the
-        # current architecture
-        sim_venv = self.create_app_environment(
-            app,
-            platform="iphonesimulator",
-            arch=self.tools.host_arch,
-        )
-        with (
-            self.console.wait_bar(
-                "Installing app requirements for iPhone simulator..."
+                **install_kwargs,
             ),
-        ):
-            sim_venv.install_requirements(
+            "iphonesimulator": self.lock_app_requirements(
+                app,
+                sim_venv,
                 requires,
-                allow_editable=False,
-                require_binary=self.require_binary_installs,
-                min_os_version=ios_min_version,
-                extra_installer_args=app.requirement_installer_args,
                 install_path=app_packages_path.parent / "app_packages.iphonesimulator",
                 install_hint=f"""
 
@@ -447,6 +442,17 @@ This may indicate that an `iphoneos` wheel could be found, but an
 binary wheels that are available are not compatible with
 Python {self.python_version_tag} and a minimum iOS version of {ios_min_version}.
 """,
+                **install_kwargs,
+            ),
+        }
+        with self.console.wait_bar(
+            "Installing app requirements for iPhone device and simulator..."
+        ):
+            self.tools.virtual_environment.install_requirements_many(
+                {
+                    "iphoneos": (venv, *installs["iphoneos"]),
+                    "iphonesimulator": (sim_venv, *installs["iphonesimulator"]),
+                }
             )
 
 
@@ -462,6 +468,18 @@ class iOSXcodeOpenCommand(iOSXcodePassiveMixin, OpenCommand):
 class iOSXcodeBuildCommand(iOSXcodePassiveMixin, BuildCommand):
     description = "Build an iOS Xcode project."
     supports_debugger = True
+    supports_precompile = True
+
+    def requirements_paths(self, app: FinalizedAppConfig) -> list[Path]:
+        """Requirements are installed separately for devices and the simulator.
+
+        :param app: The config object for the app
+        """
+        app_packages_path = self.app_packages_path(app)
+        return [
+            app_packages_path.parent / "app_packages.iphoneos",
+            app_packages_path.parent / "app_packages.iphonesimulator",
+        ]
 
     def info_plist_path(self, app: FinalizedAppConfig):
         """Obtain the path to the application's plist file.
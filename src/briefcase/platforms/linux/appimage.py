@@ -246,6 +246,7 @@ class LinuxAppImageOpenCommand(LinuxAppImageMostlyPassiveMixin, DockerOpenComman
 
 class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
     description = "Build a Linux AppImage."
+    supports_precompile = True
 
     def build_app(
         self,
@@ -357,25 +358,34 @@ class LinuxAppImageRunCommand(LinuxAppImagePassiveMixin, RunCommand):
     description = "Run a Linux AppImage."
     supported_host_os: Collection[str] = {"Linux"}
     supported_host_os_reason = "Linux AppImages can only be executed on Linux."
+    supports_test_shards = True
+    supports_profile_app = True
+    supports_benchmark_startup = True
+    supports_watch = True
 
     def run_app(
         self,
         app: FinalizedAppConfig,
         passthrough: list[str],
+        test_shards: int = 1,
         **kwargs,
     ):
         """Start the application.
 
         :param app: The config object for the app
         :param passthrough: The list of arguments to pass to the app
+        :param test_shards: The number of shards to run the test suite as
         """
         # Set up the log stream
         kwargs = self._prepare_app_kwargs(app=app)
 
         # Console apps must operate in non-streaming mode so that console input can
-        # be handled correctly. However, if we're in test mode, we *must* stream so
-        # that we can see the test exit sentinel
-        if app.console_app and not app.test_mode:
+        # be handled correctly. However, if we're in test mode, benchmarking startup,
+        # or watching for changes, we *must* stream so that we can see the test exit
+        # sentinel or startup marker, or stop the app when its code changes.
+        if app.console_app and not (
+            app.test_mode or self.startup_benchmark or self.file_watcher
+        ):
             self.console.info("=" * 75)
             self.tools.subprocess.run(
                 [self.binary_path(app), *passthrough],
@@ -384,6 +394,25 @@ class LinuxAppImageRunCommand(LinuxAppImagePassiveMixin, RunCommand):
                 stream_output=False,
                 **kwargs,
             )
+        elif test_shards > 1:
+
+            def start_shard(shard_env):
+                return self.tools.subprocess.Popen(
+                    [self.binary_path(app), *passthrough],
+                    cwd=self.tools.home_path,
+                    **{**kwargs, "env": {**kwargs.get("env", {}), **shard_env}},
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                )
+
+            # Start each shard of the test suite, and stream the logs of all shards.
+            self._stream_test_shards(
+                app,
+                test_shards=test_shards,
+                start_shard=start_shard,
+                clean_output=False,
+            )
         else:
             # Start the app in a way that lets us stream the logs
             app_popen = self.tools.subprocess.Popen(
@@ -409,6 +438,8 @@ class LinuxAppImageDevCommand(LinuxAppImageMixin, DevCommand):
 
 class LinuxAppImagePackageCommand(LinuxAppImageMixin, PackageCommand):
     description = "Package a Linux AppImage."
+    supports_prune = True
+    supports_dedupe_libraries = True
 
     def package_app(self, app: FinalizedAppConfig, **kwargs):
         """Package an AppImage.
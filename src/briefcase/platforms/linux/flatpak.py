@@ -218,6 +218,8 @@ class LinuxFlatpakBuildCommand(LinuxFlatpakMixin, BuildCommand):
 
 class LinuxFlatpakRunCommand(LinuxFlatpakMixin, RunCommand):
     description = "Run a Linux Flatpak."
+    supports_benchmark_startup = True
+    supports_watch = True
 
     def run_app(
         self,
@@ -234,9 +236,12 @@ class LinuxFlatpakRunCommand(LinuxFlatpakMixin, RunCommand):
         kwargs = self._prepare_app_kwargs(app=app)
 
         # Console apps must operate in non-streaming mode so that console input can
-        # be handled correctly. However, if we're in test mode, we *must* stream so
-        # that we can see the test exit sentinel
-        if app.console_app and not app.test_mode:
+        # be handled correctly. However, if we're in test mode, benchmarking startup,
+        # or watching for changes, we *must* stream so that we can see the test exit
+        # sentinel or startup marker, or stop the app when its code changes.
+        if app.console_app and not (
+            app.test_mode or self.startup_benchmark or self.file_watcher
+        ):
             self.console.info("=" * 75)
             self.tools.flatpak.run(
                 bundle_identifier=app.bundle_identifier,
@@ -416,8 +416,7 @@ class LinuxSystemMixin(LinuxMixin):
 
         # Run a check for each package listed in the app's system_requires,
         # plus the baseline system packages that are required.
-        missing = set()
-        verified = set()
+        packages = {}
         for package in (
             base_system_packages
             + getattr(app, "system_requires", [])
@@ -433,28 +432,39 @@ class LinuxSystemMixin(LinuxMixin):
             else:
                 installed = provided_by = package
 
-            if installed not in verified:
-                verified.add(installed)
-                try:
-                    self.tools.subprocess.check_output(
-                        [*system_verify, installed], quiet=1
-                    )
-                except subprocess.CalledProcessError:
-                    # If the system uses devirtualization, try a devirtualized name
-                    if system_devirtualize:
-                        if devirtualized := system_devirtualize(installed):
-                            try:
-                                self.tools.subprocess.check_output(
-                                    [*system_verify, devirtualized], quiet=1
-                                )
-                            except subprocess.CalledProcessError:
-                                # Couldn't check devirtualized
-                                missing.add(provided_by)
-                        else:
-                            # package isn't devirtualized
-                            missing.add(provided_by)
-                    else:
-                        missing.add(provided_by)
+            packages.setdefault(installed, provided_by)
+
+        # The checks are independent, so they can be run concurrently.
+        results = self.tools.subprocess.run_many(
+            [[*system_verify, installed] for installed in packages],
+            quiet=1,
+        )
+        unverified = [
+            installed
+            for installed, result in zip(packages, results, strict=True)
+            if result.returncode
+        ]
+
+        # If the system uses devirtualization, try a devirtualized name for any
+        # package that couldn't be verified.
+        devirtualized = {}
+        missing = set()
+        for installed in unverified:
+            if system_devirtualize and (name := system_devirtualize(installed)):
+                devirtualized[installed] = name
+            else:
+                missing.add(packages[installed])
+
+        if devirtualized:
+            results = self.tools.subprocess.run_many(
+                [[*system_verify, name] for name in devirtualized.values()],
+                quiet=1,
+            )
+            missing.update(
+                packages[installed]
+                for installed, result in zip(devirtualized, results, strict=True)
+                if result.returncode
+            )
 
         # If any required packages are missing, raise an error.
         if missing:
@@ -826,6 +836,14 @@ class LinuxSystemOpenCommand(LinuxSystemDockerMixin, DockerOpenCommand):
 
 class LinuxSystemBuildCommand(LinuxSystemDockerMixin, BuildCommand):
     description = "Build a Linux system project."
+    supports_precompile = True
+
+    def precompile_context(self, app: FinalizedAppConfig):
+        """The system Python used by the app is only available in the app context.
+
+        :param app: The config object for the app
+        """
+        return self.tools[app].app_context
 
     def build_app(self, app: FinalizedAppConfig, **kwargs):
         """Build an application.
@@ -937,25 +955,33 @@ no extension).
                 outfile.close()
 
         self.console.verbose("Update file permissions...")
+
+        def update_permissions(relative_path, entry):
+            # Symbolic links don't have permissions of their own.
+            if entry.is_symlink():
+                return
+
+            old_perms = entry.stat(follow_symlinks=False).st_mode & 0o777
+            user_perms = old_perms & 0o700
+            world_perms = old_perms & 0o007
+
+            # File permissions like 775 and 664 (where the group and user
+            # permissions are the same), cause Debian heartburn. So, make
+            # sure the group and world permissions are the same
+            new_perms = user_perms | (world_perms << 3) | world_perms
+
+            # If there's been any change in permissions, apply them
+            if new_perms != old_perms:  # pragma: no-cover-if-is-windows
+                path = Path(entry.path)
+                self.console.verbose(
+                    "Updating file permissions on "
+                    f"{path.relative_to(self.bundle_path(app))} "
+                    f"from {old_perms:o} to {new_perms:o}"
+                )
+                path.chmod(new_perms)
+
         with self.console.wait_bar("Updating file permissions..."):
-            for path in self.project_path(app).glob("**/*"):
-                old_perms = self.tools.os.stat(path).st_mode & 0o777
-                user_perms = old_perms & 0o700
-                world_perms = old_perms & 0o007
-
-                # File permissions like 775 and 664 (where the group and user
-                # permissions are the same), cause Debian heartburn. So, make
-                # sure the group and world permissions are the same
-                new_perms = user_perms | (world_perms << 3) | world_perms
-
-                # If there's been any change in permissions, apply them
-                if new_perms != old_perms:  # pragma: no-cover-if-is-windows
-                    self.console.verbose(
-                        "Updating file permissions on "
-                        f"{path.relative_to(self.bundle_path(app))} "
-                        f"from {old_perms:o} to {new_perms:o}"
-                    )
-                    path.chmod(new_perms)
+            self.tools.file.walk(self.project_path(app), [update_permissions])
 
         with self.console.wait_bar("Stripping binary..."):
             self.tools.subprocess.check_output(["strip", self.binary_path(app)])
@@ -965,26 +991,36 @@ class LinuxSystemRunCommand(LinuxSystemDockerMixin, RunCommand):
     description = "Run a Linux system project."
     supported_host_os: Collection[str] = {"Linux"}
     supported_host_os_reason = "Linux system projects can only be executed on Linux."
+    supports_test_shards = True
+    supports_profile_app = True
+    supports_benchmark_startup = True
+    supports_watch = True
 
     def run_app(
         self,
         app: FinalizedAppConfig,
         passthrough: list[str],
+        test_shards: int = 1,
         **kwargs,
     ):
         """Start the application.
 
         :param app: The config object for the app
         :param passthrough: The list of arguments to pass to the app
+        :param test_shards: The number of shards to run the test suite as
         """
         # Set up the log stream
         kwargs = self._prepare_app_kwargs(app=app)
 
         with self.tools[app].app_context.run_app_context(kwargs) as kwargs:
             # Console apps must operate in non-streaming mode so that console input can
-            # be handled correctly. However, if we're in test mode, we *must* stream so
-            # that we can see the test exit sentinel
-            if app.console_app and not app.test_mode:
+            # be handled correctly. However, if we're in test mode, benchmarking
+            # startup, or watching for changes, we *must* stream so that we can see the
+            # test exit sentinel or startup marker, or stop the app when its code
+            # changes.
+            if app.console_app and not (
+                app.test_mode or self.startup_benchmark or self.file_watcher
+            ):
                 self.console.info("=" * 75)
                 self.tools[app].app_context.run(
                     [self.binary_path(app), *passthrough],
@@ -993,6 +1029,26 @@ class LinuxSystemRunCommand(LinuxSystemDockerMixin, RunCommand):
                     stream_output=False,
                     **kwargs,
                 )
+            elif test_shards > 1:
+
+                def start_shard(shard_env):
+                    return self.tools[app].app_context.Popen(
+                        [self.binary_path(app), *passthrough],
+                        cwd=self.tools.home_path,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        bufsize=1,
+                        **{**kwargs, "env": {**kwargs.get("env", {}), **shard_env}},
+                    )
+
+                # Start each shard of the test suite, and stream the logs of all
+                # shards.
+                self._stream_test_shards(
+                    app,
+                    test_shards=test_shards,
+                    start_shard=start_shard,
+                    clean_output=False,
+                )
             else:
                 # Start the app in a way that lets us stream the logs
                 app_popen = self.tools[app].app_context.Popen(
@@ -1280,6 +1336,8 @@ class LinuxSystemPackageCommand(
     PackageCommand,
 ):
     description = "Package a Linux system project."
+    supports_prune = True
+    supports_dedupe_libraries = True
 
     @property
     def packaging_formats(self):
@@ -1515,10 +1573,14 @@ class LinuxSystemPackageCommand(
             # in <app_name> (sub)directories (e.g., /usr/bin/<app_name> or
             # /usr/share/man/man1/<app_name>.1.gz) will be included, but paths
             # *not* cleaned up, as they're part of more general system structures.
-            for filename in sorted(self.package_path(app).glob("**/*")):
-                path = filename.relative_to(self.package_path(app))
+            manifest = {}
+
+            def add_to_manifest(relative_path, entry):
+                manifest[Path(relative_path)] = entry.is_dir()
 
-                if filename.is_dir():
+            self.tools.file.walk(self.package_path(app), [add_to_manifest])
+            for path, is_dir in sorted(manifest.items()):
+                if is_dir:
                     if app.app_name in path.parts:
                         f.write(f'%dir "/{path}"\n')
                 else:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import graphlib
 import json
 import os
 import plistlib
@@ -24,7 +25,11 @@ from briefcase.integrations.subprocess import (
 )
 from briefcase.integrations.xcode import XcodeCliTools, get_identities
 from briefcase.platforms.macOS.filters import macOS_log_clean_filter
-from briefcase.platforms.macOS.utils import AppPackagesMergeMixin, is_mach_o_binary
+from briefcase.platforms.macOS.utils import (
+    AppPackagesMergeMixin,
+    FileIndex,
+    sign_dependencies,
+)
 
 if TYPE_CHECKING:
     from briefcase.commands.base import BaseCommand
@@ -347,23 +352,26 @@ class macOSCreateMixin(AppPackagesMergeMixin):
             # directly into the app_packages folder.
             host_app_packages_path = app_packages_path
 
-        with self.console.wait_bar(
-            f"Installing app requirements for {self.tools.host_arch}..."
-        ):
-            venv.install_requirements(
-                requires,
-                allow_editable=False,
-                require_binary=self.require_binary_installs,
-                min_os_version=macOS_min_version,
-                extra_installer_args=app.requirement_installer_args,
-                install_path=host_app_packages_path,
-                install_hint=f"""
+        host_requires, host_install_kwargs = self.lock_app_requirements(
+            app,
+            venv,
+            requires,
+            allow_editable=False,
+            require_binary=self.require_binary_installs,
+            min_os_version=macOS_min_version,
+            extra_installer_args=app.requirement_installer_args,
+            install_path=host_app_packages_path,
+            install_hint=f"""
 
 This may be because an {self.tools.host_arch} wheel that is compatible with
 Python {self.python_version_tag} and a minimum macOS version of {macOS_min_version}
 is not available.
 """,
-            )
+        )
+        with self.console.wait_bar(
+            f"Installing app requirements for {self.tools.host_arch}..."
+        ):
+            venv.install_requirements(host_requires, **host_install_kwargs)
 
         if getattr(app, "universal_build", True):
             # Install dependencies for the architecture that isn't the host architecture
@@ -396,20 +404,16 @@ is not available.
                     platform="macOS",
                     arch=other_arch,
                 )
-                with self.console.wait_bar(
-                    f"Installing binary app requirements for {other_arch}..."
-                ):
-                    other_venv.install_requirements(
-                        [
-                            f"{package}=={version}"
-                            for package, version in binary_packages
-                        ],
-                        allow_editable=False,
-                        require_binary=self.require_binary_installs,
-                        min_os_version=macOS_min_version,
-                        extra_installer_args=app.requirement_installer_args,
-                        install_path=other_app_packages_path,
-                        install_hint=f"""
+                other_requires, other_install_kwargs = self.lock_app_requirements(
+                    app,
+                    other_venv,
+                    [f"{package}=={version}" for package, version in binary_packages],
+                    allow_editable=False,
+                    require_binary=self.require_binary_installs,
+                    min_os_version=macOS_min_version,
+                    extra_installer_args=app.requirement_installer_args,
+                    install_path=other_app_packages_path,
+                    install_hint=f"""
 
 This may be because an {other_arch} wheel that is compatible with
 Python {self.python_version_tag} and a minimum macOS version of {macOS_min_version}
@@ -421,6 +425,12 @@ You may need to build a non-universal app by setting:
 
 in the macOS configuration section of your pyproject.toml.
 """,
+                )
+                with self.console.wait_bar(
+                    f"Installing binary app requirements for {other_arch}..."
+                ):
+                    other_venv.install_requirements(
+                        other_requires, **other_install_kwargs
                     )
             else:
                 self.console.info("All packages are pure Python, or universal.")
@@ -796,13 +806,13 @@ or
 
         return SigningIdentity(id=identity, name=identity_name)
 
-    def sign_file(
+    def sign_command(
         self,
         path: Path,
         identity: SigningIdentity,
         entitlements: Path | None = None,
-    ):
-        """Code sign a file.
+    ) -> list[str | Path]:
+        """The command to code sign a file.
 
         :param path: The path to the file to sign.
         :param identity: The code signing identity to use.
@@ -818,35 +828,59 @@ or
             process_command.append("--options")
             process_command.append(options)
 
+        return process_command
+
+    def _sign_failed(self, path: Path, error: subprocess.CalledProcessError):
+        """Handle a failure to code sign a file.
+
+        Some failures indicate that the file didn't require a signature; these are
+        ignored. Any other failure is raised as an error.
+
+        :param path: The path to the file that was being signed.
+        :param error: The error raised by the signing command.
+        """
+        errors = error.stderr
+        if any(
+            msg in errors
+            for msg in [
+                # File has a signature matching the Mach-O magic,
+                # but isn't actually a Mach-O binary
+                "unsupported format for signature",
+                # A folder named ``.framework`, but not actually a macOS Framework`
+                "bundle format unrecognized, invalid, or unsuitable",
+            ]
+        ):
+            # We should not be signing this in the first place
+            self.console.verbose(
+                f"... {Path(path).relative_to(self.base_path)} "
+                "does not require a signature"
+            )
+        else:
+            self.tools.subprocess.output_error(error)
+            raise BriefcaseCommandError(f"Unable to code sign {path}.") from error
+
+    def sign_file(
+        self,
+        path: Path,
+        identity: SigningIdentity,
+        entitlements: Path | None = None,
+    ):
+        """Code sign a file.
+
+        :param path: The path to the file to sign.
+        :param identity: The code signing identity to use.
+        :param entitlements: The path to the entitlements file to use.
+        """
         self.console.verbose(f"Signing {Path(path).relative_to(self.base_path)}")
 
         try:
             self.tools.subprocess.run(
-                process_command,
+                self.sign_command(path, identity=identity, entitlements=entitlements),
                 stderr=subprocess.PIPE,
                 check=True,
             )
         except subprocess.CalledProcessError as e:
-            errors = e.stderr
-            if any(
-                msg in errors
-                for msg in [
-                    # File has a signature matching the Mach-O magic,
-                    # but isn't actually a Mach-O binary
-                    "unsupported format for signature",
-                    # A folder named ``.framework`, but not actually a macOS Framework`
-                    "bundle format unrecognized, invalid, or unsuitable",
-                ]
-            ):
-                # We should not be signing this in the first place
-                self.console.verbose(
-                    f"... {Path(path).relative_to(self.base_path)} "
-                    "does not require a signature"
-                )
-                return
-            else:
-                self.tools.subprocess.output_error(e)
-                raise BriefcaseCommandError(f"Unable to code sign {path}.") from e
+            self._sign_failed(path, e)
 
     def sign_app(
         self,
@@ -862,70 +896,67 @@ or
         resources_path = bundle_path / "Contents/Resources"
         frameworks_path = bundle_path / "Contents/Frameworks"
 
-        sign_targets = []
-
-        for folder in (resources_path, frameworks_path):
-            # Sign all Mach-O executable objects
-            sign_targets.extend(
-                path
-                for path in folder.rglob("*")
-                if not path.is_dir()
-                and not path.is_symlink()
-                and is_mach_o_binary(path)
+        # Sign all Mach-O executable objects, embedded frameworks, and embedded apps.
+        # Symbolic links aren't signed.
+        file_index = FileIndex.shared(self.tools)
+        sign_targets = [
+            path
+            for folder in (resources_path, frameworks_path)
+            for path, info in file_index.scan(folder).items()
+            if info.kind == FileIndex.MACH_O
+            or (
+                info.kind == FileIndex.DIRECTORY
+                and path.suffix in {".framework", ".app"}
             )
-
-            # Sign all embedded frameworks
-            sign_targets.extend(folder.rglob("*.framework"))
-
-            # Sign all embedded app objects
-            sign_targets.extend(folder.rglob("*.app"))
+        ]
 
         # Sign the bundle path itself
         sign_targets.append(bundle_path)
 
-        # Run signing through a ThreadPoolExecutor so that they run in parallel. We need
-        # to ensure that objects are signed from the inside out (i.e., a folder must be
-        # signed *after* all it's contents has been signed; files in a folder must be
-        # signed *after* all subfolders in that same folder); and an app that uses a
-        # library must be signed *after* all the libraries it uses. See
-        # https://developer.apple.com/documentation/xcode/creating-distribution-signed-code-for-the-mac#Determine-the-signing-order
-        # for details.
-        #
-        # To do this, we utilize grouping on a sorted list, and rely on the fact that a
-        # new group is created whenever the grouping key changes. The sorting process
-        # guarantees depth-first ordering; the grouping is applied over the sorted
-        # content, ensuring that that folders are signed before files.
-        #
-        # This approach isn't perfect. It will fail if there's an embedded app that uses
-        # a library in a different framework, and the app is lexically sorted before the
-        # library (e.g. if app_packages/foobar/Alpha.framework/Helpers/My App.app
-        # depends on app_packages/footbar/Beta.framework/libbeta). However, if you're
-        # embedding apps in frameworks in Python libraries that are installed by pip,
-        # you're already making poor life choices; this approach is enough to satisfy
-        # the one use of app-in-framework embedding that we're aware of (PySide).
+        # Objects must be signed from the inside out (i.e., a folder must be signed
+        # *after* all its contents have been signed); and a binary that uses a
+        # library must be signed *after* the library it uses. Each object is signed
+        # as soon as everything it depends on has been signed, so objects anywhere
+        # in the app can be signed concurrently.
+        sorter = graphlib.TopologicalSorter(sign_dependencies(sign_targets))
+        sorter.prepare()
+        running = {}
+        errors = []
         progress_bar = self.console.progress_bar()
         task_id = progress_bar.add_task("Signing App", total=len(sign_targets))
         with progress_bar:
-            for group in self.tools.file.sorted_depth_first_groups(sign_targets):
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=1 if self.console.is_deep_debug else None
-                ) as executor:
-                    futures = []
-                    for path in group:
-                        future = executor.submit(
+            while True:
+                # Once a file has failed to sign, don't start signing anything else.
+                if not errors:
+                    for path in sorter.get_ready():
+                        future = self.tools.executor.submit(
                             self.sign_file,
                             path,
-                            entitlements=self.entitlements_path(app),
                             identity=identity,
+                            entitlements=self.entitlements_path(app),
                         )
-                        futures.append(future)
-                    for future in concurrent.futures.as_completed(futures):
+                        running[future] = path
+                if not running:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    path = running.pop(future)
+                    if future.exception() is not None:
+                        errors.append(future.exception())
+                    else:
+                        sorter.done(path)
                         progress_bar.update(task_id, advance=1)
-                        if future.exception():
-                            raise future.exception()
+
+        if errors:
+            raise errors[0]
 
 
 class macOSPackageMixin(macOSSigningMixin):
+    supports_prune = True
+
     ADHOC_SIGN_HELP = (
         "Perform ad-hoc signing on the app. "
         "The app will only run on this machine; it cannot be redistributed to others"
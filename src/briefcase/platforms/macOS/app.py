@@ -123,6 +123,7 @@ class macOSAppBuildCommand(
 ):
     description = "Build a macOS app."
     supports_debugger = True
+    supports_precompile = True
 
     def build_app(self, app: FinalizedAppConfig, **kwargs):
         """Build the macOS app.
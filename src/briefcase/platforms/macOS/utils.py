@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import concurrent
+import concurrent.futures
 import email
+import graphlib
 import hashlib
 import os
 import pathlib
 import plistlib
+import shutil
+import struct
 import subprocess
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from stat import S_ISDIR, S_ISLNK
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
 
 from briefcase.exceptions import BriefcaseCommandError
 
 if TYPE_CHECKING:
     from briefcase.commands.base import BaseCommand
+    from briefcase.integrations.base import ToolCache
 
     _MixinBase = BaseCommand
 else:
@@ -22,28 +28,19 @@ else:
 CORETYPES_PATH = "/System/Library/CoreServices/CoreTypes.bundle/Contents/Info.plist"
 
 
-def is_mach_o_binary(path: Path):  # pragma: no-cover-if-is-windows
-    """Determine if the file at the given path is a Mach-O binary.
+# Files with these suffixes (or no suffix at all) may be binaries, even if they
+# aren't executable.
+BINARY_SUFFIXES = {".dylib", ".o", ".so", ""}
 
-    :param path: The path to check
-    :returns: True if the file at the given location is a Mach-O binary.
-    """
-    # A binary is any file that is executable, or has a suffix from a known list
-    if os.access(path, os.X_OK) or path.suffix.lower() in {".dylib", ".o", ".so", ""}:
-        # File is a binary; read the file magic to determine if it's Mach-O.
-        with path.open("rb") as f:
-            magic = f.read(4)
-            return magic in (
-                b"\xca\xfe\xba\xbe",
-                b"\xcf\xfa\xed\xfe",
-                b"\xce\xfa\xed\xfe",
-                b"\xbe\xba\xfe\xca",
-                b"\xfe\xed\xfa\xcf",
-                b"\xfe\xed\xfa\xce",
-            )
-    else:
-        # Not a binary
-        return False
+# The magic numbers of Mach-O files, in either byte order.
+MACH_O_MAGIC_BYTES = {
+    b"\xca\xfe\xba\xbe",
+    b"\xcf\xfa\xed\xfe",
+    b"\xce\xfa\xed\xfe",
+    b"\xbe\xba\xfe\xca",
+    b"\xfe\xed\xfa\xcf",
+    b"\xfe\xed\xfa\xce",
+}
 
 
 def sha256_file_digest(path: Path) -> str:
@@ -60,12 +57,607 @@ def sha256_file_digest(path: Path) -> str:
     return file_hash.hexdigest()
 
 
+# Constants describing the headers of Mach-O files, and fat (universal) files that
+# contain multiple Mach-O files; from <mach-o/loader.h> and <mach-o/fat.h>.
+FAT_MAGIC = 0xCAFEBABE
+FAT_MAGIC_64 = 0xCAFEBABF
+MH_MAGIC = 0xFEEDFACE
+MH_MAGIC_64 = 0xFEEDFACF
+
+CPU_ARCH_MASK = 0xFF000000
+CPU_ARCH_ABI64 = 0x01000000
+CPU_ARCH_ABI64_32 = 0x02000000
+CPU_SUBTYPE_MASK = 0xFF000000
+CPU_TYPE_X86 = 7
+CPU_TYPE_ARM = 12
+CPU_TYPE_POWERPC = 18
+
+# The load commands that describe the libraries a Mach-O file links against, and the
+# runpath search paths used to find those libraries.
+LC_REQ_DYLD = 0x80000000
+LC_LOAD_DYLIB = 0xC
+LC_LOAD_WEAK_DYLIB = 0x18 | LC_REQ_DYLD
+LC_RPATH = 0x1C | LC_REQ_DYLD
+LC_REEXPORT_DYLIB = 0x1F | LC_REQ_DYLD
+LC_LAZY_LOAD_DYLIB = 0x20
+LC_LOAD_UPWARD_DYLIB = 0x23 | LC_REQ_DYLD
+DYLIB_LOAD_COMMANDS = {
+    LC_LOAD_DYLIB,
+    LC_LOAD_WEAK_DYLIB,
+    LC_REEXPORT_DYLIB,
+    LC_LAZY_LOAD_DYLIB,
+    LC_LOAD_UPWARD_DYLIB,
+}
+
+# The names used by lipo for each (CPU type, CPU subtype) pair.
+MACH_O_ARCHITECTURES = {
+    (CPU_TYPE_X86, 3): "i386",
+    (CPU_TYPE_X86 | CPU_ARCH_ABI64, 3): "x86_64",
+    (CPU_TYPE_X86 | CPU_ARCH_ABI64, 8): "x86_64h",
+    (CPU_TYPE_ARM, 9): "armv7",
+    (CPU_TYPE_ARM, 11): "armv7s",
+    (CPU_TYPE_ARM, 12): "armv7k",
+    (CPU_TYPE_ARM | CPU_ARCH_ABI64, 0): "arm64",
+    (CPU_TYPE_ARM | CPU_ARCH_ABI64, 2): "arm64e",
+    (CPU_TYPE_ARM | CPU_ARCH_ABI64_32, 1): "arm64_32",
+    (CPU_TYPE_POWERPC, 0): "ppc",
+    (CPU_TYPE_POWERPC | CPU_ARCH_ABI64, 0): "ppc64",
+}
+
+# Java class files share the fat magic number; the 2 bytes that follow are the
+# class file version, which is always more than this (the same heuristic is used
+# by `file`).
+MAX_FAT_ARCHES = 20
+
+# The largest offset that can be described by the 32-bit fat header.
+MAX_FAT_32_OFFSET = 0xFFFFFFFF
+
+
+class MachOError(Exception):
+    """A file can't be processed as a Mach-O file."""
+
+
+class MachOSlice(NamedTuple):
+    """A single-architecture Mach-O file, stored in a (possibly fat) file."""
+
+    arch: str
+    cputype: int
+    cpusubtype: int
+    # The location of the slice in the file
+    offset: int
+    size: int
+    # The alignment of the slice in a fat file, as a power of 2
+    align: int
+
+
+def _architecture(cputype: int, cpusubtype: int) -> str:
+    try:
+        return MACH_O_ARCHITECTURES[cputype, cpusubtype & ~CPU_SUBTYPE_MASK]
+    except KeyError:
+        raise MachOError(
+            f"Unknown architecture (CPU type {cputype}, subtype {cpusubtype})"
+        ) from None
+
+
+def read_mach_o(f: BinaryIO) -> tuple[bool, list[MachOSlice]]:
+    """Read the architectures in a Mach-O file.
+
+    :param f: The file to read, opened in binary mode.
+    :returns: A tuple of whether the file is fat, and the slices in the file. A thin
+        file has a single slice that spans the whole file.
+    :raises MachOError: If the file isn't a Mach-O file that can be processed.
+    """
+    size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    header = f.read(12)
+    if len(header) < 12:
+        raise MachOError("File is too small to be a Mach-O file")
+
+    magic, nfat_arch = struct.unpack(">II", header[:8])
+    if magic in {FAT_MAGIC, FAT_MAGIC_64}:
+        if not 0 < nfat_arch < MAX_FAT_ARCHES:
+            raise MachOError("Not a fat Mach-O file")
+
+        arch_format = ">IIQQII" if magic == FAT_MAGIC_64 else ">IIIII"
+        arch_size = struct.calcsize(arch_format)
+        f.seek(8)
+        data = f.read(nfat_arch * arch_size)
+        if len(data) < nfat_arch * arch_size:
+            raise MachOError("Fat header is truncated")
+
+        slices = []
+        for fields in struct.iter_unpack(arch_format, data):
+            cputype, cpusubtype, offset, slice_size, align = fields[:5]
+            if offset + slice_size > size:
+                raise MachOError("Fat header describes a slice past the end of file")
+            slices.append(
+                MachOSlice(
+                    _architecture(cputype, cpusubtype),
+                    cputype,
+                    cpusubtype,
+                    offset,
+                    slice_size,
+                    align,
+                )
+            )
+        return True, slices
+
+    # Thin Mach-O files use the byte order of their architecture.
+    for byte_order in "<>":
+        magic, cputype, cpusubtype = struct.unpack(f"{byte_order}III", header)
+        if magic in {MH_MAGIC, MH_MAGIC_64}:
+            # Slices are aligned to the page size of the architecture.
+            align = 14 if cputype & ~CPU_ARCH_MASK == CPU_TYPE_ARM else 12
+            return False, [
+                MachOSlice(
+                    _architecture(cputype, cpusubtype),
+                    cputype,
+                    cpusubtype,
+                    0,
+                    size,
+                    align,
+                )
+            ]
+
+    raise MachOError("Not a Mach-O file")
+
+
+def mach_o_architectures(path: Path) -> tuple[bool, list[str]]:
+    """Determine the architectures in a Mach-O file.
+
+    :param path: The file to inspect.
+    :returns: A tuple of whether the file is fat, and the architectures in the file.
+    :raises MachOError: If the file isn't a Mach-O file that can be processed.
+    """
+    with path.open("rb") as f:
+        fat, slices = read_mach_o(f)
+    return fat, [mach_o_slice.arch for mach_o_slice in slices]
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, size: int):
+    """Copy part of one file into another."""
+    src.seek(offset)
+    while size > 0:
+        chunk = src.read(min(size, 1024 * 1024))
+        if not chunk:
+            raise MachOError("File is truncated")
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def thin_mach_o(path: Path, arch: str, output: Path):
+    """Extract the slice for one architecture from a fat Mach-O file.
+
+    :param path: The fat file.
+    :param arch: The architecture to extract.
+    :param output: The path where the thin file will be written.
+    :raises MachOError: If the file isn't a Mach-O file that can be processed, or it
+        doesn't contain the requested architecture.
+    """
+    with path.open("rb") as f:
+        _, slices = read_mach_o(f)
+        for mach_o_slice in slices:
+            if mach_o_slice.arch == arch:
+                with output.open("wb") as out:
+                    _copy_range(f, out, mach_o_slice.offset, mach_o_slice.size)
+                break
+        else:
+            raise MachOError(f"{path} does not contain a {arch} slice")
+    shutil.copymode(path, output)
+
+
+def _fat_layout(slices: list[MachOSlice], arch_size: int) -> tuple[list[int], int]:
+    """Place slices in a fat file, each at the next offset that satisfies its
+    alignment.
+
+    :param slices: The slices, in the order they will be stored.
+    :param arch_size: The size of the header describing each slice.
+    :returns: A tuple of the offset of each slice, and the size of the file.
+    """
+    offset = 8 + arch_size * len(slices)
+    offsets = []
+    for mach_o_slice in slices:
+        alignment = 1 << mach_o_slice.align
+        offset = (offset + alignment - 1) // alignment * alignment
+        offsets.append(offset)
+        offset += mach_o_slice.size
+    return offsets, offset
+
+
+def create_fat_mach_o(output: Path, sources: list[Path]):
+    """Create a fat Mach-O file from the slices of other Mach-O files.
+
+    The sources can be thin or fat. As with `lipo -create`, the output is always a
+    fat file, even if there is only a single slice.
+
+    :param output: The path where the fat file will be written.
+    :param sources: The Mach-O files to combine.
+    :raises MachOError: If a source isn't a Mach-O file that can be processed, or
+        more than one source provides the same architecture.
+    """
+    inputs = []
+    arches = set()
+    for source in sources:
+        with source.open("rb") as f:
+            _, slices = read_mach_o(f)
+        for mach_o_slice in slices:
+            if mach_o_slice.arch in arches:
+                raise MachOError(
+                    f"More than one source provides the {mach_o_slice.arch} "
+                    "architecture"
+                )
+            arches.add(mach_o_slice.arch)
+            inputs.append((source, mach_o_slice))
+
+    # As with lipo, order the slices by alignment. If the file is larger than 4GiB,
+    # the 64-bit fat format is needed.
+    inputs.sort(key=lambda item: item[1].align)
+    magic, arch_format = FAT_MAGIC, ">IIIII"
+    offsets, end = _fat_layout([mach_o_slice for _, mach_o_slice in inputs], 20)
+    if end > MAX_FAT_32_OFFSET:
+        magic, arch_format = FAT_MAGIC_64, ">IIQQII"
+        offsets, _ = _fat_layout([mach_o_slice for _, mach_o_slice in inputs], 32)
+
+    with output.open("wb") as out:
+        out.write(struct.pack(">II", magic, len(inputs)))
+        for (_, mach_o_slice), slice_offset in zip(inputs, offsets, strict=True):
+            fields = [
+                mach_o_slice.cputype,
+                mach_o_slice.cpusubtype,
+                slice_offset,
+                mach_o_slice.size,
+                mach_o_slice.align,
+            ]
+            if magic == FAT_MAGIC_64:
+                fields.append(0)  # reserved
+            out.write(struct.pack(arch_format, *fields))
+
+        for (source, mach_o_slice), slice_offset in zip(inputs, offsets, strict=True):
+            out.write(b"\0" * (slice_offset - out.tell()))
+            with source.open("rb") as f:
+                _copy_range(f, out, mach_o_slice.offset, mach_o_slice.size)
+    shutil.copymode(sources[0], output)
+
+
+def _slice_byte_order(f: BinaryIO, mach_o_slice: MachOSlice) -> tuple[str, int]:
+    """Determine the byte order and header size of a Mach-O slice."""
+    f.seek(mach_o_slice.offset)
+    header = f.read(4)
+    for byte_order in "<>":
+        (magic,) = struct.unpack(f"{byte_order}I", header)
+        if magic == MH_MAGIC_64:
+            return byte_order, 32
+        elif magic == MH_MAGIC:
+            return byte_order, 28
+    raise MachOError("Fat file contains a slice that isn't a Mach-O file")
+
+
+def mach_o_linkage(path: Path) -> tuple[list[str], list[str]]:
+    """Determine the libraries that a Mach-O file links against.
+
+    The load commands of every slice in the file are read.
+
+    :param path: The file to inspect.
+    :returns: A tuple of the install names of the libraries the file links against
+        (e.g., ``@rpath/libfoo.dylib``), and the runpath search paths of the file
+        (e.g., ``@loader_path/../lib``).
+    :raises MachOError: If the file isn't a Mach-O file that can be processed.
+    """
+    dylibs = {}
+    rpaths = {}
+    with path.open("rb") as f:
+        _, slices = read_mach_o(f)
+        for mach_o_slice in slices:
+            byte_order, header_size = _slice_byte_order(f, mach_o_slice)
+            f.seek(mach_o_slice.offset + 16)
+            ncmds, sizeofcmds = struct.unpack(f"{byte_order}II", f.read(8))
+            f.seek(mach_o_slice.offset + header_size)
+            data = f.read(sizeofcmds)
+            if len(data) < sizeofcmds:
+                raise MachOError("Load commands are truncated")
+
+            offset = 0
+            for _ in range(ncmds):
+                if offset + 8 > len(data):
+                    raise MachOError("Load commands are truncated")
+                cmd, cmdsize = struct.unpack_from(f"{byte_order}II", data, offset)
+                if cmdsize < 8 or offset + cmdsize > len(data):
+                    raise MachOError("Load command has an invalid size")
+
+                if cmd in DYLIB_LOAD_COMMANDS or cmd == LC_RPATH:
+                    # The command stores the offset of a null-terminated string,
+                    # relative to the start of the command.
+                    (name_offset,) = struct.unpack_from(
+                        f"{byte_order}I", data, offset + 8
+                    )
+                    name = (
+                        data[offset + name_offset : offset + cmdsize]
+                        .split(b"\0", 1)[0]
+                        .decode("utf-8", errors="surrogateescape")
+                    )
+                    (rpaths if cmd == LC_RPATH else dylibs)[name] = None
+                offset += cmdsize
+
+    return list(dylibs), list(rpaths)
+
+
+def _resolve_install_name(
+    name: str,
+    loader_path: Path,
+    executable_path: Path | None,
+    rpaths: list[str],
+) -> list[Path]:
+    """Determine the files that an install name could refer to.
+
+    :param name: The install name (or runpath search path) to resolve.
+    :param loader_path: The file that contains the install name.
+    :param executable_path: The folder containing the executable that will load
+        the file; or None if the executable isn't known.
+    :param rpaths: The runpath search paths that can be used to resolve the name.
+    :returns: The paths that the install name could refer to.
+    """
+    if name.startswith("@loader_path/"):
+        return [loader_path.parent / name.removeprefix("@loader_path/")]
+    elif name.startswith("@executable_path/"):
+        if executable_path is None:
+            return []
+        return [executable_path / name.removeprefix("@executable_path/")]
+    elif name.startswith("@rpath/"):
+        return [
+            path / name.removeprefix("@rpath/")
+            for rpath in rpaths
+            if not rpath.startswith("@rpath/")
+            for path in _resolve_install_name(rpath, loader_path, executable_path, [])
+        ]
+    elif name.startswith("/"):
+        return [Path(name)]
+    else:
+        return []
+
+
+def sign_dependencies(targets: list[Path]) -> dict[Path, set[Path]]:
+    """Determine the order in which the contents of an app must be signed.
+
+    Code must be signed from the inside out: a bundle can only be signed once all
+    the code it contains has been signed; and a binary can only be signed once the
+    libraries (and the bundles containing the libraries) that it links against
+    have been signed. See
+    https://developer.apple.com/documentation/xcode/creating-distribution-signed-code-for-the-mac#Determine-the-signing-order
+    for details.
+
+    Links are determined by reading the load commands of each Mach-O file. If the
+    links between binaries form a cycle, only containment is used to order the
+    targets.
+
+    :param targets: The files and bundles that will be signed.
+    :returns: A dictionary mapping each target to the set of targets that must be
+        signed before it.
+    """
+    target_set = set(targets)
+    # Links are resolved through any symlinks (e.g., the ``Versions/Current``
+    # symlink in a framework), so targets are found by their real path.
+    real_targets = {os.path.realpath(target): target for target in targets}
+
+    def enclosing(path: Path):
+        # The targets that contain a path, from the innermost out.
+        return [parent for parent in path.parents if parent in target_set]
+
+    containment = {target: set() for target in targets}
+    for target in targets:
+        if parents := enclosing(target):
+            containment[parents[0]].add(target)
+
+    links = {target: set() for target in targets}
+    for target in targets:
+        if target.is_dir():
+            continue
+        try:
+            dylibs, rpaths = mach_o_linkage(target)
+        except (MachOError, OSError):
+            # If the file can't be processed, it's only ordered by containment.
+            continue
+
+        executable_path = next(
+            (
+                parent / "Contents/MacOS"
+                for parent in target.parents
+                if parent.suffix == ".app"
+            ),
+            None,
+        )
+        target_parents = set(enclosing(target))
+        for name in dylibs:
+            for candidate in _resolve_install_name(
+                name, target, executable_path, rpaths
+            ):
+                library = real_targets.get(os.path.realpath(candidate))
+                if library is not None and library != target:
+                    # The library, and any bundle that contains the library (but
+                    # doesn't also contain the binary), must be signed first.
+                    links[target].add(library)
+                    links[target].update(
+                        parent
+                        for parent in enclosing(library)
+                        if parent not in target_parents and parent != target
+                    )
+                    break
+
+    dependencies = {target: containment[target] | links[target] for target in targets}
+    try:
+        graphlib.TopologicalSorter(dependencies).prepare()
+    except graphlib.CycleError:
+        return containment
+    return dependencies
+
+
+class FileInfo(NamedTuple):
+    """The classification of a file (or directory) in a bundle."""
+
+    # One of the FileIndex kinds
+    kind: str
+    size: int
+    mtime_ns: int
+    # For Mach-O files, whether the file is fat, and the architectures it contains.
+    # The architectures are None if the file has a Mach-O magic number, but its
+    # headers can't be read.
+    fat: bool = False
+    architectures: tuple[str, ...] | None = ()
+
+
+class FileIndex:
+    """An index of the type of every file in a bundle.
+
+    Classifying a file requires reading the header of the file, and every file in an
+    app is inspected by more than one pass of a build (thinning, merging and
+    signing). The index stores the classification of each file, along with the size
+    and modification time of the file when it was classified; a file is only
+    classified again if it has changed.
+
+    The index is shared by all commands that use the same tool cache.
+    """
+
+    DIRECTORY = "directory"
+    SYMLINK = "symlink"
+    MACH_O = "mach-o"
+    ELF = "elf"
+    PE = "pe"
+    OTHER = "other"
+
+    def __init__(self, tools: ToolCache):
+        self.tools = tools
+        self._entries: dict[Path, FileInfo] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, tools: ToolCache) -> FileIndex:
+        """Obtain the index shared by every command that uses a tool cache.
+
+        :param tools: The tool cache.
+        :returns: The shared index.
+        """
+        if not hasattr(tools, "file_index"):
+            tools.file_index = cls(tools)
+        return tools.file_index
+
+    @classmethod
+    def classify(cls, path: Path, stat: os.stat_result) -> FileInfo:
+        """Determine the type of a file.
+
+        :param path: The file to classify.
+        :param stat: The result of an ``lstat()`` of the file.
+        :returns: The classification of the file.
+        """
+        info = FileInfo(cls.OTHER, stat.st_size, stat.st_mtime_ns)
+        if S_ISDIR(stat.st_mode):
+            return info._replace(kind=cls.DIRECTORY)
+        elif S_ISLNK(stat.st_mode):
+            return info._replace(kind=cls.SYMLINK)
+        elif not (stat.st_mode & 0o111 or path.suffix.lower() in BINARY_SUFFIXES):
+            # Only files that are executable, or have a binary suffix, are binaries.
+            return info
+
+        with path.open("rb") as f:
+            magic = f.read(4)
+            if magic in MACH_O_MAGIC_BYTES:
+                try:
+                    fat, slices = read_mach_o(f)
+                except MachOError:
+                    return info._replace(kind=cls.MACH_O, architectures=None)
+                return info._replace(
+                    kind=cls.MACH_O,
+                    fat=fat,
+                    architectures=tuple(mach_o_slice.arch for mach_o_slice in slices),
+                )
+            elif magic == b"\x7fELF":
+                return info._replace(kind=cls.ELF)
+            elif magic[:2] == b"MZ":
+                return info._replace(kind=cls.PE)
+        return info
+
+    def info(self, path: Path, like: Path | None = None) -> FileInfo:
+        """Obtain the classification of a single file.
+
+        :param path: The file to classify.
+        :param like: A file that is known to have the same content as ``path``
+            (e.g., the file it was linked or copied from). If the classification of
+            that file is known, it is reused, rather than reading ``path``.
+        :returns: The classification of the file.
+        """
+        stat = path.lstat()
+        with self._lock:
+            cached = self._entries.get(path)
+            similar = self._entries.get(like) if like else None
+        if cached and (cached.size, cached.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return cached
+
+        if similar and similar.size == stat.st_size:
+            info = similar._replace(mtime_ns=stat.st_mtime_ns)
+        else:
+            info = self.classify(path, stat)
+        with self._lock:
+            self._entries[path] = info
+        return info
+
+    def update(self, path: Path, like: Path | None = None) -> FileInfo:
+        """Record that a file has been written.
+
+        :param path: The file that has been written.
+        :param like: A file that is known to have the same content as ``path``.
+        :returns: The new classification of the file.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+        return self.info(path, like=like)
+
+    def _scan_directory(self, path: Path) -> list[tuple[Path, FileInfo]]:
+        with os.scandir(path) as entries:
+            return [
+                (Path(entry.path), self.info(Path(entry.path))) for entry in entries
+            ]
+
+    def scan(self, root: Path) -> dict[Path, FileInfo]:
+        """Classify every file and directory in a tree.
+
+        Directories are listed (and their content classified) concurrently. Symbolic
+        links are classified as links; they aren't followed.
+
+        :param root: The root of the tree. If it doesn't exist, the tree is empty.
+        :returns: A dictionary mapping every path in the tree to its
+            classification. Every directory appears before its content.
+        """
+        entries = {}
+        if not root.is_dir():
+            return entries
+
+        pending = {self.tools.executor.submit_io(self._scan_directory, root)}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                for path, info in future.result():
+                    entries[path] = info
+                    if info.kind == self.DIRECTORY:
+                        pending.add(
+                            self.tools.executor.submit_io(self._scan_directory, path)
+                        )
+        return entries
+
+
 class AppPackagesMergeMixin(_MixinBase):
     # A mixin containing the utilities to merge independent platform-specific
     # app_packages folders into a single "fat" app_packages folder.
     # This is currently only used by macOS, but it *could* be required on iOS
     # if they ever re-introduce multiple on-device architectures.
 
+    @property
+    def file_index(self) -> FileIndex:
+        """The index of the types of files, shared by every pass of the build."""
+        return FileIndex.shared(self.tools)
+
     def find_binary_packages(
         self,
         install_path: Path,
@@ -117,14 +709,84 @@ class AppPackagesMergeMixin(_MixinBase):
 
         return binary_packages
 
+    def _lipo_architectures(self, path: Path, lipo_info: str) -> tuple[bool, list[str]]:
+        """Determine the architectures in a binary from the output of ``lipo -info``.
+
+        :param path: The library file being processed.
+        :param lipo_info: The output of ``lipo -info`` for the library.
+        :returns: A tuple of whether the binary is fat, and the architectures in the
+            binary.
+        """
+        if lipo_info.startswith("Non-fat file: "):
+            return False, [lipo_info.strip().split(" ")[-1]]
+        elif lipo_info.startswith("Architectures in the fat file: "):
+            return True, lipo_info.strip().split(":")[-1].strip().split(" ")
+        else:
+            raise BriefcaseCommandError(f"Unable to determine architectures in {path}")
+
+    def _needs_thinning(
+        self,
+        path: Path,
+        fat: bool,
+        architectures: list[str],
+        arch: str,
+    ) -> bool:
+        """Determine if a binary needs to be thinned to a given architecture.
+
+        :param path: The library file being processed.
+        :param fat: Is the binary fat?
+        :param architectures: The architectures in the binary.
+        :param arch: The architecture that should be preserved.
+        :returns: True if the binary is fat, and needs to be thinned; False if the
+            binary is already thin.
+        """
+        if not fat:
+            self.console.verbose(f"{path} is already thin.")
+            return False
+        elif arch in architectures:
+            self.console.verbose(f"Thinning {path}")
+            return True
+        else:
+            raise BriefcaseCommandError(f"{path} does not contain a {arch} slice.")
+
+    def _thin_binary(self, path: Path, arch: str):
+        """Replace a fat binary with the slice for a given architecture.
+
+        :param path: The library file to thin.
+        :param arch: The architecture that should be preserved.
+        """
+        thin_lib_path = path.parent / f"{path.name}.{arch}"
+        try:
+            thin_mach_o(path, arch, thin_lib_path)
+        except (MachOError, OSError) as e:
+            raise BriefcaseCommandError(
+                f"Unable to create thin binary from {path}"
+            ) from e
+
+        # Having extracted the single architecture into a temporary file, replace
+        # the original with the thin version.
+        self.tools.shutil.move(thin_lib_path, path)
+        self.file_index.update(path)
+
     def ensure_thin_binary(self, path: Path, arch: str):
         """Ensure that a binary is thin, targeting a given architecture.
 
-        If the library is already thin, it is left as-is.
+        If the library is already thin, it is left as-is. The binary is inspected
+        and thinned in-process; ``lipo`` is only used if the binary can't be
+        processed in-process.
 
         :param path: The library file to process.
         :param arch: The architecture that should be preserved.
         """
+        try:
+            fat, architectures = mach_o_architectures(path)
+        except MachOError as e:
+            self.console.debug(f"Using lipo to process {path}: {e}")
+        else:
+            if self._needs_thinning(path, fat, architectures, arch):
+                self._thin_binary(path, arch)
+            return
+
         try:
             output = self.tools.subprocess.check_output(
                 ["lipo", "-info", path],
@@ -134,78 +796,87 @@ class AppPackagesMergeMixin(_MixinBase):
                 f"Unable to inspect architectures in {path}"
             ) from e
         else:
-            if output.startswith("Non-fat file: "):
-                self.console.verbose(f"{path} is already thin.")
-            elif output.startswith("Architectures in the fat file: "):
-                architectures = set(output.strip().split(":")[-1].strip().split(" "))
-                if arch in architectures:
-                    self.console.verbose(f"Thinning {path}")
-                    try:
-                        thin_lib_path = path.parent / f"{path.name}.{arch}"
-                        self.tools.subprocess.run(
-                            [
-                                "lipo",
-                                "-thin",
-                                arch,
-                                "-output",
-                                thin_lib_path,
-                                path,
-                            ],
-                            check=True,
-                        )
-                    except subprocess.CalledProcessError as e:
-                        raise BriefcaseCommandError(
-                            f"Unable to create thin binary from {path}"
-                        ) from e
-                    else:
-                        # Having extracted the single architecture into a temporary
-                        # file, replace the original with the thin version.
-                        self.tools.shutil.move(thin_lib_path, path)
-                else:
-                    raise BriefcaseCommandError(
-                        f"{path} does not contain a {arch} slice."
+            if self._needs_thinning(
+                path, *self._lipo_architectures(path, output), arch
+            ):
+                try:
+                    thin_lib_path = path.parent / f"{path.name}.{arch}"
+                    self.tools.subprocess.run(
+                        [
+                            "lipo",
+                            "-thin",
+                            arch,
+                            "-output",
+                            thin_lib_path,
+                            path,
+                        ],
+                        check=True,
                     )
-            else:
-                raise BriefcaseCommandError(
-                    f"Unable to determine architectures in {path}"
-                )
+                except subprocess.CalledProcessError as e:
+                    raise BriefcaseCommandError(
+                        f"Unable to create thin binary from {path}"
+                    ) from e
+                else:
+                    # Having extracted the single architecture into a temporary
+                    # file, replace the original with the thin version.
+                    self.tools.shutil.move(thin_lib_path, path)
 
-    def lipo_dylib(self, relative_path: Path, target_path: Path, sources: list[Path]):
-        """Create a fat library by invoking lipo on multiple source libraries.
+    def _lipo_create_command(
+        self,
+        relative_path: Path,
+        target_path: Path,
+        sources: list[Path],
+    ) -> list[str | Path]:
+        """The lipo command to create a fat library from multiple source libraries.
 
         :param relative_path: The path fragment for the dylib, relative to the root
         :param target_path: The root location where the fat library will be written
         :param sources: A list of root locations providing single platform libraries.
         """
-        self.console.verbose(f"Creating fat library {relative_path}")
+        # Add all the constructed source paths. If the original binary is universal,
+        # or the binary is only needed on *some* platforms (e.g., libjpeg isn't
+        # included in the x86_64 Pillow wheel), the source won't exist, so only
+        # merge sources that actually exist. lipo allows creating a "fat"
+        # single-platform binary; it's effectively a copy.
+        return [
+            "lipo",
+            "-create",
+            "-output",
+            target_path / relative_path,
+        ] + [
+            source_path / relative_path
+            for source_path in sources
+            if (source_path / relative_path).is_file()
+        ]
+
+    def _create_fat_library(
+        self,
+        relative_path: Path,
+        target_path: Path,
+        sources: list[Path],
+    ) -> bool:
+        """Create a fat library from multiple source libraries, in-process.
 
+        :param relative_path: The path fragment for the dylib, relative to the root
+        :param target_path: The root location where the fat library will be written
+        :param sources: A list of root locations providing single platform libraries.
+        :returns: True if the library was created; False if the libraries can't be
+            processed in-process, and lipo must be used instead.
+        """
         try:
-            # Ensure the directory where the library will be written exists.
-            (target_path / relative_path).parent.mkdir(exist_ok=True, parents=True)
-
-            # Add all the constructed source paths. If the original binary is universal,
-            # or the binary is only needed on *some* platforms (e.g., libjpeg isn't
-            # included in the x86_64 Pillow wheel), the source won't exist, so only
-            # merge sources that actually exist. lipo allows creating a "fat"
-            # single-platform binary; it's effectively a copy.
-            self.tools.subprocess.run(
+            create_fat_mach_o(
+                target_path / relative_path,
                 [
-                    "lipo",
-                    "-create",
-                    "-output",
-                    target_path / relative_path,
-                ]
-                + [
                     source_path / relative_path
                     for source_path in sources
                     if (source_path / relative_path).is_file()
                 ],
-                check=True,
             )
-        except subprocess.CalledProcessError as e:
-            raise BriefcaseCommandError(
-                f"Unable to create fat library for {relative_path}"
-            ) from e
+        except MachOError as e:
+            self.console.debug(f"Using lipo to merge {relative_path}: {e}")
+            return False
+        self.file_index.update(target_path / relative_path)
+        return True
 
     def thin_app_packages(
         self,
@@ -213,38 +884,109 @@ class AppPackagesMergeMixin(_MixinBase):
         arch: str,
     ):
         """Ensure that all the dylibs in a given app_packages folder are thin."""
-        dylibs = []
-        for source_path in app_packages.glob("**/*"):
-            if not source_path.is_dir() and is_mach_o_binary(source_path):
-                dylibs.append(source_path)
+        entries = self.file_index.scan(app_packages)
+        dylibs = [
+            path for path, info in entries.items() if info.kind == FileIndex.MACH_O
+        ]
 
-        # Call lipo on each dylib that was found to ensure it is thin.
+        # Ensure that each dylib that was found is thin.
         if dylibs:
-            # Do this in a threadpool to make it run faster.
-            progress_bar = self.console.progress_bar()
             self.console.info(f"Thinning libraries in {app_packages.name}...")
-            task_id = progress_bar.add_task("Create fat libraries", total=len(dylibs))
-            with (
-                progress_bar,
-                concurrent.futures.ThreadPoolExecutor(
-                    max_workers=1 if self.console.is_deep_debug else None
-                ) as executor,
-            ):
-                futures = []
-                for path in dylibs:
-                    future = executor.submit(
-                        self.ensure_thin_binary,
-                        path=path,
-                        arch=arch,
+
+            # Inspect and thin each dylib in-process, collecting the dylibs that
+            # can't be processed in-process, so they can be handled by lipo.
+            lipo_dylibs = []
+            for path in dylibs:
+                info = entries[path]
+                if info.architectures is None:
+                    self.console.debug(
+                        f"Using lipo to process {path}: Unable to read Mach-O header"
+                    )
+                    lipo_dylibs.append(path)
+                elif self._needs_thinning(
+                    path, info.fat, list(info.architectures), arch
+                ):
+                    self._thin_binary(path, arch)
+
+            # Each remaining dylib can be inspected (and thinned) independently, so
+            # run the lipo calls concurrently to make it run faster.
+            if lipo_dylibs:
+                try:
+                    lipo_infos = self.tools.subprocess.check_output_many(
+                        [["lipo", "-info", path] for path in lipo_dylibs],
+                        progress="Inspect libraries",
                     )
-                    futures.append(future)
-                for future in concurrent.futures.as_completed(futures):
-                    progress_bar.update(task_id, advance=1)
-                    if future.exception():
-                        raise future.exception()
+                except subprocess.CalledProcessError as e:
+                    raise BriefcaseCommandError(
+                        f"Unable to inspect architectures in {e.cmd[-1]}"
+                    ) from e
+            else:
+                lipo_infos = []
+
+            fat_dylibs = [
+                path
+                for path, lipo_info in zip(lipo_dylibs, lipo_infos, strict=True)
+                if self._needs_thinning(
+                    path, *self._lipo_architectures(path, lipo_info), arch
+                )
+            ]
+            if fat_dylibs:
+                try:
+                    self.tools.subprocess.run_many(
+                        [
+                            [
+                                "lipo",
+                                "-thin",
+                                arch,
+                                "-output",
+                                path.parent / f"{path.name}.{arch}",
+                                path,
+                            ]
+                            for path in fat_dylibs
+                        ],
+                        check=True,
+                        progress="Thin libraries",
+                    )
+                except subprocess.CalledProcessError as e:
+                    raise BriefcaseCommandError(
+                        f"Unable to create thin binary from {e.cmd[-1]}"
+                    ) from e
+
+                # Having extracted the single architecture into a temporary
+                # file, replace the original with the thin version.
+                for path in fat_dylibs:
+                    self.tools.shutil.move(path.parent / f"{path.name}.{arch}", path)
+                    self.file_index.update(path)
         else:
             self.console.info("No libraries require thinning.")
 
+    def _different_files(self, pairs: list[tuple[Path, Path]]) -> set[Path]:
+        """Compare the content of pairs of files.
+
+        Files with different sizes are different; the remaining files are hashed
+        concurrently, with each file hashed at most once.
+
+        :param pairs: A list of (original, other) file paths to compare.
+        :returns: The set of ``other`` paths whose content differs from the
+            original.
+        """
+        different = set()
+        to_hash = []
+        for original, other in pairs:
+            if original.stat().st_size != other.stat().st_size:
+                different.add(other)
+            else:
+                to_hash.append((original, other))
+
+        futures = {}
+        for path in {path for pair in to_hash for path in pair}:
+            futures[path] = self.tools.executor.submit(sha256_file_digest, path)
+
+        for original, other in to_hash:
+            if futures[original].result() != futures[other].result():
+                different.add(other)
+        return different
+
     def merge_app_packages(
         self,
         target_app_packages: Path,
@@ -260,75 +1002,120 @@ class AppPackagesMergeMixin(_MixinBase):
             self.tools.shutil.rmtree(target_app_packages)
         self.tools.os.mkdir(target_app_packages)
 
-        # Copy all the non-library files from the source to the target. If a file exists
-        # in multiple sources, do a checksum, and warn if there is a discrepancy. If
-        # there is a discrepancy, the version from the first source is what will be
-        # used. Don't warn if the file is in a __pycache__ folder; these will always be
-        # different, but they'll be purged later anyway. Don't warn for anything in a
-        # .dist-info folder either; these are going to be different because of platform
-        # difference, but core package metadata should be consistent.
+        # Copy all the non-library files from the source to the target, and find the
+        # dylibs that need to be merged, in a single pass over each source. Files are
+        # hard linked into the target if possible, rather than being copied. If a file
+        # exists in multiple sources, the version from the first source is what will
+        # be used; the files are compared later.
         dylibs = set()
-        digests = {}
+        originals = {}
+        collisions = []
+        link = True
         for source_app_packages in sources:
             with self.console.wait_bar(f"Merging {source_app_packages.name}..."):
-                for source_path in source_app_packages.glob("**/*"):
+                entries = self.file_index.scan(source_app_packages)
+                for source_path, info in entries.items():
                     relative_path = source_path.relative_to(source_app_packages)
                     target_path = target_app_packages / relative_path
-                    if source_path.is_dir():
+                    if info.kind == FileIndex.DIRECTORY:
                         target_path.mkdir(exist_ok=True)
+                    elif info.kind == FileIndex.MACH_O:
+                        # Dynamic libraries need to be merged in a second pass
+                        dylibs.add(relative_path)
+                    elif relative_path in originals:
+                        # Don't compare files in a __pycache__ folder; these will
+                        # always be different, but they'll be purged later anyway.
+                        # Don't compare anything in a .dist-info folder either;
+                        # these are going to be different because of platform
+                        # difference, but core package metadata should be
+                        # consistent.
+                        if not (
+                            relative_path.parent.name == "__pycache__"
+                            or Path(relative_path.parts[0]).suffix == ".dist-info"
+                        ):
+                            collisions.append(
+                                (relative_path, source_app_packages, source_path)
+                            )
+                    elif info.kind == FileIndex.SYMLINK:
+                        # Preserve symbolic links as links.
+                        self.tools.shutil.copy(
+                            source_path, target_path, follow_symlinks=False
+                        )
+                        originals[relative_path] = source_path
                     else:
-                        if is_mach_o_binary(source_path):
-                            # Dynamic libraries need to be merged in a second pass
-                            dylibs.add(relative_path)
-                        elif target_path.exists():
-                            # The file already exists. Check for differences; if there
-                            # are any differences outside `dist-info` or `__pycache__`
-                            # folders, warn the user.
-                            digest = sha256_file_digest(source_path)
-                            if digests[relative_path] != digest and not (
-                                relative_path.parent.name == "__pycache__"
-                                or Path(relative_path.parts[0]).suffix == ".dist-info"
-                            ):
-                                self.console.warning(
-                                    f"{relative_path} has different content between"
-                                    " sources; ignoring"
-                                    f" {source_app_packages.suffix[1:]} version. This"
-                                    " is usually safe if the file content is not used"
-                                    " at runtime. See"
-                                    " https://briefcase.readthedocs.io/en/stable/reference/platforms/macOS/index.html#inconsistent-content-in-non-universal-wheels"
-                                    " for more details."
-                                )
-                        else:
-                            # The file doesn't exist yet; copy it as is (including
-                            # permissions), and store the digest for later comparison
+                        # The file doesn't exist yet; link it (or copy it as is,
+                        # including permissions) into the target.
+                        if link:
+                            try:
+                                self.tools.os.link(source_path, target_path)
+                            except OSError:
+                                # The target is on a different filesystem (or the
+                                # filesystem doesn't support links); copy all files.
+                                link = False
+                        if not link:
                             self.tools.shutil.copy(source_path, target_path)
-                            digests[relative_path] = sha256_file_digest(source_path)
+                        self.file_index.update(target_path, like=source_path)
+                        originals[relative_path] = source_path
 
-        # Call lipo on each dylib that was found to create the fat version.
+        # Warn the user about any file that has different content between sources.
+        # Only the files that exist in more than one source need to be hashed; a
+        # difference in size doesn't need a hash to be detected.
+        different = self._different_files(
+            [
+                (originals[relative_path], source_path)
+                for relative_path, _, source_path in collisions
+            ]
+        )
+        for relative_path, source_app_packages, source_path in collisions:
+            if source_path in different:
+                self.console.warning(
+                    f"{relative_path} has different content between"
+                    " sources; ignoring"
+                    f" {source_app_packages.suffix[1:]} version. This"
+                    " is usually safe if the file content is not used"
+                    " at runtime. See"
+                    " https://briefcase.readthedocs.io/en/stable/reference/platforms/macOS/index.html#inconsistent-content-in-non-universal-wheels"
+                    " for more details."
+                )
+
+        # Create the fat version of each dylib that was found.
         if dylibs:
-            # Do this in a threadpool to make it run faster.
-            progress_bar = self.console.progress_bar()
             self.console.info("Merging libraries...")
-            task_id = progress_bar.add_task("Create fat libraries", total=len(dylibs))
-            with (
-                progress_bar,
-                concurrent.futures.ThreadPoolExecutor(
-                    max_workers=1 if self.console.is_deep_debug else None
-                ) as executor,
-            ):
-                futures = []
-                for relative_path in dylibs:
-                    future = executor.submit(
-                        self.lipo_dylib,
-                        target_path=target_app_packages,
-                        relative_path=relative_path,
-                        sources=sources,
+            lipo_dylibs = []
+            for relative_path in sorted(dylibs):
+                self.console.verbose(f"Creating fat library {relative_path}")
+                # Ensure the directory where the library will be written exists.
+                (target_app_packages / relative_path).parent.mkdir(
+                    exist_ok=True, parents=True
+                )
+                if not self._create_fat_library(
+                    relative_path, target_app_packages, sources
+                ):
+                    lipo_dylibs.append(relative_path)
+
+            # Each remaining fat library can be created independently, so run the
+            # lipo calls concurrently to make it run faster.
+            try:
+                if lipo_dylibs:
+                    self.tools.subprocess.run_many(
+                        [
+                            self._lipo_create_command(
+                                relative_path=relative_path,
+                                target_path=target_app_packages,
+                                sources=sources,
+                            )
+                            for relative_path in lipo_dylibs
+                        ],
+                        check=True,
+                        progress="Create fat libraries",
                     )
-                    futures.append(future)
-                for future in concurrent.futures.as_completed(futures):
-                    progress_bar.update(task_id, advance=1)
-                    if future.exception():
-                        raise future.exception()
+                    for relative_path in lipo_dylibs:
+                        self.file_index.update(target_app_packages / relative_path)
+            except subprocess.CalledProcessError as e:
+                relative_path = Path(e.cmd[3]).relative_to(target_app_packages)
+                raise BriefcaseCommandError(
+                    f"Unable to create fat library for {relative_path}"
+                ) from e
         else:
             self.console.info("No libraries require merging.")
 
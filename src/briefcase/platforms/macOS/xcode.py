@@ -75,6 +75,7 @@ class macOSXcodeUpdateCommand(macOSXcodeCreateCommand, UpdateCommand):
 class macOSXcodeBuildCommand(macOSXcodeMixin, BuildCommand):
     description = "Build a macOS Xcode project."
     supports_debugger = True
+    supports_precompile = True
 
     def build_app(self, app: BaseConfig, **kwargs):
         """Build the Xcode project for the application.
@@ -7,7 +7,7 @@ from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path, PurePosixPath
 from textwrap import dedent, indent
 from typing import Any
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from briefcase.console import Console
 from briefcase.exceptions import (
@@ -601,6 +601,10 @@ class LocalHTTPServer(ThreadingHTTPServer):
 
 class StaticWebRunCommand(StaticWebMixin, RunCommand):
     description = "Run a static web project."
+    supports_watch = True
+    # Has a browser been opened on the server? When watching for changes, the server
+    # is restarted after each rebuild, but the browser only needs to be opened once.
+    browser_opened = False
 
     def add_options(self, parser):
         super().add_options(parser)
@@ -684,8 +688,9 @@ class StaticWebRunCommand(StaticWebMixin, RunCommand):
 
             self.console.info(f"Web server open on {url}")
             # If requested, open a browser tab on the newly opened server.
-            if open_browser:
+            if open_browser and not self.browser_opened:
                 webbrowser.open_new_tab(url)
+                self.browser_opened = True
 
             self.console.info(
                 "Web server log output (type CTRL-C to stop log)...",
@@ -694,7 +699,14 @@ class StaticWebRunCommand(StaticWebMixin, RunCommand):
             self.console.info("=" * 75)
 
             # Run the server.
-            httpd.serve_forever()
+            if self.file_watcher:
+                # Serve requests until the app's code changes, so that the app can
+                # be rebuilt.
+                httpd.timeout = self.file_watcher.POLL_INTERVAL
+                while not self.file_watcher.changed():
+                    httpd.handle_request()
+            else:
+                httpd.serve_forever()
         except PermissionError as e:
             if port < 1024:
                 raise BriefcaseCommandError(
@@ -718,7 +730,10 @@ class StaticWebRunCommand(StaticWebMixin, RunCommand):
                 "Unable to start web server. Port must be in the range 0-65535."
             ) from e
         except KeyboardInterrupt:
-            # CTRL-C is the accepted way to stop the server.
+            # CTRL-C is the accepted way to stop the server. When watching for
+            # changes, it also stops watching.
+            if self.file_watcher:
+                raise
             httpd.shutdown()
         finally:
             if httpd:
@@ -755,11 +770,13 @@ class StaticWebPackageCommand(StaticWebMixin, PackageCommand):
         )
 
         with self.console.wait_bar("Building archive..."):
-            self.tools.shutil.make_archive(
-                self.distribution_path(app).with_suffix(""),
-                format="zip",
-                root_dir=self.project_path(app),
-            )
+            self.distribution_path(app).parent.mkdir(parents=True, exist_ok=True)
+            with ZipFile(self.distribution_path(app), "w", ZIP_DEFLATED) as archive:
+
+                def add_to_archive(relative_path, entry):
+                    archive.write(entry.path, relative_path)
+
+                self.tools.file.walk(self.project_path(app), [add_to_archive])
 
 
 class StaticWebPublishCommand(StaticWebMixin, PublishCommand):
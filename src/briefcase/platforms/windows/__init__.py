@@ -443,6 +443,7 @@ files that Briefcase can convert and merge automatically.
 
 class WindowsRunCommand(RunCommand):
     supports_debugger = True
+    supports_profile_app = True
 
     def run_app(
         self,
@@ -492,6 +493,8 @@ class WindowsRunCommand(RunCommand):
 
 
 class WindowsPackageCommand(PackageCommand):
+    supports_prune = True
+
     ADHOC_SIGN_HELP = (
         "Perform no signing on the app. "
         "Your app will be reported as coming from an unverified publisher."
@@ -723,10 +726,11 @@ class WindowsPackageCommand(PackageCommand):
             zip_root = f"{app.formal_name}-{app.version}"
 
             with ZipFile(self.distribution_path(app), "w", ZIP_DEFLATED) as archive:
-                for file_path in source.glob("**/*"):
-                    archive.write(
-                        file_path, zip_root / PurePath(file_path).relative_to(source)
-                    )
+
+                def add_to_archive(relative_path, entry):
+                    archive.write(entry.path, f"{zip_root}/{relative_path}")
+
+                self.tools.file.walk(source, [add_to_archive])
 
                 executable_path = self.binary_path(app)
                 config_path = executable_path.with_name(
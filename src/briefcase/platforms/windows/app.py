@@ -50,6 +50,7 @@ class WindowsAppOpenCommand(WindowsAppMixin, OpenCommand):
 class WindowsAppBuildCommand(WindowsAppMixin, BuildCommand):
     description = "Build a Windows app."
     supports_debugger = True
+    supports_precompile = True
 
     def verify_tools(self):
         super().verify_tools()
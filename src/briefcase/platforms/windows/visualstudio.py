@@ -47,6 +47,7 @@ class WindowsVisualStudioOpenCommand(WindowsVisualStudioMixin, OpenCommand):
 class WindowsVisualStudioBuildCommand(WindowsVisualStudioMixin, BuildCommand):
     description = "Build a Visual Studio project."
     supports_debugger = True
+    supports_precompile = True
 
     def verify_tools(self):
         super().verify_tools()
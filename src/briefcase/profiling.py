@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import io
+import math
+import os
+import pstats
+import re
+import statistics
+import time
+from pathlib import Path
+
+from briefcase.config import FinalizedAppConfig
+from briefcase.integrations.subprocess import StopStreaming
+
+
+class AppProfiler:
+    """Profile an app while it runs, and summarize the profile when it exits."""
+
+    CPROFILE = "cprofile"
+    IMPORTTIME = "importtime"
+    MODES = (CPROFILE, IMPORTTIME)
+
+    # A line of output produced by ``-X importtime``
+    IMPORT_TIME_RE = re.compile(
+        r"import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| *(?P<module>\S+)"
+    )
+    # The number of entries to include in the summary of a profile
+    SUMMARY_LENGTH = 20
+
+    def __init__(self, mode: str, profile_path: Path):
+        """
+        :param mode: The profiling mode; one of ``AppProfiler.MODES``.
+        :param profile_path: The path where a cProfile profile will be written.
+        """
+        self.mode = mode
+        self.profile_path = profile_path
+        # (cumulative, self, module) times for each module imported, in microseconds
+        self.import_times = []
+
+    def main_module(self, app: FinalizedAppConfig) -> str:
+        """The module that should be started as ``__main__``.
+
+        :param app: The app being profiled.
+        """
+        if self.mode == self.CPROFILE:
+            return "cProfile"
+        return app.main_module()
+
+    def arguments(self, app: FinalizedAppConfig) -> list[str]:
+        """The arguments that must precede any passthrough arguments when starting
+        the main module.
+
+        :param app: The app being profiled.
+        """
+        if self.mode == self.CPROFILE:
+            return ["-o", os.fsdecode(self.profile_path), "-m", app.main_module()]
+        return []
+
+    def environment(self) -> dict[str, str]:
+        """Any additional environment variables needed to profile the app."""
+        if self.mode == self.IMPORTTIME:
+            # Equivalent of passing "-X importtime"
+            return {"PYTHONPROFILEIMPORTTIME": "1"}
+        return {}
+
+    def filter(self, filter_func):
+        """Wrap a log filter so that any import timing output is recorded.
+
+        :param filter_func: The log filter for the app.
+        """
+
+        def _filter(line):
+            if match := self.IMPORT_TIME_RE.search(line):
+                self.import_times.append(
+                    (
+                        int(match["cumulative"]),
+                        int(match["self"]),
+                        match["module"],
+                    )
+                )
+            yield from filter_func(line)
+
+        return _filter
+
+    def summary(self) -> str | None:
+        """Summarize the profile of the app.
+
+        :returns: A text summary of the profile, or None if no profile information
+            was captured.
+        """
+        if self.mode == self.CPROFILE:
+            if not self.profile_path.exists():
+                return None
+            output = io.StringIO()
+            stats = pstats.Stats(os.fsdecode(self.profile_path), stream=output)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.SUMMARY_LENGTH)
+            return output.getvalue().strip("\n")
+        else:
+            if not self.import_times:
+                return None
+            lines = ["cumulative (ms)   self (ms)  module"]
+            for cumulative, own, module in sorted(self.import_times, reverse=True)[
+                : self.SUMMARY_LENGTH
+            ]:
+                lines.append(f"{cumulative / 1000:15.1f} {own / 1000:11.1f}  {module}")
+            return "\n".join(lines)
+
+
+class StartupBenchmark:
+    """Measure how long an app takes to start, over a number of runs."""
+
+    def __init__(self, runs: int, startup_marker: str | None, drop_caches: bool):
+        """
+        :param runs: The number of times the app will be started.
+        :param startup_marker: A regex that matches the line of log output that
+            indicates the app has started; or None if the app has started when it
+            reports the result of its test suite.
+        :param drop_caches: Should filesystem caches be dropped before each run?
+        """
+        self.runs = runs
+        self.startup_marker = startup_marker
+        self.drop_caches = drop_caches
+        # The startup time of each run that has completed, in seconds.
+        self.durations = []
+        # Was the current run stopped because the startup marker was seen?
+        self.marker_seen = False
+        self._start = None
+
+    def start(self):
+        """Start timing a run; invoked immediately before the app is launched."""
+        self.marker_seen = False
+        self._start = time.perf_counter()
+
+    def _stop(self):
+        """Finish timing the current run."""
+        if self._start is not None:
+            self.durations.append(time.perf_counter() - self._start)
+            self._start = None
+
+    @property
+    def running(self) -> bool:
+        """Is a run being timed that hasn't detected the startup of the app?"""
+        return self._start is not None
+
+    def exit_filter(self, exit_filter):
+        """Wrap the exit filter for an app so that startup can be detected.
+
+        If there is a startup marker, the log stream stops as soon as the marker is
+        seen; otherwise, the app has started when the exit filter detects an exit
+        condition.
+
+        :param exit_filter: The exit filter for the app; see ``LogFilter``.
+        :returns: An exit filter that times the startup of the app.
+        """
+        if self.startup_marker is None:
+
+            def filter_func(recent):
+                returncode = exit_filter(recent)
+                if returncode is not None:
+                    self._stop()
+                return returncode
+
+            filter_func.marker = getattr(exit_filter, "marker", None)
+        else:
+            regex = re.compile(self.startup_marker, flags=re.MULTILINE)
+
+            def filter_func(recent):
+                if regex.search(recent):
+                    self._stop()
+                    self.marker_seen = True
+                    raise StopStreaming()
+
+            # The startup marker is provided by the user, so it is always searched.
+            filter_func.marker = None
+
+        return filter_func
+
+    def results(self) -> dict[str, float]:
+        """Compute statistics over the startup times that have been recorded.
+
+        The 95th percentile uses the nearest-rank method, so it is always one of the
+        recorded startup times.
+
+        :returns: The minimum, median and 95th percentile startup times, in seconds.
+        """
+        durations = sorted(self.durations)
+        return {
+            "min": durations[0],
+            "median": statistics.median(durations),
+            "p95": durations[math.ceil(0.95 * len(durations)) - 1],
+        }
@@ -0,0 +1,282 @@
+"""A pytest plugin that records the files used by each test, and only runs the tests
+that are affected by changes to those files.
+
+This plugin is used by ``briefcase dev --test --changed``. It runs in the app's
+environment, rather than Briefcase's, so it can only use the standard library and
+pytest. It is enabled by ``PYTEST_PLUGINS``, and configured by the JSON file named by
+the ``BRIEFCASE_CHANGED_TESTS`` environment variable. The configuration has the keys:
+
+* ``map_path``: the file where the map of tests to files is stored;
+* ``token``: an identifier for the run, written to the map so that Briefcase can
+  confirm the map was written by this run;
+* ``roots``: the files, and directories of files, that should be recorded;
+* ``changed``: the files that have changed since the map was last written; or
+  ``null`` to run every test.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+CONFIG_ENV_VAR = "BRIEFCASE_CHANGED_TESTS"
+MAP_VERSION = 1
+
+
+class FileRecorder:
+    """Record the files containing the Python code that is executed.
+
+    On Python 3.12+, ``sys.monitoring`` is used, so each function only reports its
+    first call; on older versions, a profile function is used.
+    """
+
+    # The sys.monitoring tool IDs that aren't reserved for other kinds of tools.
+    TOOL_IDS = (3, 4)
+
+    def __init__(self):
+        self.filenames = set()
+        self.tool_id = None
+
+        if hasattr(sys, "monitoring"):  # pragma: no-cover-if-lt-py312
+            for tool_id in self.TOOL_IDS:
+                try:
+                    sys.monitoring.use_tool_id(tool_id, "briefcase")
+                except ValueError:
+                    continue
+                self.tool_id = tool_id
+                sys.monitoring.register_callback(
+                    tool_id, sys.monitoring.events.PY_START, self._py_start
+                )
+                break
+
+    def _py_start(self, code, offset):  # pragma: no-cover-if-lt-py312
+        self.filenames.add(code.co_filename)
+        return sys.monitoring.DISABLE
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self.filenames.add(frame.f_code.co_filename)
+
+    def start(self):
+        """Start recording files."""
+        self.filenames = set()
+        if self.tool_id is not None:  # pragma: no-cover-if-lt-py312
+            # Functions that were reported by a previous recording must be reported
+            # again.
+            sys.monitoring.restart_events()
+            sys.monitoring.set_events(self.tool_id, sys.monitoring.events.PY_START)
+        else:  # pragma: no-cover-if-gte-py312
+            threading.setprofile(self._profile)
+            sys.setprofile(self._profile)
+
+    def stop(self) -> set[str]:
+        """Stop recording files.
+
+        :returns: The files containing code that was executed since recording
+            started.
+        """
+        if self.tool_id is not None:  # pragma: no-cover-if-lt-py312
+            sys.monitoring.set_events(self.tool_id, 0)
+        else:  # pragma: no-cover-if-gte-py312
+            sys.setprofile(None)
+            threading.setprofile(None)
+        return self.filenames
+
+    def close(self):
+        """Release the resources used by the recorder."""
+        if self.tool_id is not None:  # pragma: no-cover-if-lt-py312
+            sys.monitoring.register_callback(
+                self.tool_id, sys.monitoring.events.PY_START, None
+            )
+            sys.monitoring.free_tool_id(self.tool_id)
+            self.tool_id = None
+
+
+class ChangedTestsPlugin:
+    """Select the tests affected by changed files, and record the files each test
+    uses."""
+
+    def __init__(self, config: dict):
+        """
+        :param config: The plugin configuration.
+        """
+        self.map_path = Path(config["map_path"])
+        self.token = config["token"]
+        self.roots = set(config["roots"])
+        self.root_dirs = tuple(os.path.join(root, "") for root in self.roots)
+        self.changed = None if config["changed"] is None else set(config["changed"])
+
+        try:
+            with self.map_path.open(encoding="utf-8") as f:
+                previous = json.load(f)
+            if previous.get("version") != MAP_VERSION:
+                raise ValueError("Incompatible map version")
+            self.tests = previous["tests"]
+            self.failed = set(previous["failed"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.tests = {}
+            self.failed = set()
+
+        if self.changed is None:
+            # Every test will be run, so the previous results aren't needed.
+            self.tests = {}
+            self.failed = set()
+
+        self.recorder = FileRecorder()
+        # The files used when importing each test module, keyed by node ID.
+        self.module_files = {}
+        # Canonical paths of recorded files, keyed by the file name reported by
+        # Python; or None if the file isn't in one of the roots.
+        self._paths = {}
+        self.deselected = 0
+
+    def _path(self, filename: str) -> str | None:
+        """Find the canonical path of a file, if it should be recorded.
+
+        :param filename: The file name, as reported by Python.
+        :returns: The canonical path; or None if the file isn't in one of the roots.
+        """
+        try:
+            return self._paths[filename]
+        except KeyError:
+            path = os.path.realpath(filename)
+            if path not in self.roots and not path.startswith(self.root_dirs):
+                path = None
+            self._paths[filename] = path
+            return path
+
+    def _paths_of(self, filenames) -> set[str]:
+        return {path for path in map(self._path, filenames) if path is not None}
+
+    @staticmethod
+    def _module_node_id(item) -> str | None:
+        module = item.getparent(pytest.Module)
+        return None if module is None else module.nodeid
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        """Record the files used when a test module is imported."""
+        if not isinstance(collector, pytest.Module):
+            yield
+            return
+
+        self.recorder.start()
+        try:
+            outcome = yield
+        finally:
+            filenames = self.recorder.stop()
+
+        # Modules that were imported by an earlier test module aren't executed again;
+        # but the test module still depends on them. If the test module couldn't be
+        # imported, pytest will report the error.
+        report = outcome.get_result()
+        namespace = vars(collector.obj) if report.passed else {}
+        for value in list(namespace.values()):
+            if isinstance(value, type(sys)):
+                module_name = value.__name__
+            else:
+                module_name = getattr(value, "__module__", None)
+            if not isinstance(module_name, str):
+                continue
+
+            # A module depends on the packages that contain it.
+            parts = module_name.split(".")
+            for index in range(1, len(parts) + 1):
+                module = sys.modules.get(".".join(parts[:index]))
+                filename = getattr(module, "__file__", None)
+                if filename:
+                    filenames.add(filename)
+        self.module_files[collector.nodeid] = self._paths_of(filenames)
+
+    def _affected(self, item) -> bool:
+        """Is a test affected by the changed files?
+
+        :param item: The test.
+        """
+        files = self.tests.get(item.nodeid)
+        return (
+            files is None  # A new test
+            or item.nodeid in self.failed  # A test that failed last time
+            or not self.changed.isdisjoint(files)
+        )
+
+    def pytest_collection_modifyitems(self, config, items):
+        # Forget about tests that no longer exist.
+        node_ids = {item.nodeid for item in items}
+        self.tests = {
+            node_id: files
+            for node_id, files in self.tests.items()
+            if node_id in node_ids
+        }
+        self.failed &= node_ids
+
+        if self.changed is None:
+            return
+
+        selected = []
+        deselected = []
+        for item in items:
+            (selected if self._affected(item) else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+            self.deselected = len(deselected)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Record the files used by each test."""
+        # If the test fails again, it will be reported by pytest_runtest_logreport.
+        self.failed.discard(item.nodeid)
+
+        self.recorder.start()
+        try:
+            yield
+        finally:
+            files = self._paths_of(self.recorder.stop())
+        files.update(self.module_files.get(self._module_node_id(item), ()))
+        self.tests[item.nodeid] = sorted(files)
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.recorder.close()
+
+        # If every test was deselected, there's nothing to report.
+        if self.deselected and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = exitstatus = pytest.ExitCode.OK
+
+        # An interrupted or broken run doesn't provide a complete map.
+        if exitstatus not in {pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED}:
+            return
+
+        self.map_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.map_path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MAP_VERSION,
+                    "token": self.token,
+                    "tests": self.tests,
+                    "failed": sorted(self.failed),
+                },
+                f,
+            )
+        temp_path.replace(self.map_path)
+
+
+def pytest_configure(config):
+    config_path = os.environ.get(CONFIG_ENV_VAR)
+    if config_path:
+        with Path(config_path).open(encoding="utf-8") as f:
+            plugin_config = json.load(f)
+        config.pluginmanager.register(
+            ChangedTestsPlugin(plugin_config), "briefcase_changed_tests_selector"
+        )
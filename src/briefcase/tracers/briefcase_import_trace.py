@@ -0,0 +1,117 @@
+"""A script that records the modules and files that are used by an app.
+
+This script is used by ``briefcase package --prune``. It runs in the app's bundled
+Python, rather than Briefcase's environment, so it can only use the standard library.
+Briefcase passes the source of this script to the interpreter with ``-c``, so that it
+can be run inside containers that can't see Briefcase's install; the arguments are::
+
+    <output> <module_name> <entry_point> <app_path> [<requirements_path> ...]
+
+The app's code and requirements are added to the path. If ``entry_point`` is a module
+name, that module is run as ``__main__``; otherwise, every module of the app's
+``module_name`` package is imported. The names of every module that was imported, and
+the paths of the files in each requirements folder that were opened, are then written
+as JSON to ``output``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import pkgutil
+import runpy
+import site
+import sys
+
+
+class UsageRecorder:
+    """An audit hook that records the modules that are imported, and the files in a
+    set of folders that are opened."""
+
+    def __init__(self, roots: list[str]):
+        self.roots = [os.path.join(os.path.abspath(root), "") for root in roots]
+        self.modules = set()
+        self.files = [set() for _ in roots]
+        # Audit hooks can't be removed; the hook is disabled once recording is
+        # complete.
+        self.active = True
+
+    def __call__(self, event: str, args: tuple):
+        if not self.active:
+            return
+
+        if event == "import":
+            self.modules.add(args[0])
+        elif event in {"open", "ctypes.dlopen"} and isinstance(args[0], str):
+            path = os.path.abspath(args[0])
+            for root, files in zip(self.roots, self.files, strict=True):
+                if path.startswith(root):
+                    files.add(path[len(root) :].replace(os.sep, "/"))
+
+
+def import_app(module_name: str):
+    """Import every module of the app, except ``__main__`` modules.
+
+    Modules that can't be imported are reported, but otherwise ignored; they might
+    only be importable on other platforms.
+
+    :param module_name: The name of the app's top-level package.
+    """
+
+    def report(name):
+        sys.stderr.write(f"Unable to import {name}: {sys.exc_info()[1]}\n")
+
+    package = importlib.import_module(module_name)
+    for info in pkgutil.walk_packages(
+        getattr(package, "__path__", []),
+        f"{module_name}.",
+        onerror=report,
+    ):
+        if info.name.rpartition(".")[2] == "__main__" or info.ispkg:
+            continue
+        try:
+            importlib.import_module(info.name)
+        except (Exception, SystemExit):  # noqa: BLE001
+            report(info.name)
+
+
+def main(argv: list[str]) -> int:
+    output, module_name, entry_point, app_path, *requirements_paths = argv
+
+    recorder = UsageRecorder(requirements_paths)
+    sys.addaudithook(recorder)
+
+    # Modules imported by .pth files are used by the app, so the requirements
+    # are added to the path after recording has started.
+    for requirements_path in requirements_paths:
+        site.addsitedir(requirements_path)
+    sys.path.insert(0, app_path)
+
+    if entry_point:
+        # The entry point shouldn't see the arguments of this script.
+        del sys.argv[1:]
+        try:
+            runpy.run_module(entry_point, run_name="__main__", alter_sys=True)
+        except SystemExit as e:
+            if e.code:
+                raise
+    else:
+        import_app(module_name)
+
+    recorder.active = False
+    recorder.modules.update(sys.modules)
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "modules": sorted(recorder.modules),
+                "files": [sorted(files) for files in recorder.files],
+            },
+            f,
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
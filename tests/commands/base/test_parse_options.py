@@ -70,6 +70,46 @@ def test_verbosity(base_command, verbosity, log_level):
     assert base_command.console.verbosity == log_level
 
 
+@pytest.mark.parametrize(
+    ("plain", "expected"),
+    [
+        ("", None),
+        ("--plain", True),
+    ],
+)
+def test_plain(base_command, plain, expected):
+    """Plain text console output can be requested."""
+    base_command.parse_options(extra=filter(None, ("-r", "default", plain)))
+
+    assert base_command.console.plain is expected
+
+
+@pytest.mark.parametrize(
+    ("jobs", "expected"),
+    [
+        ((), None),
+        (("--jobs", "3"), 3),
+        (("-j", "1"), 1),
+    ],
+)
+def test_jobs(base_command, jobs, expected):
+    """The number of concurrent jobs can be requested."""
+    base_command.parse_options(extra=("-r", "default", *jobs))
+
+    assert base_command.tools.executor.jobs == expected
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "lots"])
+def test_invalid_jobs(base_command, capsys, jobs):
+    """The number of jobs must be a positive integer."""
+    with pytest.raises(SystemExit) as excinfo:
+        base_command.parse_options(extra=("-r", "default", "--jobs", jobs))
+
+    # Error code for an invalid option value
+    assert excinfo.value.code == 2
+    assert "is not a positive integer" in capsys.readouterr().err
+
+
 def test_missing_option(base_command, capsys):
     """If a required option isn't provided, an error is raised."""
     with pytest.raises(SystemExit) as excinfo:
@@ -0,0 +1,152 @@
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def app_packages_path(tmp_path):
+    return tmp_path / "base_path/build/first/tester/dummy/path/to/app_packages"
+
+
+@pytest.fixture
+def dedupe_app(build_command, first_app, app_packages_path):
+    build_command._briefcase_toml[first_app] = {
+        "paths": {
+            "app_path": "path/to/app",
+            "app_packages_path": "path/to/app_packages",
+        }
+    }
+
+    # Three wheels that vendor the same library; two of them vendor another
+    # identical library.
+    for name in ["numpy", "scipy", "pandas"]:
+        create_file(
+            app_packages_path / f"{name}.libs/libgfortran-abc123.so.5.0.0",
+            "gfortran",
+            chmod=0o755,
+        )
+    for name in ["numpy", "scipy"]:
+        create_file(app_packages_path / f"{name}.libs/libz-def456.so.1", "zlib")
+    # A library that is vendored inside a package.
+    create_file(app_packages_path / "sklearn/.libs/libz-def456.so.1", "zlib")
+    # A library with the same content, but different permissions.
+    create_file(app_packages_path / "other.libs/libz-def456.so.1", "zlib", chmod=0o700)
+
+    # Identical extension modules, and identical data files, are left alone.
+    create_file(app_packages_path / "first/_speedups.so", "speedups")
+    create_file(app_packages_path / "second/_speedups.so", "speedups")
+    create_file(app_packages_path / "first.libs/data.txt", "data")
+    create_file(app_packages_path / "second.libs/data.txt", "data")
+
+    return first_app
+
+
+def test_dedupe_libraries(build_command, dedupe_app, app_packages_path, capsys):
+    """Identical vendored libraries are replaced by hard links to a single copy."""
+    build_command.dedupe_libraries(dedupe_app)
+
+    gfortran = [
+        app_packages_path / f"{name}.libs/libgfortran-abc123.so.5.0.0"
+        for name in ["numpy", "pandas", "scipy"]
+    ]
+    zlib = [
+        app_packages_path / "numpy.libs/libz-def456.so.1",
+        app_packages_path / "scipy.libs/libz-def456.so.1",
+        app_packages_path / "sklearn/.libs/libz-def456.so.1",
+    ]
+    for paths in [gfortran, zlib]:
+        assert {path.stat().st_ino for path in paths} == {paths[0].stat().st_ino}
+        assert not any(path.is_symlink() for path in paths)
+    assert gfortran[0].read_text(encoding="utf-8") == "gfortran"
+    assert gfortran[0].stat().st_nlink == 3
+
+    # Files with different permissions, extension modules and data files are
+    # still separate files.
+    for path in [
+        app_packages_path / "other.libs/libz-def456.so.1",
+        app_packages_path / "first/_speedups.so",
+        app_packages_path / "second/_speedups.so",
+        app_packages_path / "first.libs/data.txt",
+        app_packages_path / "second.libs/data.txt",
+    ]:
+        assert path.stat().st_nlink == 1
+
+    assert "Linked 4 duplicated native libraries." in capsys.readouterr().out
+
+    # Deduplication can be repeated; libraries that are already linked are ignored.
+    build_command.dedupe_libraries(dedupe_app)
+    assert "Linked 0 duplicated native libraries." in capsys.readouterr().out
+    assert gfortran[0].stat().st_nlink == 3
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_dedupe_libraries_symlink(build_command, dedupe_app, app_packages_path):
+    """If hard links can't be created, relative symbolic links are used."""
+    with mock.patch("briefcase.commands.build.os.link", side_effect=OSError):
+        build_command.dedupe_libraries(dedupe_app)
+
+    link = app_packages_path / "scipy.libs/libz-def456.so.1"
+    assert link.is_symlink()
+    assert os.readlink(link) == "../numpy.libs/libz-def456.so.1"
+    assert link.read_text(encoding="utf-8") == "zlib"
+
+    link = app_packages_path / "sklearn/.libs/libz-def456.so.1"
+    assert os.readlink(link) == "../../numpy.libs/libz-def456.so.1"
+
+
+def test_dedupe_libraries_no_links(
+    build_command, dedupe_app, app_packages_path, capsys
+):
+    """If no links can be created, the copies are retained."""
+    with (
+        mock.patch("briefcase.commands.build.os.link", side_effect=OSError),
+        mock.patch("pathlib.Path.symlink_to", side_effect=OSError),
+    ):
+        build_command.dedupe_libraries(dedupe_app)
+
+    assert "Linked 0 duplicated native libraries." in capsys.readouterr().out
+    path = app_packages_path / "scipy.libs/libz-def456.so.1"
+    assert not path.is_symlink()
+    assert path.stat().st_nlink == 1
+    assert not path.with_name("libz-def456.so.1.briefcase-link").exists()
+
+
+def test_no_requirements(build_command, first_app, capsys):
+    """If the requirements aren't in the bundle, nothing is linked."""
+    build_command._briefcase_toml[first_app] = {"paths": {"app_path": "path/to/app"}}
+
+    build_command.dedupe_libraries(first_app)
+
+    assert "Linked 0 duplicated native libraries." in capsys.readouterr().out
+
+
+def test_build_dedupe_libraries(build_command, first_app):
+    """Libraries are deduplicated after the app has been compiled."""
+    build_command.apps = {"first": first_app}
+    build_command.supports_precompile = True
+    first_app.precompile = True
+
+    build_command.precompile_app = mock.MagicMock(
+        side_effect=lambda app: build_command.actions.append(
+            ("precompile", app.app_name)
+        )
+    )
+    build_command.dedupe_libraries = mock.MagicMock(
+        side_effect=lambda app: build_command.actions.append(("dedupe", app.app_name))
+    )
+
+    options, _ = build_command.parse_options([])
+    build_command(first_app, dedupe_libraries=True, **options)
+
+    assert build_command.actions[-3:] == [
+        ("precompile", "first"),
+        ("dedupe", "first"),
+        ("build", "first", False, False, {}),
+    ]
@@ -0,0 +1,175 @@
+import importlib.util
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    return tmp_path / "base_path/build/first/tester/dummy"
+
+
+@pytest.fixture
+def precompile_app(build_command, first_app, bundle_path):
+    build_command._briefcase_toml[first_app] = {
+        "paths": {
+            "app_path": "path/to/app",
+            "app_packages_path": "path/to/app_packages",
+        }
+    }
+    create_file(bundle_path / "path/to/app/first/__init__.py", "")
+    create_file(bundle_path / "path/to/app/first/app.py", "def main():\n    pass\n")
+    create_file(bundle_path / "path/to/app_packages/dep.py", "VALUE = 42\n")
+    # A file that isn't valid Python
+    create_file(bundle_path / "path/to/app_packages/template.py", "{{ value }} = 1\n")
+    create_file(bundle_path / "path/to/app_packages/data.txt", "data")
+    return first_app
+
+
+def pyc_flags(path):
+    """The flags in the header of a .pyc file."""
+    with path.open("rb") as f:
+        header = f.read(8)
+    assert header[:4] == importlib.util.MAGIC_NUMBER
+    return int.from_bytes(header[4:8], "little")
+
+
+def cached(path):
+    return (
+        path.parent / "__pycache__" / f"{path.stem}.{sys.implementation.cache_tag}.pyc"
+    )
+
+
+def test_precompile(build_command, precompile_app, bundle_path, capsys):
+    """The code and requirements of an app are compiled to unchecked-hash bytecode."""
+    build_command.precompile_app(precompile_app)
+
+    app_py = bundle_path / "path/to/app/first/app.py"
+    dep_py = bundle_path / "path/to/app_packages/dep.py"
+    for source in [app_py, dep_py]:
+        # Bytecode exists, with the hash-based (0b01) but unchecked (0b10) flags.
+        assert pyc_flags(cached(source)) == 0b01
+        # The sources are retained.
+        assert source.exists()
+
+    # The file that isn't valid Python wasn't compiled, and a warning was displayed.
+    assert not cached(bundle_path / "path/to/app_packages/template.py").exists()
+    assert (
+        "Some Python files in the app could not be compiled to bytecode"
+        in capsys.readouterr().out
+    )
+
+    # The location of the build isn't encoded in the bytecode.
+    assert str(bundle_path).encode() not in cached(app_py).read_bytes()
+    assert b"path/to/app/first/app.py" in cached(app_py).read_bytes()
+
+
+def test_precompile_remove_sources(build_command, precompile_app, bundle_path):
+    """If requested, compiled sources are removed from the bundle."""
+    precompile_app.precompile_remove_sources = True
+
+    build_command.precompile_app(precompile_app)
+
+    # Bytecode is written next to the source, and the source is removed.
+    for source in [
+        bundle_path / "path/to/app/first/__init__.py",
+        bundle_path / "path/to/app/first/app.py",
+        bundle_path / "path/to/app_packages/dep.py",
+    ]:
+        assert pyc_flags(source.with_suffix(".pyc")) == 0b01
+        assert not source.exists()
+
+    # Files that weren't compiled are retained.
+    assert (bundle_path / "path/to/app_packages/template.py").exists()
+    assert (bundle_path / "path/to/app_packages/data.txt").exists()
+
+
+@pytest.mark.parametrize("mode", ["test_mode", "debugger"])
+def test_precompile_keep_sources(build_command, precompile_app, bundle_path, mode):
+    """Sources aren't removed from apps that are being tested or debugged."""
+    precompile_app.precompile_remove_sources = True
+    setattr(precompile_app, mode, mock.MagicMock())
+
+    build_command.precompile_app(precompile_app)
+
+    assert pyc_flags(cached(bundle_path / "path/to/app/first/app.py")) == 0b01
+    assert (bundle_path / "path/to/app/first/app.py").exists()
+
+
+def test_precompile_no_app_packages(build_command, precompile_app, bundle_path):
+    """If the template doesn't install requirements in the bundle, only the app's
+    code is compiled."""
+    del build_command._briefcase_toml[precompile_app]["paths"]["app_packages_path"]
+    build_command.tools.subprocess = mock.MagicMock()
+
+    build_command.precompile_app(precompile_app)
+
+    build_command.tools.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "compileall",
+            "-q",
+            "-j",
+            "0",
+            "--invalidation-mode",
+            "unchecked-hash",
+            "-s",
+            bundle_path,
+            bundle_path / "path/to/app",
+        ],
+        check=True,
+    )
+
+
+def test_precompile_failure(build_command, precompile_app):
+    """If the compiler fails, a warning is displayed."""
+    build_command.tools.subprocess = mock.MagicMock()
+    build_command.tools.subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd=["python"], returncode=1
+    )
+    build_command.console.warning = mock.MagicMock()
+
+    build_command.precompile_app(precompile_app)
+
+    build_command.console.warning.assert_called_once_with(
+        "Some Python files in the app could not be compiled to bytecode."
+    )
+
+
+@pytest.mark.parametrize(
+    ("supported", "precompile", "compiled"),
+    [
+        (True, True, True),
+        (True, False, False),
+        (False, True, False),
+    ],
+)
+def test_build_precompiles(
+    build_command, first_app, supported, precompile, compiled, monkeypatch
+):
+    """Apps that request precompilation are compiled before they are built, on
+    platforms that support it."""
+    build_command.apps = {"first": first_app}
+    monkeypatch.setattr(build_command, "supports_precompile", supported)
+    if precompile:
+        first_app.precompile = True
+
+    def precompile_app(app):
+        build_command.actions.append(("precompile", app.app_name))
+
+    build_command.precompile_app = precompile_app
+
+    options, _ = build_command.parse_options([])
+    build_command(first_app, **options)
+
+    assert (("precompile", "first") in build_command.actions) is compiled
+    if compiled:
+        assert build_command.actions[-2:] == [
+            ("precompile", "first"),
+            ("build", "first", False, False, {}),
+        ]
@@ -0,0 +1,301 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    return tmp_path / "base_path/build/first/tester/dummy"
+
+
+@pytest.fixture
+def app_packages_path(bundle_path):
+    return bundle_path / "path/to/app_packages"
+
+
+@pytest.fixture
+def prune_app(build_command, first_app, bundle_path, app_packages_path):
+    build_command._briefcase_toml[first_app] = {
+        "paths": {
+            "app_path": "path/to/app",
+            "app_packages_path": "path/to/app_packages",
+        }
+    }
+    app_path = bundle_path / "path/to/app"
+    create_file(app_path / "first/__init__.py", "")
+    create_file(
+        app_path / "first/app.py",
+        "import used.sub\nimport single\nimport spacename.used\nimport lazy\n",
+    )
+
+    # A package that is used, with a subpackage that isn't, tests, translations
+    # and data.
+    create_file(
+        app_packages_path / "used/__init__.py",
+        "import os\n"
+        "path = os.path.join(os.path.dirname(__file__), 'locale/en/messages.mo')\n"
+        "with open(path, 'rb') as f:\n"
+        "    f.read()\n",
+    )
+    create_file(app_packages_path / "used/sub/__init__.py", "")
+    create_file(app_packages_path / "used/unused_sub/__init__.py", "")
+    create_file(app_packages_path / "used/tests/__init__.py", "")
+    create_file(app_packages_path / "used/tests/test_used.py", "")
+    create_file(app_packages_path / "used/data/tests/sample.txt", "")
+    create_file(app_packages_path / "used/data/values.json", "{}")
+    create_file(app_packages_path / "used/locale/en/messages.mo", "")
+    create_file(app_packages_path / "used/other/locales/fr.mo", "")
+    create_file(app_packages_path / "used-1.0.dist-info/RECORD", "")
+    # Modules that are, and aren't, used
+    create_file(app_packages_path / "single.py", "")
+    create_file(app_packages_path / "unused_single.py", "")
+    create_file(app_packages_path / "unused/__init__.py", "")
+    # A namespace package
+    create_file(app_packages_path / "spacename/used/__init__.py", "")
+    create_file(app_packages_path / "spacename/unused/__init__.py", "")
+    # Packages that are loaded dynamically, and are protected by `prune_keep`
+    create_file(app_packages_path / "lazy/__init__.py", "")
+    create_file(app_packages_path / "lazy/plugins/__init__.py", "")
+    create_file(app_packages_path / "lazy/plugins/extra/__init__.py", "")
+    create_file(app_packages_path / "lazy/other/__init__.py", "")
+    create_file(app_packages_path / "dynamic/__init__.py", "")
+    create_file(app_packages_path / "dynamic/tests/__init__.py", "")
+    create_file(app_packages_path / "dynamic_module.py", "")
+    # A distribution that provides a plugin
+    create_file(app_packages_path / "backend/__init__.py", "")
+    create_file(app_packages_path / "backend/widgets/__init__.py", "")
+    create_file(app_packages_path / "backend_module.py", "")
+    create_file(
+        app_packages_path / "backend-1.0.dist-info/entry_points.txt",
+        "[console_scripts]\nbackend = backend:main\n\n"
+        "[app.backends]\nbackend = backend\n",
+    )
+    create_file(
+        app_packages_path / "backend-1.0.dist-info/RECORD",
+        "backend/__init__.py,sha256=abc,0\n"
+        "backend/widgets/__init__.py,sha256=abc,0\n"
+        "backend_module.py,sha256=abc,0\n"
+        "backend-1.0.dist-info/RECORD,,\n"
+        "../../bin/backend,sha256=abc,0\n",
+    )
+    # A distribution that only provides a command
+    create_file(app_packages_path / "tool/__init__.py", "")
+    create_file(
+        app_packages_path / "tool-1.0.dist-info/entry_points.txt",
+        "[console_scripts]\ntool = tool:main\n",
+    )
+    create_file(app_packages_path / "tool-1.0.dist-info/RECORD", "tool/__init__.py,,\n")
+    # A test suite installed at the top level
+    create_file(app_packages_path / "tests/test_thing.py", "")
+
+    first_app.prune_keep = ["lazy.plugins", "dynamic", "dynamic_module"]
+    return first_app
+
+
+def remaining_files(app_packages_path):
+    return {
+        path.relative_to(app_packages_path).as_posix()
+        for path in app_packages_path.glob("**/*")
+        if path.is_file()
+    }
+
+
+def test_prune(build_command, prune_app, bundle_path, app_packages_path, capsys):
+    """Without an entry point, only unused tests and translations are removed."""
+    build_command.prune_app(prune_app)
+
+    assert (
+        "first doesn't define a prune_entry_point; only unused test and "
+        "translation folders will be removed."
+    ) in capsys.readouterr().out
+    assert remaining_files(app_packages_path) == {
+        "used/__init__.py",
+        "used/sub/__init__.py",
+        "used/unused_sub/__init__.py",
+        "used/data/values.json",
+        "used/locale/en/messages.mo",
+        "used-1.0.dist-info/RECORD",
+        "single.py",
+        "unused_single.py",
+        "unused/__init__.py",
+        "spacename/used/__init__.py",
+        "spacename/unused/__init__.py",
+        "lazy/__init__.py",
+        "lazy/plugins/__init__.py",
+        "lazy/plugins/extra/__init__.py",
+        "lazy/other/__init__.py",
+        "dynamic/__init__.py",
+        "dynamic/tests/__init__.py",
+        "dynamic_module.py",
+        "backend/__init__.py",
+        "backend/widgets/__init__.py",
+        "backend_module.py",
+        "backend-1.0.dist-info/entry_points.txt",
+        "backend-1.0.dist-info/RECORD",
+        "tool/__init__.py",
+        "tool-1.0.dist-info/entry_points.txt",
+        "tool-1.0.dist-info/RECORD",
+    }
+
+    # No trace is left in the bundle.
+    assert not (
+        app_packages_path.parent.parent / "briefcase-import-trace.json"
+    ).exists()
+
+
+def test_prune_entry_point(build_command, prune_app, bundle_path, app_packages_path):
+    """If an entry point is provided, only the modules it uses are retained."""
+    create_file(
+        bundle_path / "path/to/app/first/smoke.py",
+        "from first import app\n",
+    )
+    prune_app.prune_entry_point = "first.smoke"
+
+    build_command.prune_app(prune_app)
+
+    assert remaining_files(app_packages_path) == {
+        "used/__init__.py",
+        "used/sub/__init__.py",
+        "used/data/values.json",
+        "used/locale/en/messages.mo",
+        "used-1.0.dist-info/RECORD",
+        "single.py",
+        "spacename/used/__init__.py",
+        "lazy/__init__.py",
+        "lazy/plugins/__init__.py",
+        "lazy/plugins/extra/__init__.py",
+        "dynamic/__init__.py",
+        "dynamic/tests/__init__.py",
+        "dynamic_module.py",
+        "backend/__init__.py",
+        "backend/widgets/__init__.py",
+        "backend_module.py",
+        "backend-1.0.dist-info/entry_points.txt",
+        "backend-1.0.dist-info/RECORD",
+        "tool-1.0.dist-info/entry_points.txt",
+        "tool-1.0.dist-info/RECORD",
+    }
+
+
+def test_prune_entry_point_subset(
+    build_command, prune_app, bundle_path, app_packages_path
+):
+    """Modules that the entry point doesn't import are removed."""
+    create_file(bundle_path / "path/to/app/first/smoke.py", "import single\n")
+    prune_app.prune_entry_point = "first.smoke"
+
+    build_command.prune_app(prune_app)
+
+    assert (app_packages_path / "single.py").exists()
+    assert not (app_packages_path / "used").exists()
+    assert (app_packages_path / "lazy/plugins").exists()
+    assert not (app_packages_path / "lazy/other").exists()
+
+
+def test_prune_verify_failure(build_command, prune_app, bundle_path, app_packages_path):
+    """If the app can't be run once it has been pruned, an error is raised."""
+    # The entry point only imports a package if its tests are present.
+    create_file(
+        bundle_path / "path/to/app/first/smoke.py",
+        "import os\n"
+        "import used\n"
+        "if os.path.isdir(os.path.join(os.path.dirname(used.__file__), 'tests')):\n"
+        "    import single\n"
+        "else:\n"
+        "    raise ImportError('tests are missing')\n",
+    )
+    prune_app.prune_entry_point = "first.smoke"
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"first can't be run after its requirements were pruned",
+    ):
+        build_command.prune_app(prune_app)
+
+
+def test_prune_verify_missing(build_command, prune_app, bundle_path, app_packages_path):
+    """If the app no longer imports a module once it has been pruned, an error is
+    raised."""
+    prune_app.prune_entry_point = "first.smoke"
+    build_command.trace_imports = mock.MagicMock(
+        side_effect=[
+            ({"single", "unused"}, [set()]),
+            ({"single"}, [set()]),
+        ]
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"first can no longer import some modules after its requirements "
+        r"were pruned:\n\n    unused\n",
+    ):
+        build_command.prune_app(prune_app)
+
+    assert build_command.trace_imports.call_count == 2
+
+
+def test_prune_failure(build_command, prune_app, bundle_path, app_packages_path):
+    """If the app can't be traced, an error is raised, and nothing is removed."""
+    create_file(bundle_path / "path/to/app/first/smoke.py", "raise ValueError()\n")
+    prune_app.prune_entry_point = "first.smoke"
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to determine the modules used by the app.",
+    ):
+        build_command.prune_app(prune_app)
+
+    assert (app_packages_path / "unused").exists()
+    assert not (bundle_path / "briefcase-import-trace.json").exists()
+
+
+def test_plugin_without_record(
+    build_command, prune_app, bundle_path, app_packages_path, capsys
+):
+    """If a plugin distribution has no RECORD, a warning is displayed."""
+    (app_packages_path / "backend-1.0.dist-info/RECORD").unlink()
+    create_file(bundle_path / "path/to/app/first/smoke.py", "from first import app\n")
+    prune_app.prune_entry_point = "first.smoke"
+
+    build_command.prune_app(prune_app)
+
+    assert "backend-1.0.dist-info doesn't have a RECORD file" in capsys.readouterr().out
+    assert not (app_packages_path / "backend").exists()
+
+
+def test_no_requirements(build_command, first_app):
+    """If the requirements aren't in the bundle, nothing is traced."""
+    build_command.trace_imports = mock.MagicMock()
+
+    build_command.prune_app(first_app)
+
+    build_command.trace_imports.assert_not_called()
+
+
+def test_build_prune(build_command, first_app):
+    """The app is pruned before it is compiled."""
+    build_command.apps = {"first": first_app}
+    build_command.supports_precompile = True
+    first_app.precompile = True
+
+    build_command.prune_app = mock.MagicMock(
+        side_effect=lambda app: build_command.actions.append(("prune", app.app_name))
+    )
+    build_command.precompile_app = mock.MagicMock(
+        side_effect=lambda app: build_command.actions.append(
+            ("precompile", app.app_name)
+        )
+    )
+
+    options, _ = build_command.parse_options([])
+    build_command(first_app, prune=True, **options)
+
+    assert build_command.actions[-3:] == [
+        ("prune", "first"),
+        ("precompile", "first"),
+        ("build", "first", False, False, {}),
+    ]
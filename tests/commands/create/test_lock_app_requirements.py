@@ -0,0 +1,183 @@
+import pytest
+
+from briefcase.integrations.virtual_environment.lock import RequirementsLock
+
+PACKAGES = [
+    {"name": "first", "version": "1.0", "hashes": ["sha256:123"]},
+    {"name": "second", "version": "2.0", "hashes": ["sha256:456"]},
+]
+
+
+@pytest.fixture
+def mock_venv(mock_venv):
+    mock_venv.lock_target = "cp312-tester-x86_64"
+    mock_venv.resolve_requirements.return_value = PACKAGES
+    return mock_venv
+
+
+@pytest.fixture
+def locked_app(myapp, bundle_path):
+    myapp.lock_requirements = True
+    return myapp
+
+
+def test_unlocked(create_command, mock_venv, myapp):
+    """If the app doesn't use a lockfile, the install is unchanged."""
+    requires, install_kwargs = create_command.lock_app_requirements(
+        myapp,
+        mock_venv,
+        ["first", "second"],
+        require_binary=True,
+    )
+
+    assert requires == ["first", "second"]
+    assert install_kwargs == {"require_binary": True}
+    mock_venv.resolve_requirements.assert_not_called()
+    assert not create_command.requirements_lock_path(myapp).exists()
+
+
+def test_new_lockfile(create_command, mock_venv, locked_app, bundle_path):
+    """If the app doesn't have a lockfile, the requirements are resolved, and the
+    pinned requirements are installed."""
+    requires, install_kwargs = create_command.lock_app_requirements(
+        locked_app,
+        mock_venv,
+        ["first", "second"],
+        allow_editable=False,
+        require_binary=True,
+        min_os_version="12.0",
+        extra_installer_args=["--no-cache"],
+        install_hint="A hint",
+    )
+
+    mock_venv.resolve_requirements.assert_called_once_with(
+        ["first", "second"],
+        require_binary=True,
+        min_os_version="12.0",
+        extra_installer_args=["--no-cache"],
+        install_hint="A hint",
+    )
+
+    # The lockfile is stored next to pyproject.toml
+    lock_path = create_command.base_path / "briefcase-my-app.lock"
+    assert create_command.requirements_lock_path(locked_app) == lock_path
+    assert (
+        RequirementsLock(lock_path).pinned(
+            "cp312-tester-x86_64",
+            RequirementsLock.inputs_hash(
+                ["first", "second"],
+                require_binary=True,
+                min_os_version="12.0",
+                extra_installer_args=["--no-cache"],
+            ),
+        )
+        == PACKAGES
+    )
+
+    # The pinned requirements are installed from a requirements file, without
+    # resolving dependencies.
+    requirements_path = bundle_path / "requirements-cp312-tester-x86_64.txt"
+    assert requirements_path.read_text(encoding="utf-8") == (
+        "first==1.0 --hash=sha256:123\nsecond==2.0 --hash=sha256:456\n"
+    )
+    assert requires == []
+    assert install_kwargs == {
+        "allow_editable": False,
+        "require_binary": True,
+        "min_os_version": "12.0",
+        "extra_installer_args": ["--no-cache", "-r", str(requirements_path)],
+        "install_hint": "A hint",
+        "include_deps": False,
+    }
+
+
+def test_existing_lockfile(create_command, mock_venv, locked_app, bundle_path):
+    """If the lockfile has pinned the requirements, they aren't resolved again."""
+    create_command.lock_app_requirements(locked_app, mock_venv, ["first", "second"])
+    mock_venv.resolve_requirements.reset_mock()
+
+    requires, install_kwargs = create_command.lock_app_requirements(
+        locked_app, mock_venv, ["first", "second"]
+    )
+
+    mock_venv.resolve_requirements.assert_not_called()
+    assert requires == []
+    assert install_kwargs == {
+        "include_deps": False,
+        "extra_installer_args": [
+            "-r",
+            str(bundle_path / "requirements-cp312-tester-x86_64.txt"),
+        ],
+    }
+
+
+def test_local_path(create_command, mock_venv, locked_app, bundle_path, tmp_path):
+    """Local paths are pinned relative to the project, and resolved at install."""
+    mock_venv.resolve_requirements.return_value = [
+        {"name": "local", "version": "0.1", "path": "src/local"},
+    ]
+    create_command.lock_app_requirements(locked_app, mock_venv, ["./src/local"])
+
+    # The project is moved to another location.
+    moved_path = tmp_path / "moved"
+    create_command.base_path.rename(moved_path)
+    create_command.base_path = moved_path
+    moved_bundle_path = moved_path / bundle_path.relative_to(tmp_path / "base_path")
+    mock_venv.resolve_requirements.reset_mock()
+
+    create_command.lock_app_requirements(locked_app, mock_venv, ["./src/local"])
+
+    mock_venv.resolve_requirements.assert_not_called()
+    requirements_path = moved_bundle_path / "requirements-cp312-tester-x86_64.txt"
+    assert requirements_path.read_text(encoding="utf-8") == (
+        f"local @ {(moved_path / 'src/local').resolve().as_uri()}\n"
+    )
+
+
+def test_changed_requirements(create_command, mock_venv, locked_app):
+    """If the requirements have changed, they are resolved again."""
+    create_command.lock_app_requirements(locked_app, mock_venv, ["first", "second"])
+    create_command.lock_app_requirements(locked_app, mock_venv, ["first"])
+    create_command.lock_app_requirements(
+        locked_app, mock_venv, ["first"], require_binary=True
+    )
+
+    assert mock_venv.resolve_requirements.call_count == 3
+
+
+def test_other_target(create_command, mock_venv, locked_app):
+    """Requirements are pinned separately for each target."""
+    create_command.lock_app_requirements(locked_app, mock_venv, ["first", "second"])
+    mock_venv.lock_target = "cp312-tester-arm64"
+    create_command.lock_app_requirements(locked_app, mock_venv, ["first", "second"])
+
+    assert mock_venv.resolve_requirements.call_count == 2
+    assert set(
+        RequirementsLock(create_command.requirements_lock_path(locked_app)).targets
+    ) == {"cp312-tester-x86_64", "cp312-tester-arm64"}
+
+
+def test_install_app_requirements(
+    create_command,
+    mock_venv,
+    locked_app,
+    bundle_path,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """Locked requirements are used when app requirements are installed."""
+    locked_app.requires = ["first", "second"]
+
+    create_command.install_app_requirements(locked_app, mock_venv)
+
+    mock_venv.install_requirements.assert_called_once_with(
+        [],
+        allow_editable=False,
+        require_binary=True,
+        install_path=app_packages_path,
+        extra_installer_args=[
+            "-r",
+            str(bundle_path / "requirements-cp312-tester-x86_64.txt"),
+        ],
+        include_deps=False,
+    )
@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def sources(create_command, myapp, tmp_path, app_path, app_requirements_path_index):
+    """Create app sources, and install them into the bundle."""
+    myapp.sources = ["src/my_app", "src/other.py"]
+    myapp.test_sources = ["tests"]
+
+    create_file(tmp_path / "base_path/src/my_app/__init__.py", "# init")
+    create_file(tmp_path / "base_path/src/my_app/app.py", "# app")
+    create_file(tmp_path / "base_path/src/other.py", "# other")
+    create_file(tmp_path / "base_path/tests/test_app.py", "# test")
+
+    create_command.install_app_code(myapp)
+
+    return tmp_path / "base_path"
+
+
+def test_modified(create_command, myapp, sources, app_path):
+    """A modified source file is copied into the bundle."""
+    (sources / "src/my_app/app.py").write_text("# new app", encoding="utf-8")
+
+    added = create_command.sync_app_code(
+        myapp, changes={os.fspath(sources / "src/my_app/app.py")}
+    )
+
+    assert not added
+    assert (app_path / "my_app/app.py").read_text(encoding="utf-8") == "# new app"
+    assert (app_path / "my_app/__init__.py").read_text(encoding="utf-8") == "# init"
+
+
+def test_modified_file_source(create_command, myapp, sources, app_path):
+    """A source that is a single file can be updated."""
+    (sources / "src/other.py").write_text("# new other", encoding="utf-8")
+
+    added = create_command.sync_app_code(
+        myapp, changes={os.fspath(sources / "src/other.py")}
+    )
+
+    assert not added
+    assert (app_path / "other.py").read_text(encoding="utf-8") == "# new other"
+
+
+def test_added(create_command, myapp, sources, app_path):
+    """A new source file is copied into the bundle, creating any directories that are
+    needed."""
+    create_file(sources / "src/my_app/sub/new.py", "# new")
+
+    added = create_command.sync_app_code(
+        myapp, changes={os.fspath(sources / "src/my_app/sub/new.py")}
+    )
+
+    assert added
+    assert (app_path / "my_app/sub/new.py").read_text(encoding="utf-8") == "# new"
+
+
+def test_deleted(create_command, myapp, sources, app_path):
+    """A deleted source file is removed from the bundle."""
+    (sources / "src/my_app/app.py").unlink()
+
+    added = create_command.sync_app_code(
+        myapp, changes={os.fspath(sources / "src/my_app/app.py")}
+    )
+
+    assert not added
+    assert not (app_path / "my_app/app.py").exists()
+    assert (app_path / "my_app/__init__.py").exists()
+
+
+def test_unknown_paths(create_command, myapp, sources, app_path):
+    """Changes to files that aren't part of the app's sources are ignored."""
+    create_file(sources / "pyproject.toml", "[tool.briefcase]")
+    create_file(sources / "src/my_app_extra/extra.py", "# extra")
+
+    added = create_command.sync_app_code(
+        myapp,
+        changes={
+            os.fspath(sources / "pyproject.toml"),
+            os.fspath(sources / "src/my_app_extra/extra.py"),
+            os.fspath(sources / "src/my_app/missing.py"),
+        },
+    )
+
+    assert not added
+    assert not (app_path / "pyproject.toml").exists()
+    assert not (app_path / "my_app_extra").exists()
+
+
+@pytest.mark.parametrize("test_mode", [True, False])
+def test_test_sources(create_command, myapp, sources, app_path, test_mode):
+    """Test sources are only updated in test mode."""
+    myapp.test_mode = test_mode
+    create_file(sources / "tests/test_new.py", "# new test")
+
+    added = create_command.sync_app_code(
+        myapp, changes={os.fspath(sources / "tests/test_new.py")}
+    )
+
+    assert added == test_mode
+    assert (app_path / "tests/test_new.py").exists() == test_mode
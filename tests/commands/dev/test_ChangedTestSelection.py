@@ -0,0 +1,265 @@
+import json
+import os
+import sys
+
+import pytest
+
+from briefcase.commands.dev import ChangedTestSelection
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    project_path = tmp_path / "project"
+    create_file(project_path / "pyproject.toml", "[tool.briefcase]")
+    create_file(project_path / "src/first/__init__.py", "")
+    create_file(project_path / "src/first/app.py", "app")
+    create_file(project_path / "src/first/__pycache__/app.pyc", "cache")
+    create_file(project_path / "src/first/.app.py.swp", "swap")
+    create_file(project_path / "tests/test_app.py", "test")
+    return project_path
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    return tmp_path / "data"
+
+
+@pytest.fixture
+def selection(project_path, data_path):
+    return ChangedTestSelection(
+        [project_path / "src/first", project_path / "tests"],
+        pyproject_path=project_path / "pyproject.toml",
+        data_path=data_path,
+    )
+
+
+def realpath(path):
+    return os.path.realpath(path)
+
+
+def load(path):
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record_run(data_path, tests=None, failed=()):
+    """Simulate the plugin recording a run of the test suite."""
+    config = load(data_path / "config.json")
+    create_file(
+        data_path / "map.json",
+        json.dumps(
+            {
+                "version": 1,
+                "token": config["token"],
+                "tests": tests or {},
+                "failed": list(failed),
+            }
+        ),
+    )
+
+
+def test_first_run(selection, project_path, data_path, dummy_console):
+    """If the test suite hasn't been recorded, every test is run."""
+    assert selection.select(dummy_console)
+
+    config = load(data_path / "config.json")
+    assert config == {
+        "map_path": os.fspath(data_path / "map.json"),
+        "token": config["token"],
+        "roots": [
+            realpath(project_path / "src/first"),
+            realpath(project_path / "tests"),
+        ],
+        "changed": None,
+    }
+
+    # A snapshot of the app's files was taken, ignoring hidden and cache files.
+    state = load(data_path / "state.json")
+    assert state["baseline"] is None
+    assert state["pending"]["token"] == config["token"]
+    assert sorted(state["pending"]["snapshot"]) == [
+        realpath(project_path / "pyproject.toml"),
+        realpath(project_path / "src/first/__init__.py"),
+        realpath(project_path / "src/first/app.py"),
+        realpath(project_path / "tests/test_app.py"),
+    ]
+
+
+def test_no_changes(selection, data_path, dummy_console):
+    """If nothing has changed since the test suite passed, no tests are run."""
+    selection.select(dummy_console)
+    record_run(data_path)
+
+    assert not selection.select(dummy_console)
+    assert load(data_path / "state.json")["pending"] is None
+
+    # Nothing has changed since the last recorded run, so there is still nothing to
+    # run.
+    assert not selection.select(dummy_console)
+
+
+def test_failed_tests(selection, data_path, dummy_console):
+    """If tests failed last time, the test suite is run, even if nothing has
+    changed."""
+    selection.select(dummy_console)
+    record_run(data_path, failed=["tests/test_app.py::test_app"])
+
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] == []
+
+
+@pytest.mark.parametrize(
+    ("change", "path"),
+    [
+        ("modify", "src/first/app.py"),
+        ("add", "src/first/new.py"),
+        ("delete", "src/first/app.py"),
+        ("add", "tests/test_new.py"),
+    ],
+)
+def test_changed(selection, project_path, data_path, dummy_console, change, path):
+    """Python files that have been added, modified or deleted are reported to the
+    plugin."""
+    selection.select(dummy_console)
+    record_run(data_path)
+
+    if change == "delete":
+        (project_path / path).unlink()
+    else:
+        create_file(project_path / path, "new content")
+
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] == [realpath(project_path / path)]
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Creating symlinks requires privileges on Windows",
+)
+def test_unreadable_file(selection, project_path, data_path, dummy_console):
+    """Files that can't be read are ignored."""
+    (project_path / "src/first/broken.py").symlink_to(project_path / "missing.py")
+
+    selection.select(dummy_console)
+
+    snapshot = load(data_path / "state.json")["pending"]["snapshot"]
+    assert realpath(project_path / "src/first/broken.py") not in snapshot
+    assert realpath(project_path / "missing.py") not in snapshot
+
+
+def test_touched(selection, project_path, data_path, dummy_console):
+    """A file whose modification time has changed, but whose content hasn't, isn't a
+    change."""
+    selection.select(dummy_console)
+    record_run(data_path)
+
+    stat = (project_path / "src/first/app.py").stat()
+    os.utime(
+        project_path / "src/first/app.py",
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+    )
+
+    assert not selection.select(dummy_console)
+    # The new modification time was saved.
+    baseline = load(data_path / "state.json")["baseline"]
+    assert baseline[realpath(project_path / "src/first/app.py")][0] == (
+        stat.st_mtime_ns + 1_000_000_000
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["pyproject.toml", "src/first/resources/data.txt", "tests/conftest.py"],
+)
+def test_full_run_changes(selection, project_path, data_path, dummy_console, path):
+    """If a file that can't be attributed to specific tests changes, every test is
+    run."""
+    selection.select(dummy_console)
+    record_run(data_path)
+
+    create_file(project_path / path, "new content")
+
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] is None
+
+
+def test_unrecorded_run(selection, project_path, data_path, dummy_console, capsys):
+    """If a run isn't recorded, changes are still detected since the last recorded
+    run."""
+    selection.select(dummy_console)
+    record_run(data_path)
+
+    # The next run is interrupted before it is recorded.
+    create_file(project_path / "src/first/app.py", "new content")
+    assert selection.select(dummy_console)
+
+    # The change made before the interrupted run is still reported.
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] == [
+        realpath(project_path / "src/first/app.py")
+    ]
+    assert "didn't record" not in capsys.readouterr().out
+
+
+def test_not_pytest(selection, data_path, dummy_console, capsys):
+    """If the test suite doesn't record a map, a warning is shown, and every test is
+    run."""
+    selection.select(dummy_console)
+
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] is None
+    assert (
+        "The last test run didn't record the files used by each test, so every test "
+        "will be run." in capsys.readouterr().out
+    )
+
+
+@pytest.mark.parametrize(
+    ("filename", "content"),
+    [
+        ("map.json", "not json"),
+        ("map.json", '{"version": 0}'),
+        ("state.json", "[]"),
+        ("state.json", '{"version": 0}'),
+    ],
+)
+def test_unusable_records(selection, data_path, dummy_console, filename, content):
+    """If a record can't be used, every test is run."""
+    selection.select(dummy_console)
+    record_run(data_path)
+    create_file(data_path / filename, content)
+
+    assert selection.select(dummy_console)
+    assert load(data_path / "config.json")["changed"] is None
+
+
+def test_environment(selection, data_path):
+    """The plugin is added to the app's environment."""
+    assert selection.environment(
+        {"PYTHONPATH": "src"}, {"PYTEST_PLUGINS": "other"}
+    ) == {
+        "PYTHONPATH": os.pathsep.join(
+            [os.fspath(ChangedTestSelection.PLUGIN_PATH), "src"]
+        ),
+        "PYTEST_PLUGINS": "other,briefcase_changed_tests",
+        "BRIEFCASE_CHANGED_TESTS": os.fspath(data_path / "config.json"),
+    }
+
+
+def test_environment_minimal(selection, data_path):
+    """The plugin can be added to an environment that doesn't define a path or
+    plugins."""
+    assert selection.environment({}, {}) == {
+        "PYTHONPATH": os.fspath(ChangedTestSelection.PLUGIN_PATH),
+        "PYTEST_PLUGINS": "briefcase_changed_tests",
+        "BRIEFCASE_CHANGED_TESTS": os.fspath(data_path / "config.json"),
+    }
+
+
+def test_plugin_path():
+    """The plugin can be found on the plugin path."""
+    assert (
+        ChangedTestSelection.PLUGIN_PATH / f"{ChangedTestSelection.PLUGIN_MODULE}.py"
+    ).is_file()
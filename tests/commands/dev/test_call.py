@@ -82,6 +82,11 @@ class DummyDevCommand(DevCommand):
     def install_dev_requirements(self, app, venv, **kwargs):
         self.actions.append(("dev_requirements", app.app_name, venv))
 
+    def update_dev_requirements(self, app, venv, update_requirements=False, **kwargs):
+        self.actions.append(
+            ("update_dev_requirements", app.app_name, venv, update_requirements)
+        )
+
     def get_environment(self, app):
         return self.env
 
@@ -139,6 +144,8 @@ def test_no_args_one_app(dev_command, first_app):
         ("verify-app-tools", "first"),
         # Virtual environment was generated
         ("virtual-environment", "venv", "first", first_venv),
+        # Installed requirements were brought up to date
+        ("update_dev_requirements", "first", first_venv, False),
         # Run the first app devly
         (
             "run_dev",
@@ -262,6 +269,8 @@ def test_with_arg_one_app(dev_command, first_app):
         ("verify-app-tools", "first"),
         # Virtual environment was generated
         ("virtual-environment", "venv", "first", first_venv),
+        # Installed requirements were brought up to date
+        ("update_dev_requirements", "first", first_venv, False),
         # Run the first app devly
         (
             "run_dev",
@@ -311,6 +320,8 @@ def test_with_arg_two_apps(dev_command, first_app, second_app):
         ("verify-app-tools", "second"),
         # Virtual environment was generated
         ("virtual-environment", "venv", "second", second_venv),
+        # Installed requirements were brought up to date
+        ("update_dev_requirements", "second", second_venv, False),
         # Run the second app devly
         (
             "run_dev",
@@ -492,10 +503,10 @@ def test_update_requirements(dev_command, first_app):
     # Run the run command
     dev_command(**options)
 
-    # A representation of the venv was generated,
-    # and the environment was explicitly re-created
+    # A representation of the venv was generated; the existing environment is
+    # re-used.
     first_venv = dev_command.venvs["first"]
-    first_venv.prepare.assert_called_once_with(recreate=True)
+    first_venv.prepare.assert_called_once_with(recreate=False)
 
     # The right sequence of things will be done
     assert dev_command.actions == [
@@ -509,8 +520,8 @@ def test_update_requirements(dev_command, first_app):
         ("verify-app-tools", "first"),
         # Virtual environment was generated
         ("virtual-environment", "venv", "first", first_venv),
-        # Requirements were installed again
-        ("dev_requirements", "first", first_venv),
+        # Every requirement was updated
+        ("update_dev_requirements", "first", first_venv, True),
         # Then, it will be started
         (
             "run_dev",
@@ -522,27 +533,24 @@ def test_update_requirements(dev_command, first_app):
         ),
     ]
 
-    # A clean call will have been made internally, but that's not tracked
-    # by the mock. No *additional* clean calls were made.
+    # The environment wasn't cleaned.
     first_venv.clean.assert_not_called()
 
 
 def test_install_requirements_failure(dev_command, first_app):
-    """If the installation of requirements fails, the dev environment is cleaned."""
+    """If the installation of requirements into a new environment fails, the dev
+    environment is cleaned."""
     # Add a single app
     dev_command.apps = {
         "first": first_app,
     }
-    # Simulate that the venv already exists (installed app)
-    dev_command.venvs["first"] = True
-
     # Mock a failure in the installation of development requirements
     dev_command.install_dev_requirements = mock.MagicMock(
         side_effect=RequirementsInstallError()
     )
 
-    # Configure a requirements update
-    options, _ = dev_command.parse_options(["-r"])
+    # Configure no command line options
+    options, _ = dev_command.parse_options([])
 
     # Run the run command; it will raise an error
     with pytest.raises(
@@ -551,10 +559,9 @@ def test_install_requirements_failure(dev_command, first_app):
     ):
         dev_command(**options)
 
-    # A representation of the venv was generated,
-    # and the environment was explicitly re-created
+    # A representation of the venv was generated
     first_venv = dev_command.venvs["first"]
-    first_venv.prepare.assert_called_once_with(recreate=True)
+    first_venv.prepare.assert_called_once_with(recreate=False)
 
     # The right sequence of things will be done
     assert dev_command.actions == [
@@ -632,10 +639,9 @@ def test_update_uninstalled(dev_command, first_app_uninstalled):
     # Run the run command
     dev_command(**options)
 
-    # A representation of the venv was generated,
-    # and the environment was explicitly re-created
+    # A representation of the venv was generated
     first_venv = dev_command.venvs["first"]
-    first_venv.prepare.assert_called_once_with(recreate=True)
+    first_venv.prepare.assert_called_once_with(recreate=False)
 
     # The right sequence of things will be done
     assert dev_command.actions == [
@@ -676,10 +682,9 @@ def test_no_run(dev_command, first_app_uninstalled):
     # Run the run command
     dev_command(**options)
 
-    # A representation of the venv was generated,
-    # and the environment was explicitly re-created
+    # A representation of the venv was generated
     first_venv = dev_command.venvs["first"]
-    first_venv.prepare.assert_called_once_with(recreate=True)
+    first_venv.prepare.assert_called_once_with(recreate=False)
 
     assert dev_command.actions == [
         # Host OS is verified
@@ -697,6 +702,42 @@ def test_no_run(dev_command, first_app_uninstalled):
     ]
 
 
+def test_no_run_installed(dev_command, first_app):
+    """Installing requirements without running the app updates every requirement of
+    an existing environment."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+
+    # Configure an update without run
+    options, _ = dev_command.parse_options(["--no-run"])
+
+    # Run the run command
+    dev_command(**options)
+
+    # The existing environment was re-used
+    first_venv = dev_command.venvs["first"]
+    first_venv.prepare.assert_called_once_with(recreate=False)
+
+    assert dev_command.actions == [
+        # Host OS is verified
+        ("verify-host",),
+        # Tools are verified
+        ("verify-tools",),
+        # App template is verified
+        ("verify-app-template", "first"),
+        # App tools are verified for app
+        ("verify-app-tools", "first"),
+        # Virtual environment was generated
+        ("virtual-environment", "venv", "first", first_venv),
+        # Every requirement was updated
+        ("update_dev_requirements", "first", first_venv, True),
+    ]
+
+
 def test_run_test(dev_command, first_app):
     """The test suite can be run in development mode."""
     # Add a single app
@@ -728,6 +769,8 @@ def test_run_test(dev_command, first_app):
         ("verify-app-tools", "first"),
         # Virtual environment was generated
         ("virtual-environment", "venv", "first", first_venv),
+        # Installed requirements were brought up to date
+        ("update_dev_requirements", "first", first_venv, False),
         # Then, it will be started
         (
             "run_dev",
@@ -781,3 +824,248 @@ def test_run_test_uninstalled(dev_command, first_app_uninstalled):
             dev_command.env,
         ),
     ]
+
+
+def test_run_test_shards(dev_command, first_app):
+    """The test suite can be run as multiple shards in development mode."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+    dev_command.run_dev_app = mock.MagicMock()
+
+    # Configure the test options
+    options, _ = dev_command.parse_options(["--test", "--test-shards", "4"])
+
+    # Run the run command
+    dev_command(**options)
+
+    # The app is run with the requested number of shards
+    dev_command.run_dev_app.assert_called_once_with(
+        first_app,
+        env=dev_command.env,
+        venv=dev_command.venvs["first"],
+        passthrough=[],
+        test_shards=4,
+    )
+
+
+def test_test_shards_without_test_mode(dev_command, first_app):
+    """Test shards can only be requested in test mode."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+
+    # Configure the shard option, without test mode
+    options, _ = dev_command.parse_options(["--test-shards", "4"])
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"--test-shards can only be used when running in test mode.",
+    ):
+        dev_command(**options)
+
+    # Nothing was done
+    assert dev_command.actions == []
+
+
+def test_profile_app(dev_command, first_app, tmp_path, capsys):
+    """An app can be profiled in development mode."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+
+    # Running the app is profiled.
+    def run_dev_app(app, **kwargs):
+        assert dev_command.app_profiler.mode == "importtime"
+        dev_command.app_profiler.import_times.append((2500, 1500, "first"))
+
+    dev_command.run_dev_app = mock.MagicMock(side_effect=run_dev_app)
+
+    # Configure the profile option
+    options, _ = dev_command.parse_options(["--profile-app", "importtime"])
+
+    # Run the run command
+    dev_command(**options)
+
+    # The app is run, and the profile is summarized.
+    dev_command.run_dev_app.assert_called_once_with(
+        first_app,
+        env=dev_command.env,
+        venv=dev_command.venvs["first"],
+        passthrough=[],
+    )
+    output = capsys.readouterr().out
+    assert "[first] App profile:" in output
+    assert "            2.5         1.5  first" in output
+    assert "The full profile has been saved" not in output
+
+
+def test_profile_app_with_test_shards(dev_command, first_app):
+    """An app can't be profiled when its test suite is sharded."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = dev_command.parse_options(
+        ["--test", "--test-shards", "4", "--profile-app"]
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"--profile-app can't be used with --test-shards.",
+    ):
+        dev_command(**options)
+
+    # Nothing was done
+    assert dev_command.actions == []
+
+
+def test_benchmark_startup(dev_command, first_app, tmp_path, capsys):
+    """The startup of an app can be benchmarked in development mode."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+
+    # Running the app reports a test result, indicating the app has started.
+    def run_dev_app(app, **kwargs):
+        exit_filter = dev_command.startup_benchmark.exit_filter(lambda recent: 0)
+        exit_filter(">>>>>>>>>> EXIT 0 <<<<<<<<<<")
+
+    dev_command.run_dev_app = mock.MagicMock(side_effect=run_dev_app)
+
+    options, _ = dev_command.parse_options(["--test", "--benchmark-startup", "2"])
+    dev_command(**options)
+
+    # The app is run twice
+    assert (
+        dev_command.run_dev_app.call_args_list
+        == [
+            mock.call(
+                first_app,
+                env=dev_command.env,
+                venv=dev_command.venvs["first"],
+                passthrough=[],
+            )
+        ]
+        * 2
+    )
+    assert "[first] Startup time over 2 runs (warm):" in capsys.readouterr().out
+    assert (tmp_path / "logs/first.startup.json").exists()
+
+
+def test_watch(dev_command, first_app):
+    """An app can be restarted whenever its code changes."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+    dev_command.watch_dev_app = mock.MagicMock()
+
+    options, _ = dev_command.parse_options(["--watch", "--", "arg"])
+    dev_command(**options)
+
+    # The app is watched, rather than run once.
+    dev_command.watch_dev_app.assert_called_once_with(
+        first_app,
+        venv=dev_command.venvs["first"],
+        passthrough=["arg"],
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (
+            ["--watch", "--profile-app"],
+            (
+                r"--watch can't be used with --profile-app, --benchmark-startup "
+                r"or --test-shards."
+            ),
+        ),
+        (
+            ["--test", "--watch", "--test-shards", "2"],
+            (
+                r"--watch can't be used with --profile-app, --benchmark-startup "
+                r"or --test-shards."
+            ),
+        ),
+        (["--watch", "--no-run"], r"--watch can't be used with --no-run."),
+    ],
+)
+def test_watch_invalid(dev_command, first_app, args, message):
+    """Watching can't be combined with incompatible options."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = dev_command.parse_options(args)
+    with pytest.raises(BriefcaseCommandError, match=message):
+        dev_command(**options)
+
+    # Nothing was done
+    assert dev_command.actions == []
+
+
+def test_changed_tests(dev_command, first_app, tmp_path):
+    """The test suite can be limited to the tests affected by changes."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+    # Simulate that the venv already exists (installed app)
+    dev_command.venvs["first"] = True
+
+    options, _ = dev_command.parse_options(["--test", "--changed"])
+    dev_command(**options)
+
+    # The app's sources and tests are used to select tests.
+    changed_tests = dev_command.changed_tests
+    assert changed_tests.paths == [tmp_path / "src/first"]
+    assert changed_tests.pyproject_path == tmp_path / "pyproject.toml"
+    assert changed_tests.map_path == (
+        tmp_path / ".briefcase/first/changed-tests/map.json"
+    )
+    assert dev_command.actions[-1][:3] == ("run_dev", "first", True)
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["--changed"], r"--changed can only be used when running in test mode."),
+        (
+            ["--test", "--changed", "--test-shards", "2"],
+            r"--changed can't be used with --benchmark-startup or --test-shards.",
+        ),
+        (
+            ["--test", "--changed", "--benchmark-startup", "2"],
+            r"--changed can't be used with --benchmark-startup or --test-shards.",
+        ),
+    ],
+)
+def test_changed_tests_invalid(dev_command, first_app, args, message):
+    """Test selection can't be combined with incompatible options."""
+    # Add a single app
+    dev_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = dev_command.parse_options(args)
+    with pytest.raises(BriefcaseCommandError, match=message):
+        dev_command(**options)
+
+    # Nothing was done
+    assert dev_command.actions == []
@@ -1,9 +1,13 @@
+import os
 import subprocess
 import sys
 from unittest import mock
 
 import pytest
 
+from briefcase.commands.dev import ChangedTestSelection
+from briefcase.commands.run import AppProfiler
+
 
 def test_dev_run(dev_command, first_app, tmp_path):
     """The app can be run in dev mode."""
@@ -148,6 +152,65 @@ def test_dev_test_mode(dev_command, first_app, is_console_app, tmp_path):
     )
 
 
+@pytest.mark.parametrize("is_console_app", [True, False])
+def test_dev_test_mode_shards(dev_command, first_app, is_console_app, tmp_path):
+    """The test suite can be run as multiple shards in development mode."""
+    first_app.console_app = is_console_app
+    first_app.test_mode = True
+
+    dev_command._stream_app_logs = mock.MagicMock()
+    dev_command._stream_test_shards = mock.MagicMock()
+    mock_venv = mock.MagicMock()
+    app_popen = mock.MagicMock()
+    mock_venv.Popen.return_value = app_popen
+
+    dev_command.run_dev_app(
+        first_app,
+        env={"a": 1},
+        venv=mock_venv,
+        passthrough=[],
+        test_shards=3,
+    )
+
+    # The shards were streamed, rather than a single app
+    dev_command._stream_app_logs.assert_not_called()
+    dev_command._stream_test_shards.assert_called_once_with(
+        first_app,
+        test_shards=3,
+        start_shard=mock.ANY,
+        clean_output=False,
+    )
+    mock_venv.Popen.assert_not_called()
+
+    # Starting a shard starts the test suite with the shard environment
+    start_shard = dev_command._stream_test_shards.mock_calls[0].kwargs["start_shard"]
+    assert start_shard({"SHARD": "1"}) == app_popen
+    mock_venv.Popen.assert_called_once_with(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import runpy, sys;"
+                "sys.path.pop(0);"
+                "sys.argv.extend([]);"
+                'runpy.run_module("tests.first", run_name="__main__", alter_sys=True)'
+            ),
+        ],
+        env={
+            "a": 1,
+            "PYTHONUNBUFFERED": "1",
+            "PYTHONDEVMODE": "1",
+            "PYTHONUTF8": "1",
+            "SHARD": "1",
+        },
+        cwd=dev_command.tools.home_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        encoding="UTF-8",
+    )
+
+
 @pytest.mark.parametrize("is_console_app", [True, False])
 def test_dev_test_mode_with_args(dev_command, first_app, is_console_app, tmp_path):
     """The test suite can be run in development mode with args."""
@@ -329,3 +392,164 @@ def test_dev_run_with_env_variables(dev_command, first_app, tmp_path, monkeypatc
         popen=app_popen,
         clean_output=False,
     )
+
+
+def test_dev_run_profiled(dev_command, first_app, tmp_path):
+    """The app can be run in dev mode under cProfile."""
+    dev_command._stream_app_logs = mock.MagicMock()
+    dev_command.app_profiler = AppProfiler("cprofile", tmp_path / "first.prof")
+    mock_venv = mock.MagicMock()
+    app_popen = mock.MagicMock()
+    mock_venv.Popen.return_value = app_popen
+
+    dev_command.run_dev_app(
+        first_app,
+        env={"a": 1},
+        venv=mock_venv,
+        passthrough=["foo"],
+    )
+
+    profile_path = str(tmp_path / "first.prof")
+    mock_venv.Popen.assert_called_once_with(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import runpy, sys;"
+                "sys.path.pop(0);"
+                f"sys.argv.extend(['-o', {profile_path!r}, '-m', 'first', 'foo']);"
+                'runpy.run_module("cProfile", run_name="__main__", alter_sys=True)'
+            ),
+        ],
+        env={
+            "a": 1,
+            "PYTHONUNBUFFERED": "1",
+            "PYTHONDEVMODE": "1",
+            "PYTHONUTF8": "1",
+        },
+        cwd=dev_command.tools.home_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        encoding="UTF-8",
+    )
+
+
+def test_dev_run_profiled_imports(dev_command, first_app, tmp_path):
+    """The app can be run in dev mode with import timing enabled."""
+    dev_command._stream_app_logs = mock.MagicMock()
+    dev_command.app_profiler = AppProfiler("importtime", tmp_path / "first.prof")
+    mock_venv = mock.MagicMock()
+    app_popen = mock.MagicMock()
+    mock_venv.Popen.return_value = app_popen
+
+    dev_command.run_dev_app(
+        first_app,
+        env={"a": 1},
+        venv=mock_venv,
+        passthrough=[],
+    )
+
+    mock_venv.Popen.assert_called_once_with(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import runpy, sys;"
+                "sys.path.pop(0);"
+                "sys.argv.extend([]);"
+                'runpy.run_module("first", run_name="__main__", alter_sys=True)'
+            ),
+        ],
+        env={
+            "a": 1,
+            "PYTHONUNBUFFERED": "1",
+            "PYTHONDEVMODE": "1",
+            "PYTHONUTF8": "1",
+            "PYTHONPROFILEIMPORTTIME": "1",
+        },
+        cwd=dev_command.tools.home_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        encoding="UTF-8",
+    )
+
+
+def test_dev_run_console_watched(dev_command, first_app, tmp_path):
+    """If a console app is being watched for changes, its output is streamed."""
+    first_app.console_app = True
+    dev_command.file_watcher = mock.MagicMock()
+    dev_command._stream_app_logs = mock.MagicMock()
+    mock_venv = mock.MagicMock()
+    app_popen = mock.MagicMock()
+    mock_venv.Popen.return_value = app_popen
+
+    dev_command.run_dev_app(
+        first_app,
+        env={"a": 1},
+        venv=mock_venv,
+        passthrough=[],
+    )
+
+    # The app was started in a way that allows it to be streamed
+    mock_venv.run.assert_not_called()
+    mock_venv.Popen.assert_called_once()
+    dev_command._stream_app_logs.assert_called_once_with(
+        first_app,
+        popen=app_popen,
+        clean_output=False,
+    )
+
+
+def test_dev_test_mode_changed(dev_command, first_app, tmp_path):
+    """When only the tests affected by changes are run, the test selection plugin is
+    enabled."""
+    first_app.test_mode = True
+    dev_command._stream_app_logs = mock.MagicMock()
+    dev_command.changed_tests = mock.MagicMock(spec=ChangedTestSelection)
+    dev_command.changed_tests.select.return_value = True
+    dev_command.changed_tests.environment.return_value = {"PLUGIN": "enabled"}
+    mock_venv = mock.MagicMock()
+
+    dev_command.run_dev_app(
+        first_app,
+        env={"PYTHONPATH": "src"},
+        venv=mock_venv,
+        passthrough=[],
+    )
+
+    dev_command.changed_tests.select.assert_called_once_with(dev_command.console)
+    # The plugin is configured with the host's environment.
+    assert dev_command.changed_tests.environment.call_args.args[1] is os.environ
+    assert mock_venv.Popen.call_args.kwargs["env"] == {
+        "PYTHONPATH": "src",
+        "PLUGIN": "enabled",
+        "PYTHONUNBUFFERED": "1",
+        "PYTHONDEVMODE": "1",
+        "PYTHONUTF8": "1",
+    }
+    dev_command._stream_app_logs.assert_called_once()
+
+
+def test_dev_test_mode_unchanged(dev_command, first_app, capsys):
+    """If no tests are affected by changes, the test suite isn't run."""
+    first_app.test_mode = True
+    dev_command._stream_app_logs = mock.MagicMock()
+    dev_command.changed_tests = mock.MagicMock(spec=ChangedTestSelection)
+    dev_command.changed_tests.select.return_value = False
+    mock_venv = mock.MagicMock()
+
+    dev_command.run_dev_app(
+        first_app,
+        env={},
+        venv=mock_venv,
+        passthrough=[],
+    )
+
+    mock_venv.Popen.assert_not_called()
+    dev_command._stream_app_logs.assert_not_called()
+    assert (
+        "[first] No changes since the test suite last passed; skipping tests."
+        in capsys.readouterr().out
+    )
@@ -0,0 +1,226 @@
+import json
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import RequirementsInstallError
+from briefcase.integrations.virtual_environment import VirtualEnvironment
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def venv(tmp_path):
+    venv = mock.MagicMock(spec=VirtualEnvironment)
+    venv.venv_path = tmp_path / ".briefcase/first/venv-dev"
+    return venv
+
+
+def record_installed(venv, requires, installer_args=()):
+    """Record the requirements that are installed in the environment."""
+    create_file(
+        venv.venv_path / "briefcase-requirements.json",
+        json.dumps({"requires": requires, "installer_args": list(installer_args)}),
+    )
+
+
+def installed(venv):
+    """Read the record of the requirements that are installed in the environment."""
+    with (venv.venv_path / "briefcase-requirements.json").open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_install_records_requirements(dev_command, first_app, venv):
+    """When requirements are installed, they are recorded."""
+    first_app.requires = ["package-one", "./local"]
+    first_app.test_requires = ["pytest"]
+    first_app.requirement_installer_args = ["--no-cache"]
+
+    dev_command.install_dev_requirements(first_app, venv)
+
+    venv.install_requirements.assert_called_once_with(
+        ["package-one", "./local", "pytest"],
+        allow_editable=True,
+        extra_installer_args=["--no-cache"],
+    )
+    assert installed(venv) == {
+        "requires": ["package-one", "./local", "pytest"],
+        "installer_args": ["--no-cache"],
+    }
+    # The app's requirements weren't modified.
+    assert first_app.requires == ["package-one", "./local"]
+
+
+def test_unchanged(dev_command, first_app, venv):
+    """If the requirements haven't changed, nothing is installed."""
+    first_app.requires = ["package-one", "./local"]
+    record_installed(venv, ["package-one", "./local"])
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    venv.install_requirements.assert_not_called()
+    venv.uninstall_requirements.assert_not_called()
+    venv.prepare.assert_not_called()
+
+
+def test_added(dev_command, first_app, venv):
+    """Only requirements that have been added or changed are installed."""
+    first_app.requires = ["package-one==2.0", "./local", "package-two"]
+    first_app.test_requires = ["pytest"]
+    record_installed(venv, ["package-one==1.0", "./local"])
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    # package-one's requirement changed, so it's re-installed, not uninstalled.
+    venv.uninstall_requirements.assert_not_called()
+    venv.install_requirements.assert_called_once_with(
+        ["package-one==2.0", "package-two", "pytest"],
+        allow_editable=True,
+        extra_installer_args=[],
+    )
+    assert installed(venv)["requires"] == [
+        "package-one==2.0",
+        "./local",
+        "package-two",
+        "pytest",
+    ]
+
+
+def test_removed(dev_command, first_app, venv):
+    """Packages whose requirements have been removed are uninstalled."""
+    first_app.requires = ["package-one"]
+    record_installed(
+        venv,
+        ["package-one", "Package_Two>=1.0", "package-three[extra]; python_version>'3'"],
+    )
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    venv.uninstall_requirements.assert_called_once_with(
+        ["package-three", "package-two"]
+    )
+    venv.install_requirements.assert_not_called()
+    assert installed(venv)["requires"] == ["package-one"]
+
+
+def test_added_and_removed(dev_command, first_app, venv):
+    """Removed packages are uninstalled before added packages are installed."""
+    first_app.requires = ["package-two"]
+    record_installed(venv, ["package-one"])
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    assert venv.mock_calls == [
+        mock.call.uninstall_requirements(["package-one"]),
+        mock.call.install_requirements(
+            ["package-two"],
+            allow_editable=True,
+            extra_installer_args=[],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("removed", ["./local", "git+https://example.com/repo.git"])
+def test_removed_unnamed(dev_command, first_app, venv, removed):
+    """If a removed requirement doesn't name a package, the environment is
+    re-created."""
+    first_app.requires = ["package-one"]
+    record_installed(venv, ["package-one", removed])
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    venv.prepare.assert_called_once_with(recreate=True)
+    venv.uninstall_requirements.assert_not_called()
+    venv.install_requirements.assert_called_once_with(
+        ["package-one"],
+        allow_editable=True,
+        extra_installer_args=[],
+    )
+    assert installed(venv)["requires"] == ["package-one"]
+
+
+def test_removed_unnamed_failure(dev_command, first_app, venv):
+    """If the requirements of a re-created environment can't be installed, the
+    environment is cleaned."""
+    first_app.requires = ["package-one"]
+    record_installed(venv, ["package-one", "./local"])
+    venv.install_requirements.side_effect = RequirementsInstallError()
+
+    with pytest.raises(RequirementsInstallError):
+        dev_command.update_dev_requirements(first_app, venv)
+
+    venv.clean.assert_called_once_with()
+
+
+def test_update_requirements(dev_command, first_app, venv):
+    """If an update is requested, every requirement is re-installed."""
+    first_app.requires = ["package-one", "./local"]
+    record_installed(venv, ["package-one", "./local", "package-two"])
+
+    dev_command.update_dev_requirements(first_app, venv, update_requirements=True)
+
+    venv.uninstall_requirements.assert_called_once_with(["package-two"])
+    venv.install_requirements.assert_called_once_with(
+        ["package-one", "./local"],
+        allow_editable=True,
+        extra_installer_args=[],
+    )
+
+
+def test_installer_args_changed(dev_command, first_app, venv):
+    """If the installer arguments change, every requirement is re-installed."""
+    first_app.requires = ["package-one"]
+    first_app.requirement_installer_args = ["--no-cache"]
+    record_installed(venv, ["package-one"])
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    venv.install_requirements.assert_called_once_with(
+        ["package-one"],
+        allow_editable=True,
+        extra_installer_args=["--no-cache"],
+    )
+    assert installed(venv)["installer_args"] == ["--no-cache"]
+
+
+def test_install_failure(dev_command, first_app, venv):
+    """If requirements can't be installed, the record isn't updated, so the
+    installation is retried next time."""
+    first_app.requires = ["package-one", "package-two"]
+    record_installed(venv, ["package-one"])
+    venv.install_requirements.side_effect = RequirementsInstallError()
+
+    with pytest.raises(RequirementsInstallError):
+        dev_command.update_dev_requirements(first_app, venv)
+
+    assert installed(venv)["requires"] == ["package-one"]
+    venv.clean.assert_not_called()
+
+
+@pytest.mark.parametrize("content", [None, "not json", '{"requires": []}'])
+def test_no_record(dev_command, first_app, venv, content):
+    """If there is no usable record of the installed requirements, the requirements
+    are assumed to be installed."""
+    first_app.requires = ["package-one"]
+    if content is not None:
+        create_file(venv.venv_path / "briefcase-requirements.json", content)
+
+    dev_command.update_dev_requirements(first_app, venv)
+
+    venv.install_requirements.assert_not_called()
+    assert installed(venv)["requires"] == ["package-one"]
+
+
+def test_no_record_update_requirements(dev_command, first_app, venv):
+    """If there is no record of the installed requirements, and an update is
+    requested, every requirement is installed."""
+    first_app.requires = ["package-one"]
+
+    dev_command.update_dev_requirements(first_app, venv, update_requirements=True)
+
+    venv.install_requirements.assert_called_once_with(
+        ["package-one"],
+        allow_editable=True,
+        extra_installer_args=[],
+    )
+    assert installed(venv)["requires"] == ["package-one"]
@@ -0,0 +1,196 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.integrations.file_watcher import FileWatcher
+
+
+def write_pyproject(tmp_path, requires, test_requires=()):
+    """Write a pyproject.toml that defines the requirements of the first app."""
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.briefcase]\n"
+        'project_name = "First"\n'
+        'license = "MIT"\n'
+        "[tool.briefcase.app.first]\n"
+        f"requires = {list(requires)!r}\n"
+        f"test_requires = {list(test_requires)!r}\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def mock_watcher(monkeypatch):
+    """Replace the file watcher with a mock."""
+    watcher = mock.MagicMock(spec=FileWatcher)
+    watcher.pending = False
+    watcher_class = mock.MagicMock(return_value=watcher)
+    monkeypatch.setattr("briefcase.commands.dev.FileWatcher", watcher_class)
+    return watcher_class
+
+
+@pytest.fixture
+def dev_command(dev_command, first_app, tmp_path):
+    dev_command.run_dev_app = mock.MagicMock()
+    dev_command.update_dev_requirements = mock.MagicMock()
+    first_app.test_sources = ["tests"]
+    write_pyproject(tmp_path, requires=["first-dep"])
+    return dev_command
+
+
+def test_restart(dev_command, first_app, mock_watcher, tmp_path, capsys):
+    """The app is restarted whenever its code changes."""
+    venv = mock.MagicMock()
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(tmp_path / "src/first/app.py")},
+        {str(tmp_path / "tests/test_app.py")},
+        KeyboardInterrupt,
+    ]
+
+    dev_command.watch_dev_app(first_app, venv=venv, passthrough=["arg"])
+
+    # The app's sources, test sources and pyproject.toml were watched.
+    mock_watcher.assert_called_once_with(
+        [tmp_path / "pyproject.toml", tmp_path / "src/first", tmp_path / "tests"]
+    )
+
+    # The app was started 3 times; requirements weren't re-installed.
+    assert (
+        dev_command.run_dev_app.call_args_list
+        == [
+            mock.call(
+                first_app,
+                env=dev_command.get_environment(first_app),
+                venv=venv,
+                passthrough=["arg"],
+            )
+        ]
+        * 3
+    )
+    dev_command.update_dev_requirements.assert_not_called()
+
+    output = capsys.readouterr().out
+    assert output.count("[first] Waiting for changes (press Ctrl-C to stop)...") == 3
+    assert output.count("[first] Changes detected; restarting app...") == 2
+
+    # The watcher was closed, and is no longer in use.
+    watcher.close.assert_called_once_with()
+    assert dev_command.file_watcher is None
+
+
+def test_restart_pending(dev_command, first_app, mock_watcher, tmp_path, capsys):
+    """If the app was stopped because its code changed, the app is restarted without
+    waiting for further changes."""
+    watcher = mock_watcher.return_value
+    watcher.pending = True
+    watcher.wait.side_effect = [{str(tmp_path / "src/first/app.py")}, KeyboardInterrupt]
+
+    dev_command.watch_dev_app(first_app, venv=mock.MagicMock(), passthrough=[])
+
+    assert dev_command.run_dev_app.call_count == 2
+    assert "Waiting for changes" not in capsys.readouterr().out
+
+
+def test_requirements_changed(dev_command, first_app, mock_watcher, tmp_path):
+    """If the requirements of the app change, they are re-installed before the app
+    is restarted."""
+    venv = mock.MagicMock()
+    pyproject_path = str(tmp_path / "pyproject.toml")
+
+    def change_requirements(requires, test_requires=()):
+        def _change():
+            write_pyproject(tmp_path, requires=requires, test_requires=test_requires)
+            return {pyproject_path}
+
+        return _change
+
+    changes = iter(
+        [
+            # Requirements are changed
+            change_requirements(["first-dep", "second-dep"]),
+            # pyproject.toml is changed, but the requirements aren't
+            change_requirements(["first-dep", "second-dep"]),
+            # Test requirements are changed
+            change_requirements(["first-dep", "second-dep"], ["pytest"]),
+        ]
+    )
+
+    def wait():
+        try:
+            return next(changes)()
+        except StopIteration:
+            raise KeyboardInterrupt from None
+
+    mock_watcher.return_value.wait.side_effect = wait
+
+    # Record the requirements of the app when they are installed.
+    installed = []
+    dev_command.update_dev_requirements.side_effect = lambda app, venv: (
+        installed.append((app.requires, app.test_requires))
+    )
+
+    dev_command.watch_dev_app(first_app, venv=venv, passthrough=[])
+
+    # Requirements were installed when they changed
+    assert installed == [
+        (["first-dep", "second-dep"], []),
+        (["first-dep", "second-dep"], ["pytest"]),
+    ]
+    assert dev_command.run_dev_app.call_count == 4
+
+
+def test_requirements_install_failure(
+    dev_command, first_app, mock_watcher, tmp_path, capsys
+):
+    """If requirements can't be installed, the error is reported, and installation
+    is retried the next time pyproject.toml changes."""
+    pyproject_path = str(tmp_path / "pyproject.toml")
+    write_pyproject(tmp_path, requires=["first-dep", "second-dep"])
+    mock_watcher.return_value.wait.side_effect = [
+        {pyproject_path},
+        {pyproject_path},
+        KeyboardInterrupt,
+    ]
+    dev_command.update_dev_requirements.side_effect = [
+        BriefcaseCommandError("Unable to install requirements."),
+        None,
+    ]
+
+    # The requirements are read when watching starts, so the change must be made
+    # once watching has started.
+    dev_command._project_requirements = mock.MagicMock(
+        side_effect=[
+            (["first-dep"], []),
+            (["first-dep", "second-dep"], []),
+            (["first-dep", "second-dep"], []),
+        ]
+    )
+
+    dev_command.watch_dev_app(first_app, venv=mock.MagicMock(), passthrough=[])
+
+    assert dev_command.update_dev_requirements.call_count == 2
+    assert "[first] Unable to install requirements." in capsys.readouterr().out
+    assert dev_command.run_dev_app.call_count == 3
+
+
+def test_app_failure(dev_command, first_app, mock_watcher, tmp_path, capsys):
+    """If the app fails, the failure is reported, and the app is restarted when its
+    code changes."""
+    dev_command.run_dev_app.side_effect = [
+        BriefcaseCommandError("Problem running app first (return code 1)."),
+        BriefcaseTestSuiteFailure(),
+        None,
+    ]
+    mock_watcher.return_value.wait.side_effect = [
+        {str(tmp_path / "src/first/app.py")},
+        {str(tmp_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    dev_command.watch_dev_app(first_app, venv=mock.MagicMock(), passthrough=[])
+
+    assert dev_command.run_dev_app.call_count == 3
+    assert "[first] Problem running app first (return code 1)." in (
+        capsys.readouterr().out
+    )
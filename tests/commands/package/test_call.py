@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
@@ -1068,3 +1070,175 @@ def test_create_before_package_external_app(
 
     # The dist folder has been created.
     assert (tmp_path / "base_path/dist").exists()
+
+
+def test_prune_package(package_command, first_app, tmp_path):
+    """If pruning is requested, a built app is built again to prune it."""
+    package_command.supports_prune = True
+    package_command.apps = {
+        "first": first_app,
+    }
+
+    # Request pruning
+    options, _ = package_command.parse_options(["--prune"])
+
+    package_command(**options)
+
+    assert package_command.actions == [
+        # Host OS is verified
+        ("verify-host",),
+        # Tools are verified
+        ("verify-tools",),
+        # App config has been finalized
+        ("finalize-app-config", "first"),
+        # The app is built, with pruning
+        (
+            "build",
+            "first",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+                "prune": True,
+            },
+        ),
+        # App template is verified
+        ("verify-app-template", "first"),
+        # App tools are verified for app
+        ("verify-app-tools", "first"),
+        # Package the first app
+        (
+            "package",
+            "first",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+                "prune": True,
+                "build_state": "first",
+            },
+        ),
+    ]
+
+
+def test_prune_not_supported(package_command, first_app):
+    """Pruning can't be requested if the platform doesn't support it."""
+    package_command.apps = {
+        "first": first_app,
+    }
+
+    with pytest.raises(SystemExit):
+        package_command.parse_options(["--prune"])
+
+
+def test_dedupe_libraries_package(package_command, first_app):
+    """If library deduplication is requested, a built app is built again."""
+    package_command.supports_dedupe_libraries = True
+    package_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = package_command.parse_options(["--dedupe-libraries"])
+
+    package_command(**options)
+
+    assert package_command.actions == [
+        # Host OS is verified
+        ("verify-host",),
+        # Tools are verified
+        ("verify-tools",),
+        # App config has been finalized
+        ("finalize-app-config", "first"),
+        # The app is built, with deduplication
+        (
+            "build",
+            "first",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+                "dedupe_libraries": True,
+            },
+        ),
+        # App template is verified
+        ("verify-app-template", "first"),
+        # App tools are verified for app
+        ("verify-app-tools", "first"),
+        # Package the first app
+        (
+            "package",
+            "first",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+                "dedupe_libraries": True,
+                "build_state": "first",
+            },
+        ),
+    ]
+
+
+def test_dedupe_libraries_not_supported(package_command, first_app):
+    """Library deduplication can't be requested if the platform doesn't support
+    it."""
+    package_command.apps = {
+        "first": first_app,
+    }
+
+    with pytest.raises(SystemExit):
+        package_command.parse_options(["--dedupe-libraries"])
+
+
+def test_size_report(package_command, first_app, second_app):
+    """If a size report is requested, each app is reported once it is packaged."""
+    package_command.apps = {
+        "first": first_app,
+        "second": second_app,
+    }
+    package_command.report_size = mock.Mock(
+        side_effect=lambda app: package_command.actions.append(
+            ("size-report", app.app_name)
+        )
+    )
+
+    options, _ = package_command.parse_options(["--size-report"])
+
+    package_command(**options)
+
+    assert package_command.actions == [
+        # Host OS is verified
+        ("verify-host",),
+        # Tools are verified
+        ("verify-tools",),
+        # App configs have been finalized
+        ("finalize-app-config", "first"),
+        ("finalize-app-config", "second"),
+        # App template is verified
+        ("verify-app-template", "first"),
+        # App tools are verified for app
+        ("verify-app-tools", "first"),
+        # Package the first app; the size report option isn't passed on
+        (
+            "package",
+            "first",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+            },
+        ),
+        # The first app is reported
+        ("size-report", "first"),
+        # App template is verified
+        ("verify-app-template", "second"),
+        # App tools are verified for app
+        ("verify-app-tools", "second"),
+        # Package the second app
+        (
+            "package",
+            "second",
+            {
+                "adhoc_sign": False,
+                "identity": None,
+                "package_state": "first",
+            },
+        ),
+        # The second app is reported
+        ("size-report", "second"),
+    ]
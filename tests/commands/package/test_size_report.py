@@ -0,0 +1,456 @@
+import json
+import os
+import struct
+from unittest import mock
+
+import pytest
+
+from briefcase.commands.package import SizeReport, elf_debug_size
+
+from ...utils import create_file
+
+
+def elf_content(sections, bits=64, byte_order="<"):
+    """Generate the content of an ELF binary with the given sections.
+
+    :param sections: A list of (name, type, size) tuples describing the sections.
+    :param bits: The word size of the binary.
+    :param byte_order: The byte order of the binary.
+    """
+    names = b"\0" + b"".join(name + b"\0" for name, _, _ in sections) + b".shstrtab\0"
+    header_size, entry_size = (64, 64) if bits == 64 else (52, 40)
+    shoff = header_size + len(names)
+
+    entries = [b"\0" * entry_size]
+    name_offset = 1
+    for name, section_type, size in [*sections, (b".shstrtab", 3, len(names))]:
+        offset = header_size if name == b".shstrtab" else 0
+        if bits == 64:
+            entry = struct.pack(
+                f"{byte_order}IIQQQQIIQQ",
+                name_offset,
+                section_type,
+                0,
+                0,
+                offset,
+                size,
+                0,
+                0,
+                0,
+                0,
+            )
+        else:
+            entry = struct.pack(
+                f"{byte_order}IIIIIIIIII",
+                name_offset,
+                section_type,
+                0,
+                0,
+                offset,
+                size,
+                0,
+                0,
+                0,
+                0,
+            )
+        entries.append(entry)
+        name_offset += len(name) + 1
+
+    ident = b"\x7fELF" + bytes([2 if bits == 64 else 1, 2 if byte_order == ">" else 1])
+    ident += b"\0" * 10
+    if bits == 64:
+        header = ident + struct.pack(
+            f"{byte_order}HHIQQQIHHHHHH",
+            3,
+            62,
+            1,
+            0,
+            0,
+            shoff,
+            0,
+            header_size,
+            0,
+            0,
+            entry_size,
+            len(entries),
+            len(entries) - 1,
+        )
+    else:
+        header = ident + struct.pack(
+            f"{byte_order}HHIIIIIHHHHHH",
+            3,
+            3,
+            1,
+            0,
+            0,
+            shoff,
+            0,
+            header_size,
+            0,
+            0,
+            entry_size,
+            len(entries),
+            len(entries) - 1,
+        )
+    return header + names + b"".join(entries)
+
+
+@pytest.mark.parametrize("bits", [64, 32])
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+def test_elf_debug_size(tmp_path, bits, byte_order):
+    """The debug sections and symbol tables of an ELF binary are measured."""
+    create_file(
+        tmp_path / "lib.so",
+        elf_content(
+            [
+                (b".text", 1, 1000),
+                (b".debug_info", 1, 300),
+                (b".debug_line", 1, 200),
+                (b".symtab", 2, 40),
+                (b".strtab", 3, 20),
+                (b".dynsym", 11, 70),
+                # A debug section that has been stripped into another file.
+                (b".debug_str", 8, 5000),
+            ],
+            bits=bits,
+            byte_order=byte_order,
+        ),
+        mode="wb",
+    )
+
+    assert elf_debug_size(tmp_path / "lib.so") == 560
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"MZ not an ELF binary",
+        b"\x7fELF truncated",
+        # The section headers are beyond the end of the file.
+        elf_content([(b".debug_info", 1, 300)])[:100],
+    ],
+)
+def test_elf_debug_size_unreadable(tmp_path, content):
+    """If a file isn't a readable ELF binary, it has no debug sections."""
+    create_file(tmp_path / "lib.dll", content, mode="wb")
+
+    assert elf_debug_size(tmp_path / "lib.dll") == 0
+
+
+@pytest.mark.parametrize(
+    ("size", "description"),
+    [
+        (0, "0 B"),
+        (999, "999 B"),
+        (1000, "1.0 KB"),
+        (123456, "123.5 KB"),
+        (12345678, "12.3 MB"),
+        (1234567890, "1.2 GB"),
+        (1234567890000, "1234.6 GB"),
+    ],
+)
+def test_format_size(size, description):
+    """Sizes are described in the largest appropriate unit."""
+    assert SizeReport.format_size(size) == description
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    bundle_path = tmp_path / "bundle"
+    app_path = bundle_path / "app"
+    app_packages_path = bundle_path / "app_packages"
+
+    create_file(app_path / "first/__init__.py", "# app" * 10)
+    create_file(app_path / "first/resources/icon.png", "icon" * 100)
+
+    # A distribution that installs a package with a native library
+    create_file(app_packages_path / "numpy/__init__.py", "# numpy" * 10)
+    create_file(
+        app_packages_path / "numpy/core.so",
+        elf_content([(b".text", 1, 1000), (b".debug_info", 1, 300)]),
+        mode="wb",
+    )
+    create_file(app_packages_path / "numpy.libs/libz.so.1", "zlib" * 500)
+    create_file(
+        app_packages_path / "numpy-2.0.0.dist-info/RECORD",
+        "numpy/__init__.py,,\n"
+        "numpy/core.so,,\n"
+        "numpy.libs/libz.so.1,,\n"
+        "numpy-2.0.0.dist-info/RECORD,,\n"
+        "../../bin/f2py,,\n",
+    )
+    # Bytecode generated after installation is attributed by top-level name.
+    create_file(app_packages_path / "numpy/__pycache__/__init__.pyc", "bytecode")
+
+    # A second distribution, with a copy of the same library, and a data file.
+    create_file(app_packages_path / "scipy/__init__.py", "# scipy")
+    create_file(app_packages_path / "scipy.libs/libz.so.1", "zlib" * 500)
+    create_file(app_packages_path / "scipy/data.npz", "data" * 50)
+    create_file(
+        app_packages_path / "scipy-1.0.0.dist-info/RECORD",
+        "scipy/__init__.py,,\nscipy.libs/libz.so.1,,\n",
+    )
+
+    # Two distributions that install into the same namespace; and a distribution
+    # without a RECORD file.
+    create_file(app_packages_path / "ns/first.py", "# first")
+    create_file(app_packages_path / "ns/second.py", "# second")
+    create_file(app_packages_path / "ns/third.txt", "third")
+    create_file(app_packages_path / "first-1.0.dist-info/RECORD", "ns/first.py,,\n")
+    create_file(app_packages_path / "second-1.0.dist-info/RECORD", "ns/second.py,,\n")
+    create_file(app_packages_path / "third-1.0.dist-info/METADATA", "Name: third")
+
+    # A Windows library and its debug symbols; and a macOS debug symbol bundle.
+    create_file(app_packages_path / "win/lib.pyd", "pyd" * 10)
+    create_file(app_packages_path / "win/lib.pdb", "pdb" * 20)
+    create_file(
+        app_packages_path / "mac/lib.dylib.dSYM/Contents/Resources/DWARF/lib",
+        "dwarf" * 10,
+    )
+
+    # The support package, and the stub binary.
+    create_file(bundle_path / "support/python3.zip", "stdlib" * 1000)
+    create_file(bundle_path / "First", "stub" * 50)
+
+    # A hard link is only counted once; a symlink isn't counted.
+    os.link(app_packages_path / "scipy/data.npz", app_packages_path / "scipy/link.npz")
+    (app_packages_path / "numpy.libs/libz.so").symlink_to("libz.so.1")
+    return bundle_path
+
+
+@pytest.fixture
+def size_report(bundle_path, mock_tools):
+    size_report = SizeReport(
+        bundle_path,
+        {
+            "app": [bundle_path / "app"],
+            "requirements": [bundle_path / "app_packages"],
+            "support": [bundle_path / "support"],
+        },
+    )
+    size_report.scan(mock_tools.file)
+    return size_report
+
+
+def test_results(size_report, bundle_path):
+    """The size of the content of a bundle is analysed."""
+    elf_size = (bundle_path / "app_packages/numpy/core.so").stat().st_size
+    results = size_report.results()
+
+    assert results["total"] == {
+        "size": sum(size_report.files.values()),
+        "files": 22,
+    }
+    assert results["areas"] == {
+        "app": 450,
+        "requirements": 4635 + elf_size,
+        "support": 6000,
+        "other": 200,
+    }
+    # Files that aren't recorded by a distribution are attributed by their
+    # top-level name, unless the name is shared by several distributions.
+    assert results["distributions"] == {
+        "numpy": 2185 + elf_size,
+        "scipy": 2250,
+        "(unknown)": 145,
+        "second": 23,
+        "first": 21,
+        "third": 11,
+    }
+    assert results["native_libraries"] == {
+        "size": 4030 + elf_size,
+        "debug_size": 300 + 60 + 50,
+        "files": [
+            {
+                "path": "app_packages/numpy.libs/libz.so.1",
+                "size": 2000,
+                "debug_size": 0,
+            },
+            {
+                "path": "app_packages/scipy.libs/libz.so.1",
+                "size": 2000,
+                "debug_size": 0,
+            },
+            {"path": "app_packages/numpy/core.so", "size": elf_size, "debug_size": 300},
+            {"path": "app_packages/win/lib.pyd", "size": 30, "debug_size": 0},
+        ],
+        "debug_files": [
+            {"path": "app_packages/win/lib.pdb", "size": 60},
+            {
+                "path": "app_packages/mac/lib.dylib.dSYM/Contents/Resources/DWARF/lib",
+                "size": 50,
+            },
+        ],
+    }
+    assert results["duplicates"] == [
+        {
+            "size": 2000,
+            "paths": [
+                "app_packages/numpy.libs/libz.so.1",
+                "app_packages/scipy.libs/libz.so.1",
+            ],
+        },
+    ]
+    assert [data_file["path"] for data_file in results["data_files"]] == [
+        "support/python3.zip",
+        "app/first/resources/icon.png",
+        "First",
+        "app_packages/scipy/data.npz",
+        "app_packages/numpy-2.0.0.dist-info/RECORD",
+        "app_packages/scipy-1.0.0.dist-info/RECORD",
+        "app_packages/second-1.0.dist-info/RECORD",
+        "app_packages/first-1.0.dist-info/RECORD",
+        "app_packages/third-1.0.dist-info/METADATA",
+        "app_packages/ns/third.txt",
+    ]
+
+
+def test_summary(size_report):
+    """The results can be summarized."""
+    size_report.SUMMARY_LENGTH = 2
+
+    assert size_report.summary() == [
+        "Total: 11.6 KB in 22 files",
+        "    app:                 450 B",
+        "    requirements:       5.0 KB",
+        "    support:            6.0 KB",
+        "    other:               200 B",
+        "",
+        "Requirements by distribution:",
+        "        2.5 KB  numpy",
+        "        2.2 KB  scipy",
+        "",
+        "Native libraries: 4.4 KB in 4 files; 410 B of debug symbols",
+        "        2.0 KB  app_packages/numpy.libs/libz.so.1",
+        "        2.0 KB  app_packages/scipy.libs/libz.so.1",
+        "",
+        "Duplicate files: 2.0 KB in 1 sets of identical files",
+        (
+            "        2.0 KB  app_packages/numpy.libs/libz.so.1, "
+            "app_packages/scipy.libs/libz.so.1"
+        ),
+        "",
+        "Largest data files:",
+        "        6.0 KB  support/python3.zip",
+        "         400 B  app/first/resources/icon.png",
+    ]
+
+
+def test_summary_debug(tmp_path, mock_tools):
+    """The debug symbols of a native library are summarized."""
+    create_file(
+        tmp_path / "lib.so",
+        elf_content([(b".text", 1, 1000), (b".debug_info", 1, 300)]),
+        mode="wb",
+    )
+    size_report = SizeReport(tmp_path, {})
+    size_report.scan(mock_tools.file)
+
+    assert size_report.summary()[-1] == "         349 B  lib.so (300 B debug)"
+
+
+def test_summary_empty(tmp_path, mock_tools):
+    """A bundle without content can be summarized."""
+    size_report = SizeReport(tmp_path, {"app": [tmp_path / "app"]})
+    size_report.scan(mock_tools.file)
+
+    assert size_report.summary() == [
+        "Total: 0 B in 0 files",
+        "    app:                   0 B",
+        "    other:                 0 B",
+        "",
+        "Native libraries: 0 B in 0 files; 0 B of debug symbols",
+    ]
+
+
+def test_report_size(package_command, first_app, tmp_path, monkeypatch):
+    """A size report is displayed, and saved to the logs folder."""
+    bundle_path = tmp_path / "base_path/build/first/tester/dummy"
+    create_file(bundle_path / "app/first/__init__.py", "# app")
+    create_file(bundle_path / "app/first/data.bin", "data")
+    monkeypatch.setattr(
+        package_command,
+        "size_report_areas",
+        mock.Mock(return_value={"app": [bundle_path / "app"]}),
+    )
+    first_app.packaging_format = "pkg"
+
+    package_command.report_size(first_app)
+
+    with (tmp_path / "base_path/logs/first.size-report.json").open(
+        encoding="utf-8"
+    ) as f:
+        results = json.load(f)
+
+    assert results["app_name"] == "first"
+    assert results["version"] == "0.0.1"
+    assert results["platform"] == "Tester"
+    assert results["output_format"] == "Dummy"
+    assert results["packaging_format"] == "pkg"
+    # The bundle is analysed, because the dummy platform doesn't define the content
+    # that is packaged.
+    assert results["total"] == {"size": 29, "files": 4}
+    assert results["areas"] == {"app": 9, "other": 20}
+
+
+def test_report_size_package_path(package_command, first_app, tmp_path, monkeypatch):
+    """If the platform defines the content that is packaged, it is analysed."""
+    bundle_path = tmp_path / "base_path/build/first/tester/dummy"
+    create_file(bundle_path / "First.app/app/first/__init__.py", "# app")
+    monkeypatch.setattr(
+        package_command,
+        "bundle_package_path",
+        mock.Mock(return_value=bundle_path / "First.app"),
+    )
+    monkeypatch.setattr(
+        package_command,
+        "size_report_areas",
+        mock.Mock(return_value={"app": [bundle_path / "First.app/app"]}),
+    )
+    first_app.packaging_format = "pkg"
+
+    package_command.report_size(first_app)
+
+    results = json.loads(
+        (tmp_path / "base_path/logs/first.size-report.json").read_text(encoding="utf-8")
+    )
+    assert results["total"] == {"size": 5, "files": 1}
+    assert results["areas"] == {"app": 5, "other": 0}
+
+
+def test_size_report_areas(package_command, first_app, tmp_path, monkeypatch):
+    """The areas of the bundle are defined by the template's path index."""
+    bundle_path = tmp_path / "base_path/build/first/tester/dummy"
+    package_command._briefcase_toml[first_app] = {
+        "paths": {
+            "app_path": "app",
+            "app_packages_path": "app_packages",
+            "support_path": "support",
+        }
+    }
+    monkeypatch.setattr(
+        package_command,
+        "build_command",
+        mock.Mock(requirements_paths=mock.Mock(return_value=[bundle_path / "reqs"])),
+    )
+
+    assert package_command.size_report_areas(first_app) == {
+        "app": [bundle_path / "app"],
+        "requirements": [bundle_path / "reqs"],
+        "support": [bundle_path / "support"],
+    }
+
+
+def test_size_report_areas_minimal(package_command, first_app, tmp_path, monkeypatch):
+    """Areas that the template doesn't define are omitted."""
+    bundle_path = tmp_path / "base_path/build/first/tester/dummy"
+    package_command._briefcase_toml[first_app] = {"paths": {"app_path": "app"}}
+    monkeypatch.setattr(
+        package_command,
+        "build_command",
+        mock.Mock(requirements_paths=mock.Mock(return_value=[])),
+    )
+
+    assert package_command.size_report_areas(first_app) == {
+        "app": [bundle_path / "app"],
+    }
@@ -259,3 +259,55 @@ def test_log_filter(
         # processed
         assert log_filter.returncode == returncode
         assert terminated
+
+
+def test_exit_marker():
+    """The exit filter is only evaluated when its marker has been seen recently."""
+    exit_filter = mock.MagicMock(return_value=None)
+    exit_filter.marker = "EXIT"
+
+    log_filter = LogFilter(
+        mock.MagicMock(),
+        clean_filter=None,
+        clean_output=True,
+        exit_filter=exit_filter,
+    )
+
+    # Lines without the marker don't invoke the exit filter
+    for i in range(20):
+        assert list(log_filter(f"line {i}")) == [f"line {i}"]
+    exit_filter.assert_not_called()
+
+    # Once the marker is seen, the filter is evaluated on every line until the
+    # marker leaves the recent history.
+    list(log_filter("EXIT?"))
+    for i in range(20):
+        list(log_filter(f"line {i}"))
+    assert exit_filter.call_count == LogFilter.HISTORY_LENGTH
+    assert exit_filter.call_args_list[0].args == (
+        "\n".join([f"line {i}" for i in range(11, 20)] + ["EXIT?"]),
+    )
+    assert exit_filter.call_args_list[-1].args == (
+        "\n".join(["EXIT?"] + [f"line {i}" for i in range(9)]),
+    )
+
+
+def test_exit_without_marker():
+    """If the exit filter has no marker, it is evaluated on every line."""
+    exit_filter = mock.MagicMock(spec=lambda tail: None, return_value=None)
+
+    log_filter = LogFilter(
+        mock.MagicMock(),
+        clean_filter=None,
+        clean_output=True,
+        exit_filter=exit_filter,
+    )
+
+    for i in range(20):
+        list(log_filter(f"line {i}"))
+
+    assert exit_filter.call_count == 20
+    # Only the most recent lines are inspected
+    assert exit_filter.call_args_list[-1].args == (
+        "\n".join(f"line {i}" for i in range(10, 20)),
+    )
@@ -68,3 +68,38 @@ def test_bad_custom_filter():
     # Custom filter matches, but doesn't capture output
     recent = ["line 1", "line 2", "WIBBLE 123 WIBBLE"]
     assert custom_func("\n".join(recent)) == -998
+
+
+def test_marker():
+    """A filter can be annotated with a marker."""
+    assert LogFilter.test_filter(r"^FINISHED (?P<returncode>\d+)$").marker is None
+
+    exit_func = LogFilter.test_filter(
+        r"^FINISHED (?P<returncode>\d+)$",
+        marker="FINISHED ",
+    )
+    assert exit_func.marker == "FINISHED "
+
+
+def test_default_marker():
+    """The default exit marker appears in lines matched by the default exit regex."""
+    exit_func = LogFilter.test_filter(
+        LogFilter.DEFAULT_EXIT_REGEX,
+        marker=LogFilter.DEFAULT_EXIT_MARKER,
+    )
+
+    line = ">>>>>>>>>> EXIT 42 <<<<<<<<<<"
+    assert LogFilter.DEFAULT_EXIT_MARKER in line
+    assert exit_func(line) == 42
+
+
+def test_app_exit_filter(first_app):
+    """The exit filter for an app only uses a marker for the default exit regex."""
+    exit_func = LogFilter.exit_filter(first_app)
+    assert exit_func.regex.pattern == LogFilter.DEFAULT_EXIT_REGEX
+    assert exit_func.marker == LogFilter.DEFAULT_EXIT_MARKER
+
+    first_app.exit_regex = r"^DONE (?P<returncode>\d+)$"
+    exit_func = LogFilter.exit_filter(first_app)
+    assert exit_func.regex.pattern == r"^DONE (?P<returncode>\d+)$"
+    assert exit_func.marker is None
@@ -0,0 +1,40 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def drop_caches_path(run_command, tmp_path, monkeypatch):
+    drop_caches_path = tmp_path / "drop_caches"
+    monkeypatch.setattr(run_command, "DROP_CACHES_PATH", drop_caches_path)
+    run_command.tools.os = mock.MagicMock()
+    return drop_caches_path
+
+
+def test_drop_caches(run_command, drop_caches_path):
+    """On Linux, caches can be dropped."""
+    run_command.tools.host_os = "Linux"
+
+    assert run_command._drop_caches()
+
+    run_command.tools.os.sync.assert_called_once_with()
+    assert drop_caches_path.read_text(encoding="ascii") == "3\n"
+
+
+def test_drop_caches_not_permitted(run_command, drop_caches_path):
+    """If caches can't be dropped, the failure is reported."""
+    run_command.tools.host_os = "Linux"
+    drop_caches_path.mkdir()
+
+    assert not run_command._drop_caches()
+
+
+@pytest.mark.parametrize("host_os", ["Darwin", "Windows"])
+def test_drop_caches_unsupported(run_command, drop_caches_path, host_os):
+    """Caches can only be dropped on Linux."""
+    run_command.tools.host_os = host_os
+
+    assert not run_command._drop_caches()
+
+    run_command.tools.os.sync.assert_not_called()
+    assert not drop_caches_path.exists()
@@ -0,0 +1,55 @@
+import pytest
+
+
+def write_pyproject(base_path, content):
+    base_path.mkdir(parents=True, exist_ok=True)
+    (base_path / "pyproject.toml").write_text(content, encoding="utf-8")
+
+
+def test_requirements(run_command, first_app, tmp_path):
+    """The requirements of an app can be read from pyproject.toml."""
+    write_pyproject(
+        tmp_path / "base_path",
+        "[tool.briefcase]\n"
+        'project_name = "First"\n'
+        'license = "MIT"\n'
+        "[tool.briefcase.app.first]\n"
+        'requires = ["first-dep"]\n'
+        'test_requires = ["pytest"]\n',
+    )
+
+    assert run_command._project_requirements(first_app) == (["first-dep"], ["pytest"])
+
+
+def test_no_requirements(run_command, first_app, tmp_path):
+    """If an app doesn't define requirements, the requirements are empty."""
+    write_pyproject(
+        tmp_path / "base_path",
+        "[tool.briefcase]\n"
+        'project_name = "First"\n'
+        'license = "MIT"\n'
+        "[tool.briefcase.app.first]\n",
+    )
+
+    assert run_command._project_requirements(first_app) == ([], [])
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # Invalid TOML
+        "[tool.briefcase",
+        # The app isn't defined
+        '[tool.briefcase]\n[tool.briefcase.app.second]\nrequires = ["x"]\n',
+    ],
+)
+def test_unreadable(run_command, first_app, tmp_path, content):
+    """If the requirements of an app can't be read, None is returned."""
+    write_pyproject(tmp_path / "base_path", content)
+
+    assert run_command._project_requirements(first_app) is None
+
+
+def test_missing(run_command, first_app):
+    """If pyproject.toml doesn't exist, None is returned."""
+    assert run_command._project_requirements(first_app) is None
@@ -2,8 +2,14 @@ from unittest import mock
 
 import pytest
 
-from briefcase.commands.run import LogFilter
+from briefcase.commands.run import (
+    AppProfiler,
+    FileWatcher,
+    LogFilter,
+    StartupBenchmark,
+)
 from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.integrations.subprocess import StopStreaming
 
 
 def test_run_app(run_command, first_app):
@@ -41,6 +47,7 @@ def test_run_app(run_command, first_app):
     assert not filter_func.clean_output
     assert filter_func.clean_filter == clean_filter
     assert filter_func.exit_filter.regex.pattern == LogFilter.DEFAULT_EXIT_REGEX
+    assert filter_func.exit_marker == LogFilter.DEFAULT_EXIT_MARKER
 
 
 def test_run_app_custom_stop_func(run_command, first_app):
@@ -77,6 +84,36 @@ def test_run_app_custom_stop_func(run_command, first_app):
     assert filter_func.exit_filter.regex.pattern == LogFilter.DEFAULT_EXIT_REGEX
 
 
+def test_run_app_profiled(run_command, first_app, tmp_path):
+    """If the app is being profiled, import timing output is captured from the log."""
+    popen = mock.MagicMock()
+    popen.poll = mock.MagicMock(return_value=0)
+    run_command.app_profiler = AppProfiler("importtime", tmp_path / "first.prof")
+
+    # Stream some import timing output through the filter function.
+    output = []
+
+    def mock_stream(label, popen_process, stop_func, filter_func):
+        for line in [
+            "import time:       145 |        145 |   _io",
+            "Hello world",
+        ]:
+            output.extend(filter_func(line))
+
+    run_command.tools.subprocess.stream_output = mock.MagicMock(side_effect=mock_stream)
+
+    # Stream the app logs
+    run_command._stream_app_logs(
+        first_app,
+        popen=popen,
+        clean_output=False,
+    )
+
+    # All output was passed through, and the import timing was recorded.
+    assert output == ["import time:       145 |        145 |   _io", "Hello world"]
+    assert run_command.app_profiler.import_times == [(145, 145, "_io")]
+
+
 def test_test_mode_success(run_command, first_app):
     """An app can be streamed in test mode."""
     first_app.test_mode = True
@@ -253,6 +290,8 @@ def test_test_mode_custom_filters(run_command, first_app):
     assert not filter_func.clean_output
     assert filter_func.clean_filter == clean_filter
     assert filter_func.exit_filter.regex.pattern == "THIS IS WHAT SUCCESS LOOKS LIKE"
+    # A custom exit regex isn't gated by a marker.
+    assert filter_func.exit_marker is None
 
 
 def test_run_app_failure(run_command, first_app):
@@ -490,3 +529,166 @@ def test_run_app_ctrl_c(run_command, first_app):
     assert not filter_func.clean_output
     assert filter_func.clean_filter == clean_filter
     assert filter_func.exit_filter.regex.pattern == LogFilter.DEFAULT_EXIT_REGEX
+
+
+@pytest.mark.parametrize("test_mode", [True, False])
+def test_benchmark_startup_marker(run_command, first_app, test_mode):
+    """If startup is being benchmarked, streaming stops when the startup marker is
+    seen, and the app's exit status isn't checked."""
+    first_app.test_mode = test_mode
+    popen = mock.MagicMock()
+    # The app was terminated when streaming stopped
+    popen.poll = mock.MagicMock(return_value=-15)
+    run_command.startup_benchmark = StartupBenchmark(
+        runs=1,
+        startup_marker=r"^App started$",
+        drop_caches=False,
+    )
+    run_command.startup_benchmark.start()
+
+    # Stream some output through the filter function, until streaming is stopped.
+    output = []
+
+    def mock_stream(label, popen_process, stop_func, filter_func):
+        try:
+            for line in ["Hello world", "App started", "Goodbye"]:
+                output.extend(filter_func(line))
+        except StopStreaming:
+            pass
+
+    run_command.tools.subprocess.stream_output = mock.MagicMock(side_effect=mock_stream)
+
+    # Stream the app logs
+    run_command._stream_app_logs(
+        first_app,
+        popen=popen,
+        clean_output=False,
+    )
+
+    # Streaming stopped at the marker, and the startup time was recorded.
+    assert output == ["Hello world"]
+    assert not run_command.startup_benchmark.running
+    assert len(run_command.startup_benchmark.durations) == 1
+
+
+def test_benchmark_startup_exit_sentinel(run_command, first_app, capsys):
+    """If startup is benchmarked without a startup marker, the test result is
+    reported as normal."""
+    first_app.test_mode = True
+    popen = mock.MagicMock()
+    run_command.startup_benchmark = StartupBenchmark(
+        runs=1,
+        startup_marker=None,
+        drop_caches=False,
+    )
+    run_command.startup_benchmark.start()
+
+    def mock_stream(label, popen_process, stop_func, filter_func):
+        try:
+            for line in ["Hello world", ">>>>>>>>>> EXIT 0 <<<<<<<<<<"]:
+                list(filter_func(line))
+        except StopStreaming:
+            pass
+
+    run_command.tools.subprocess.stream_output = mock.MagicMock(side_effect=mock_stream)
+
+    # Stream the app logs
+    run_command._stream_app_logs(
+        first_app,
+        popen=popen,
+        clean_output=False,
+    )
+
+    assert "Test suite passed!" in capsys.readouterr().out
+    assert len(run_command.startup_benchmark.durations) == 1
+
+
+def test_benchmark_startup_ctrl_c(run_command, first_app):
+    """If the user presses Ctrl-C while startup is being benchmarked, the benchmark
+    is abandoned."""
+    popen = mock.MagicMock()
+    run_command.startup_benchmark = StartupBenchmark(
+        runs=3,
+        startup_marker=r"App started",
+        drop_caches=False,
+    )
+    run_command.tools.subprocess.stream_output = mock.MagicMock(
+        side_effect=KeyboardInterrupt
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        run_command._stream_app_logs(
+            first_app,
+            popen=popen,
+            clean_output=False,
+        )
+
+
+def test_watch_changed(run_command, first_app):
+    """If the app is being watched, streaming stops when the app's code changes, and
+    the app's exit status isn't checked."""
+    popen = mock.MagicMock()
+    # The app was terminated when streaming stopped
+    popen.poll = mock.MagicMock(return_value=-15)
+    app_stop_func = mock.MagicMock(return_value=False)
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    run_command.file_watcher.changed.side_effect = [False, True]
+    run_command.file_watcher.pending = True
+
+    # Poll the stop function until it requests streaming to stop.
+    stop_results = []
+
+    def mock_stream(label, popen_process, stop_func, filter_func):
+        while not stop_results or not stop_results[-1]:
+            stop_results.append(stop_func())
+
+    run_command.tools.subprocess.stream_output = mock.MagicMock(side_effect=mock_stream)
+
+    # Stream the app logs
+    run_command._stream_app_logs(
+        first_app,
+        popen=popen,
+        clean_output=False,
+        stop_func=app_stop_func,
+    )
+
+    # Both the app's stop function and the watcher were consulted
+    assert stop_results == [False, True]
+    assert app_stop_func.call_count == 2
+
+
+def test_watch_app_exit(run_command, first_app):
+    """If the app is being watched, and exits with an error before its code changes,
+    the error is raised."""
+    popen = mock.MagicMock()
+    popen.poll = mock.MagicMock(return_value=1)
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    run_command.file_watcher.pending = False
+    run_command.tools.subprocess.stream_output = mock.MagicMock()
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Problem running app first \(return code 1\).",
+    ):
+        run_command._stream_app_logs(
+            first_app,
+            popen=popen,
+            clean_output=False,
+        )
+
+
+def test_watch_ctrl_c(run_command, first_app):
+    """If the user presses Ctrl-C while the app is being watched, the interrupt is
+    raised so that watching stops."""
+    popen = mock.MagicMock()
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    run_command.tools.subprocess.stream_output = mock.MagicMock(
+        side_effect=KeyboardInterrupt
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        run_command._stream_app_logs(
+            first_app,
+            popen=popen,
+            clean_output=False,
+        )
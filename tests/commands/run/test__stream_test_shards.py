@@ -0,0 +1,165 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.integrations.subprocess import StopStreaming
+
+
+@pytest.fixture
+def shard_logs():
+    """The log output that will be produced by each shard, keyed by shard index."""
+    return {}
+
+
+@pytest.fixture
+def run_command(run_command, shard_logs):
+    run_command.tools.subprocess.cleanup = mock.MagicMock()
+
+    # Streaming a shard passes the shard's log output through the filter function
+    # (stopping if the filter requests it), and returns a streamer that has finished.
+    def mock_stream(label, popen_process, filter_func):
+        output = []
+        try:
+            for line in shard_logs[popen_process.shard_index]:
+                output.extend(filter_func(line))
+        except StopStreaming:
+            pass
+        popen_process.output = output
+
+        streamer = mock.MagicMock()
+        streamer.is_alive.return_value = False
+        return streamer
+
+    run_command.tools.subprocess.stream_output_non_blocking = mock.MagicMock(
+        side_effect=mock_stream
+    )
+    return run_command
+
+
+@pytest.fixture
+def start_shard():
+    """A function that starts a mock process for a shard."""
+
+    def _start_shard(shard_env):
+        popen = mock.MagicMock()
+        popen.shard_index = int(shard_env["BRIEFCASE_TEST_SHARD_INDEX"])
+        return popen
+
+    return mock.MagicMock(side_effect=_start_shard)
+
+
+def test_success(run_command, first_app, shard_logs, start_shard, capsys):
+    """A test suite can be run as multiple shards."""
+    first_app.test_mode = True
+    for index in range(3):
+        shard_logs[index] = [f"test {index}", ">>>>>>>>>> EXIT 0 <<<<<<<<<<"]
+
+    run_command._stream_test_shards(first_app, test_shards=3, start_shard=start_shard)
+
+    # Each shard was started with environment variables identifying the shard
+    assert start_shard.call_args_list == [
+        mock.call(
+            {"BRIEFCASE_TEST_SHARD_INDEX": "0", "BRIEFCASE_TEST_SHARD_COUNT": "3"}
+        ),
+        mock.call(
+            {"BRIEFCASE_TEST_SHARD_INDEX": "1", "BRIEFCASE_TEST_SHARD_COUNT": "3"}
+        ),
+        mock.call(
+            {"BRIEFCASE_TEST_SHARD_INDEX": "2", "BRIEFCASE_TEST_SHARD_COUNT": "3"}
+        ),
+    ]
+
+    # Each shard was streamed with a prefix, and cleaned up.
+    for index, call in enumerate(
+        run_command.tools.subprocess.stream_output_non_blocking.call_args_list
+    ):
+        popen = call.kwargs["popen_process"]
+        assert call.kwargs["label"] == f"first shard {index + 1}/3"
+        assert popen.output == [f"[shard {index + 1}/3] test {index}"]
+        run_command.tools.subprocess.cleanup.assert_any_call(
+            f"first shard {index + 1}/3", popen
+        )
+        popen.__enter__.assert_called_once()
+        popen.__exit__.assert_called_once()
+
+    assert "Test suite passed!" in capsys.readouterr().out
+
+
+def test_failure(run_command, first_app, shard_logs, start_shard, capsys):
+    """If any shard fails, the test suite fails."""
+    first_app.test_mode = True
+    shard_logs[0] = [">>>>>>>>>> EXIT 0 <<<<<<<<<<"]
+    shard_logs[1] = [">>>>>>>>>> EXIT 3 <<<<<<<<<<"]
+    shard_logs[2] = [">>>>>>>>>> EXIT 0 <<<<<<<<<<"]
+
+    with pytest.raises(BriefcaseTestSuiteFailure):
+        run_command._stream_test_shards(
+            first_app, test_shards=3, start_shard=start_shard
+        )
+
+    output = capsys.readouterr().out
+    assert "Test suite shard 2/3 failed! (return code 3)" in output
+    assert "Test suite passed!" not in output
+    assert run_command.tools.subprocess.cleanup.call_count == 3
+
+
+def test_no_result(run_command, first_app, shard_logs, start_shard):
+    """If any shard doesn't report a result, an error is raised."""
+    first_app.test_mode = True
+    shard_logs[0] = [">>>>>>>>>> EXIT 0 <<<<<<<<<<"]
+    shard_logs[1] = ["test 1"]
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Test suite shard 2/2 didn't report a result.",
+    ):
+        run_command._stream_test_shards(
+            first_app, test_shards=2, start_shard=start_shard
+        )
+
+
+def test_custom_exit_regex(run_command, first_app, shard_logs, start_shard, capsys):
+    """Each shard uses the app's exit regex."""
+    first_app.test_mode = True
+    first_app.exit_regex = r"^DONE (?P<returncode>\d+)$"
+    shard_logs[0] = ["DONE 0"]
+    shard_logs[1] = ["DONE 0"]
+
+    run_command._stream_test_shards(first_app, test_shards=2, start_shard=start_shard)
+
+    assert "Test suite passed!" in capsys.readouterr().out
+
+
+def test_start_failure(run_command, first_app, start_shard):
+    """If a shard can't be started, the shards that have started are cleaned up."""
+    first_app.test_mode = True
+    start_shard.side_effect = [mock.MagicMock(shard_index=0), OSError("no app")]
+    run_command.tools.subprocess.stream_output_non_blocking.side_effect = None
+
+    with pytest.raises(OSError, match=r"no app"):
+        run_command._stream_test_shards(
+            first_app, test_shards=2, start_shard=start_shard
+        )
+
+    run_command.tools.subprocess.cleanup.assert_called_once_with(
+        "first shard 1/2", mock.ANY
+    )
+
+
+def test_ctrl_c(run_command, first_app, shard_logs, start_shard, monkeypatch, capsys):
+    """If the user presses Ctrl-C, the shards are cleaned up, and the command exits
+    normally."""
+    first_app.test_mode = True
+    shard_logs[0] = []
+    shard_logs[1] = []
+    monkeypatch.setattr("time.sleep", mock.MagicMock())
+
+    run_command.tools.subprocess.stream_output_non_blocking.side_effect = None
+    streamer = run_command.tools.subprocess.stream_output_non_blocking.return_value
+    streamer.is_alive.side_effect = KeyboardInterrupt
+
+    run_command._stream_test_shards(first_app, test_shards=2, start_shard=start_shard)
+
+    assert "Stopping..." in capsys.readouterr().out
+    assert run_command.tools.subprocess.cleanup.call_count == 2
@@ -1,6 +1,10 @@
+import json
+from unittest import mock
+
 import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.subprocess import StopStreaming
 
 
 def test_no_args_one_app(run_command, first_app):
@@ -1169,3 +1173,462 @@ def test_run_external_app(run_command, first_app):
         match=r"'first' is declared as an external app",
     ):
         run_command(**options)
+
+
+def test_test_mode_shards(run_command, first_app):
+    """An app that supports sharding can run its test suite as multiple shards."""
+    run_command.supports_test_shards = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # Configure the test options
+    options, _ = run_command.parse_options(["--test", "--test-shards", "3"])
+
+    # Run the run command
+    run_command(**options)
+
+    # The app is built and run in test mode, with the requested number of shards.
+    assert run_command.actions[-1] == (
+        "run",
+        "first",
+        True,
+        False,
+        (None, None),
+        {
+            "build_state": "first",
+            "test_shards": 3,
+            "passthrough": [],
+        },
+    )
+
+
+def test_test_shards_unsupported(run_command, first_app):
+    """If a platform doesn't support test shards, an error is raised."""
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # The option isn't available for the platform
+    with pytest.raises(SystemExit):
+        run_command.parse_options(["--test", "--test-shards", "3"])
+
+    # If sharding is requested programmatically, an error is raised.
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Dummy run command doesn't support --test-shards.",
+    ):
+        run_command(test_mode=True, test_shards=3)
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+def test_test_shards_without_test_mode(run_command, first_app):
+    """Test shards can only be requested in test mode."""
+    run_command.supports_test_shards = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # Configure the shard option, without test mode
+    options, _ = run_command.parse_options(["--test-shards", "3"])
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"--test-shards can only be used when running in test mode.",
+    ):
+        run_command(**options)
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+def test_profile_app(run_command, first_app, tmp_path, capsys):
+    """An app can be profiled while it runs."""
+    run_command.supports_profile_app = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # A stale profile exists from a previous run
+    profile_path = tmp_path / "base_path/logs/first.prof"
+    profile_path.parent.mkdir(parents=True)
+    profile_path.write_text("stale", encoding="utf-8")
+
+    # Configure the profile option
+    options, _ = run_command.parse_options(["--profile-app", "--", "arg"])
+
+    # Run the run command
+    run_command(**options)
+
+    # The app is run with the app's main module started by cProfile.
+    assert run_command.actions[-1] == (
+        "run",
+        "first",
+        False,
+        False,
+        (None, None),
+        {
+            "passthrough": ["-o", str(profile_path), "-m", "first", "arg"],
+        },
+    )
+
+    # The stale profile was removed; as the app didn't produce a profile,
+    # there's nothing to summarize.
+    assert not profile_path.exists()
+    assert "No profiling information was captured for the app." in (
+        capsys.readouterr().out
+    )
+
+
+def test_profile_app_importtime(run_command, first_app, tmp_path):
+    """An app's imports can be profiled."""
+    run_command.supports_profile_app = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # Configure the profile option
+    options, _ = run_command.parse_options(["--profile-app", "importtime"])
+
+    # Run the run command
+    run_command(**options)
+
+    # The app is run with the usual arguments, and the profiler is configured.
+    assert run_command.actions[-1][-1] == {
+        "passthrough": [],
+    }
+    assert run_command.app_profiler.mode == "importtime"
+    assert run_command.app_profiler.environment() == {"PYTHONPROFILEIMPORTTIME": "1"}
+
+
+def test_profile_app_summary_after_failure(run_command, first_app, capsys):
+    """If the app fails to run, any profile information is still summarized."""
+    run_command.supports_profile_app = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+    run_command.run_app = mock.MagicMock(side_effect=BriefcaseCommandError("failed"))
+
+    # Configure the profile option
+    options, _ = run_command.parse_options(["--profile-app", "importtime"])
+
+    with pytest.raises(BriefcaseCommandError, match=r"failed"):
+        run_command(**options)
+
+    assert "No profiling information was captured for the app." in (
+        capsys.readouterr().out
+    )
+
+
+def test_profile_app_unsupported(run_command, first_app):
+    """If a platform doesn't support profiling, an error is raised."""
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # The option isn't available for the platform
+    with pytest.raises(SystemExit):
+        run_command.parse_options(["--profile-app"])
+
+    # If profiling is requested programmatically, an error is raised.
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Dummy run command doesn't support --profile-app.",
+    ):
+        run_command(profile_app="cprofile")
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+def test_profile_app_with_test_shards(run_command, first_app):
+    """An app can't be profiled when its test suite is sharded."""
+    run_command.supports_profile_app = True
+    run_command.supports_test_shards = True
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = run_command.parse_options(
+        ["--test", "--test-shards", "2", "--profile-app"]
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"--profile-app can't be used with --test-shards.",
+    ):
+        run_command(**options)
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+@pytest.fixture
+def benchmark_command(run_command, first_app):
+    """A run command for a platform that supports startup benchmarks, running an app
+    that reports its startup."""
+    run_command.supports_benchmark_startup = True
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # Running the app streams output that matches the startup marker.
+    run_app = run_command.run_app
+
+    def mock_run_app(app, **kwargs):
+        state = run_app(app, **kwargs)
+        with pytest.raises(StopStreaming):
+            run_command.startup_benchmark.exit_filter(None)("App started")
+        return state
+
+    run_command.run_app = mock_run_app
+    return run_command
+
+
+def test_benchmark_startup(benchmark_command, tmp_path, capsys):
+    """The startup of an app can be benchmarked."""
+    benchmark_command._drop_caches = mock.MagicMock()
+
+    options, _ = benchmark_command.parse_options(
+        ["--benchmark-startup", "3", "--startup-marker", "App started"]
+    )
+    state = benchmark_command(**options)
+
+    # The app was run 3 times; caches weren't dropped.
+    assert [action[0] for action in benchmark_command.actions].count("run") == 3
+    assert benchmark_command.actions[-1][-1] == {"passthrough": []}
+    assert state == {"run_state": "first"}
+    benchmark_command._drop_caches.assert_not_called()
+
+    # The results were reported
+    output = capsys.readouterr().out
+    assert "[first] Startup benchmark run 3 of 3..." in output
+    assert "[first] Startup time over 3 runs (warm):" in output
+    assert "    median: " in output
+
+    # The results were saved
+    results_path = tmp_path / "base_path/logs/first.startup.json"
+    with results_path.open(encoding="utf-8") as f:
+        results = json.load(f)
+    assert results["app_name"] == "first"
+    assert results["version"] == "0.0.1"
+    assert results["startup_marker"] == "App started"
+    assert not results["cold"]
+    assert len(results["durations"]) == 3
+    assert results["min"] <= results["median"] <= results["p95"]
+
+
+def test_benchmark_startup_drop_caches(benchmark_command, tmp_path, capsys):
+    """The startup of an app can be benchmarked with cold caches."""
+    benchmark_command._drop_caches = mock.MagicMock(return_value=True)
+
+    options, _ = benchmark_command.parse_options(
+        ["--benchmark-startup", "2", "--startup-marker", "App", "--drop-caches"]
+    )
+    benchmark_command(**options)
+
+    # Caches were dropped before each run.
+    assert benchmark_command._drop_caches.call_count == 2
+    assert "[first] Startup time over 2 runs (cold):" in capsys.readouterr().out
+
+    with (tmp_path / "base_path/logs/first.startup.json").open(encoding="utf-8") as f:
+        assert json.load(f)["cold"]
+
+
+def test_benchmark_startup_drop_caches_not_permitted(benchmark_command, capsys):
+    """If caches can't be dropped, the startup of an app is benchmarked with warm
+    caches."""
+    benchmark_command._drop_caches = mock.MagicMock(return_value=False)
+
+    options, _ = benchmark_command.parse_options(
+        ["--benchmark-startup", "2", "--startup-marker", "App", "--drop-caches"]
+    )
+    benchmark_command(**options)
+
+    # An attempt to drop caches was only made once.
+    benchmark_command._drop_caches.assert_called_once_with()
+    output = capsys.readouterr().out
+    assert output.count("Unable to drop filesystem caches") == 1
+    assert "[first] Startup time over 2 runs (warm):" in output
+
+
+def test_benchmark_startup_not_started(run_command, first_app):
+    """If the app doesn't report that it has started, an error is raised."""
+    run_command.supports_benchmark_startup = True
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = run_command.parse_options(
+        ["--benchmark-startup", "3", "--startup-marker", "App started"]
+    )
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Startup benchmark run 1 didn't detect that the app had started.",
+    ):
+        run_command(**options)
+
+    # The app was only run once.
+    assert [action[0] for action in run_command.actions].count("run") == 1
+
+
+def test_benchmark_startup_unsupported(run_command, first_app):
+    """If a platform doesn't support startup benchmarks, an error is raised."""
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # The option isn't available for the platform
+    with pytest.raises(SystemExit):
+        run_command.parse_options(["--benchmark-startup", "3"])
+
+    # If a benchmark is requested programmatically, an error is raised.
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Dummy run command doesn't support --benchmark-startup.",
+    ):
+        run_command(benchmark_startup=3, startup_marker="App")
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (
+            ["--startup-marker", "App"],
+            (
+                r"--startup-marker and --drop-caches can only be used with "
+                r"--benchmark-startup."
+            ),
+        ),
+        (
+            ["--drop-caches"],
+            (
+                r"--startup-marker and --drop-caches can only be used with "
+                r"--benchmark-startup."
+            ),
+        ),
+        (
+            ["--benchmark-startup", "3"],
+            (
+                r"--benchmark-startup requires a --startup-marker, "
+                r"unless the app is running in test mode."
+            ),
+        ),
+        (
+            ["--benchmark-startup", "3", "--startup-marker", "App (started"],
+            r"--startup-marker 'App \(started' isn't a valid regular expression: ",
+        ),
+        (
+            ["--test", "--benchmark-startup", "3", "--profile-app"],
+            r"--benchmark-startup can't be used with --profile-app or --test-shards.",
+        ),
+        (
+            ["--test", "--benchmark-startup", "3", "--test-shards", "2"],
+            r"--benchmark-startup can't be used with --profile-app or --test-shards.",
+        ),
+    ],
+)
+def test_benchmark_startup_invalid(run_command, first_app, args, message):
+    """Invalid startup benchmark options are rejected."""
+    run_command.supports_benchmark_startup = True
+    run_command.supports_profile_app = True
+    run_command.supports_test_shards = True
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = run_command.parse_options(args)
+    with pytest.raises(BriefcaseCommandError, match=message):
+        run_command(**options)
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+def test_watch(run_command, first_app):
+    """An app can be rebuilt and restarted whenever its code changes."""
+    run_command.supports_watch = True
+    run_command.watch_app = mock.MagicMock(return_value={"watch_state": "first"})
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # Configure the watch option
+    options, _ = run_command.parse_options(["--watch", "--", "arg"])
+
+    # Run the run command
+    result = run_command(**options)
+
+    # The app is watched, rather than run.
+    run_command.watch_app.assert_called_once_with(first_app, passthrough=["arg"])
+    assert result == {"watch_state": "first"}
+    assert [action[0] for action in run_command.actions].count("run") == 0
+
+
+def test_watch_unsupported(run_command, first_app):
+    """If a platform doesn't support watching, an error is raised."""
+    # Add a single app
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    # The option isn't available for the platform
+    with pytest.raises(SystemExit):
+        run_command.parse_options(["--watch"])
+
+    # If watching is requested programmatically, an error is raised.
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Dummy run command doesn't support --watch.",
+    ):
+        run_command(watch=True)
+
+    # Nothing was done
+    assert run_command.actions == []
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--watch", "--profile-app"],
+        ["--watch", "--benchmark-startup", "3", "--startup-marker", "started"],
+        ["--watch", "--test", "--test-shards", "2"],
+    ],
+)
+def test_watch_invalid(run_command, first_app, args):
+    """Watching can't be combined with options that run the app a specific number of
+    times."""
+    run_command.supports_watch = True
+    run_command.supports_benchmark_startup = True
+    run_command.supports_profile_app = True
+    run_command.supports_test_shards = True
+    run_command.apps = {
+        "first": first_app,
+    }
+
+    options, _ = run_command.parse_options(args)
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=(
+            r"--watch can't be used with --profile-app, --benchmark-startup "
+            r"or --test-shards."
+        ),
+    ):
+        run_command(**options)
+
+    # Nothing was done
+    assert run_command.actions == []
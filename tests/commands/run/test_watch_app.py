@@ -0,0 +1,289 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError, BriefcaseTestSuiteFailure
+from briefcase.integrations.file_watcher import FileWatcher
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def mock_watcher(monkeypatch):
+    """Replace the file watcher with a mock."""
+    watcher = mock.MagicMock(spec=FileWatcher)
+    watcher.pending = False
+    watcher_class = mock.MagicMock(return_value=watcher)
+    monkeypatch.setattr("briefcase.commands.run.FileWatcher", watcher_class)
+    return watcher_class
+
+
+@pytest.fixture
+def run_command(run_command):
+    run_command.update_command = mock.MagicMock(return_value=None)
+    run_command.build_command = mock.MagicMock(return_value=None)
+    run_command.run_app = mock.MagicMock(return_value=None)
+    run_command._project_requirements = mock.MagicMock(return_value=(["dep"], []))
+    return run_command
+
+
+@pytest.fixture
+def base_path(tmp_path):
+    return tmp_path / "base_path"
+
+
+def test_restart(run_command, first_app, mock_watcher, base_path, capsys):
+    """The app is rebuilt and restarted whenever its code changes."""
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(base_path / "src/first/app.py")},
+        {str(base_path / "src/first/other.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=["arg"], extra="value")
+
+    # The app's sources and pyproject.toml were watched.
+    mock_watcher.assert_called_once_with(
+        [base_path / "pyproject.toml", base_path / "src/first"]
+    )
+
+    # Only the changed code was updated before each rebuild.
+    assert run_command.update_command.call_args_list == [
+        mock.call(
+            first_app,
+            changes={str(base_path / "src/first/app.py")},
+            update_requirements=False,
+            update_resources=False,
+            extra="value",
+        ),
+        mock.call(
+            first_app,
+            changes={str(base_path / "src/first/other.py")},
+            update_requirements=False,
+            update_resources=False,
+            extra="value",
+        ),
+    ]
+    assert (
+        run_command.build_command.call_args_list
+        == [mock.call(first_app, no_update=True, extra="value")] * 2
+    )
+
+    # The app was started 3 times.
+    assert (
+        run_command.run_app.call_args_list
+        == [mock.call(first_app, passthrough=["arg"], extra="value")] * 3
+    )
+
+    output = capsys.readouterr().out
+    assert output.count("[first] Waiting for changes (press Ctrl-C to stop)...") == 3
+    assert output.count("[first] Changes detected; rebuilding app...") == 2
+
+    # The watcher was closed, and is no longer in use.
+    watcher.close.assert_called_once_with()
+    assert run_command.file_watcher is None
+
+
+def test_restart_pending(run_command, first_app, mock_watcher, base_path, capsys):
+    """If the app was stopped because its code changed, the app is rebuilt without
+    waiting for further changes."""
+    watcher = mock_watcher.return_value
+    watcher.pending = True
+    watcher.wait.side_effect = [
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    assert run_command.run_app.call_count == 2
+    assert "Waiting for changes" not in capsys.readouterr().out
+
+
+def test_state(run_command, first_app, mock_watcher, base_path):
+    """State from the update and build is passed to the restarted app."""
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+    run_command.update_command.return_value = {"update_state": "first"}
+    run_command.build_command.return_value = {"build_state": "first"}
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    run_command.build_command.assert_called_once_with(
+        first_app, no_update=True, update_state="first"
+    )
+    assert run_command.run_app.call_args_list[-1] == mock.call(
+        first_app, passthrough=[], build_state="first"
+    )
+
+
+def test_resources_changed(run_command, first_app, mock_watcher, base_path):
+    """If an image used to generate resources changes, the resources are
+    re-installed."""
+    first_app.icon = "src/first/resources/first"
+    first_app.document_types = {
+        "doc": {"icon": "src/first/resources/doc", "description": "A document"},
+    }
+    icon = create_file(base_path / "src/first/resources/first-256.png", "icon")
+    doc_icon = create_file(base_path / "src/first/resources/doc.png", "icon")
+    create_file(base_path / "src/first/resources/other.png", "icon")
+
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(icon)},
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    # The images were watched
+    mock_watcher.assert_called_once_with(
+        [
+            base_path / "pyproject.toml",
+            base_path / "src/first",
+            doc_icon,
+            icon,
+        ]
+    )
+
+    # Resources were only updated when an image changed.
+    assert [
+        call.kwargs["update_resources"]
+        for call in run_command.update_command.call_args_list
+    ] == [True, False]
+
+
+def test_icon_variants(run_command, first_app, base_path):
+    """Images for every variant of an icon are found."""
+    first_app.icon = {
+        "round": "resources/round",
+        "square": "resources/square",
+    }
+    round_icon = create_file(base_path / "resources/round-48.png", "icon")
+    square_icon = create_file(base_path / "resources/square-48.png", "icon")
+    (base_path / "resources/round-dir").mkdir()
+
+    assert run_command._resource_paths(first_app) == {
+        str(round_icon),
+        str(square_icon),
+    }
+
+
+def test_requirements_changed(run_command, first_app, mock_watcher, base_path):
+    """If the requirements of the app change, they are re-installed."""
+    pyproject_path = str(base_path / "pyproject.toml")
+    run_command._project_requirements.side_effect = [
+        (["dep"], []),
+        # Requirements are changed
+        (["dep", "new-dep"], ["pytest"]),
+        # pyproject.toml is changed, but the requirements aren't
+        (["dep", "new-dep"], ["pytest"]),
+    ]
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {pyproject_path},
+        {pyproject_path},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    assert [
+        call.kwargs["update_requirements"]
+        for call in run_command.update_command.call_args_list
+    ] == [True, False]
+    assert first_app.requires == ["dep", "new-dep"]
+    assert first_app.test_requires == ["pytest"]
+
+
+def test_requirements_unreadable(run_command, first_app, mock_watcher, base_path):
+    """If the requirements of the app can't be read, they aren't re-installed."""
+    run_command._project_requirements.side_effect = [(["dep"], []), None]
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [{str(base_path / "pyproject.toml")}, KeyboardInterrupt]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    assert not run_command.update_command.call_args.kwargs["update_requirements"]
+
+
+def test_update_failure(run_command, first_app, mock_watcher, base_path, capsys):
+    """If the app can't be updated, the error is reported, and the update is retried
+    when the app next changes."""
+    pyproject_path = str(base_path / "pyproject.toml")
+    run_command._project_requirements.side_effect = [
+        (["dep"], []),
+        (["dep", "new-dep"], []),
+    ]
+    run_command.update_command.side_effect = [
+        BriefcaseCommandError("Unable to install requirements."),
+        None,
+    ]
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {pyproject_path},
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    # The requirements update was retried
+    assert [
+        call.kwargs["update_requirements"]
+        for call in run_command.update_command.call_args_list
+    ] == [True, True]
+
+    # The app wasn't restarted when the update failed.
+    assert run_command.build_command.call_count == 1
+    assert run_command.run_app.call_count == 2
+    assert "[first] Unable to install requirements." in capsys.readouterr().out
+
+
+def test_build_failure(run_command, first_app, mock_watcher, base_path, capsys):
+    """If the app can't be built, the error is reported, and watching continues."""
+    run_command.build_command.side_effect = [
+        BriefcaseCommandError("Unable to build app."),
+        None,
+    ]
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(base_path / "src/first/app.py")},
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    assert run_command.run_app.call_count == 2
+    assert "[first] Unable to build app." in capsys.readouterr().out
+
+
+def test_test_failure(run_command, first_app, mock_watcher, base_path):
+    """If a test suite fails, watching continues."""
+    run_command.run_app.side_effect = [BriefcaseTestSuiteFailure(), None]
+    watcher = mock_watcher.return_value
+    watcher.wait.side_effect = [
+        {str(base_path / "src/first/app.py")},
+        KeyboardInterrupt,
+    ]
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    assert run_command.run_app.call_count == 2
+
+
+def test_ctrl_c_while_running(run_command, first_app, mock_watcher):
+    """If the user presses Ctrl-C while the app is running, watching stops."""
+    run_command.run_app.side_effect = KeyboardInterrupt
+
+    run_command.watch_app(first_app, passthrough=[])
+
+    mock_watcher.return_value.wait.assert_not_called()
+    mock_watcher.return_value.close.assert_called_once_with()
+    assert run_command.file_watcher is None
@@ -26,6 +26,8 @@ class DummyUpdateCommand(UpdateCommand):
         self.actions = []
         self.tools.host_arch = "gothic"
         self.tools.subprocess = mock.MagicMock(spec_set=Subprocess)
+        # Does syncing code add new files to the bundle?
+        self.sync_adds_files = False
 
     def briefcase_toml(self, app):
         # default any app to an empty `briefcase.toml`
@@ -73,6 +75,10 @@ class DummyUpdateCommand(UpdateCommand):
         self.actions.append(("code", app.app_name, app.test_mode))
         create_file(self.bundle_path(app) / "code.py", "print('app')")
 
+    def sync_app_code(self, app, changes):
+        self.actions.append(("sync-code", app.app_name, sorted(changes)))
+        return self.sync_adds_files
+
     def install_app_resources(self, app):
         self.actions.append(("resources", app.app_name))
         create_file(self.bundle_path(app) / "resources", "app resources")
@@ -0,0 +1,131 @@
+import pytest
+
+
+def test_code_changes(update_command, first_app, tmp_path):
+    """If only code has changed, only the changed code is updated."""
+    update_command.update_app_changes(
+        update_command.apps["first"],
+        changes={"src/first/app.py"},
+        update_requirements=False,
+        update_resources=False,
+    )
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("verify-app-template", "first"),
+        ("verify-app-tools", "first"),
+        ("sync-code", "first", ["src/first/app.py"]),
+    ]
+
+    # The app still exists
+    assert (tmp_path / "base_path/build/first/tester/dummy/first.bundle").exists()
+
+
+def test_code_added(update_command, first_app):
+    """If code has been added to the bundle, the bundle is cleaned up."""
+    update_command.sync_adds_files = True
+
+    update_command.update_app_changes(
+        update_command.apps["first"],
+        changes={"src/first/new.py"},
+        update_requirements=False,
+        update_resources=False,
+    )
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("verify-app-template", "first"),
+        ("verify-app-tools", "first"),
+        ("sync-code", "first", ["src/first/new.py"]),
+        ("cleanup", "first"),
+    ]
+
+
+def test_update_requirements(update_command, first_app, tmp_path):
+    """If requirements have changed, they are re-installed."""
+    update_command.update_app_changes(
+        update_command.apps["first"],
+        changes={"pyproject.toml"},
+        update_requirements=True,
+        update_resources=False,
+    )
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("verify-app-template", "first"),
+        ("verify-app-tools", "first"),
+        ("sync-code", "first", ["pyproject.toml"]),
+        ("create-app-env", "first", "Tester", "gothic", "default", True),
+        ("requirements", "Tester-gothic", "first", False, False),
+        ("cleanup", "first"),
+    ]
+
+    # Requirements have been updated; resources haven't
+    assert (tmp_path / "base_path/build/first/tester/dummy/requirements").exists()
+    assert not (tmp_path / "base_path/build/first/tester/dummy/resources").exists()
+
+
+def test_update_requirements_managed_python(update_command, first_app, monkeypatch):
+    """If the app environment provides Python, the managed environment is updated
+    along with the requirements."""
+    monkeypatch.setattr(
+        "briefcase.integrations.virtual_environment.VenvVirtualEnvironment"
+        ".provides_python",
+        True,
+    )
+
+    update_command.update_app_changes(
+        update_command.apps["first"],
+        changes={"pyproject.toml"},
+        update_requirements=True,
+        update_resources=False,
+    )
+
+    assert update_command.actions[-3:] == [
+        ("requirements", "Tester-gothic", "first", False, False),
+        ("install-managed-python-env", "first", "Tester-gothic"),
+        ("cleanup", "first"),
+    ]
+
+
+def test_update_resources(update_command, first_app, tmp_path):
+    """If resources have changed, they are re-installed."""
+    update_command.update_app_changes(
+        update_command.apps["first"],
+        changes={"src/first/resources/first.png"},
+        update_requirements=False,
+        update_resources=True,
+    )
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("verify-app-template", "first"),
+        ("verify-app-tools", "first"),
+        ("sync-code", "first", ["src/first/resources/first.png"]),
+        ("resources", "first"),
+    ]
+
+    # Resources have been updated
+    assert (tmp_path / "base_path/build/first/tester/dummy/resources").exists()
+
+
+@pytest.mark.parametrize("changes", [set(), {"src/first/app.py"}])
+def test_call(update_command, first_app, changes):
+    """If changes are provided when the command is invoked, only the changes are
+    applied."""
+    update_command(
+        app=update_command.apps["first"],
+        changes=changes,
+        update_resources=True,
+    )
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("verify-host",),
+        ("verify-tools",),
+        ("finalize-app-config", "first"),
+        ("verify-app-template", "first"),
+        ("verify-app-tools", "first"),
+        ("sync-code", "first", sorted(changes)),
+        ("resources", "first"),
+    ]
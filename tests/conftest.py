@@ -11,6 +11,7 @@ import pytest
 
 from briefcase.config import DraftAppConfig
 from briefcase.integrations.base import ToolCache
+from briefcase.integrations.executor import Executor
 from briefcase.integrations.file import File
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.integrations.virtual_environment import VirtualEnvironment
@@ -167,9 +168,10 @@ def mock_tools(dummy_console, tmp_path) -> ToolCache:
     mock_tools.base_path.mkdir(parents=True)
     mock_tools.home_path.mkdir(parents=True)
 
-    # Make File and Subprocess always available
+    # Make File, Subprocess and Executor always available
     File.verify(tools=mock_tools)
     Subprocess.verify(tools=mock_tools)
+    Executor.verify(tools=mock_tools)
 
     return mock_tools
 
@@ -1,10 +1,34 @@
+from rich.progress import Progress
+
+from briefcase.console import PlainProgress
+
+
 def test_wait_bar_always_interactive(console):
     """Progress Bar is not disabled when console is interactive."""
     with console.progress_bar() as bar:
         assert bar.disable is False
 
 
-def test_wait_bar_non_interactive(non_interactive_console):
-    """Progress Bar is disabled when console is non-interactive."""
+def test_wait_bar_non_interactive(non_interactive_console, monkeypatch):
+    """Progress Bar is disabled when console is non-interactive, but using color."""
+    monkeypatch.setattr(type(non_interactive_console), "is_color_enabled", True)
+
     with non_interactive_console.progress_bar() as bar:
+        assert isinstance(bar, Progress)
         assert bar.disable is True
+
+
+def test_wait_bar_plain(non_interactive_console, monkeypatch):
+    """Progress is reported as text when console is non-interactive without color."""
+    monkeypatch.setattr(type(non_interactive_console), "is_color_enabled", False)
+
+    with non_interactive_console.progress_bar() as bar:
+        assert isinstance(bar, PlainProgress)
+
+
+def test_wait_bar_forced_plain(console):
+    """Progress is reported as text when plain output is requested."""
+    console.plain = True
+
+    with console.progress_bar() as bar:
+        assert isinstance(bar, PlainProgress)
@@ -462,6 +462,33 @@ def test_save_log_to_file_fail_to_write_file(
     )
 
 
+def test_multiline_message(console, capsys, monkeypatch):
+    """A message with multiple lines is printed with a single call."""
+    console.save_log = False
+    mock_print = MagicMock(wraps=console.print)
+    monkeypatch.setattr(console, "print", mock_print)
+
+    with console.context("Deep"):
+        console.info("first line\n\nthird line\n", prefix="prefix")
+
+    assert capsys.readouterr().out == (
+        "\n"
+        "Entering Deep context...\n"
+        "Deep| --------------------------------------------------------------------\n"
+        "Deep| \n"
+        "Deep| [prefix] first line\n"
+        "Deep| [prefix] \n"
+        "Deep| [prefix] third line\n"
+        "Deep| --------------------------------------------------------------------\n"
+        "Leaving Deep context.\n"
+        "\n"
+    )
+    # All the lines of the message were printed with a single call
+    assert (
+        sum("first line" in str(call.args) for call in mock_print.call_args_list) == 1
+    )
+
+
 def test_log_with_context(console, capsys):
     """Log file can be given a persistent context."""
     console.verbosity = LogLevel.DEBUG
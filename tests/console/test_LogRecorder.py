@@ -0,0 +1,172 @@
+import io
+
+import pytest
+
+from briefcase.console import Console, LogRecorder
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "compressed"])
+def compress(request):
+    return request.param
+
+
+def test_write_and_export(compress):
+    """Content written to the recorder can be exported."""
+    recorder = LogRecorder(compress=compress)
+    recorder.write("first line\n")
+    recorder.write("second line\n")
+
+    assert recorder.size == 23
+    assert recorder.export_text() == "first line\nsecond line\n"
+    recorder.close()
+
+
+def test_export_clears(compress):
+    """Exporting the log clears the log."""
+    recorder = LogRecorder(compress=compress)
+    recorder.write("first line\n")
+
+    assert recorder.export_text() == "first line\n"
+    assert recorder.export_text() == ""
+
+    # The recorder can continue to be used after export
+    recorder.write("second line\n")
+    assert recorder.export_text() == "second line\n"
+    recorder.close()
+
+
+def test_copy_to(monkeypatch, compress):
+    """The log can be streamed to a file, and continue to be written."""
+    # Use a tiny chunk size to ensure multibyte characters are split across chunks
+    monkeypatch.setattr(LogRecorder, "CHUNK_SIZE", 3)
+    recorder = LogRecorder(compress=compress)
+    recorder.write("first line 🐝\n")
+
+    log_file = io.StringIO()
+    recorder.copy_to(log_file)
+    assert log_file.getvalue() == "first line 🐝\n"
+
+    # Copying doesn't clear the log
+    recorder.write("second line\n")
+    assert recorder.export_text() == "first line 🐝\nsecond line\n"
+    recorder.close()
+
+
+def test_spooled_to_disk(monkeypatch, compress):
+    """Content larger than the spool size is retained."""
+    monkeypatch.setattr(LogRecorder, "SPOOL_SIZE", 10)
+    recorder = LogRecorder(compress=compress)
+    for i in range(100):
+        recorder.write(f"line {i}\n")
+
+    assert recorder.export_text() == "".join(f"line {i}\n" for i in range(100))
+    recorder.close()
+
+
+def test_ring_buffer(compress):
+    """If a maximum size is specified, the oldest content is discarded."""
+    recorder = LogRecorder(max_size=20, compress=compress)
+    for i in range(10):
+        recorder.write(f"line {i}\n")
+
+    # A new segment is started once a segment reaches 10 bytes (i.e., after 2
+    # lines). The most recent segment is empty, and the previous segment holds the
+    # last 2 lines.
+    assert recorder.size == 14
+    assert recorder.discarded == 56
+    assert recorder.export_text() == (
+        "... 56 bytes of earlier log output discarded ...\nline 8\nline 9\n"
+    )
+
+    # Exporting resets the count of discarded content.
+    assert recorder.discarded == 0
+    recorder.close()
+
+
+def test_invalid_max_size():
+    """The maximum size of the log must allow for 2 segments."""
+    with pytest.raises(ValueError, match=r"Maximum log size must be at least 2 bytes"):
+        LogRecorder(max_size=1)
+
+
+def test_close_is_idempotent():
+    """The recorder can be closed more than once."""
+    recorder = LogRecorder()
+    recorder.close()
+    recorder.close()
+
+
+def test_console_log_max_size():
+    """The console log can be bounded."""
+    console = Console(log_max_size=1000, log_compress=True)
+    for i in range(100):
+        console.to_log(f"line {i}", stack_offset=1)
+
+    log = console.export_log()
+    assert "bytes of earlier log output discarded" in log
+    assert "line 0 " not in log
+    assert "line 99 " in log
+    console.close()
+
+
+def test_console_log_defaults(monkeypatch):
+    """By default, the console log is neither bounded nor compressed."""
+    monkeypatch.delenv("BRIEFCASE_LOG_MAX_SIZE", raising=False)
+    monkeypatch.delenv("BRIEFCASE_LOG_COMPRESS", raising=False)
+    console = Console()
+
+    assert console._log_recorder.max_size is None
+    assert not console._log_recorder.compress
+    console.close()
+
+
+def test_console_log_environment(monkeypatch):
+    """The console log can be configured with environment variables."""
+    monkeypatch.setenv("BRIEFCASE_LOG_MAX_SIZE", "1000")
+    monkeypatch.setenv("BRIEFCASE_LOG_COMPRESS", "yes")
+    console = Console()
+
+    assert console._log_recorder.max_size == 1000
+    assert console._log_recorder.compress
+    console.close()
+
+
+def test_console_log_environment_override(monkeypatch):
+    """Explicit log settings take precedence over the environment."""
+    monkeypatch.setenv("BRIEFCASE_LOG_MAX_SIZE", "1000")
+    monkeypatch.setenv("BRIEFCASE_LOG_COMPRESS", "yes")
+    console = Console(log_max_size=500, log_compress=False)
+
+    assert console._log_recorder.max_size == 500
+    assert not console._log_recorder.compress
+    console.close()
+
+
+@pytest.mark.parametrize("max_size", ["big", "1", "-5"])
+def test_console_log_invalid_max_size(monkeypatch, capsys, max_size):
+    """An invalid maximum log size in the environment is ignored with a warning."""
+    monkeypatch.setenv("BRIEFCASE_LOG_MAX_SIZE", max_size)
+    monkeypatch.delenv("BRIEFCASE_LOG_COMPRESS", raising=False)
+    console = Console()
+
+    assert console._log_recorder.max_size is None
+    assert (
+        f"The value of BRIEFCASE_LOG_MAX_SIZE ({max_size!r}) is not an integer of "
+        "at least 2; the log size will not be limited."
+    ) in capsys.readouterr().out
+    console.close()
+
+
+def test_console_log_invalid_compress(monkeypatch, capsys):
+    """An invalid log compression flag in the environment is ignored with a
+    warning."""
+    monkeypatch.delenv("BRIEFCASE_LOG_MAX_SIZE", raising=False)
+    monkeypatch.setenv("BRIEFCASE_LOG_COMPRESS", "maybe")
+    console = Console()
+
+    assert not console._log_recorder.compress
+    assert (
+        "The value of BRIEFCASE_LOG_COMPRESS ('maybe') is not a boolean; "
+        "the log will not be compressed."
+    ) in capsys.readouterr().out
+    console.close()
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import briefcase.console
+from briefcase.console import PlainProgress
+
+
+@pytest.fixture
+def mock_time(monkeypatch):
+    mock_time = MagicMock(return_value=0.0)
+    monkeypatch.setattr(briefcase.console.time, "monotonic", mock_time)
+    return mock_time
+
+
+def test_short_task(capsys, mock_time, dummy_console):
+    """A task that completes within the reporting interval produces no output."""
+    progress = PlainProgress(console=dummy_console)
+    with progress:
+        task_id = progress.add_task("Downloader", total=100)
+        for _ in range(10):
+            progress.update(task_id, advance=10)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_periodic_report(capsys, mock_time, dummy_console):
+    """Progress is reported at most once per interval, if it has changed."""
+    progress = PlainProgress(console=dummy_console, interval_sec=5)
+    with progress:
+        task_id = progress.add_task("Downloader", total=200)
+
+        # Before the first interval has elapsed
+        mock_time.return_value = 1.0
+        progress.update(task_id, advance=10)
+        # After the first interval
+        mock_time.return_value = 6.0
+        progress.update(task_id, advance=10)
+        # Within the second interval
+        mock_time.return_value = 7.0
+        progress.update(task_id, advance=50)
+        # After the second interval
+        mock_time.return_value = 12.0
+        progress.update(task_id, completed=150)
+        # After the third interval, but no progress
+        mock_time.return_value = 20.0
+        progress.update(task_id, advance=0)
+        # Progress beyond the total is capped
+        progress.update(task_id, advance=100, description="Downloading")
+
+    assert capsys.readouterr().out == (
+        "  Downloader: 10%\n  Downloader: 75%\n  Downloading: 100%\n"
+    )
+
+
+def test_unknown_total(capsys, mock_time, dummy_console):
+    """A task without a total doesn't report progress."""
+    progress = PlainProgress(console=dummy_console)
+    with progress:
+        task_id = progress.add_task("Downloader", total=None)
+        mock_time.return_value = 100.0
+        progress.update(task_id, advance=10)
+
+        # The total can be provided later.
+        progress.update(task_id, total=20)
+
+    assert capsys.readouterr().out == "  Downloader: 50%\n"
@@ -0,0 +1,137 @@
+import time
+from unittest.mock import MagicMock, call
+
+import pytest
+from rich.console import Console as RichConsole
+from rich.table import Table
+
+import briefcase.console
+from briefcase.console import Console, PlainTextConsole
+
+
+@pytest.mark.parametrize(
+    ("messages", "kwargs"),
+    [
+        (("a line of output",), {}),
+        ((), {}),
+        (("  trailing space  ",), {}),
+        (("a\ttab",), {}),
+        (("multiple\nlines",), {}),
+        (("control\rcodes\x07",), {}),
+        (("[bold]markup[/bold] and \\[escaped]",), {}),
+        (("[bold]markup[/bold] and \\[escaped]",), {"markup": True}),
+        (("[bold]markup[/bold] and \\[escaped]",), {"markup": False}),
+        (("ansi \x1b[31mred\x1b[0m",), {}),
+        (("first", "second"), {"sep": "-", "end": "!\n"}),
+        (("styled",), {"style": "bold red", "highlight": False}),
+    ],
+)
+def test_matches_rich(capsys, messages, kwargs):
+    """Plain text output matches the output of Rich without color."""
+    rich_console = RichConsole(emoji=False, soft_wrap=True, no_color=True)
+    rich_console.print(*messages, **kwargs)
+    rich_output = capsys.readouterr().out
+
+    PlainTextConsole().print(*messages, **kwargs)
+    assert capsys.readouterr().out == rich_output
+
+
+@pytest.mark.parametrize(
+    ("messages", "kwargs", "can_print"),
+    [
+        (("text",), {}, True),
+        (("text", "more text"), {"markup": False, "style": "dim"}, True),
+        ((Table(),), {}, False),
+        (("text",), {"justify": "center"}, False),
+    ],
+)
+def test_can_print(messages, kwargs, can_print):
+    """Only strings with supported formatting can be printed as plain text."""
+    assert PlainTextConsole.can_print(messages, kwargs) is can_print
+
+
+def test_periodic_flush(monkeypatch):
+    """Output is only flushed once per flush interval."""
+    mock_time = MagicMock(side_effect=[0.05, 0.2, 0.2, 0.25])
+    monkeypatch.setattr(briefcase.console.time, "monotonic", mock_time)
+    mock_stdout = MagicMock()
+    monkeypatch.setattr(briefcase.console.sys, "stdout", mock_stdout)
+    mock_timer = MagicMock()
+    monkeypatch.setattr(briefcase.console.threading, "Timer", mock_timer)
+
+    plain_console = PlainTextConsole()
+    plain_console.print("first")
+    plain_console.print("second")
+    plain_console.print("third")
+
+    assert mock_stdout.write.call_count == 3
+    # Only the second print exceeded the flush interval
+    mock_stdout.flush.assert_called_once_with()
+    # A flush was scheduled for the first and third prints; the first was
+    # cancelled by the flush of the second print.
+    assert mock_timer.call_args_list == [
+        call(PlainTextConsole.FLUSH_INTERVAL, plain_console.flush),
+        call(PlainTextConsole.FLUSH_INTERVAL, plain_console.flush),
+    ]
+    assert mock_timer.return_value.start.call_count == 2
+    mock_timer.return_value.cancel.assert_called_once_with()
+
+
+def test_idle_flush(monkeypatch):
+    """Output that hasn't been flushed is flushed once the console is idle."""
+    mock_stdout = MagicMock()
+    monkeypatch.setattr(briefcase.console.sys, "stdout", mock_stdout)
+
+    plain_console = PlainTextConsole()
+    # The first line is flushed immediately; the second line is written within
+    # the flush interval, and no further output follows.
+    plain_console.print("first")
+    plain_console.print("second")
+    assert mock_stdout.flush.call_count == 1
+
+    deadline = time.monotonic() + 5
+    while mock_stdout.flush.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert mock_stdout.flush.call_count == 2
+    assert plain_console._flush_timer is None
+
+
+@pytest.mark.parametrize(
+    ("plain", "is_interactive", "is_color_enabled", "is_plain"),
+    [
+        (None, True, True, False),
+        (None, True, False, False),
+        (None, False, True, False),
+        (None, False, False, True),
+        (True, True, True, True),
+        (False, False, False, False),
+    ],
+)
+def test_is_plain(monkeypatch, plain, is_interactive, is_color_enabled, is_plain):
+    """Plain text is used when requested, or for uncolored non-interactive output."""
+    monkeypatch.setattr(Console, "is_interactive", is_interactive)
+    monkeypatch.setattr(Console, "is_color_enabled", is_color_enabled)
+    console = Console(plain=plain)
+    try:
+        assert console.is_plain is is_plain
+    finally:
+        console.close()
+
+
+def test_to_console_plain(monkeypatch, capsys):
+    """Plain text console output bypasses Rich for strings."""
+    console = Console(plain=True)
+    mock_rich_print = MagicMock()
+    monkeypatch.setattr(console._console_impl, "print", mock_rich_print)
+    try:
+        console.to_console("a line of output")
+        assert capsys.readouterr().out == "a line of output\n"
+        mock_rich_print.assert_not_called()
+
+        # A renderable is still printed by Rich
+        table = Table()
+        console.to_console(table)
+        mock_rich_print.assert_called_once_with(table)
+    finally:
+        console.close()
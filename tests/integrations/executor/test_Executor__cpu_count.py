@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.executor import Executor
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def executor(mock_tools, tmp_path, monkeypatch):
+    monkeypatch.setattr(Executor, "CGROUP_PATH", tmp_path / "cgroup")
+    mock_tools.host_os = "Linux"
+    return Executor(tools=mock_tools)
+
+
+def test_process_cpu_count(executor):
+    """If the OS can report the CPUs available to the process, it is used."""
+    executor.tools.os = MagicMock(spec=["process_cpu_count", "cpu_count"])
+    executor.tools.os.process_cpu_count.return_value = 6
+    executor.tools.os.cpu_count.return_value = 12
+
+    assert executor.cpu_count() == 6
+
+
+def test_sched_getaffinity(executor):
+    """If the process has a CPU affinity, it is used."""
+    executor.tools.os = MagicMock(spec=["sched_getaffinity", "cpu_count"])
+    executor.tools.os.sched_getaffinity.return_value = {0, 2, 4}
+    executor.tools.os.cpu_count.return_value = 12
+
+    assert executor.cpu_count() == 3
+    executor.tools.os.sched_getaffinity.assert_called_once_with(0)
+
+
+def test_cpu_count(executor):
+    """If the OS can't report the process CPU affinity, the CPU count is used."""
+    executor.tools.os = MagicMock(spec=["cpu_count"])
+    executor.tools.os.cpu_count.return_value = 12
+
+    assert executor.cpu_count() == 12
+
+
+def test_unknown_cpu_count(executor):
+    """If the CPU count can't be determined, 1 CPU is assumed."""
+    executor.tools.os = MagicMock(spec=["cpu_count"])
+    executor.tools.os.cpu_count.return_value = None
+
+    assert executor.cpu_count() == 1
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("max 100000\n", 12),
+        ("200000 100000\n", 2),
+        ("150000 100000\n", 2),
+        ("50000 100000\n", 1),
+        ("2000000 100000\n", 12),
+        ("garbage\n", 12),
+        ("lots 100000\n", 12),
+    ],
+)
+def test_cgroup_v2_quota(executor, tmp_path, content, expected):
+    """A cgroup v2 CPU quota limits the CPU count."""
+    executor.tools.os = MagicMock(spec=["cpu_count"])
+    executor.tools.os.cpu_count.return_value = 12
+    create_file(tmp_path / "cgroup/cpu.max", content)
+
+    assert executor.cpu_count() == expected
+
+
+@pytest.mark.parametrize(
+    ("quota", "period", "expected"),
+    [
+        ("-1\n", "100000\n", 12),
+        ("400000\n", "100000\n", 4),
+        ("250000\n", "100000\n", 3),
+        ("100000\n", "0\n", 12),
+    ],
+)
+def test_cgroup_v1_quota(executor, tmp_path, quota, period, expected):
+    """A cgroup v1 CPU quota limits the CPU count."""
+    executor.tools.os = MagicMock(spec=["cpu_count"])
+    executor.tools.os.cpu_count.return_value = 12
+    create_file(tmp_path / "cgroup/cpu/cpu.cfs_quota_us", quota)
+    create_file(tmp_path / "cgroup/cpu/cpu.cfs_period_us", period)
+
+    assert executor.cpu_count() == expected
+
+
+@pytest.mark.parametrize("host_os", ["Darwin", "Windows"])
+def test_cgroup_ignored_on_other_platforms(executor, tmp_path, host_os):
+    """cgroup quotas are only considered on Linux."""
+    executor.tools.host_os = host_os
+    executor.tools.os = MagicMock(spec=["cpu_count"])
+    executor.tools.os.cpu_count.return_value = 12
+    create_file(tmp_path / "cgroup/cpu.max", "100000 100000\n")
+
+    assert executor.cpu_count() == 12
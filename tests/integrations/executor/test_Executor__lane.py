@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from briefcase.console import LogLevel
+from briefcase.integrations.executor import Executor
+
+
+@pytest.fixture
+def executor(mock_tools):
+    executor = Executor(tools=mock_tools, jobs=3)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("jobs", "verbosity", "cpu_size", "io_size"),
+    [
+        (3, LogLevel.INFO, 3, 7),
+        (1, LogLevel.INFO, 1, 5),
+        (64, LogLevel.INFO, 64, 32),
+        (3, LogLevel.DEEP_DEBUG, 1, 1),
+    ],
+)
+def test_lane_size(executor, jobs, verbosity, cpu_size, io_size):
+    """The size of each lane is derived from the number of jobs."""
+    executor.jobs = jobs
+    executor.tools.console.verbosity = verbosity
+
+    assert executor.lane_size(Executor.CPU) == cpu_size
+    assert executor.lane_size(Executor.IO) == io_size
+
+
+def test_unknown_lane(executor):
+    """An unknown lane raises an error."""
+    with pytest.raises(ValueError, match=r"Unknown executor lane 'gpu'"):
+        executor.lane("gpu")
+
+
+def test_lane_is_shared(executor):
+    """The pool for a lane is created once, and shared."""
+    cpu = executor.lane(Executor.CPU)
+    io = executor.lane(Executor.IO)
+
+    assert cpu is not io
+    assert executor.lane(Executor.CPU) is cpu
+    assert executor.lane(Executor.IO) is io
+
+
+def test_lane_is_resized(executor):
+    """If the size of a lane changes, a new pool is created."""
+    cpu = executor.lane(Executor.CPU)
+
+    executor.tools.console.verbosity = LogLevel.DEEP_DEBUG
+
+    assert executor.lane(Executor.CPU) is not cpu
+
+
+def test_submit(executor):
+    """Work can be submitted to each lane."""
+    cpu_future = executor.submit(lambda x, y=0: x + y, 1, y=2)
+    io_future = executor.submit_io(threading.current_thread)
+
+    assert cpu_future.result() == 3
+    assert io_future.result().name.startswith("briefcase-io")
+
+
+def test_shutdown(executor):
+    """Shutting down the executor discards the lanes."""
+    cpu = executor.lane(Executor.CPU)
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        cpu.submit(print)
+
+    # A new pool is created on the next use.
+    assert executor.lane(Executor.CPU) is not cpu
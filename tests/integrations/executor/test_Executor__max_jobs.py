@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.console import LogLevel
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.executor import Executor
+
+
+@pytest.fixture
+def executor(mock_tools):
+    executor = Executor(tools=mock_tools)
+    executor.cpu_count = MagicMock(return_value=6)
+    return executor
+
+
+def test_default(executor):
+    """By default, the number of jobs is the number of CPUs."""
+    assert executor.max_jobs == 6
+
+
+def test_explicit_jobs(executor):
+    """An explicit number of jobs takes priority."""
+    executor.tools.os.environ = {"BRIEFCASE_JOBS": "3"}
+    executor.jobs = 2
+
+    assert executor.max_jobs == 2
+
+
+def test_environment(executor):
+    """The number of jobs can be set in the environment."""
+    executor.tools.os.environ = {"BRIEFCASE_JOBS": "3"}
+
+    assert executor.max_jobs == 3
+
+
+def test_empty_environment(executor):
+    """An empty environment variable is ignored."""
+    executor.tools.os.environ = {"BRIEFCASE_JOBS": ""}
+
+    assert executor.max_jobs == 6
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "lots"])
+def test_invalid_environment(executor, value):
+    """An invalid number of jobs in the environment raises an error."""
+    executor.tools.os.environ = {"BRIEFCASE_JOBS": value}
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The value of BRIEFCASE_JOBS \(.*\) is not a positive integer",
+    ):
+        _ = executor.max_jobs
+
+
+@pytest.mark.parametrize("jobs", [None, 4])
+def test_deep_debug(executor, jobs):
+    """In deep debug mode, all work is serial."""
+    executor.tools.console.verbosity = LogLevel.DEEP_DEBUG
+    executor.jobs = jobs
+
+    assert executor.max_jobs == 1
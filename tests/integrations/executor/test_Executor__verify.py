@@ -0,0 +1,38 @@
+import pytest
+
+from briefcase.exceptions import UnsupportedHostError
+from briefcase.integrations.executor import Executor
+
+
+def test_short_circuit(mock_tools):
+    """Tool is not created if already cached."""
+    mock_tools.executor = "tool"
+
+    tool = Executor.verify(mock_tools)
+
+    assert tool == "tool"
+    assert tool == mock_tools.executor
+
+
+def test_unsupported_os(mock_tools):
+    """When host OS is not supported, an error is raised."""
+    mock_tools.host_os = "wonky"
+
+    # Delete executor since it has already been verified
+    delattr(mock_tools, "executor")
+
+    with pytest.raises(
+        UnsupportedHostError,
+        match=f"{Executor.name} is not supported on wonky",
+    ):
+        Executor.verify(mock_tools)
+
+
+def test_verify(mock_tools):
+    """Verifying Executor always returns/set executor tool."""
+    delattr(mock_tools, "executor")
+
+    executor = Executor.verify(mock_tools)
+    assert isinstance(executor, Executor)
+    assert executor is mock_tools.executor
+    assert executor.jobs is None
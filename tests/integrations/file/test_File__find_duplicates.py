@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+from briefcase.integrations.file import File
+
+from ...utils import create_file
+
+
+def test_find_duplicates(tmp_path):
+    """Files with identical content are grouped together."""
+    paths = [
+        create_file(tmp_path / "a/libz.so", "zlib"),
+        create_file(tmp_path / "b/libz.so", "zlib"),
+        create_file(tmp_path / "c/libz-copy.so", "zlib"),
+        # The same size as the copies, but different content.
+        create_file(tmp_path / "d/libz.so", "ZLIB"),
+        create_file(tmp_path / "e/first.txt", "first content"),
+        create_file(tmp_path / "e/second.txt", "first content"),
+        create_file(tmp_path / "unique.txt", "unique"),
+    ]
+
+    assert File.find_duplicates(paths) == [
+        [tmp_path / "a/libz.so", tmp_path / "b/libz.so", tmp_path / "c/libz-copy.so"],
+        [tmp_path / "e/first.txt", tmp_path / "e/second.txt"],
+    ]
+
+
+def test_find_duplicates_ignored(tmp_path):
+    """Empty files, and hard links to the same file, aren't duplicates."""
+    paths = [
+        create_file(tmp_path / "first/__init__.py", ""),
+        create_file(tmp_path / "second/__init__.py", ""),
+        create_file(tmp_path / "libz.so", "zlib"),
+    ]
+    os.link(tmp_path / "libz.so", tmp_path / "libz-link.so")
+    paths.append(tmp_path / "libz-link.so")
+
+    assert File.find_duplicates(paths) == []
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_find_duplicates_symlinks(tmp_path):
+    """Symbolic links aren't duplicates of the file they point to."""
+    create_file(tmp_path / "libz.so.1", "zlib")
+    (tmp_path / "libz.so").symlink_to("libz.so.1")
+
+    assert File.find_duplicates([tmp_path / "libz.so.1", tmp_path / "libz.so"]) == []
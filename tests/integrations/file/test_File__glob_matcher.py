@@ -0,0 +1,59 @@
+import pytest
+
+from briefcase.integrations.file import File
+
+
+@pytest.mark.parametrize(
+    ("patterns", "path", "is_dir", "matches"),
+    [
+        # No patterns never match
+        ([], "path/to/file.txt", False, False),
+        # Literal paths
+        (["path/to/file.txt"], "path/to/file.txt", False, True),
+        (["path/to/file.txt"], "path/to/other.txt", False, False),
+        (["path/to/file.txt"], "path/to/file.txt/deeper", False, False),
+        (["path/./to//file.txt"], "path/to/file.txt", False, True),
+        # Regular expression syntax is literal
+        (["file(1).txt"], "file(1).txt", False, True),
+        (["file.txt"], "fileAtxt", False, False),
+        # Single character wildcards
+        (["path/?.txt"], "path/a.txt", False, True),
+        (["path/?.txt"], "path/ab.txt", False, False),
+        # Wildcards
+        (["path/*.txt"], "path/file.txt", False, True),
+        (["path/*.txt"], "path/.hidden.txt", False, True),
+        (["path/*"], "path/file.txt", False, True),
+        (["path/*"], "path/to/file.txt", False, False),
+        (["*/file.txt"], "path/file.txt", False, True),
+        (["*/file.txt"], "path/to/file.txt", False, False),
+        # Character sets
+        (["file[12].txt"], "file1.txt", False, True),
+        (["file[12].txt"], "file3.txt", False, False),
+        (["file[a-c].txt"], "fileb.txt", False, True),
+        (["file[!12].txt"], "file3.txt", False, True),
+        (["file[!12].txt"], "file1.txt", False, False),
+        (["path[!x]to"], "path/to", False, False),
+        (["file[]].txt"], "file].txt", False, True),
+        (["file[^&&].txt"], "file&.txt", False, True),
+        # A set that isn't closed is literal
+        (["file[1.txt"], "file[1.txt", False, True),
+        # Recursive wildcards match any number of directories
+        (["**/__pycache__"], "__pycache__", True, True),
+        (["**/__pycache__"], "path/to/__pycache__", True, True),
+        (["**/__pycache__"], "path/to/__pycache__/file.pyc", False, False),
+        (["path/**/*.txt"], "path/file.txt", False, True),
+        (["path/**/*.txt"], "path/to/deep/file.txt", False, True),
+        (["path/**/*.txt"], "other/to/file.txt", False, False),
+        # A trailing recursive wildcard only matches directories
+        (["path/**"], "path", True, True),
+        (["path/**"], "path/to", True, True),
+        (["path/**"], "path/to/file.txt", False, False),
+        # Any pattern can match
+        (["*.txt", "*.doc"], "file.doc", False, True),
+        (["*.txt", "path/**"], "path/to", True, True),
+        (["*.txt", "path/**"], "path/file.doc", False, False),
+    ],
+)
+def test_glob_matcher(patterns, path, is_dir, matches):
+    """Glob patterns are matched with the same semantics as Path.glob()."""
+    assert File.glob_matcher(patterns)(path, is_dir) is matches
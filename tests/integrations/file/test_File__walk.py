@@ -0,0 +1,95 @@
+import shutil
+import sys
+
+import pytest
+
+from ...utils import create_file
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    create_file(root / "b_file.txt", "b")
+    create_file(root / "a_dir/second.txt", "second")
+    create_file(root / "a_dir/first.txt", "first")
+    create_file(root / "a_dir/deep/file.txt", "deep")
+    create_file(root / "c_dir/file.txt", "c")
+    return root
+
+
+def visit_all(visited):
+    def visitor(relative_path, entry):
+        visited.append((relative_path, entry.is_dir(follow_symlinks=False)))
+
+    return visitor
+
+
+def test_walk(mock_tools, tree):
+    """Every path in a tree is visited, top-down and in lexical order."""
+    visited = []
+    mock_tools.file.walk(tree, [visit_all(visited)])
+
+    assert visited == [
+        ("a_dir", True),
+        ("b_file.txt", False),
+        ("c_dir", True),
+        ("a_dir/deep", True),
+        ("a_dir/first.txt", False),
+        ("a_dir/second.txt", False),
+        ("a_dir/deep/file.txt", False),
+        ("c_dir/file.txt", False),
+    ]
+
+
+def test_walk_multiple_visitors(mock_tools, tree):
+    """Every visitor sees every path."""
+    first = []
+    second = []
+    mock_tools.file.walk(tree, [visit_all(first), visit_all(second)])
+
+    assert len(first) == 8
+    assert first == second
+
+
+def test_walk_prune(mock_tools, tree):
+    """If a visitor removes a path, later visitors don't see it, and the content of
+    a removed directory isn't visited."""
+
+    def remove(relative_path, entry):
+        if relative_path == "a_dir":
+            shutil.rmtree(entry.path)
+            return True
+        return False
+
+    visited = []
+    mock_tools.file.walk(tree, [remove, visit_all(visited)])
+
+    assert visited == [
+        ("b_file.txt", False),
+        ("c_dir", True),
+        ("c_dir/file.txt", False),
+    ]
+    assert not (tree / "a_dir").exists()
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_walk_symlinks(mock_tools, tree):
+    """Symbolic links are visited, but not followed."""
+    (tree / "link").symlink_to(tree / "a_dir")
+
+    visited = []
+    mock_tools.file.walk(tree, [visit_all(visited)])
+
+    assert ("link", False) in visited
+    assert "link/first.txt" not in [path for path, _ in visited]
+
+
+def test_walk_missing(mock_tools, tmp_path):
+    """A tree that doesn't exist has nothing to visit."""
+    visited = []
+    mock_tools.file.walk(tmp_path / "missing", [visit_all(visited)])
+
+    assert visited == []
@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from briefcase.integrations.file_watcher import FileWatcher, Inotify
+
+
+@pytest.fixture(autouse=True)
+def fast_intervals(monkeypatch):
+    # Don't wait between polls; keep the debounce interval short.
+    monkeypatch.setattr(FileWatcher, "POLL_INTERVAL", 0)
+    monkeypatch.setattr(FileWatcher, "DEBOUNCE_INTERVAL", 0.05)
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    project_path = tmp_path / "project"
+    (project_path / "src/first").mkdir(parents=True)
+    (project_path / "src/first/__init__.py").write_text("", encoding="utf-8")
+    (project_path / "src/first/app.py").write_text("app", encoding="utf-8")
+    (project_path / "pyproject.toml").write_text("config", encoding="utf-8")
+    return project_path
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+def watcher(request, project_path):
+    watcher = FileWatcher(
+        [
+            project_path / "pyproject.toml",
+            project_path / "src/first",
+            project_path / "tests",
+        ],
+        use_inotify=request.param,
+    )
+    yield watcher
+    watcher.close()
+
+
+def wait_for_change(watcher):
+    """Wait (for a short time) for the watcher to notice a change."""
+    deadline = time.monotonic() + 2
+    while not watcher.changed():
+        assert time.monotonic() < deadline, "Change wasn't detected"
+        time.sleep(0.01)
+
+
+def test_no_changes(watcher):
+    """If nothing changes, no change is detected."""
+    assert not watcher.changed()
+    assert not watcher.pending
+
+
+@pytest.mark.parametrize(
+    ("change", "path"),
+    [
+        ("modify", "src/first/app.py"),
+        ("delete", "src/first/app.py"),
+        ("create", "src/first/other.py"),
+        ("modify", "pyproject.toml"),
+    ],
+)
+def test_change(watcher, project_path, change, path):
+    """Files that are modified, deleted or added are detected."""
+    if change == "delete":
+        (project_path / path).unlink()
+    else:
+        (project_path / path).write_text("new content", encoding="utf-8")
+
+    wait_for_change(watcher)
+    assert watcher.wait() == {os.fspath(project_path / path)}
+
+    # Once reported, the change is no longer pending.
+    assert not watcher.pending
+    assert not watcher.changed()
+
+
+def test_new_directory(watcher, project_path):
+    """Changes in a directory that is created after watching starts are detected."""
+    (project_path / "src/first/sub").mkdir()
+    (project_path / "src/first/sub/mod.py").write_text("", encoding="utf-8")
+    wait_for_change(watcher)
+    watcher.wait()
+
+    (project_path / "src/first/sub/mod.py").write_text("new content", encoding="utf-8")
+
+    wait_for_change(watcher)
+    assert watcher.wait() == {os.fspath(project_path / "src/first/sub/mod.py")}
+
+
+def test_ignored(watcher, project_path):
+    """Changes to hidden files and bytecode caches are ignored."""
+    (project_path / "src/first/__pycache__").mkdir()
+    (project_path / "src/first/__pycache__/app.pyc").write_text("", encoding="utf-8")
+    (project_path / "src/first/.app.py.swp").write_text("", encoding="utf-8")
+
+    time.sleep(0.1)
+    assert not watcher.changed()
+
+
+def test_debounce(watcher, project_path):
+    """A burst of changes is reported as a single change."""
+
+    def edit():
+        for i in range(5):
+            (project_path / "src/first/app.py").write_text("x" * i, encoding="utf-8")
+            time.sleep(0.01)
+        (project_path / "src/first/other.py").write_text("", encoding="utf-8")
+
+    thread = threading.Thread(target=edit)
+    thread.start()
+    try:
+        changes = watcher.wait()
+    finally:
+        thread.join()
+
+    # Wait for any trailing changes to be settled.
+    changes |= watcher.wait() if watcher.changed() else set()
+    assert changes == {
+        os.fspath(project_path / "src/first/app.py"),
+        os.fspath(project_path / "src/first/other.py"),
+    }
+
+
+def test_inotify_unavailable(monkeypatch, project_path):
+    """If inotify isn't available, the watcher polls for changes."""
+    monkeypatch.setattr("sys.platform", "darwin")
+
+    watcher = FileWatcher([project_path / "src/first"])
+
+    assert watcher.inotify is None
+    (project_path / "src/first/app.py").write_text("new content", encoding="utf-8")
+    assert watcher.changed()
+
+
+def test_inotify_watch_failure(monkeypatch, project_path):
+    """If a path can't be watched by inotify, the watcher polls for changes."""
+    inotify = mock.MagicMock(spec=Inotify)
+    inotify.add_watch.return_value = False
+    monkeypatch.setattr(Inotify, "create", mock.MagicMock(return_value=inotify))
+
+    watcher = FileWatcher([project_path / "src/first"])
+
+    assert watcher.inotify is None
+    inotify.close.assert_called_once_with()
+    (project_path / "src/first/app.py").write_text("new content", encoding="utf-8")
+    assert watcher.changed()
@@ -1,5 +1,6 @@
 import threading
 from io import StringIO
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -331,3 +332,74 @@ def test_filter_func_line_unexpected_error(streamer, capsys):
         "Like something totally went wrong\n"
     )
     # fmt: on
+
+
+def test_batched_output(streamer, monkeypatch, capsys):
+    """If a batch interval is provided, output is printed in batches."""
+    monkeypatch.setattr(
+        streamer.console, "info", MagicMock(wraps=streamer.console.info)
+    )
+    streamer.batch_interval = 60
+
+    streamer.start()
+    streamer.join(timeout=5)
+
+    # fmt: off
+    assert capsys.readouterr().out == (
+        "output line 1\n"
+        "\n"
+        "output line 3\n"
+    )
+    # fmt: on
+    # All the output was printed in one batch when the streamer exited.
+    streamer.console.info.assert_called_once_with("output line 1\n\noutput line 3\n")
+
+
+def test_batched_output_size(streamer, monkeypatch, capsys):
+    """A batch is printed when it reaches the maximum batch size."""
+    monkeypatch.setattr(PopenOutputStreamer, "BATCH_SIZE", 2)
+    monkeypatch.setattr(
+        streamer.console, "info", MagicMock(wraps=streamer.console.info)
+    )
+    streamer.batch_interval = 60
+
+    streamer.start()
+    streamer.join(timeout=5)
+
+    assert capsys.readouterr().out == "output line 1\n\noutput line 3\n"
+    assert streamer.console.info.call_args_list == [
+        call("output line 1\n\n"),
+        call("output line 3\n"),
+    ]
+
+
+def test_batched_output_flush(streamer, monkeypatch, capsys):
+    """Batched output is printed when the streamer is flushed."""
+    streamer.batch_interval = 60
+
+    streamer_is_waiting = threading.Event()
+    continue_streaming = threading.Event()
+
+    def mock_readline():
+        """Wait on asserts while returning output lines."""
+        yield "output line 1\n"
+        yield "output line 2\n"
+        streamer_is_waiting.set()
+        continue_streaming.wait(timeout=5)
+        yield "output line 3\n"
+        yield ""
+
+    streamer.popen_process.stdout.readline.side_effect = mock_readline()
+
+    streamer.start()
+    streamer_is_waiting.wait(timeout=5)
+
+    # Nothing has been printed until the streamer is flushed
+    assert capsys.readouterr().out == ""
+    streamer.flush()
+    assert capsys.readouterr().out == "output line 1\noutput line 2\n"
+
+    continue_streaming.set()
+    streamer.join(timeout=5)
+
+    assert capsys.readouterr().out == "output line 3\n"
@@ -0,0 +1,54 @@
+import subprocess
+
+import pytest
+
+
+def mock_run(args, **kwargs):
+    return subprocess.CompletedProcess(
+        args,
+        returncode=3 if args[0] == "broken" else 0,
+        stdout=f"output from {args[0]}\n",
+    )
+
+
+def test_call(mock_sub, sub_kw):
+    """The output of each command is returned, in command order."""
+    mock_sub._subprocess.run.side_effect = mock_run
+
+    output = mock_sub.check_output_many([["first", "world"], ["second", "world"]])
+
+    assert output == ["output from first\n", "output from second\n"]
+    for call in mock_sub._subprocess.run.mock_calls:
+        assert call.kwargs == {
+            **sub_kw,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+        }
+
+
+def test_call_with_stderr(mock_sub, sub_kw):
+    """If stderr is redirected, it isn't merged into the output."""
+    mock_sub._subprocess.run.side_effect = mock_run
+
+    mock_sub.check_output_many([["first", "world"]], stderr=subprocess.DEVNULL)
+
+    mock_sub._subprocess.run.assert_called_once_with(
+        ["first", "world"],
+        **sub_kw,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def test_failure(mock_sub):
+    """If any command fails, an error is raised."""
+    mock_sub._subprocess.run.side_effect = mock_run
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        mock_sub.check_output_many(
+            [["first", "world"], ["broken", "world"]],
+            fail_fast=False,
+        )
+
+    assert exc_info.value.cmd == ["broken", "world"]
+    assert exc_info.value.output == "output from broken\n"
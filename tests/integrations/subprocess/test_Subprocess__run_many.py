@@ -0,0 +1,379 @@
+import concurrent.futures
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.console import LogLevel
+
+
+@pytest.fixture
+def caplog(mock_sub):
+    # Capture the logged content independent of the console.
+    actual_log = []
+
+    def test_log(*messages, **kwargs):
+        for message in messages:
+            actual_log.append(message + "\n")
+
+    mock_sub.tools.console.to_log = test_log
+    return actual_log
+
+
+def mock_run(returncodes=None, barrier=None):
+    """Generate a side effect for ``subprocess.run`` that reports the command that was
+    invoked as the output.
+
+    :param returncodes: A mapping of the first argument of a command to the return
+        code that command should produce. Defaults to 0.
+    :param barrier: An optional barrier that a command must wait on before it
+        completes.
+    """
+    returncodes = returncodes or {}
+
+    def _run(args, **kwargs):
+        if barrier and args[0] in barrier:
+            barrier[args[0]].wait()
+        return subprocess.CompletedProcess(
+            args,
+            returncode=returncodes.get(args[0], 0),
+            stdout=f"output from {args[0]}\n",
+        )
+
+    return _run
+
+
+def log_entry(name, returncode=0):
+    return (
+        "\n"
+        ">>> Running Command:\n"
+        f">>>     {name} world\n"
+        ">>> Working Directory:\n"
+        f">>>     {Path.cwd()}\n"
+        ">>> Command Output:\n"
+        f">>>     output from {name}\n"
+        f">>> Return code: {returncode}\n"
+        "\n"
+    )
+
+
+def test_call(mock_sub, caplog, sub_kw):
+    """Multiple commands can be run, with results returned in command order."""
+    mock_sub._subprocess.run.side_effect = mock_run()
+
+    results = mock_sub.run_many(
+        [["first", "world"], ["second", "world"], ["third", Path("world")]]
+    )
+
+    # Each command was run with captured output
+    assert sorted(call.args[0] for call in mock_sub._subprocess.run.mock_calls) == [
+        ["first", "world"],
+        ["second", "world"],
+        ["third", "world"],
+    ]
+    for call in mock_sub._subprocess.run.mock_calls:
+        assert call.kwargs == {
+            **sub_kw,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+        }
+
+    # Results are in the order the commands were provided
+    assert [result.stdout for result in results] == [
+        "output from first\n",
+        "output from second\n",
+        "output from third\n",
+    ]
+
+    # Commands are logged in the order they were provided.
+    assert "".join(caplog) == (
+        log_entry("first") + log_entry("second") + log_entry("third")
+    )
+
+
+def test_log_order(mock_sub, caplog):
+    """Commands are logged in the order provided, even if they complete out of
+    order."""
+    mock_sub.tools.executor.jobs = 2
+
+    # Neither command can complete until both commands have started.
+    barrier = threading.Barrier(2)
+    mock_sub._subprocess.run.side_effect = mock_run(
+        barrier={"first": barrier, "second": barrier}
+    )
+
+    mock_sub.run_many([["first", "world"], ["second", "world"]])
+
+    assert "".join(caplog) == log_entry("first") + log_entry("second")
+
+
+def test_quiet(mock_sub, caplog):
+    """If quiet=2, the commands aren't logged."""
+    mock_sub._subprocess.run.side_effect = mock_run()
+
+    mock_sub.run_many([["first", "world"], ["second", "world"]], quiet=2)
+
+    assert caplog == []
+
+
+def test_failure_without_check(mock_sub, caplog):
+    """If check isn't requested, failures are returned as results."""
+    mock_sub._subprocess.run.side_effect = mock_run(returncodes={"second": 3})
+
+    results = mock_sub.run_many([["first", "world"], ["second", "world"]])
+
+    assert [result.returncode for result in results] == [0, 3]
+    assert "".join(caplog) == log_entry("first") + log_entry("second", 3)
+
+
+@pytest.mark.parametrize(
+    ("verbosity", "expected_output"),
+    [
+        (
+            LogLevel.INFO,
+            (
+                "\n"
+                "Running Command:\n"
+                "    second world\n"
+                "Command Output:\n"
+                "    output from second\n"
+                "Return code: 3\n"
+                "\n"
+            ),
+        ),
+        (LogLevel.DEBUG, ""),
+    ],
+)
+def test_failure_with_check(mock_sub, capsys, verbosity, expected_output):
+    """If check is requested, the first failure is raised."""
+    mock_sub.tools.console.verbosity = verbosity
+    mock_sub._subprocess.run.side_effect = mock_run(
+        returncodes={"second": 3, "third": 4}
+    )
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            check=True,
+            fail_fast=False,
+            max_workers=1,
+        )
+
+    # The error is for the first failed command; all commands were run.
+    assert exc_info.value.cmd == ["second", "world"]
+    assert exc_info.value.returncode == 3
+    assert mock_sub._subprocess.run.call_count == 3
+
+    # The error was output to the console if not in debug mode.
+    assert capsys.readouterr().out.endswith(expected_output)
+
+
+def test_fail_fast(mock_sub, caplog):
+    """If a command fails, commands that haven't started aren't run."""
+    mock_sub._subprocess.run.side_effect = mock_run(returncodes={"first": 3})
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            check=True,
+            quiet=1,
+            max_workers=1,
+        )
+
+    assert exc_info.value.cmd == ["first", "world"]
+
+    # The first command was run and logged. With a single worker, the second
+    # command may have already started by the time the failure is detected;
+    # but the third command can't have started.
+    assert mock_sub._subprocess.run.call_count < 3
+    assert "".join(caplog).startswith(log_entry("first", 3))
+    assert "third world" not in "".join(caplog)
+
+
+def test_fail_fast_simultaneous(mock_sub, monkeypatch):
+    """If a command fails as another command completes, nothing new is started."""
+    mock_sub._subprocess.run.side_effect = mock_run(returncodes={"first": 3})
+
+    # Wait for all running commands to complete, so that the first two commands
+    # are reported as completing together, with the failure reported first.
+    wait = concurrent.futures.wait
+
+    def wait_together(futures, return_when=concurrent.futures.ALL_COMPLETED):
+        done, not_done = wait(futures)
+        if return_when == concurrent.futures.FIRST_COMPLETED:
+            done = sorted(done, key=lambda future: -future.result().returncode)
+        return done, not_done
+
+    monkeypatch.setattr(concurrent.futures, "wait", wait_together)
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            check=True,
+            max_workers=2,
+        )
+
+    assert exc_info.value.cmd == ["first", "world"]
+    # The successful completion of the second command didn't start the third.
+    assert mock_sub._subprocess.run.call_count == 2
+
+
+def test_missing_executable(mock_sub, caplog):
+    """If a command can't be run, the other results are logged before the error is
+    raised."""
+    run = mock_run()
+
+    def _run(args, **kwargs):
+        if args[0] == "second":
+            raise FileNotFoundError(2, "No such file or directory", "second")
+        return run(args, **kwargs)
+
+    mock_sub._subprocess.run.side_effect = _run
+
+    with pytest.raises(FileNotFoundError):
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            fail_fast=False,
+        )
+
+    # Every command was run; and every command was logged in order, with the
+    # command that couldn't be run logged without a result.
+    assert mock_sub._subprocess.run.call_count == 3
+    assert "".join(caplog) == (
+        log_entry("first")
+        + "\n"
+        + ">>> Running Command:\n"
+        + ">>>     second world\n"
+        + ">>> Working Directory:\n"
+        + f">>>     {Path.cwd()}\n"
+        + log_entry("third")
+    )
+
+
+def test_missing_executable_fail_fast(mock_sub, caplog):
+    """If a command can't be run, commands that haven't started aren't run."""
+    mock_sub._subprocess.run.side_effect = FileNotFoundError(
+        2, "No such file or directory", "first"
+    )
+
+    with pytest.raises(FileNotFoundError):
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            max_workers=1,
+        )
+
+    assert mock_sub._subprocess.run.call_count < 3
+    assert "third world" not in "".join(caplog)
+
+
+def test_error_after_stop(mock_sub, caplog):
+    """If a command that was still running when the batch was stopped can't be run,
+    it is logged, and the first failure is raised."""
+    mock_sub.tools.executor.jobs = 2
+
+    # The first command can't fail until the second command has started; and the
+    # second command can't fail until the first command has failed.
+    second_started = threading.Event()
+    first_done = threading.Event()
+    run = mock_run(returncodes={"first": 3})
+
+    def _run(args, **kwargs):
+        if args[0] == "second":
+            second_started.set()
+            first_done.wait()
+            time.sleep(0.1)
+            raise FileNotFoundError(2, "No such file or directory", "second")
+        second_started.wait()
+        try:
+            return run(args, **kwargs)
+        finally:
+            first_done.set()
+
+    mock_sub._subprocess.run.side_effect = _run
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        mock_sub.run_many(
+            [["first", "world"], ["second", "world"], ["third", "world"]],
+            check=True,
+            max_workers=2,
+        )
+
+    # The first failure is raised. The third command was never started, but both
+    # of the commands that were started were logged.
+    assert exc_info.value.cmd == ["first", "world"]
+    assert mock_sub._subprocess.run.call_count == 2
+    assert "".join(caplog).startswith(log_entry("first", 3))
+    assert "second world" in "".join(caplog)
+    assert "third world" not in "".join(caplog)
+
+
+def test_progress(mock_sub):
+    """A progress bar can be displayed, and completion can be observed."""
+    mock_sub._subprocess.run.side_effect = mock_run()
+    mock_sub.tools.console.progress_bar = MagicMock()
+    progress_bar = mock_sub.tools.console.progress_bar.return_value
+    on_complete = MagicMock()
+
+    results = mock_sub.run_many(
+        [["first", "world"], ["second", "world"]],
+        progress="Doing things",
+        on_complete=on_complete,
+    )
+
+    progress_bar.add_task.assert_called_once_with("Doing things", total=2)
+    assert progress_bar.update.call_count == 2
+    assert sorted(call.args for call in on_complete.call_args_list) == [
+        (0, results[0]),
+        (1, results[1]),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("jobs", "verbosity", "max_workers", "expected"),
+    [
+        (4, LogLevel.INFO, None, 4),
+        (4, LogLevel.INFO, 2, 2),
+        (1, LogLevel.INFO, None, 1),
+        # In deep debug mode, commands are run one at a time.
+        (4, LogLevel.DEEP_DEBUG, None, 1),
+    ],
+)
+def test_concurrency(mock_sub, jobs, verbosity, max_workers, expected):
+    """The number of concurrent commands is limited by the jobs and the batch."""
+    mock_sub.tools.executor.jobs = jobs
+    mock_sub.tools.console.verbosity = verbosity
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def _run(args, **kwargs):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return subprocess.CompletedProcess(args, returncode=0, stdout="")
+
+    mock_sub._subprocess.run.side_effect = _run
+
+    mock_sub.run_many(
+        [[f"cmd{i}", "world"] for i in range(8)],
+        max_workers=max_workers,
+    )
+
+    assert mock_sub._subprocess.run.call_count == 8
+    assert max_active <= expected
+    if expected == 1:
+        assert max_active == 1
+
+
+def test_no_commands(mock_sub):
+    """If there are no commands, there are no results."""
+    assert mock_sub.run_many([]) == []
+    mock_sub._subprocess.run.assert_not_called()
@@ -0,0 +1,334 @@
+import json
+import os
+import shutil
+import sys
+from unittest import mock
+
+import pytest
+
+from briefcase.integrations.virtual_environment.base import (
+    VirtualEnvironment,
+    link_or_copy,
+)
+
+from ..conftest import MockVirtualEnvironment
+
+
+class TemplateVirtualEnvironment(MockVirtualEnvironment):
+    """A mock environment that can be created from scratch."""
+
+    env_type: str = "template"
+
+    def __init__(self, *args, content=b"", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.content = content
+        self.created = []
+
+    def create(self, path):
+        self.created.append(path)
+        (path / "something/bin").mkdir(parents=True)
+        (path / "something/lib/__pycache__").mkdir(parents=True)
+
+        (path / "pyvenv.cfg").write_text(f"command = venv {path}\n", encoding="utf-8")
+        script = path / "something/bin/script"
+        script.write_text(f"#!{path}/something/bin/python\n", encoding="utf-8")
+        script.chmod(0o755)
+        (path / "something/lib/module.py").write_text("# module", encoding="utf-8")
+        (path / "something/lib/__pycache__/module.pyc").write_bytes(
+            b"\0" + os.fsencode(path)
+        )
+        (path / "something/lib/data.bin").write_bytes(self.content)
+
+
+@pytest.fixture
+def template_venv(first_app, mock_tools, base_path):
+    return TemplateVirtualEnvironment(
+        "forest",
+        app=first_app,
+        tools=mock_tools,
+        base_path=base_path,
+    )
+
+
+def other_venv(venv, **kwargs):
+    """Create another environment of the same type for the same app."""
+    return TemplateVirtualEnvironment(
+        "jungle",
+        app=venv.app,
+        tools=venv.tools,
+        base_path=venv.base_path,
+        **kwargs,
+    )
+
+
+def test_template_path(mock_venv, mock_tools):
+    """Templates are cached for each type of environment and interpreter."""
+    assert mock_venv.template_path.parent == mock_tools.base_path / "environments"
+    assert mock_venv.template_path.name.startswith("mock_venv-")
+
+    with mock.patch.object(sys, "executable", "/other/python"):
+        other_path = mock_venv.template_path
+    assert other_path != mock_venv.template_path
+
+
+def test_create_required(first_app, mock_tools, base_path):
+    """Environments must define how they are created."""
+
+    class UncreatableVirtualEnvironment(VirtualEnvironment):
+        @classmethod
+        def verify(cls, tools):
+            pass
+
+        def exists(self):
+            return False
+
+        def prepare(self, recreate=False):
+            return False
+
+        def clean(self):
+            pass
+
+    with pytest.raises(TypeError, match=r"abstract method.*create"):
+        UncreatableVirtualEnvironment(
+            "forest",
+            app=first_app,
+            tools=mock_tools,
+            base_path=base_path,
+        )
+
+
+def test_create_environment(template_venv):
+    """An environment is cloned from a new template."""
+    template_venv.create_environment()
+
+    template_path = template_venv.template_path
+    venv_path = template_venv.venv_path
+    build_path = template_path.with_name(f"{template_path.name}.{os.getpid()}")
+
+    # The template was built in a temporary location, then moved into place.
+    assert template_venv.created == [build_path]
+    assert not build_path.exists()
+    assert json.loads(
+        (template_path / "briefcase-template.json").read_text(encoding="utf-8")
+    ) == {
+        "version": 1,
+        "origin": os.fspath(build_path),
+        "relocate": ["pyvenv.cfg", "something/bin/script"],
+    }
+
+    # The environment exists, and references its own location.
+    assert template_venv.exists()
+    assert (venv_path / "pyvenv.cfg").read_text(
+        encoding="utf-8"
+    ) == f"command = venv {venv_path}\n"
+    script = venv_path / "something/bin/script"
+    assert script.read_text(encoding="utf-8") == (
+        f"#!{venv_path}/something/bin/python\n"
+    )
+    assert os.access(script, os.X_OK) or sys.platform == "win32"
+
+    # Files that don't reference the location of the template are linked, but
+    # relocated files aren't.
+    assert os.path.samefile(
+        venv_path / "something/lib/module.py",
+        template_path / "something/lib/module.py",
+    )
+    assert not os.path.samefile(script, template_path / "something/bin/script")
+    assert (template_path / "something/bin/script").read_text(encoding="utf-8") == (
+        f"#!{build_path}/something/bin/python\n"
+    )
+
+    # Bytecode and the template description aren't copied.
+    assert not (venv_path / "something/lib/__pycache__").exists()
+    assert not (venv_path / "briefcase-template.json").exists()
+
+
+def test_existing_template(template_venv):
+    """If a template exists, new environments are cloned without creating a
+    template."""
+    template_venv.create_environment()
+
+    venv = other_venv(template_venv)
+    venv.create_environment()
+
+    assert venv.created == []
+    assert venv.exists()
+    assert (venv.venv_path / "something/bin/script").read_text(encoding="utf-8") == (
+        f"#!{venv.venv_path}/something/bin/python\n"
+    )
+
+
+def test_not_relocatable(template_venv):
+    """If the template references its location in a binary file, environments are
+    created from scratch."""
+    template_venv.content = b"\0" + os.fsencode(
+        template_venv.template_path.with_name(
+            f"{template_venv.template_path.name}.{os.getpid()}"
+        )
+    )
+
+    template_venv.create_environment()
+
+    assert template_venv.created[-1] == template_venv.venv_path
+    assert template_venv.exists()
+
+    # The template is kept, so later environments don't re-create it.
+    assert (
+        json.loads(
+            (template_venv.template_path / "briefcase-template.json").read_text(
+                encoding="utf-8"
+            )
+        )["relocate"]
+        is None
+    )
+
+    venv = other_venv(template_venv)
+    venv.create_environment()
+    assert venv.created == [venv.venv_path]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks require privileges")
+def test_symlink_not_relocatable(template_venv, tmp_path):
+    """If the template contains a symlink to its location, it can't be cloned."""
+    path = tmp_path / "template"
+    (path / "bin").mkdir(parents=True)
+    (path / "bin/python3").symlink_to("python")
+    assert template_venv.template_relocations(path) == []
+
+    (path / "bin/python").symlink_to(path / "bin/python3.11")
+    assert template_venv.template_relocations(path) is None
+
+
+@pytest.mark.parametrize(
+    "marker",
+    [
+        None,
+        "not json",
+        '{"version": 0, "origin": "/template", "relocate": []}',
+    ],
+)
+def test_invalid_template(template_venv, marker):
+    """An incomplete or incompatible template is replaced."""
+    template_path = template_venv.template_path
+    (template_path / "stale").mkdir(parents=True)
+    if marker:
+        (template_path / "briefcase-template.json").write_text(marker, encoding="utf-8")
+
+    template_venv.create_environment()
+
+    assert len(template_venv.created) == 1
+    assert not (template_path / "stale").exists()
+    assert not (template_venv.venv_path / "stale").exists()
+    assert template_venv.exists()
+
+
+def test_stale_build(template_venv):
+    """A template left behind by an earlier process with the same ID is replaced."""
+    template_path = template_venv.template_path
+    build_path = template_path.with_name(f"{template_path.name}.{os.getpid()}")
+    (build_path / "stale").mkdir(parents=True)
+
+    template_venv.create_environment()
+
+    assert not build_path.exists()
+    assert not (template_path / "stale").exists()
+    assert template_venv.exists()
+
+
+def test_concurrent_template(template_venv):
+    """If another process creates the template first, that template is used."""
+    template_path = template_venv.template_path
+    build_path = template_path.with_name(f"{template_path.name}.{os.getpid()}")
+
+    def create(path):
+        TemplateVirtualEnvironment.create(template_venv, path)
+        if path == build_path:
+            # Another process finishes creating the template
+            shutil.copytree(path, template_path)
+            (template_path / "briefcase-template.json").write_text(
+                json.dumps(
+                    {"version": 1, "origin": "/other", "relocate": ["pyvenv.cfg"]}
+                ),
+                encoding="utf-8",
+            )
+
+    template_venv.create = create
+    template_venv.create_environment()
+
+    # The environment was cloned from the other process's template.
+    assert template_venv.created == [build_path]
+    assert not build_path.exists()
+    assert template_venv.exists()
+    assert (template_venv.venv_path / "pyvenv.cfg").read_text(
+        encoding="utf-8"
+    ) == f"command = venv {build_path}\n"
+
+
+def test_concurrent_incomplete_template(template_venv):
+    """If another process creates a template that can't be read, the environment is
+    created from scratch."""
+
+    def create(path):
+        TemplateVirtualEnvironment.create(template_venv, path)
+        if path != template_venv.venv_path:
+            # Another process creates an unusable template
+            (template_venv.template_path / "partial").mkdir(parents=True)
+
+    template_venv.create = create
+    template_venv.create_environment()
+
+    assert template_venv.created[-1] == template_venv.venv_path
+    assert not template_venv.template_path.exists()
+    assert template_venv.exists()
+
+
+def test_template_unwritable(template_venv, mock_tools):
+    """If the template can't be written, the environment is created from scratch."""
+    # A file is in the place of the template directory.
+    template_venv.template_path.parent.parent.mkdir(parents=True, exist_ok=True)
+    template_venv.template_path.parent.write_text("", encoding="utf-8")
+
+    template_venv.create_environment()
+
+    assert template_venv.created == [template_venv.venv_path]
+    assert template_venv.exists()
+    mock_tools.console.debug.assert_called_once()
+
+
+def test_clone_failure(template_venv, monkeypatch):
+    """If the template can't be cloned, the environment is created from scratch."""
+    template_venv.template()
+
+    def copytree(src, dst, **kwargs):
+        (dst / "partial").mkdir(parents=True)
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(shutil, "copytree", copytree)
+
+    template_venv.create_environment()
+
+    assert template_venv.created[-1] == template_venv.venv_path
+    assert not (template_venv.venv_path / "partial").exists()
+    assert template_venv.exists()
+
+
+def test_link_or_copy(tmp_path):
+    """Files are linked where possible."""
+    source = tmp_path / "source.txt"
+    source.write_text("content", encoding="utf-8")
+
+    link_or_copy(source, tmp_path / "link.txt")
+
+    assert os.path.samefile(source, tmp_path / "link.txt")
+
+
+def test_link_or_copy_fallback(tmp_path, monkeypatch):
+    """If a file can't be linked, it is copied."""
+    source = tmp_path / "source.txt"
+    source.write_text("content", encoding="utf-8")
+    monkeypatch.setattr(os, "link", mock.Mock(side_effect=OSError("Cross-device")))
+
+    link_or_copy(source, tmp_path / "copy.txt")
+
+    assert not os.path.samefile(source, tmp_path / "copy.txt")
+    assert (tmp_path / "copy.txt").read_text(encoding="utf-8") == "content"
@@ -421,3 +421,11 @@ def test_install_failure(mock_tools, mock_venv):
         encoding="UTF-8",
         env=None,
     )
+
+
+def test_output_prefix(mock_tools, mock_venv):
+    """If an output prefix is provided, each line of installer output is labeled."""
+    mock_venv.install_requirements(["pkg1"], output_prefix="target")
+
+    filter_func = mock_tools.subprocess.run.call_args.kwargs["filter_func"]
+    assert list(filter_func("Collecting pkg1")) == ["[target] Collecting pkg1"]
@@ -0,0 +1,225 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from briefcase.exceptions import RequirementsInstallError
+
+
+def resolve_call(venv, *args, env=None):
+    """The pip call that resolves requirements."""
+    return [
+        [
+            sys.executable,
+            "-u",
+            "-X",
+            "utf8",
+            "-m",
+            "pip",
+            "--python",
+            venv.executable,
+            "install",
+            "--disable-pip-version-check",
+            "--no-user",
+            "--dry-run",
+            "--ignore-installed",
+            "--quiet",
+            "--report",
+            "-",
+            *args,
+        ],
+        {"encoding": "UTF-8", "env": env},
+    ]
+
+
+def report(*items):
+    """A pip installation report."""
+    return json.dumps({"version": "1", "install": list(items)})
+
+
+def test_resolve_requirements(mock_tools, mock_venv):
+    """Requirements are resolved into pinned packages."""
+    mock_tools.subprocess.check_output.return_value = report(
+        {
+            "download_info": {
+                "url": "https://example.com/second-2.0-py3-none-any.whl",
+                "archive_info": {
+                    "hash": "sha256=abc",
+                    "hashes": {"sha256": "abc", "md5": "def"},
+                },
+            },
+            "is_direct": False,
+            "metadata": {"name": "second", "version": "2.0"},
+        },
+        {
+            "download_info": {
+                "url": "https://example.com/First-1.0-py3-none-any.whl",
+                "archive_info": {"hash": "sha256=123", "hashes": {"sha256": "123"}},
+            },
+            "is_direct": False,
+            "metadata": {"name": "First", "version": "1.0"},
+        },
+        {
+            "download_info": {
+                "url": (mock_venv.base_path / "src/local").as_uri(),
+                "dir_info": {},
+            },
+            "is_direct": True,
+            "metadata": {"name": "local", "version": "0.1"},
+        },
+        {
+            "download_info": {
+                "url": (mock_venv.base_path.parent / "sibling").as_uri(),
+                "dir_info": {},
+            },
+            "is_direct": True,
+            "metadata": {"name": "sibling", "version": "0.4"},
+        },
+        {
+            "download_info": {
+                "url": "https://example.com/archive.tar.gz",
+                "archive_info": {"hashes": {"sha256": "456"}},
+            },
+            "is_direct": True,
+            "metadata": {"name": "archived", "version": "0.2"},
+        },
+        {
+            "download_info": {
+                "url": "https://github.com/example/repo.git",
+                "vcs_info": {"vcs": "git", "commit_id": "cafe"},
+            },
+            "is_direct": True,
+            "metadata": {"name": "scm", "version": "0.3"},
+        },
+    )
+
+    packages = mock_venv.resolve_requirements(
+        [
+            "first",
+            "second>=2",
+            "./src/local",
+            "../sibling",
+            "scm@git+https://github.com/...",
+        ]
+    )
+
+    args, kwargs = resolve_call(
+        mock_venv,
+        "first",
+        "second>=2",
+        "./src/local",
+        "../sibling",
+        "scm@git+https://github.com/...",
+    )
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+    # Packages are sorted by name; hashes are sorted by algorithm. Local paths
+    # are relative to the project.
+    assert packages == [
+        {
+            "name": "archived",
+            "version": "0.2",
+            "url": "https://example.com/archive.tar.gz",
+            "hashes": ["sha256:456"],
+        },
+        {"name": "First", "version": "1.0", "hashes": ["sha256:123"]},
+        {"name": "local", "version": "0.1", "path": "src/local"},
+        {
+            "name": "scm",
+            "version": "0.3",
+            "url": "git+https://github.com/example/repo.git@cafe",
+        },
+        {"name": "second", "version": "2.0", "hashes": ["md5:def", "sha256:abc"]},
+        {"name": "sibling", "version": "0.4", "path": "../sibling"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("platform", "arch", "min_os_version", "args", "env"),
+    [
+        ("macOS", "arm64", None, ["--platform", "macosx_11_0_arm64"], None),
+        ("macOS", "x86_64", "12.3", ["--platform", "macosx_12_3_x86_64"], None),
+        (
+            "iphonesimulator",
+            "arm64",
+            "16.4",
+            [
+                "--platform",
+                "ios_16_4_arm64_iphonesimulator",
+                "--extra-index-url",
+                "https://pypi.anaconda.org/beeware/simple",
+            ],
+            {"PYTHONPATH": str(Path("/path/to/support"))},
+        ),
+        ("linux", "x86_64", None, [], None),
+    ],
+)
+def test_platform(mock_tools, mock_venv, platform, arch, min_os_version, args, env):
+    """Requirements are resolved for the platform of the environment."""
+    mock_venv.platform = platform
+    mock_venv.arch = arch
+    mock_venv.platform_path = Path("/path/to/support")
+    mock_tools.subprocess.check_output.return_value = report()
+
+    assert mock_venv.resolve_requirements(["pkg1"], min_os_version=min_os_version) == []
+
+    args, kwargs = resolve_call(mock_venv, *args, "pkg1", env=env)
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+
+def test_installer_options(mock_tools, mock_venv, tmp_path):
+    """Binary requirements and extra installer arguments are used by the
+    resolution."""
+    mock_venv.base_path = tmp_path
+    (tmp_path / "wheels").mkdir()
+    mock_tools.subprocess.check_output.return_value = report()
+
+    mock_venv.resolve_requirements(
+        ["pkg1"],
+        require_binary=True,
+        extra_installer_args=["--find-links", "./wheels"],
+    )
+
+    args, kwargs = resolve_call(
+        mock_venv,
+        "--only-binary",
+        ":all:",
+        "--find-links",
+        tmp_path / "wheels",
+        "pkg1",
+    )
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        subprocess.CalledProcessError(returncode=1, cmd="pip"),
+        None,
+    ],
+)
+def test_resolve_failure(mock_tools, mock_venv, error):
+    """If the requirements can't be resolved, an error is raised."""
+    if error:
+        mock_tools.subprocess.check_output.side_effect = error
+    else:
+        mock_tools.subprocess.check_output.return_value = "not a report"
+
+    with pytest.raises(RequirementsInstallError) as exc_info:
+        mock_venv.resolve_requirements(["pkg1"], install_hint="\n\nA hint.")
+
+    assert exc_info.value.install_hint == "\n\nA hint."
+
+
+def test_lock_target(mock_tools, mock_venv):
+    """The lock target identifies the Python version, platform and architecture."""
+    python_tag = f"cp{sys.version_info.major}{sys.version_info.minor}"
+    mock_tools.host_os = "Linux"
+    mock_tools.host_arch = "x86_64"
+    assert mock_venv.lock_target == f"{python_tag}-Linux-x86_64"
+
+    mock_venv.platform = "iphonesimulator"
+    mock_venv.arch = "arm64"
+    assert mock_venv.lock_target == f"{python_tag}-iphonesimulator-arm64"
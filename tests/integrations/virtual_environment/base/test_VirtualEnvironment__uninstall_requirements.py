@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+from briefcase.exceptions import RequirementsUninstallError
+
+
+def test_uninstall_requirements(mock_tools, mock_venv):
+    """Packages can be uninstalled with pip."""
+    mock_venv.uninstall_requirements(["pkg1", "pkg2"])
+
+    # pip was run using the *Briefcase* environment,
+    # targeted at the *venv*'s Python install.
+    mock_tools.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-u",
+            "-X",
+            "utf8",
+            "-m",
+            "pip",
+            "--python",
+            mock_venv.executable,
+            "uninstall",
+            "--disable-pip-version-check",
+            "--yes",
+            "-vv",
+            "pkg1",
+            "pkg2",
+        ],
+        check=True,
+        encoding="UTF-8",
+    )
+
+
+def test_uninstall_failure(mock_tools, mock_venv):
+    """An uninstall failure is reported as a RequirementsUninstallError."""
+    mock_tools.subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd="pip", returncode=1
+    )
+
+    with pytest.raises(
+        RequirementsUninstallError,
+        match=r"Unable to uninstall requirements that have been removed",
+    ):
+        mock_venv.uninstall_requirements(["pkg1"])
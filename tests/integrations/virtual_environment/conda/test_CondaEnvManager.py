@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -16,6 +17,52 @@ from ....utils import create_file
 PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
 
 
+def mock_create(cmd, *args, **kwargs):
+    """A side effect of calling run that creates the conda-meta marker directory."""
+    if cmd[:2] == [CondaVirtualEnvironment.conda_exe, "create"]:
+        (Path(cmd[3]) / "conda-meta").mkdir(parents=True)
+
+
+def template_build_path(venv):
+    """The path where the template for an environment is created."""
+    return venv.template_path.with_name(f"{venv.template_path.name}.{os.getpid()}")
+
+
+def create_call(path, verbose=True):
+    return call(
+        [CondaVirtualEnvironment.conda_exe, "create", "--prefix", path, "--yes"]
+        + ([] if verbose else ["--quiet"])
+        + [f"python={PYTHON_VERSION}", "pip"],
+        check=True,
+    )
+
+
+def clone_call(venv, verbose=True):
+    return call(
+        [
+            CondaVirtualEnvironment.conda_exe,
+            "create",
+            "--prefix",
+            venv.venv_path,
+            "--clone",
+            venv.template_path,
+            "--offline",
+            "--yes",
+        ]
+        + ([] if verbose else ["--quiet"]),
+        check=True,
+    )
+
+
+def config_call(venv, verbose=True):
+    return call(
+        [CondaVirtualEnvironment.conda_exe, "config", "--prefix", venv.venv_path]
+        + ([] if verbose else ["--quiet"])
+        + ["--set", "solver", "rattler"],
+        check=True,
+    )
+
+
 def test_manager(mock_tools):
     """A Conda environment can be generated by the manager."""
     # Reset the verification status
@@ -93,52 +140,75 @@ def test_conda_too_old(mock_tools):
 def test_create(mock_tools, venv, base_path, recreate, verbose):
     """A conda environment can be created."""
     mock_tools.console.is_verbose = verbose
+    mock_tools.subprocess.run.side_effect = mock_create
+
+    # venv does not initially exist
+    assert not venv.exists()
+
+    # venv was cloned from a new template, and now exists.
+    assert venv.prepare(recreate=recreate)
+    assert venv.exists()
+    assert venv.venv_path == base_path / ".briefcase/first-app/conda-myenv"
+    assert (
+        venv.template_path
+        == mock_tools.base_path / f"environments/conda-{PYTHON_VERSION}"
+    )
+
+    assert mock_tools.subprocess.run.mock_calls == [
+        create_call(template_build_path(venv), verbose=verbose),
+        clone_call(venv, verbose=verbose),
+        config_call(venv, verbose=verbose),
+    ]
+
+    # The description of the template wasn't copied into the environment.
+    assert (venv.template_path / "briefcase-template.json").exists()
+    assert not (venv.venv_path / "briefcase-template.json").exists()
+
+
+def test_create_from_template(venv, first_app, mock_tools, base_path):
+    """Once a template exists, environments are cloned from the template."""
+    mock_tools.subprocess.run.side_effect = mock_create
+    assert venv.prepare()
+    mock_tools.subprocess.run.reset_mock()
+
+    other_venv = CondaVirtualEnvironment(
+        name="other",
+        app=first_app,
+        tools=mock_tools,
+        base_path=base_path,
+    )
+    assert other_venv.prepare()
+    assert other_venv.exists()
+
+    assert mock_tools.subprocess.run.mock_calls == [
+        clone_call(other_venv),
+        config_call(other_venv),
+    ]
+
+
+def test_clone_failure(venv, mock_tools, base_path):
+    """If the template can't be cloned, the environment is created from scratch."""
+    create_file(
+        venv.template_path / "briefcase-template.json",
+        '{"version": 1, "origin": "/template", "relocate": []}',
+    )
 
-    # Mock a side effect of calling run that creates the pyvenv.cfg marker file.
     def mock_run(cmd, *args, **kwargs):
-        if cmd[:2] == [CondaVirtualEnvironment.conda_exe, "create"]:
+        if "--clone" in cmd:
+            # A partial environment is created
             (Path(cmd[3]) / "conda-meta").mkdir(parents=True)
+            raise subprocess.CalledProcessError(returncode=1, cmd="conda")
+        mock_create(cmd)
 
     mock_tools.subprocess.run.side_effect = mock_run
 
-    # venv does not initially exist
-    assert not venv.exists()
-
-    # venv was created, and now exists.
-    assert venv.prepare(recreate=recreate)
+    assert venv.prepare()
     assert venv.exists()
 
     assert mock_tools.subprocess.run.mock_calls == [
-        call(
-            [
-                venv.conda_exe,
-                "create",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-                "--yes",
-            ]
-            + ([] if verbose else ["--quiet"])
-            + [
-                f"python={PYTHON_VERSION}",
-                "pip",
-            ],
-            check=True,
-        ),
-        call(
-            [
-                venv.conda_exe,
-                "config",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-            ]
-            + ([] if verbose else ["--quiet"])
-            + [
-                "--set",
-                "solver",
-                "rattler",
-            ],
-            check=True,
-        ),
+        clone_call(venv),
+        create_call(venv.venv_path),
+        config_call(venv),
     ]
 
 
@@ -169,33 +239,13 @@ def test_recreate(venv, mock_tools, base_path):
     """If an environment already exists, recreating can be triggered."""
     # Create a marker file for the venv
     create_file(venv.venv_path / "conda-meta/python.json", "exists")
+    mock_tools.subprocess.run.side_effect = mock_create
 
     assert venv.prepare(recreate=True)
     assert mock_tools.subprocess.run.mock_calls == [
-        call(
-            [
-                venv.conda_exe,
-                "create",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-                "--yes",
-                f"python={PYTHON_VERSION}",
-                "pip",
-            ],
-            check=True,
-        ),
-        call(
-            [
-                venv.conda_exe,
-                "config",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-                "--set",
-                "solver",
-                "rattler",
-            ],
-            check=True,
-        ),
+        create_call(template_build_path(venv)),
+        clone_call(venv),
+        config_call(venv),
     ]
 
 
@@ -211,28 +261,20 @@ def test_conda_create_failure(venv, mock_tools, base_path):
     ):
         venv.prepare()
 
-    mock_tools.subprocess.run.assert_called_once_with(
-        [
-            venv.conda_exe,
-            "create",
-            "--prefix",
-            base_path / ".briefcase/first-app/conda-myenv",
-            "--yes",
-            f"python={PYTHON_VERSION}",
-            "pip",
-        ],
-        check=True,
-    )
+    assert mock_tools.subprocess.run.mock_calls == [
+        create_call(template_build_path(venv)),
+    ]
 
 
 def test_config_rattler_failure(venv, mock_tools, base_path):
     """If the rattler config can't be applied, BriefcaseCommandError is raised."""
-    mock_tools.subprocess.run = MagicMock(
-        side_effect=[
-            0,
-            subprocess.CalledProcessError(returncode=1, cmd="conda"),
-        ]
-    )
+
+    def mock_run(cmd, *args, **kwargs):
+        if cmd[1] == "config":
+            raise subprocess.CalledProcessError(returncode=1, cmd="conda")
+        mock_create(cmd)
+
+    mock_tools.subprocess.run.side_effect = mock_run
 
     with pytest.raises(
         BriefcaseCommandError,
@@ -241,28 +283,7 @@ def test_config_rattler_failure(venv, mock_tools, base_path):
         venv.prepare()
 
     assert mock_tools.subprocess.run.mock_calls == [
-        call(
-            [
-                venv.conda_exe,
-                "create",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-                "--yes",
-                f"python={PYTHON_VERSION}",
-                "pip",
-            ],
-            check=True,
-        ),
-        call(
-            [
-                venv.conda_exe,
-                "config",
-                "--prefix",
-                base_path / ".briefcase/first-app/conda-myenv",
-                "--set",
-                "solver",
-                "rattler",
-            ],
-            check=True,
-        ),
+        create_call(template_build_path(venv)),
+        clone_call(venv),
+        config_call(venv),
     ]
@@ -293,3 +293,14 @@ def test_pip_install_failure(mock_tools, venv):
         check=True,
         env={"PIP_REQUIRE_VIRTUALENV": None},
     )
+
+
+def test_output_prefix(mock_tools, venv):
+    """If an output prefix is provided, each line of output from both installers is
+    labeled."""
+    venv.install_requirements(["pkg1", "../path/to/pkg2"], output_prefix="target")
+
+    assert mock_tools.subprocess.run.call_count == 2
+    for run_call in mock_tools.subprocess.run.call_args_list:
+        filter_func = run_call.kwargs["filter_func"]
+        assert list(filter_func("Installing")) == ["[target] Installing"]
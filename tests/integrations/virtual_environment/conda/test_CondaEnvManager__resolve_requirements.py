@@ -0,0 +1,14 @@
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def test_resolve_requirements(mock_tools, venv):
+    """Requirements installed by conda can't be locked."""
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Requirements installed into a conda environment can't be locked.",
+    ):
+        venv.resolve_requirements(["pkg1"])
+
+    mock_tools.subprocess.check_output.assert_not_called()
@@ -0,0 +1,36 @@
+import subprocess
+
+import pytest
+
+from briefcase.exceptions import RequirementsUninstallError
+
+
+@pytest.mark.parametrize("verbose", [True, False])
+def test_uninstall_requirements(mock_tools, venv, verbose):
+    """Packages are uninstalled with `conda remove`."""
+    mock_tools.console.is_verbose = verbose
+
+    venv.uninstall_requirements(["pkg1", "pkg2"])
+
+    mock_tools.subprocess.run.assert_called_once_with(
+        [
+            venv.conda_exe,
+            "remove",
+            "--prefix",
+            venv.venv_path,
+            "--yes",
+        ]
+        + ([] if verbose else ["--quiet"])
+        + ["pkg1", "pkg2"],
+        check=True,
+    )
+
+
+def test_uninstall_failure(mock_tools, venv):
+    """An uninstall failure is reported as a RequirementsUninstallError."""
+    mock_tools.subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd="conda", returncode=1
+    )
+
+    with pytest.raises(RequirementsUninstallError):
+        venv.uninstall_requirements(["pkg1"])
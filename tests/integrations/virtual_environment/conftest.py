@@ -46,11 +46,14 @@ class MockVirtualEnvironment(VirtualEnvironment):
     def exists(self) -> bool:
         return (self.venv_path / "something").exists()
 
+    def create(self, path):
+        marker = path / "something/marker"
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text("mock env", encoding="utf-8")
+
     def prepare(self, recreate=False) -> bool:
         if not self.exists() or recreate:
-            marker = self.venv_path / "something/marker"
-            marker.parent.mkdir(parents=True, exist_ok=True)
-            marker.write_text("mock env", encoding="utf-8")
+            self.create(self.venv_path)
             created = True
         else:
             created = False
@@ -32,6 +32,16 @@ def test_create(noop_venv, recreate):
     assert noop_venv.marker_path.read_text(encoding="utf-8") == sys.executable
 
 
+def test_create_path(noop_venv, tmp_path):
+    """The environment can be created at a specific path."""
+    noop_venv.create(tmp_path / "other/env")
+
+    assert (tmp_path / "other/env/venv_path").read_text(
+        encoding="utf-8"
+    ) == sys.executable
+    assert not noop_venv.marker_path.exists()
+
+
 @pytest.mark.parametrize("recreate", [True, False])
 def test_existing(noop_venv, recreate):
     """If the environment exists, it will only be created on a re-create."""
@@ -0,0 +1,5 @@
+def test_uninstall_requirements(noop_venv, mock_tools):
+    """Packages are never uninstalled from the ambient environment."""
+    noop_venv.uninstall_requirements(["pkg1", "pkg2"])
+
+    mock_tools.subprocess.run.assert_not_called()
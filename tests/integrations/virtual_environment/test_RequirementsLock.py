@@ -0,0 +1,143 @@
+import sys
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.virtual_environment.lock import RequirementsLock
+
+if sys.version_info >= (3, 11):  # pragma: no-cover-if-lt-py311
+    import tomllib
+else:  # pragma: no-cover-if-gte-py311
+    import tomli as tomllib
+
+PACKAGES = [
+    {"name": "first", "version": "1.0", "hashes": ["sha256:123"]},
+    {"name": "second", "version": "2.0", "hashes": ["md5:456", "sha256:789"]},
+]
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return tmp_path / "briefcase-first.lock"
+
+
+def test_new_lockfile(lock_path):
+    """If the lockfile doesn't exist, there are no pinned requirements."""
+    lock = RequirementsLock(lock_path)
+
+    assert lock.pinned("cp312-macOS-arm64", "inputs") is None
+    assert not lock_path.exists()
+
+
+def test_update(lock_path):
+    """Pinned requirements are saved, and can be read back."""
+    lock = RequirementsLock(lock_path)
+    lock.update("cp312-macOS-x86_64", "inputs-x86_64", PACKAGES)
+    lock.update("cp312-macOS-arm64", "inputs-arm64", PACKAGES[:1])
+
+    # Targets are written in a stable order.
+    with lock_path.open("rb") as f:
+        data = tomllib.load(f)
+    assert data["version"] == 1
+    assert list(data["targets"]) == ["cp312-macOS-arm64", "cp312-macOS-x86_64"]
+    assert data["targets"]["cp312-macOS-x86_64"] == {
+        "inputs": "inputs-x86_64",
+        "packages": PACKAGES,
+    }
+    assert not lock_path.with_name("briefcase-first.lock.tmp").exists()
+
+    lock = RequirementsLock(lock_path)
+    assert lock.pinned("cp312-macOS-x86_64", "inputs-x86_64") == PACKAGES
+    assert lock.pinned("cp312-macOS-arm64", "inputs-arm64") == PACKAGES[:1]
+
+    # If the inputs have changed, the pinned requirements can't be used.
+    assert lock.pinned("cp312-macOS-arm64", "inputs-x86_64") is None
+    assert lock.pinned("cp312-iphoneos-arm64", "inputs-arm64") is None
+
+
+def test_unreadable(lock_path):
+    """If the lockfile can't be parsed, an error is raised."""
+    lock_path.write_text("not [toml", encoding="utf-8")
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to read requirements lockfile",
+    ):
+        RequirementsLock(lock_path)
+
+
+def test_incompatible_version(lock_path):
+    """If the lockfile was written by an incompatible version, an error is
+    raised."""
+    lock_path.write_text("version = 999\n", encoding="utf-8")
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"was written by an incompatible version of Briefcase",
+    ):
+        RequirementsLock(lock_path)
+
+
+def test_inputs_hash():
+    """The inputs hash changes if the requirements or options change."""
+    inputs = RequirementsLock.inputs_hash(["first", "second"], require_binary=True)
+
+    assert inputs == RequirementsLock.inputs_hash(
+        ["first", "second"], require_binary=True
+    )
+    assert inputs != RequirementsLock.inputs_hash(
+        ["second", "first"], require_binary=True
+    )
+    assert inputs != RequirementsLock.inputs_hash(
+        ["first", "second"], require_binary=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("packages", "requirements"),
+    [
+        (
+            PACKAGES,
+            [
+                "first==1.0 --hash=sha256:123",
+                "second==2.0 --hash=md5:456 --hash=sha256:789",
+            ],
+        ),
+        (
+            [
+                {"name": "first", "version": "1.0", "url": "https://example.com/a.whl"},
+                {"name": "second", "version": "2.0"},
+            ],
+            ["first @ https://example.com/a.whl", "second==2.0"],
+        ),
+        # If any package can't be hashed, hashes aren't used.
+        (
+            [
+                *PACKAGES,
+                {"name": "local", "url": "file:///path/to/local"},
+            ],
+            [
+                "first==1.0",
+                "second==2.0",
+                "local @ file:///path/to/local",
+            ],
+        ),
+    ],
+)
+def test_requirements(packages, requirements, tmp_path):
+    """Pinned requirements are converted into requirement file lines."""
+    assert RequirementsLock.requirements(packages, tmp_path) == requirements
+
+
+def test_requirements_local_path(tmp_path):
+    """Local paths are resolved relative to the project."""
+    base_path = tmp_path / "project"
+    packages = [
+        {"name": "local", "version": "0.1", "path": "src/local"},
+        {"name": "sibling", "version": "0.2", "path": "../sibling"},
+    ]
+
+    assert RequirementsLock.requirements(packages, base_path) == [
+        f"local @ {(base_path / 'src/local').resolve().as_uri()}",
+        f"sibling @ {(tmp_path / 'sibling').resolve().as_uri()}",
+    ]
@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError, RequirementsInstallError
+from briefcase.integrations.virtual_environment import VirtualEnvironmentManager
+
+from .conftest import MockVirtualEnvironment
+
+
+class StandInEnvironment(MockVirtualEnvironment):
+    """An environment that records installs, rather than running an installer."""
+
+    def __init__(self, *args, error=None, barrier=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.error = error
+        self.barrier = barrier
+        self.installs = []
+
+    def install_requirements(self, requires, **kwargs):
+        self.installs.append((requires, kwargs, threading.current_thread().name))
+        if self.barrier:
+            # Both installs must be in progress at the same time to pass the barrier.
+            self.barrier.wait()
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def manager(mock_tools):
+    mock_tools.console.is_deep_debug = False
+    return VirtualEnvironmentManager.verify(mock_tools)
+
+
+@pytest.fixture
+def make_venv(first_app, mock_tools, base_path):
+    def _make_venv(name, **kwargs):
+        return StandInEnvironment(
+            name,
+            app=first_app,
+            tools=mock_tools,
+            base_path=base_path,
+            **kwargs,
+        )
+
+    return _make_venv
+
+
+def test_concurrent_installs(manager, make_venv):
+    """Installs for each target are run concurrently, with labeled output."""
+    barrier = threading.Barrier(2, timeout=5)
+    device_venv = make_venv("device", barrier=barrier)
+    sim_venv = make_venv("sim", barrier=barrier)
+
+    manager.install_requirements_many(
+        {
+            "device": (device_venv, ["pkg1"], {"install_path": "device"}),
+            "sim": (sim_venv, ["pkg1"], {"install_path": "sim"}),
+        }
+    )
+
+    assert [install[:2] for install in device_venv.installs] == [
+        (["pkg1"], {"output_prefix": "device", "install_path": "device"})
+    ]
+    assert [install[:2] for install in sim_venv.installs] == [
+        (["pkg1"], {"output_prefix": "sim", "install_path": "sim"})
+    ]
+    # The installs were run by the executor.
+    assert device_venv.installs[0][2].startswith("briefcase-io")
+    assert sim_venv.installs[0][2].startswith("briefcase-io")
+
+
+def test_deep_debug_serial(manager, make_venv, mock_tools):
+    """In deep debug mode, installs are run one at a time."""
+    mock_tools.console.is_deep_debug = True
+    events = []
+
+    def install(name):
+        def _install(requires, **kwargs):
+            events.append(("start", name))
+            time.sleep(0.05)
+            events.append(("end", name))
+
+        return _install
+
+    venvs = {name: make_venv(name) for name in ["device", "sim"]}
+    for name, venv in venvs.items():
+        venv.install_requirements = install(name)
+
+    manager.install_requirements_many(
+        {name: (venv, ["pkg1"], {}) for name, venv in venvs.items()}
+    )
+
+    assert events == [
+        ("start", "device"),
+        ("end", "device"),
+        ("start", "sim"),
+        ("end", "sim"),
+    ]
+
+
+def test_single_failure(manager, make_venv):
+    """If one install fails, its error is raised once the other install completes."""
+    error = RequirementsInstallError(install_hint="\n\nDevice hint.\n")
+    device_venv = make_venv("device", error=error)
+    sim_venv = make_venv("sim")
+
+    with pytest.raises(RequirementsInstallError) as exc_info:
+        manager.install_requirements_many(
+            {
+                "device": (device_venv, ["pkg1"], {}),
+                "sim": (sim_venv, ["pkg1"], {}),
+            }
+        )
+
+    assert exc_info.value is error
+    assert len(sim_venv.installs) == 1
+
+
+def test_multiple_failures(manager, make_venv):
+    """If several installs fail, the errors are combined."""
+    device_venv = make_venv(
+        "device",
+        error=RequirementsInstallError(install_hint="\n\nNo device wheel.\n"),
+    )
+    sim_venv = make_venv("sim", error=RequirementsInstallError())
+
+    with pytest.raises(RequirementsInstallError) as exc_info:
+        manager.install_requirements_many(
+            {
+                "device": (device_venv, ["pkg1"], {}),
+                "sim": (sim_venv, ["pkg1"], {}),
+            }
+        )
+
+    assert exc_info.value.msg == (
+        "Unable to install requirements. This may be because one of your\n"
+        "requirements is invalid, or because pip was unable to connect\n"
+        "to the PyPI server.\n"
+        "\n"
+        "Unable to install requirements for device.\n"
+        "\n"
+        "No device wheel.\n"
+        "\n"
+        "Unable to install requirements for sim.\n"
+    )
+
+
+def test_unexpected_failure(manager, make_venv):
+    """If an install fails for an unexpected reason, that error is raised as-is."""
+    error = BriefcaseCommandError("Something else went wrong")
+    device_venv = make_venv("device", error=RequirementsInstallError())
+    sim_venv = make_venv("sim", error=error)
+
+    with pytest.raises(BriefcaseCommandError) as exc_info:
+        manager.install_requirements_many(
+            {
+                "device": (device_venv, ["pkg1"], {}),
+                "sim": (sim_venv, ["pkg1"], {}),
+            }
+        )
+
+    assert exc_info.value is error
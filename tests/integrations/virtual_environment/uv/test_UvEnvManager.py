@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -14,6 +15,17 @@ from briefcase.integrations.virtual_environment import (
 from ....utils import create_file
 
 
+def mock_create(cmd, *args, **kwargs):
+    """A side effect of calling run that creates the pyvenv.cfg marker file."""
+    if cmd[:2] == ["uv", "venv"]:
+        create_file(Path(cmd[-1]) / "pyvenv.cfg", "")
+
+
+def template_build_path(venv):
+    """The path where the template for an environment is created."""
+    return venv.template_path.with_name(f"{venv.template_path.name}.{os.getpid()}")
+
+
 def test_manager(mock_tools):
     """A uv environment can be generated by the manager."""
     # Reset the verification status
@@ -54,21 +66,15 @@ def test_uv_not_available(mock_tools):
 @pytest.mark.parametrize("recreate", [True, False])
 def test_create(mock_tools, venv, base_path, recreate):
     """A uv venv can be created."""
-
-    # Mock a side effect of calling run that creates the pyvenv.cfg marker file.
-    def mock_run(cmd, *args, **kwargs):
-        if cmd[:2] == ["uv", "venv"]:
-            Path(cmd[-1]).mkdir(parents=True)
-            (Path(cmd[-1]) / "pyvenv.cfg").write_text("", encoding="UTF-8")
-
-    mock_tools.subprocess.run.side_effect = mock_run
+    mock_tools.subprocess.run.side_effect = mock_create
 
     # venv does not initially exist
     assert not venv.exists()
 
-    # venv was created, and now exists.
+    # venv was created from a new template, and now exists.
     assert venv.prepare(recreate=recreate)
     assert venv.exists()
+    assert (venv.template_path / "pyvenv.cfg").exists()
 
     mock_tools.subprocess.run.assert_called_once_with(
         [
@@ -77,12 +83,32 @@ def test_create(mock_tools, venv, base_path, recreate):
             "--python",
             sys.executable,
             "--seed",
-            base_path / ".briefcase/first-app/uv-myenv",
+            template_build_path(venv),
         ],
         check=True,
     )
 
 
+def test_create_from_template(venv, first_app, mock_tools, base_path):
+    """Once a template exists, environments are cloned from the template."""
+    mock_tools.subprocess.run.side_effect = mock_create
+    assert venv.prepare()
+    mock_tools.subprocess.run.reset_mock()
+
+    other_venv = UvVirtualEnvironment(
+        name="other",
+        app=first_app,
+        tools=mock_tools,
+        base_path=base_path,
+    )
+    assert other_venv.prepare()
+    assert other_venv.exists()
+    assert other_venv.venv_path == base_path / ".briefcase/first-app/uv-other"
+
+    # The environment was cloned, rather than created.
+    mock_tools.subprocess.run.assert_not_called()
+
+
 def test_creates_parent_directory(first_app, mock_tools, tmp_path):
     """Environment parent directories on demand."""
     venv_path = tmp_path / "nested" / "missing" / "test_venv"
@@ -110,6 +136,7 @@ def test_recreate(venv, mock_tools, base_path):
     """If an environment already exists, recreating can be triggered."""
     # Create a marker file for the venv
     create_file(venv.venv_path / "pyvenv.cfg", "exists")
+    mock_tools.subprocess.run.side_effect = mock_create
 
     assert venv.prepare(recreate=True)
     mock_tools.subprocess.run.assert_called_once_with(
@@ -119,7 +146,7 @@ def test_recreate(venv, mock_tools, base_path):
             "--python",
             sys.executable,
             "--seed",
-            base_path / ".briefcase/first-app/uv-myenv",
+            template_build_path(venv),
         ],
         check=True,
     )
@@ -144,7 +171,7 @@ def test_venv_failure(venv, mock_tools, base_path):
             "--python",
             sys.executable,
             "--seed",
-            base_path / ".briefcase/first-app/uv-myenv",
+            template_build_path(venv),
         ],
         check=True,
     )
@@ -412,3 +412,11 @@ def test_install_failure(mock_tools, venv):
             "VIRTUAL_ENV": str(venv.venv_path),
         },
     )
+
+
+def test_output_prefix(mock_tools, venv):
+    """If an output prefix is provided, each line of installer output is labeled."""
+    venv.install_requirements(["pkg1"], output_prefix="target")
+
+    filter_func = mock_tools.subprocess.run.call_args.kwargs["filter_func"]
+    assert list(filter_func("Resolved 1 package")) == ["[target] Resolved 1 package"]
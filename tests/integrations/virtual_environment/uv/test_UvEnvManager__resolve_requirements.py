@@ -0,0 +1,131 @@
+import os
+import subprocess
+
+import pytest
+
+from briefcase.exceptions import RequirementsInstallError
+
+
+def compile_call(venv, *args, requires, env=None):
+    """The uv call that resolves requirements."""
+    return [
+        [
+            "uv",
+            "pip",
+            "compile",
+            "-",
+            "--generate-hashes",
+            "--no-header",
+            "--no-annotate",
+            "--quiet",
+            *args,
+        ],
+        {
+            "input": "\n".join(requires),
+            "encoding": "UTF-8",
+            "env": {
+                **(env or {}),
+                "PATH": str(venv.bin_dir) + os.pathsep + os.environ["PATH"],
+                "VIRTUAL_ENV": str(venv.venv_path),
+            },
+        },
+    ]
+
+
+def test_resolve_requirements(mock_tools, venv):
+    """Requirements are resolved into pinned packages with `uv pip compile`."""
+    mock_tools.subprocess.check_output.return_value = (
+        "second==2.0 \\\n"
+        "    --hash=sha256:abc \\\n"
+        "    --hash=sha256:def\n"
+        "first==1.0 \\\n"
+        "    --hash=sha256:123\n"
+        f"local @ {(venv.base_path / 'src/local').as_uri()}\n"
+        "\n"
+        "# A comment\n"
+        "--index-url https://example.com/simple\n"
+    )
+
+    packages = venv.resolve_requirements(["first", "second>=2", "./src/local"])
+
+    args, kwargs = compile_call(
+        venv,
+        requires=["first", "second>=2", "./src/local"],
+    )
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+    assert packages == [
+        {"name": "first", "version": "1.0", "hashes": ["sha256:123"]},
+        {"name": "local", "path": "src/local"},
+        {"name": "second", "version": "2.0", "hashes": ["sha256:abc", "sha256:def"]},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("platform", "arch", "min_os_version", "args", "env"),
+    [
+        ("macOS", "x86_64", None, ["--python-platform", "x86_64-apple-darwin"], None),
+        (
+            "macOS",
+            "arm64",
+            "12.3",
+            ["--python-platform", "aarch64-apple-darwin"],
+            {"MACOSX_DEPLOYMENT_TARGET": "12.3"},
+        ),
+        (
+            "iphonesimulator",
+            "arm64",
+            "16.4",
+            ["--python-platform", "arm64-apple-ios-simulator"],
+            {"IPHONEOS_DEPLOYMENT_TARGET": "16.4"},
+        ),
+        ("linux", "x86_64", "1.0", [], None),
+    ],
+)
+def test_platform(mock_tools, venv, platform, arch, min_os_version, args, env):
+    """Requirements are resolved for the platform of the environment."""
+    venv.platform = platform
+    venv.arch = arch
+    mock_tools.subprocess.check_output.return_value = ""
+
+    assert venv.resolve_requirements(["pkg1"], min_os_version=min_os_version) == []
+
+    args, kwargs = compile_call(venv, *args, requires=["pkg1"], env=env)
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("requires", "args"),
+    [
+        (["pkg1", "./wheels/pkg2-1.0-py3-none-any.whl"], ["--only-binary", ":all:"]),
+        # uv can't resolve local directories if binaries are required.
+        (["pkg1", "./src/pkg2"], []),
+    ],
+)
+def test_require_binary(mock_tools, venv, requires, args):
+    """Binary requirements are used by the resolution, unless there are source
+    requirements."""
+    mock_tools.subprocess.check_output.return_value = ""
+
+    venv.resolve_requirements(
+        requires,
+        require_binary=True,
+        extra_installer_args=["--find-links", "wheels"],
+    )
+
+    args, kwargs = compile_call(
+        venv, *args, "--find-links", "wheels", requires=requires
+    )
+    mock_tools.subprocess.check_output.assert_called_once_with(args, **kwargs)
+
+
+def test_resolve_failure(mock_tools, venv):
+    """If the requirements can't be resolved, an error is raised."""
+    mock_tools.subprocess.check_output.side_effect = subprocess.CalledProcessError(
+        returncode=1, cmd="uv"
+    )
+
+    with pytest.raises(RequirementsInstallError) as exc_info:
+        venv.resolve_requirements(["pkg1"], install_hint="\n\nA hint.")
+
+    assert exc_info.value.install_hint == "\n\nA hint."
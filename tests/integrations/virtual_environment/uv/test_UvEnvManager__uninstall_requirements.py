@@ -0,0 +1,31 @@
+import os
+import subprocess
+
+import pytest
+
+from briefcase.exceptions import RequirementsUninstallError
+
+
+def test_uninstall_requirements(mock_tools, venv):
+    """Packages can be uninstalled with `uv pip uninstall`."""
+    venv.uninstall_requirements(["pkg1", "pkg2"])
+
+    mock_tools.subprocess.run.assert_called_once_with(
+        ["uv", "pip", "uninstall", "-vv", "pkg1", "pkg2"],
+        check=True,
+        encoding="UTF-8",
+        env={
+            "PATH": str(venv.bin_dir) + os.pathsep + os.environ["PATH"],
+            "VIRTUAL_ENV": str(venv.venv_path),
+        },
+    )
+
+
+def test_uninstall_failure(mock_tools, venv):
+    """An uninstall failure is reported as a RequirementsUninstallError."""
+    mock_tools.subprocess.run.side_effect = subprocess.CalledProcessError(
+        cmd="uv", returncode=1
+    )
+
+    with pytest.raises(RequirementsUninstallError):
+        venv.uninstall_requirements(["pkg1"])
@@ -9,6 +9,8 @@ from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.platforms.iOS.xcode import iOSXcodeBuildCommand
 
+from ....utils import create_file
+
 
 @pytest.fixture
 def build_command(dummy_console, tmp_path):
@@ -141,3 +143,18 @@ def test_build_app_failed(build_command, first_app_generated, tmp_path):
         check=True,
         filter_func=mock.ANY,
     )
+
+
+def test_precompile_paths(build_command, first_app_generated, tmp_path):
+    """The requirements for devices and the simulator are both precompiled."""
+    bundle_path = tmp_path / "base_path/build/first-app/ios/xcode"
+    create_file(
+        bundle_path / "briefcase.toml",
+        '[paths]\napp_path="app"\napp_packages_path="app_packages"\n',
+    )
+
+    assert build_command.precompile_paths(first_app_generated) == [
+        bundle_path / "app",
+        bundle_path / "app_packages.iphoneos",
+        bundle_path / "app_packages.iphonesimulator",
+    ]
@@ -128,6 +128,7 @@ def test_install_requirements(
             "are not compatible\n"
             "with Python 3.X and a minimum iOS version of 12.0.\n"
         ),
+        output_prefix="iphoneos",
     )
     mock_sim_venv.install_requirements.assert_called_once_with(
         [
@@ -147,6 +148,7 @@ def test_install_requirements(
             "binary wheels that are available are not compatible with\n"
             "Python 3.X and a minimum iOS version of 12.0.\n"
         ),
+        output_prefix="iphonesimulator",
     )
 
 
@@ -210,6 +212,7 @@ def test_legacy_support_format(
         extra_installer_args=[],
         install_path=bundle_path / "app_packages.iphoneos",
         install_hint=mock.ANY,
+        output_prefix="iphoneos",
     )
     mock_sim_venv.install_requirements.assert_called_once_with(
         [
@@ -222,6 +225,7 @@ def test_legacy_support_format(
         extra_installer_args=[],
         install_path=bundle_path / "app_packages.iphonesimulator",
         install_hint=mock.ANY,
+        output_prefix="iphonesimulator",
     )
 
 
@@ -258,6 +262,7 @@ def test_min_os_version(
         extra_installer_args=[],
         install_path=bundle_path / "app_packages.iphoneos",
         install_hint=mock.ANY,
+        output_prefix="iphoneos",
     )
     mock_sim_venv.install_requirements.assert_called_once_with(
         [
@@ -270,6 +275,7 @@ def test_min_os_version(
         extra_installer_args=[],
         install_path=bundle_path / "app_packages.iphonesimulator",
         install_hint=mock.ANY,
+        output_prefix="iphonesimulator",
     )
 
 
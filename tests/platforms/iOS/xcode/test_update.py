@@ -89,6 +89,7 @@ def test_install_requirements(
         extra_installer_args=["-f", "./wheels"],
         install_path=bundle_path / "app_packages.iphoneos",
         install_hint=mock.ANY,
+        output_prefix="iphoneos",
     )
     mock_sim_venv.install_requirements.assert_called_once_with(
         [
@@ -101,4 +102,5 @@ def test_install_requirements(
         extra_installer_args=["-f", "./wheels"],
         install_path=bundle_path / "app_packages.iphonesimulator",
         install_hint=mock.ANY,
+        output_prefix="iphonesimulator",
     )
@@ -5,6 +5,7 @@ import pytest
 
 from briefcase.console import LogLevel
 from briefcase.exceptions import UnsupportedHostError
+from briefcase.integrations.file_watcher import FileWatcher
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.platforms.linux.appimage import LinuxAppImageRunCommand
 
@@ -154,6 +155,38 @@ def test_run_console_app(run_command, first_app_config, tmp_path):
     run_command._stream_app_logs.assert_not_called()
 
 
+def test_run_console_app_watched(run_command, first_app_config, tmp_path):
+    """When watching for changes, a console app's output is streamed, so that the app
+    can be stopped when its code changes."""
+    first_app_config.console_app = True
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    log_popen = mock.MagicMock()
+    run_command.tools.subprocess.Popen.return_value = log_popen
+
+    # Run the app
+    run_command.run_app(first_app_config, passthrough=[])
+
+    # The process was started with its output captured
+    run_command.tools.subprocess.Popen.assert_called_with(
+        [
+            tmp_path
+            / "base_path/build/first-app/linux/appimage/First_App-0.0.1-x86_64.AppImage"
+        ],
+        cwd=tmp_path / "home",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+    )
+    run_command.tools.subprocess.run.assert_not_called()
+
+    # The streamer was started
+    run_command._stream_app_logs.assert_called_once_with(
+        first_app_config,
+        popen=log_popen,
+        clean_output=False,
+    )
+
+
 def test_run_console_app_with_passthrough(run_command, first_app_config, tmp_path):
     """A linux console App can be started in debug mode with args."""
     run_command.console.verbosity = LogLevel.DEBUG
@@ -244,6 +277,52 @@ def test_run_app_test_mode(run_command, first_app_config, is_console_app, tmp_pa
     )
 
 
+@pytest.mark.parametrize("is_console_app", [True, False])
+def test_run_app_test_mode_shards(
+    run_command,
+    first_app_config,
+    is_console_app,
+    tmp_path,
+):
+    """A linux App can run its test suite as multiple shards."""
+    first_app_config.console_app = is_console_app
+    first_app_config.test_mode = True
+    run_command._stream_test_shards = mock.MagicMock()
+
+    # Set up the log streamer to return a known stream
+    log_popen = mock.MagicMock()
+    run_command.tools.subprocess.Popen.return_value = log_popen
+
+    # Run the app
+    run_command.run_app(first_app_config, passthrough=["foo"], test_shards=2)
+
+    # The shards were streamed
+    run_command._stream_app_logs.assert_not_called()
+    run_command._stream_test_shards.assert_called_once_with(
+        first_app_config,
+        test_shards=2,
+        start_shard=mock.ANY,
+        clean_output=False,
+    )
+
+    # Starting a shard starts the app with the shard environment
+    start_shard = run_command._stream_test_shards.mock_calls[0].kwargs["start_shard"]
+    assert start_shard({"SHARD": "1"}) == log_popen
+    run_command.tools.subprocess.Popen.assert_called_once_with(
+        [
+            tmp_path
+            / "base_path/build/first-app/linux/appimage"
+            / "First_App-0.0.1-x86_64.AppImage",
+            "foo",
+        ],
+        cwd=tmp_path / "home",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        env={"BRIEFCASE_MAIN_MODULE": "tests.first_app", "SHARD": "1"},
+    )
+
+
 @pytest.mark.parametrize("is_console_app", [True, False])
 def test_run_app_test_mode_with_args(
     run_command,
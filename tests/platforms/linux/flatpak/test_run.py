@@ -6,6 +6,7 @@ from briefcase.console import LogLevel
 from briefcase.integrations.flatpak import Flatpak
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.platforms.linux.flatpak import LinuxFlatpakRunCommand
+from briefcase.profiling import StartupBenchmark
 
 
 @pytest.fixture
@@ -113,6 +114,31 @@ def test_run_console_app(run_command, first_app_config):
     run_command._stream_app_logs.assert_not_called()
 
 
+def test_run_console_app_benchmark_startup(run_command, first_app_config):
+    """The startup of a console flatpak can be benchmarked."""
+    first_app_config.console_app = True
+    run_command.startup_benchmark = StartupBenchmark(
+        runs=1,
+        startup_marker="App started",
+        drop_caches=False,
+    )
+
+    # Run the app
+    run_command.run_app(first_app_config, passthrough=[])
+
+    # App is executed, with output streamed so startup can be detected
+    run_command.tools.flatpak.run.assert_called_once_with(
+        bundle_identifier="com.example.first-app",
+        args=[],
+        stream_output=True,
+    )
+    run_command._stream_app_logs.assert_called_once_with(
+        first_app_config,
+        popen=run_command.tools.flatpak.run.return_value,
+        clean_output=False,
+    )
+
+
 def test_run_console_app_with_passthrough(run_command, first_app_config):
     """A console flatpak can be executed in debug mode with args."""
     run_command.console.verbosity = LogLevel.DEBUG
@@ -83,6 +83,25 @@ def test_build_app(build_command, first_app, tmp_path):
     )
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Can't build Linux apps on Windows")
+def test_build_app_symlink_permissions(build_command, first_app, tmp_path):
+    """Permissions aren't updated through symbolic links."""
+    bundle_path = tmp_path / "base_path/build/first-app/somevendor/surprising"
+    lib_dir = bundle_path / "first-app-0.0.1/usr/lib/first-app"
+
+    # A file outside the app, linked into the app.
+    create_file(tmp_path / "system/libsystem.so", "system")
+    (tmp_path / "system/libsystem.so").chmod(0o664)
+    (lib_dir / "app/libsystem.so").symlink_to(tmp_path / "system/libsystem.so")
+
+    build_command.build_app(first_app)
+
+    # The permissions of the file in the app have been updated...
+    assert os.stat(lib_dir / "app/support.so").st_mode & 0o777 == 0o755
+    # ... but the linked file is untouched.
+    assert os.stat(tmp_path / "system/libsystem.so").st_mode & 0o777 == 0o664
+
+
 def test_build_bootstrap_failed(build_command, first_app, tmp_path):
     """If the bootstrap binary can't be compiled, an error is raised."""
     # Mock a build failure
@@ -259,3 +278,11 @@ def test_custom_man_page_missing(build_command, first_app, tmp_path):
         match=r"The man page source file 'docs/nonexistent\.1' does not exist.",
     ):
         build_command.build_app(first_app)
+
+
+def test_precompile_context(build_command, first_app):
+    """Bytecode is compiled using the system Python in the app context."""
+    assert (
+        build_command.precompile_context(first_app)
+        is build_command.tools[first_app].app_context
+    )
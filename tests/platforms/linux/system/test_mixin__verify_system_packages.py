@@ -21,12 +21,27 @@ def build_command(dummy_console, tmp_path, first_app):
     # All calls to `shutil.which()` succeed
     command.tools.shutil.which = MagicMock(return_value="/path/to/exe")
 
-    # Mock subprocess
+    # Mock subprocess; by default, all packages are installed.
     command.tools.subprocess = MagicMock()
+    command.tools.subprocess.run_many.side_effect = installed_packages()
 
     return command
 
 
+def installed_packages(*missing):
+    """Mock the result of verifying packages, with some packages missing."""
+
+    def run_many(commands, **kwargs):
+        return [
+            subprocess.CompletedProcess(
+                args=command, returncode=1 if command[-1] in missing else 0
+            )
+            for command in commands
+        ]
+
+    return run_many
+
+
 def test_deb_requirements(build_command, first_app_config):
     """Debian requirements can be verified."""
     first_app_config.target_vendor_base = "debian"
@@ -34,13 +49,18 @@ def test_deb_requirements(build_command, first_app_config):
     build_command.verify_system_packages(first_app_config)
 
     # The packages were verified
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["dpkg", "-s", "python3-dev"], quiet=1),
-        call(["dpkg", "-s", "dpkg-dev"], quiet=1),
-        call(["dpkg", "-s", "g++"], quiet=1),
-        call(["dpkg", "-s", "gcc"], quiet=1),
-        call(["dpkg", "-s", "libc6-dev"], quiet=1),
-        call(["dpkg", "-s", "make"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["dpkg", "-s", "python3-dev"],
+                ["dpkg", "-s", "dpkg-dev"],
+                ["dpkg", "-s", "g++"],
+                ["dpkg", "-s", "gcc"],
+                ["dpkg", "-s", "libc6-dev"],
+                ["dpkg", "-s", "make"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -50,11 +70,16 @@ def test_rpm_requirements(build_command, first_app_config):
 
     build_command.verify_system_packages(first_app_config)
 
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["rpm", "-q", "python3-devel"], quiet=1),
-        call(["rpm", "-q", "gcc"], quiet=1),
-        call(["rpm", "-q", "make"], quiet=1),
-        call(["rpm", "-q", "pkgconf-pkg-config"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["rpm", "-q", "python3-devel"],
+                ["rpm", "-q", "gcc"],
+                ["rpm", "-q", "make"],
+                ["rpm", "-q", "pkgconf-pkg-config"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -64,10 +89,13 @@ def test_suse_requirements(build_command, first_app_config):
 
     build_command.verify_system_packages(first_app_config)
 
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["rpm", "-q", "--whatprovides", "python3-devel"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
         call(
-            ["rpm", "-q", "--whatprovides", "patterns-devel-base-devel_basis"], quiet=1
+            [
+                ["rpm", "-q", "--whatprovides", "python3-devel"],
+                ["rpm", "-q", "--whatprovides", "patterns-devel-base-devel_basis"],
+            ],
+            quiet=1,
         ),
     ]
 
@@ -78,9 +106,14 @@ def test_arch_requirements(build_command, first_app_config, capsys):
 
     build_command.verify_system_packages(first_app_config)
 
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["pacman", "-Q", "python3"], quiet=1),
-        call(["pacman", "-Q", "base-devel"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["pacman", "-Q", "python3"],
+                ["pacman", "-Q", "base-devel"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -91,7 +124,7 @@ def test_unknown_requirements(build_command, first_app_config, capsys):
     build_command.verify_system_packages(first_app_config)
 
     # No packages verified
-    build_command.tools.subprocess.check_output.assert_not_called()
+    build_command.tools.subprocess.run_many.assert_not_called()
 
     # A warning was logged.
     output = capsys.readouterr().out
@@ -124,16 +157,12 @@ def test_missing_packages(build_command, first_app_config, capsys):
     first_app_config.system_requires = ["first", "second", "third"]
 
     # Mock the side effect of checking those requirements.
-    build_command.tools.subprocess.check_output.side_effect = [
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # compiler
-        "installed",  # compiler++
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # aliased-1
-        "installed",  # aliased-2
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # aliased-3
-        "installed",  # first
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # second
-        "installed",  # third
-    ]
+    build_command.tools.subprocess.run_many.side_effect = installed_packages(
+        "compiler",
+        "aliased-1",
+        "aliased-3",
+        "second",
+    )
 
     # Verify the requirements. This will raise an error, but the error
     # message will tell you how to install the system packages. This includes
@@ -145,15 +174,20 @@ def test_missing_packages(build_command, first_app_config, capsys):
         build_command.verify_system_packages(first_app_config)
 
     # All requirements are checked; base package names are checked for aliases
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["check", "compiler"], quiet=1),
-        call(["check", "compiler++"], quiet=1),
-        call(["check", "aliased-1"], quiet=1),
-        call(["check", "aliased-2"], quiet=1),
-        call(["check", "aliased-3"], quiet=1),
-        call(["check", "first"], quiet=1),
-        call(["check", "second"], quiet=1),
-        call(["check", "third"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["check", "compiler"],
+                ["check", "compiler++"],
+                ["check", "aliased-1"],
+                ["check", "aliased-2"],
+                ["check", "aliased-3"],
+                ["check", "first"],
+                ["check", "second"],
+                ["check", "third"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -165,7 +199,7 @@ def test_missing_system_verify(build_command, first_app_config, capsys):
     build_command.verify_system_packages(first_app_config)
 
     # No packages verified
-    build_command.tools.subprocess.check_output.assert_not_called()
+    build_command.tools.subprocess.run_many.assert_not_called()
 
     # A warning was logged.
     output = capsys.readouterr().out
@@ -190,19 +224,21 @@ def test_packages_installed(build_command, first_app_config, capsys):
     first_app_config.system_requires = ["first", "second", "third"]
     first_app_config.system_runtime_requires = ["first", "other", "compiler"]
 
-    # Mock the effect of checking requirements that are all present
-    build_command.tools.subprocess.check_output.return_value = "installed"
-
     # Verify the requirements. This will raise an error.
     build_command.verify_system_packages(first_app_config)
 
     # All requirements are checked, but `first` and `compiler` are only verified once
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["check", "compiler"], quiet=1),
-        call(["check", "first"], quiet=1),
-        call(["check", "second"], quiet=1),
-        call(["check", "third"], quiet=1),
-        call(["check", "other"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["check", "compiler"],
+                ["check", "first"],
+                ["check", "second"],
+                ["check", "third"],
+                ["check", "other"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -232,14 +268,12 @@ def test_missing_virtual_packages(build_command, first_app_config, capsys):
 
     # Mock the side effect of checking those requirements. third is available in it's
     # devirtualized form. first isn't available, but isn't a virtual package.
-    build_command.tools.subprocess.check_output.side_effect = [
-        "installed",  # compiler
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # first
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # second-virtual
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # second
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # third-virtual
-        "installed",  # third
-    ]
+    build_command.tools.subprocess.run_many.side_effect = installed_packages(
+        "first",
+        "second-virtual",
+        "second",
+        "third-virtual",
+    )
 
     # Verify the requirements. This will raise an error, but the error message will tell
     # you how to install the system packages. This includes using an alias for the
@@ -252,15 +286,24 @@ def test_missing_virtual_packages(build_command, first_app_config, capsys):
 
     # All requirements are checked; base package names are checked for
     # both aliases and virtual packages
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["check", "compiler"], quiet=1),
-        call(["check", "first"], quiet=1),
-        # Second is checked in both virtual and devirtualized form
-        call(["check", "second-virtual"], quiet=1),
-        call(["check", "second"], quiet=1),
-        # Third is checked in both virtual and devirtualized form
-        call(["check", "third-virtual"], quiet=1),
-        call(["check", "third"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["check", "compiler"],
+                ["check", "first"],
+                ["check", "second-virtual"],
+                ["check", "third-virtual"],
+            ],
+            quiet=1,
+        ),
+        # Second and third are checked in devirtualized form
+        call(
+            [
+                ["check", "second"],
+                ["check", "third"],
+            ],
+            quiet=1,
+        ),
     ]
 
 
@@ -291,28 +334,32 @@ def test_virtual_packages_installed(build_command, first_app_config, capsys):
 
     # Mock the effect of checking requirements that are all present,
     # although the virtual packages are only found in devirtualized form.
-    build_command.tools.subprocess.check_output.side_effect = [
-        "installed",  # compiler
-        "installed",  # first
-        "installed",  # second
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # third-virtual
-        "installed",  # third-virtual
-        subprocess.CalledProcessError(cmd="check", returncode=1),  # other-virtual
-        "installed",  # other
-    ]
+    build_command.tools.subprocess.run_many.side_effect = installed_packages(
+        "third-virtual",
+        "other-virtual",
+    )
 
     # Verify the requirements. This will raise an error.
     build_command.verify_system_packages(first_app_config)
 
     # All requirements are checked, but `first` is only verified once
-    assert build_command.tools.subprocess.check_output.mock_calls == [
-        call(["check", "compiler"], quiet=1),
-        call(["check", "first"], quiet=1),
-        call(["check", "second"], quiet=1),
-        # Third is checked in both virtual and devirtualized form
-        call(["check", "third-virtual"], quiet=1),
-        call(["check", "third"], quiet=1),
-        # Other is checked in both virtual and devirtualized form
-        call(["check", "other-virtual"], quiet=1),
-        call(["check", "other"], quiet=1),
+    assert build_command.tools.subprocess.run_many.mock_calls == [
+        call(
+            [
+                ["check", "compiler"],
+                ["check", "first"],
+                ["check", "second"],
+                ["check", "third-virtual"],
+                ["check", "other-virtual"],
+            ],
+            quiet=1,
+        ),
+        # Third and other are checked in devirtualized form
+        call(
+            [
+                ["check", "third"],
+                ["check", "other"],
+            ],
+            quiet=1,
+        ),
     ]
@@ -16,6 +16,7 @@ from briefcase.platforms.linux.system import (
     LinuxSystemDockerMixin,
     LinuxSystemRunCommand,
 )
+from briefcase.profiling import AppProfiler
 
 
 @pytest.fixture
@@ -72,6 +73,12 @@ def run_command(dummy_console, tmp_path, first_app, monkeypatch):
     command.tools.subprocess.check_output = mock.MagicMock(
         spec_set=Subprocess.check_output
     )
+    command.tools.subprocess.run_many = mock.MagicMock(
+        spec_set=Subprocess.run_many,
+        side_effect=lambda commands, **kwargs: [
+            subprocess.CompletedProcess(args, returncode=0) for args in commands
+        ],
+    )
 
     command._stream_app_logs = mock.MagicMock()
 
@@ -321,6 +328,47 @@ def test_run_gui_app_passthrough(run_command, first_app, sub_kw, tmp_path):
     )
 
 
+def test_run_gui_app_profiled(run_command, first_app, sub_kw, tmp_path, monkeypatch):
+    """A bootstrap binary for a GUI app can be started under a profiler."""
+
+    # Set up tool cache
+    run_command.verify_app_tools(app=first_app)
+    run_command.app_profiler = AppProfiler("importtime", tmp_path / "first.prof")
+
+    # Set up the log streamer to return a known stream
+    log_popen = mock.MagicMock()
+    run_command.tools.subprocess._subprocess.Popen = mock.MagicMock(
+        return_value=log_popen
+    )
+
+    # Mock out the environment
+    monkeypatch.setattr(run_command.tools.os, "environ", {"ENVVAR": "Value"})
+
+    # Run the app
+    run_command.run_app(first_app, passthrough=[])
+
+    # The process was started, with the profiler's environment
+    run_command.tools.subprocess._subprocess.Popen.assert_called_with(
+        [
+            os.fsdecode(
+                tmp_path
+                / "base_path/build/first-app/somevendor/surprising/"
+                / "first-app-0.0.1/usr/bin/first-app"
+            )
+        ],
+        cwd=os.fsdecode(tmp_path / "home"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        env={
+            "ENVVAR": "Value",
+            "BRIEFCASE_MAIN_MODULE": "first_app",
+            "PYTHONPROFILEIMPORTTIME": "1",
+        },
+        **sub_kw,
+    )
+
+
 def test_run_gui_app_failed(run_command, first_app, sub_kw, tmp_path):
     """If there's a problem starting the GUI app, an exception is raised."""
 
@@ -614,6 +662,66 @@ def test_run_app_test_mode(
     )
 
 
+@pytest.mark.parametrize("is_console_app", [True, False])
+def test_run_app_test_mode_shards(
+    run_command,
+    first_app,
+    is_console_app,
+    sub_kw,
+    tmp_path,
+    monkeypatch,
+):
+    """A linux App can run its test suite as multiple shards."""
+    first_app.console_app = is_console_app
+    first_app.test_mode = True
+    run_command._stream_test_shards = mock.MagicMock()
+
+    # Set up tool cache
+    run_command.verify_app_tools(app=first_app)
+
+    # Set up the log streamer to return a known stream
+    log_popen = mock.MagicMock()
+    run_command.tools.subprocess._subprocess.Popen.return_value = log_popen
+
+    # Mock out the environment
+    monkeypatch.setattr(run_command.tools.os, "environ", {"ENVVAR": "Value"})
+
+    # Run the app
+    run_command.run_app(first_app, passthrough=[], test_shards=2)
+
+    # The shards were streamed
+    run_command._stream_app_logs.assert_not_called()
+    run_command._stream_test_shards.assert_called_once_with(
+        first_app,
+        test_shards=2,
+        start_shard=mock.ANY,
+        clean_output=False,
+    )
+
+    # Starting a shard starts the app with the shard environment
+    start_shard = run_command._stream_test_shards.mock_calls[0].kwargs["start_shard"]
+    assert start_shard({"SHARD": "1"}) == log_popen
+    run_command.tools.subprocess._subprocess.Popen.assert_called_once_with(
+        [
+            os.fsdecode(
+                tmp_path
+                / "base_path/build/first-app/somevendor/surprising/"
+                / "first-app-0.0.1/usr/bin/first-app"
+            )
+        ],
+        cwd=os.fsdecode(tmp_path / "home"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        env={
+            "ENVVAR": "Value",
+            "BRIEFCASE_MAIN_MODULE": "tests.first_app",
+            "SHARD": "1",
+        },
+        **sub_kw,
+    )
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Windows paths can't be dockerized")
 @pytest.mark.parametrize("is_console_app", [True, False])
 def test_run_app_test_mode_docker(
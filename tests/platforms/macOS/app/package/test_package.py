@@ -122,6 +122,8 @@ def test_no_notarize_option(package_command):
         "installer_identity": None,
         "sign_installer": True,
         "packaging_format": None,
+        "prune": False,
+        "size_report": False,
         "submission_id": None,
         "update": False,
         "wait": True,
@@ -142,6 +144,8 @@ def test_installer_identity_option(package_command):
         "installer_identity": "DEADBEEF",
         "sign_installer": True,
         "packaging_format": None,
+        "prune": False,
+        "size_report": False,
         "submission_id": None,
         "update": False,
         "wait": True,
@@ -160,6 +164,8 @@ def test_no_sign_installer(package_command):
         "installer_identity": None,
         "sign_installer": False,
         "packaging_format": None,
+        "prune": False,
+        "size_report": False,
         "submission_id": None,
         "update": False,
         "wait": True,
@@ -178,6 +184,8 @@ def test_resume(package_command):
         "installer_identity": None,
         "sign_installer": True,
         "packaging_format": None,
+        "prune": False,
+        "size_report": False,
         "submission_id": "cafe-beef-1234",
         "update": False,
         "wait": True,
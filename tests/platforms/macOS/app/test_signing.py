@@ -1,5 +1,7 @@
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -42,15 +44,14 @@ def dummy_command(dummy_console, tmp_path):
     return cmd
 
 
-def sign_call(
+def sign_command(
     tmp_path,
     filepath,
     identity,
     entitlements=True,
     runtime=True,
 ):
-    """A test utility method to quickly construct a subprocess call to invoke codesign
-    on a file."""
+    """A test utility method to quickly construct the codesign command for a file."""
     args = [
         "codesign",
         filepath,
@@ -73,7 +74,29 @@ def sign_call(
             ]
         )
 
-    return mock.call(args, stderr=subprocess.PIPE, check=True)
+    return args
+
+
+def sign_call(
+    tmp_path,
+    filepath,
+    identity,
+    entitlements=True,
+    runtime=True,
+):
+    """A test utility method to quickly construct a subprocess call to invoke codesign
+    on a file."""
+    return mock.call(
+        sign_command(
+            tmp_path,
+            filepath,
+            identity,
+            entitlements=entitlements,
+            runtime=runtime,
+        ),
+        stderr=subprocess.PIPE,
+        check=True,
+    )
 
 
 def mock_codesign(results):
@@ -685,75 +708,76 @@ def test_sign_app(
     lib_path = app_path / "Contents/Resources/app_packages"
     frameworks_path = app_path / "Contents/Frameworks"
 
-    assert len(dummy_command.tools.subprocess.run.mock_calls) == 11
-    dummy_command.tools.subprocess.run.assert_has_calls(
+    commands = [call.args[0] for call in dummy_command.tools.subprocess.run.mock_calls]
+    for call in dummy_command.tools.subprocess.run.mock_calls:
+        assert call.kwargs == {"stderr": subprocess.PIPE, "check": True}
+    assert len(commands) == 11
+    assert sorted(commands, key=str) == sorted(
         [
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "subfolder/second_so.so",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "subfolder/second_dylib.dylib",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "special.binary",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "other_binary",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "first_so.so",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "first_dylib.dylib",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "Extras.app/Contents/MacOS/Extras",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 lib_path / "Extras.app",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 frameworks_path / "Extras.framework/Versions/1.2/libs/extras.dylib",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 frameworks_path / "Extras.framework",
                 identity=sekrit_identity,
             ),
-            sign_call(
+            sign_command(
                 tmp_path,
                 app_path,
                 identity=sekrit_identity,
             ),
         ],
-        any_order=True,
+        key=str,
     )
 
     # Also check that files are not signed after their parent directory has been
     # signed. Reduce the files mentions in the calls to the dummy command
     # to a list of path objects, then ensure that the call to sign any given file
     # does not occur *after* it's parent directory.
-    sign_targets = [
-        Path(call.args[0][1]) for call in dummy_command.tools.subprocess.run.mock_calls
-    ]
+    sign_targets = [Path(args[1]) for args in commands]
 
     parents = set()
     for path in sign_targets:
@@ -801,10 +825,95 @@ def test_sign_app_with_failure(
             identity=sekrit_identity,
         )
 
-    # There has been at least 1 call to sign files. We can't know how many are
-    # actually signed, as threads are involved.
-    assert dummy_command.tools.subprocess.run.call_count > 0
+    # Files that depend on the file that failed weren't signed.
+    signed = {
+        Path(call.args[0][1]).name
+        for call in dummy_command.tools.subprocess.run.mock_calls
+    }
+    assert "first_dylib.dylib" in signed
+    assert "First App.app" not in signed
 
     # Output only happens if in debug mode.
     output = capsys.readouterr().out
-    assert len(output.strip("\n").split("\n")) == (8 if verbose else 1)
+    assert (len(output.strip("\n").split("\n")) > 1) == verbose
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Can't test macOS codesigning on Windows",
+)
+def test_sign_app_order(dummy_command, sekrit_identity, first_app_with_binaries):
+    """Each object in an app is signed after everything it contains."""
+    events = []
+    lock = threading.Lock()
+
+    def sign_file(path, identity, entitlements):
+        with lock:
+            events.append(("start", path))
+        time.sleep(0.01)
+        with lock:
+            events.append(("end", path))
+
+    dummy_command.sign_file = sign_file
+    dummy_command.sign_app(first_app_with_binaries, identity=sekrit_identity)
+
+    # Every target was signed exactly once.
+    started = [path for event, path in events if event == "start"]
+    assert len(started) == 11
+    assert len(set(started)) == 11
+
+    # Every target was signed after all the targets it contains were finished.
+    for index, (event, path) in enumerate(events):
+        if event == "start":
+            finished = {p for e, p in events[:index] if e == "end"}
+            assert {p for p in started if path in p.parents} <= finished
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Can't test macOS codesigning on Windows",
+)
+def test_sign_app_concurrent(dummy_command, sekrit_identity, first_app_with_binaries):
+    """Objects at different levels of the app are signed concurrently."""
+    dummy_command.tools.executor.jobs = 4
+    first_so_started = threading.Event()
+
+    def sign_file(path, identity, entitlements):
+        if path.name == "first_so.so":
+            first_so_started.set()
+        elif path.name == "second_so.so":
+            # A file in a subfolder can be signed at the same time as a file in
+            # the parent folder.
+            assert first_so_started.wait(timeout=5)
+
+    dummy_command.sign_file = sign_file
+    dummy_command.sign_app(first_app_with_binaries, identity=sekrit_identity)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Can't test macOS codesigning on Windows",
+)
+def test_sign_app_failure_stops_signing(
+    dummy_command,
+    sekrit_identity,
+    first_app_with_binaries,
+):
+    """If a file fails to sign, running signatures complete, but nothing else is
+    signed."""
+    dummy_command.tools.executor.jobs = 1
+    signed = []
+
+    def sign_file(path, identity, entitlements):
+        signed.append(path)
+        if len(signed) == 2:
+            raise BriefcaseCommandError(f"Unable to code sign {path}.")
+
+    dummy_command.sign_file = sign_file
+    with pytest.raises(BriefcaseCommandError, match=r"Unable to code sign"):
+        dummy_command.sign_app(first_app_with_binaries, identity=sekrit_identity)
+
+    # The signing tasks that were already queued ran, but the app bundle was
+    # never signed.
+    assert len(signed) < 11
+    assert all(path.name != "First App.app" for path in signed)
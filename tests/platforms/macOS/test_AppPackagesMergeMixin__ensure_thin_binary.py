@@ -1,11 +1,12 @@
 import subprocess
+from unittest import mock
 
 import pytest
 
 from briefcase.console import LogLevel
 from briefcase.exceptions import BriefcaseCommandError
 
-from ...utils import create_file, file_content
+from ...utils import create_file, fat_mach_o_content, file_content, mach_o_content
 
 
 @pytest.mark.parametrize("verbose", [True, False])
@@ -268,3 +269,86 @@ def test_lipo_thin_fail(dummy_command, verbose, tmp_path, capsys):
     # Output only happens if in debug mode
     output = capsys.readouterr().out.split("\n")
     assert len(output) == (2 if verbose else 1)
+
+
+def test_in_process_thin(dummy_command, tmp_path):
+    """A thin Mach-O binary is inspected without invoking lipo."""
+    create_file(
+        tmp_path / "path/to/file.dylib",
+        mach_o_content("arm64", b"thin"),
+        mode="wb",
+    )
+
+    dummy_command.ensure_thin_binary(tmp_path / "path/to/file.dylib", arch="arm64")
+
+    # Lipo was not invoked, and the file is unmodified.
+    dummy_command.tools.subprocess.check_output.assert_not_called()
+    dummy_command.tools.subprocess.run.assert_not_called()
+    assert file_content(tmp_path / "path/to/file.dylib") == mach_o_content(
+        "arm64", b"thin"
+    )
+
+
+def test_in_process_fat(dummy_command, tmp_path):
+    """A fat Mach-O binary is thinned without invoking lipo."""
+    create_file(
+        tmp_path / "path/to/file.dylib",
+        fat_mach_o_content(
+            [
+                ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+                ("arm64", mach_o_content("arm64", b"arm"), 14),
+            ]
+        ),
+        mode="wb",
+    )
+
+    dummy_command.ensure_thin_binary(tmp_path / "path/to/file.dylib", arch="arm64")
+
+    # Lipo was not invoked; the file has been replaced by the arm64 slice.
+    dummy_command.tools.subprocess.check_output.assert_not_called()
+    dummy_command.tools.subprocess.run.assert_not_called()
+    assert file_content(tmp_path / "path/to/file.dylib") == mach_o_content(
+        "arm64", b"arm"
+    )
+    assert not (tmp_path / "path/to/file.dylib.arm64").exists()
+
+
+def test_in_process_missing_arch(dummy_command, tmp_path):
+    """If a fat Mach-O binary doesn't contain the requested architecture, an error
+    is raised."""
+    create_file(
+        tmp_path / "path/to/file.dylib",
+        fat_mach_o_content([("x86_64", mach_o_content("x86_64", b"intel"), 12)]),
+        mode="wb",
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"file.dylib does not contain a arm64 slice.",
+    ):
+        dummy_command.ensure_thin_binary(
+            tmp_path / "path/to/file.dylib",
+            arch="arm64",
+        )
+
+
+def test_in_process_thin_failure(dummy_command, tmp_path, monkeypatch):
+    """If the slice can't be extracted, an error is raised."""
+    create_file(
+        tmp_path / "path/to/file.dylib",
+        fat_mach_o_content([("arm64", mach_o_content("arm64", b"arm"), 14)]),
+        mode="wb",
+    )
+    monkeypatch.setattr(
+        "briefcase.platforms.macOS.utils.thin_mach_o",
+        mock.Mock(side_effect=OSError("disk full")),
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to create thin binary from .*file.dylib",
+    ):
+        dummy_command.ensure_thin_binary(
+            tmp_path / "path/to/file.dylib",
+            arch="arm64",
+        )
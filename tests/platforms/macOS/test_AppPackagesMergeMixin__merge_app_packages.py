@@ -1,13 +1,22 @@
 import os
 import subprocess
+import sys
 from pathlib import Path
 from textwrap import dedent
+from unittest import mock
 
 import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.platforms.macOS.utils import mach_o_architectures, sha256_file_digest
 
-from ...utils import create_file, create_installed_package, file_content
+from ...utils import (
+    create_file,
+    create_installed_package,
+    fat_mach_o_content,
+    file_content,
+    mach_o_content,
+)
 
 
 @pytest.mark.parametrize("pre_existing", [True, False])
@@ -57,13 +66,14 @@ def test_merge(dummy_command, pre_existing, tmp_path):
     )
 
     # Mock subprocess so that lipo generates output files.
-    def lipo(cmd, **kwargs):
-        if cmd[0] != "lipo":
-            pytest.fail(f"Subprocess called {cmd[0]}, not lipo")
+    def lipo(commands, **kwargs):
+        for cmd in commands:
+            if cmd[0] != "lipo":
+                pytest.fail(f"Subprocess called {cmd[0]}, not lipo")
 
-        create_file(cmd[3], b"\xca\xfe\xba\xbedylib-merged", mode="wb")
+            create_file(cmd[3], b"\xca\xfe\xba\xbedylib-merged", mode="wb")
 
-    dummy_command.tools.subprocess.run.side_effect = lipo
+    dummy_command.tools.subprocess.run_many.side_effect = lipo
 
     # Merge the two sources into a final location.
     merged_path = tmp_path / "merged_app_packages"
@@ -190,9 +200,10 @@ def test_merge_problem(dummy_command, tmp_path):
     )
 
     # Mock subprocess so that lipo generates an exception
-    dummy_command.tools.subprocess.run.side_effect = subprocess.CalledProcessError(
-        returncode=1, cmd="lipo"
-    )
+    def lipo(commands, **kwargs):
+        raise subprocess.CalledProcessError(returncode=1, cmd=commands[0])
+
+    dummy_command.tools.subprocess.run_many.side_effect = lipo
 
     # Merge the two sources into a final location. This will raise an exception.
     with pytest.raises(
@@ -228,7 +239,7 @@ def test_merge_no_dylib(dummy_command, tmp_path, capsys):
     )
 
     # subprocess wasn't called.
-    dummy_command.tools.subprocess.run.assert_not_called()
+    dummy_command.tools.subprocess.run_many.assert_not_called()
 
     # The final merged app packages contains only the merged content.
     assert {
@@ -298,3 +309,224 @@ def test_merge_no_dylib(dummy_command, tmp_path, capsys):
             ),
         ),
     }
+
+
+def test_merge_in_process(dummy_command, tmp_path):
+    "Mach-O libraries are merged in-process; lipo is only used for other libraries"
+    create_installed_package(
+        tmp_path / "app_packages.arm64",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_arm64",
+        extra_content=[
+            ("pkg/module1.dylib", mach_o_content("arm64", b"arm")),
+            ("pkg/module2.dylib", b"\xca\xfe\xba\xbedylib-arm64"),
+        ],
+    )
+    create_installed_package(
+        tmp_path / "app_packages.x86_64",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_x86_64",
+        extra_content=[
+            ("pkg/module1.dylib", mach_o_content("x86_64", b"intel")),
+            ("pkg/module2.dylib", b"\xca\xfe\xba\xbedylib-x86_64"),
+        ],
+    )
+
+    # Mock subprocess so that lipo generates output files.
+    def lipo(commands, **kwargs):
+        for cmd in commands:
+            create_file(cmd[3], b"\xca\xfe\xba\xbedylib-merged", mode="wb")
+
+    dummy_command.tools.subprocess.run_many.side_effect = lipo
+
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.merge_app_packages(
+        merged_path,
+        sources=[
+            tmp_path / "app_packages.arm64",
+            tmp_path / "app_packages.x86_64",
+        ],
+    )
+
+    # Lipo was only used for the library that couldn't be processed in-process.
+    dummy_command.tools.subprocess.run_many.assert_called_once_with(
+        [
+            [
+                "lipo",
+                "-create",
+                "-output",
+                merged_path / "pkg/module2.dylib",
+                tmp_path / "app_packages.arm64/pkg/module2.dylib",
+                tmp_path / "app_packages.x86_64/pkg/module2.dylib",
+            ]
+        ],
+        check=True,
+        progress="Create fat libraries",
+    )
+
+    assert file_content(merged_path / "pkg/module1.dylib") == fat_mach_o_content(
+        [
+            ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+            ("arm64", mach_o_content("arm64", b"arm"), 14),
+        ]
+    )
+    assert (
+        file_content(merged_path / "pkg/module2.dylib")
+        == b"\xca\xfe\xba\xbedylib-merged"
+    )
+
+
+def test_merge_without_lipo(dummy_command, tmp_path):
+    "If all libraries can be merged in-process, lipo isn't invoked"
+    create_installed_package(
+        tmp_path / "app_packages.arm64",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_arm64",
+        extra_content=[("pkg/module1.dylib", mach_o_content("arm64", b"arm"))],
+    )
+    create_installed_package(
+        tmp_path / "app_packages.x86_64",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_x86_64",
+        extra_content=[("pkg/module1.dylib", mach_o_content("x86_64", b"intel"))],
+    )
+
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.merge_app_packages(
+        merged_path,
+        sources=[
+            tmp_path / "app_packages.arm64",
+            tmp_path / "app_packages.x86_64",
+        ],
+    )
+
+    dummy_command.tools.subprocess.run_many.assert_not_called()
+    assert mach_o_architectures(merged_path / "pkg/module1.dylib") == (
+        True,
+        ["x86_64", "arm64"],
+    )
+
+
+@pytest.fixture
+def collision_sources(tmp_path):
+    "Two app packages sources with files that exist in both sources"
+    create_installed_package(
+        tmp_path / "app_packages.gothic",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_gothic",
+        extra_content=[
+            ("pkg/same.py", "# same python"),
+            ("pkg/different.py", "# different python"),
+            ("pkg/resized.py", "# python"),
+            ("pkg/unique.py", "# unique python"),
+            ("pkg/__pycache__/same.cpython-313.pyc", "gothic bytecode"),
+        ],
+    )
+    create_installed_package(
+        tmp_path / "app_packages.modern",
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_modern",
+        extra_content=[
+            ("pkg/same.py", "# same python"),
+            ("pkg/different.py", "# differing python"),
+            ("pkg/resized.py", "# resized python"),
+            ("pkg/__pycache__/same.cpython-313.pyc", "modern bytecode"),
+        ],
+    )
+    return [tmp_path / "app_packages.gothic", tmp_path / "app_packages.modern"]
+
+
+def test_merge_collisions(dummy_command, collision_sources, tmp_path, monkeypatch):
+    "Only files that exist in multiple sources are compared"
+    hashed = []
+
+    def digest(path):
+        hashed.append(path.relative_to(tmp_path))
+        return sha256_file_digest(path)
+
+    monkeypatch.setattr(
+        "briefcase.platforms.macOS.utils.sha256_file_digest",
+        digest,
+    )
+
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.console.warning = mock.MagicMock()
+    dummy_command.merge_app_packages(merged_path, sources=collision_sources)
+
+    # Only the files with the same size in both sources were hashed. Files in
+    # __pycache__ or dist-info folders aren't compared.
+    assert sorted(hashed) == [
+        Path("app_packages.gothic/pkg/__init__.py"),
+        Path("app_packages.gothic/pkg/app.py"),
+        Path("app_packages.gothic/pkg/different.py"),
+        Path("app_packages.gothic/pkg/same.py"),
+        Path("app_packages.modern/pkg/__init__.py"),
+        Path("app_packages.modern/pkg/app.py"),
+        Path("app_packages.modern/pkg/different.py"),
+        Path("app_packages.modern/pkg/same.py"),
+    ]
+
+    # A warning was raised for each file that is different.
+    assert sorted(
+        call.args[0].split(" ")[0] for call in dummy_command.console.warning.mock_calls
+    ) == [
+        str(Path("pkg/different.py")),
+        str(Path("pkg/resized.py")),
+    ]
+
+    # The first source's version of each file is used
+    assert file_content(merged_path / "pkg/different.py") == "# different python"
+    assert file_content(merged_path / "pkg/resized.py") == "# python"
+    assert file_content(merged_path / "pkg/unique.py") == "# unique python"
+    assert (
+        file_content(merged_path / "pkg/__pycache__/same.cpython-313.pyc")
+        == "gothic bytecode"
+    )
+
+
+def test_merge_links(dummy_command, collision_sources, tmp_path):
+    "Files are linked into the merged app packages"
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.merge_app_packages(merged_path, sources=collision_sources)
+
+    assert (merged_path / "pkg/unique.py").samefile(
+        tmp_path / "app_packages.gothic/pkg/unique.py"
+    )
+
+
+def test_merge_without_links(dummy_command, collision_sources, tmp_path):
+    "If files can't be linked, they are copied"
+    dummy_command.tools.os = mock.MagicMock(wraps=os)
+    dummy_command.tools.os.link.side_effect = OSError("Cross-device link")
+
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.merge_app_packages(merged_path, sources=collision_sources)
+
+    # Once a link has failed, no more links are attempted.
+    dummy_command.tools.os.link.assert_called_once()
+    assert not (merged_path / "pkg/unique.py").samefile(
+        tmp_path / "app_packages.gothic/pkg/unique.py"
+    )
+    assert file_content(merged_path / "pkg/unique.py") == "# unique python"
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_merge_symlinks(dummy_command, collision_sources, tmp_path):
+    "Symbolic links are preserved as links in the merged app packages"
+    (tmp_path / "app_packages.gothic/pkg/alias.py").symlink_to("unique.py")
+
+    merged_path = tmp_path / "merged_app_packages"
+    dummy_command.merge_app_packages(merged_path, sources=collision_sources)
+
+    assert (merged_path / "pkg/alias.py").is_symlink()
+    assert os.readlink(merged_path / "pkg/alias.py") == "unique.py"
+    assert file_content(merged_path / "pkg/alias.py") == "# unique python"
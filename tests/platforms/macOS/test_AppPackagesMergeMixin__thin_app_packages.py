@@ -4,7 +4,13 @@ import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
 
-from ...utils import create_file, create_installed_package, file_content
+from ...utils import (
+    create_file,
+    create_installed_package,
+    fat_mach_o_content,
+    file_content,
+    mach_o_content,
+)
 
 
 def test_thin_app_packages(dummy_command, tmp_path):
@@ -26,19 +32,20 @@ def test_thin_app_packages(dummy_command, tmp_path):
     )
 
     # All dylibs have 2 architectures
-    dummy_command.tools.subprocess.check_output.return_value = (
+    dummy_command.tools.subprocess.check_output_many.return_value = [
         "Architectures in the fat file: path/to/file.dylib are: modern gothic\n"
-    )
+    ] * 3
 
     # Mock the effect of calling lipo -thin
-    def thin_dylib(*args, **kwargs):
-        create_file(
-            args[0][args[0].index("-output") + 1],
-            b"\xca\xfe\xba\xbedylib-thin",
-            mode="wb",
-        )
+    def thin_dylibs(commands, **kwargs):
+        for cmd in commands:
+            create_file(
+                cmd[cmd.index("-output") + 1],
+                b"\xca\xfe\xba\xbedylib-thin",
+                mode="wb",
+            )
 
-    dummy_command.tools.subprocess.run.side_effect = thin_dylib
+    dummy_command.tools.subprocess.run_many.side_effect = thin_dylibs
 
     # Thin the app_packages folder to gothic dylibs
     dummy_command.thin_app_packages(app_packages, arch="gothic")
@@ -77,17 +84,18 @@ def test_thin_app_packages_problem(dummy_command, tmp_path):
     )
 
     # All dylibs have 2 architectures
-    dummy_command.tools.subprocess.check_output.return_value = (
+    dummy_command.tools.subprocess.check_output_many.return_value = [
         "Architectures in the fat file: path/to/file.dylib are: modern gothic\n"
-    )
+    ] * 3
 
     # Mock the effect of calling lipo -thin. Calling on a .so file raises an error.
-    def thin_dylib(*args, **kwargs):
-        if str(args[0][-1]).endswith(".so"):
-            raise subprocess.CalledProcessError(cmd="lipo -thin", returncode=-1)
-        create_file(args[0][args[0].index("-output") + 1], "dylib-thin")
+    def thin_dylibs(commands, **kwargs):
+        for cmd in commands:
+            if str(cmd[-1]).endswith(".so"):
+                raise subprocess.CalledProcessError(cmd=cmd, returncode=-1)
+            create_file(cmd[cmd.index("-output") + 1], "dylib-thin")
 
-    dummy_command.tools.subprocess.run.side_effect = thin_dylib
+    dummy_command.tools.subprocess.run_many.side_effect = thin_dylibs
 
     # Thin the app_packages folder to gothic dylibs. This raises an error:
     with pytest.raises(
@@ -116,5 +124,128 @@ def test_thin_no_dylibs(dummy_command, tmp_path):
     dummy_command.thin_app_packages(app_packages, arch="gothic")
 
     # lipo was not called.
-    dummy_command.tools.subprocess.check_output.assert_not_called()
-    dummy_command.tools.subprocess.run.assert_not_called()
+    dummy_command.tools.subprocess.check_output_many.assert_not_called()
+    dummy_command.tools.subprocess.run_many.assert_not_called()
+
+
+def test_thin_app_packages_in_process(dummy_command, tmp_path):
+    "Mach-O libraries are thinned in-process; lipo is only used for other libraries"
+    app_packages = tmp_path / "app_packages.arm64"
+
+    fat_content = fat_mach_o_content(
+        [
+            ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+            ("arm64", mach_o_content("arm64", b"arm"), 14),
+        ]
+    )
+    create_installed_package(
+        app_packages,
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_arm64",
+        extra_content=[
+            ("pkg/other.py", "# other python"),
+            ("pkg/sub1/module1.dylib", fat_content),
+            ("pkg/sub1/module2.so", mach_o_content("arm64", b"thin")),
+            # A library that can't be processed in-process
+            ("pkg/sub2/module3.dylib", b"\xca\xfe\xba\xbedylib-fat"),
+        ],
+    )
+
+    dummy_command.tools.subprocess.check_output_many.return_value = [
+        "Architectures in the fat file: path/to/file.dylib are: x86_64 arm64\n"
+    ]
+
+    # Mock the effect of calling lipo -thin
+    def thin_dylibs(commands, **kwargs):
+        for cmd in commands:
+            create_file(
+                cmd[cmd.index("-output") + 1],
+                b"\xca\xfe\xba\xbedylib-thin",
+                mode="wb",
+            )
+
+    dummy_command.tools.subprocess.run_many.side_effect = thin_dylibs
+
+    dummy_command.thin_app_packages(app_packages, arch="arm64")
+
+    # Lipo was only used for the library that couldn't be processed in-process.
+    dummy_command.tools.subprocess.check_output_many.assert_called_once_with(
+        [["lipo", "-info", app_packages / "pkg/sub2/module3.dylib"]],
+        progress="Inspect libraries",
+    )
+    dummy_command.tools.subprocess.run_many.assert_called_once_with(
+        [
+            [
+                "lipo",
+                "-thin",
+                "arm64",
+                "-output",
+                app_packages / "pkg/sub2/module3.dylib.arm64",
+                app_packages / "pkg/sub2/module3.dylib",
+            ]
+        ],
+        check=True,
+        progress="Thin libraries",
+    )
+
+    # All libraries are thin.
+    assert file_content(app_packages / "pkg/sub1/module1.dylib") == mach_o_content(
+        "arm64", b"arm"
+    )
+    assert file_content(app_packages / "pkg/sub1/module2.so") == mach_o_content(
+        "arm64", b"thin"
+    )
+    assert (
+        file_content(app_packages / "pkg/sub2/module3.dylib")
+        == b"\xca\xfe\xba\xbedylib-thin"
+    )
+
+
+def test_thin_app_packages_without_lipo(dummy_command, tmp_path):
+    "If all libraries can be thinned in-process, lipo isn't invoked"
+    app_packages = tmp_path / "app_packages.arm64"
+    create_installed_package(
+        app_packages,
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_arm64",
+        extra_content=[
+            ("pkg/module1.dylib", mach_o_content("arm64", b"thin")),
+        ],
+    )
+
+    dummy_command.thin_app_packages(app_packages, arch="arm64")
+
+    dummy_command.tools.subprocess.check_output_many.assert_not_called()
+    dummy_command.tools.subprocess.run_many.assert_not_called()
+    assert file_content(app_packages / "pkg/module1.dylib") == mach_o_content(
+        "arm64", b"thin"
+    )
+
+
+def test_thin_app_packages_inspect_problem(dummy_command, tmp_path):
+    "If one of the libraries can't be inspected, an error is raised"
+    app_packages = tmp_path / "app_packages.gothic"
+    create_installed_package(
+        app_packages,
+        "pkg",
+        "2.3.4",
+        tag="macOS_11_0_gothic",
+        extra_content=[
+            ("pkg/module1.dylib", b"\xca\xfe\xba\xbedylib-fat"),
+        ],
+    )
+
+    dummy_command.tools.subprocess.check_output_many.side_effect = (
+        subprocess.CalledProcessError(
+            cmd=["lipo", "-info", app_packages / "pkg/module1.dylib"],
+            returncode=-1,
+        )
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to inspect architectures in .*module1\.dylib",
+    ):
+        dummy_command.thin_app_packages(app_packages, arch="gothic")
@@ -0,0 +1,156 @@
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from briefcase.platforms.macOS.utils import FileIndex, FileInfo
+
+from ...utils import create_file, fat_mach_o_content, mach_o_content
+
+
+@pytest.fixture
+def file_index(dummy_command):
+    return FileIndex.shared(dummy_command.tools)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    create_file(root / "module.py", "# python")
+    create_file(root / "pkg/thin.so", mach_o_content("arm64", b"arm"), mode="wb")
+    create_file(
+        root / "pkg/sub/fat.dylib",
+        fat_mach_o_content(
+            [
+                ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+                ("arm64", mach_o_content("arm64", b"arm"), 14),
+            ]
+        ),
+        mode="wb",
+    )
+    create_file(root / "pkg/unreadable.so", b"\xca\xfe\xba\xbe\x00", mode="wb")
+    create_file(root / "pkg/linux.so", b"\x7fELF binary", mode="wb")
+    create_file(root / "pkg/windows", b"MZ binary", mode="wb")
+    create_file(root / "pkg/script", "#!/bin/sh\n", chmod=0o755)
+    # A file with a Mach-O header, but not a binary suffix or executable permissions
+    create_file(root / "pkg/data.bin", mach_o_content("arm64"), mode="wb")
+    return root
+
+
+def test_shared(dummy_command):
+    """The same index is shared by all users of a tool cache."""
+    file_index = FileIndex.shared(dummy_command.tools)
+
+    assert FileIndex.shared(dummy_command.tools) is file_index
+    assert dummy_command.file_index is file_index
+
+
+def test_scan(file_index, tree):
+    """Every file and directory in a tree is classified."""
+    entries = file_index.scan(tree)
+
+    assert {path.relative_to(tree): info.kind for path, info in entries.items()} == {
+        Path("module.py"): FileIndex.OTHER,
+        Path("pkg"): FileIndex.DIRECTORY,
+        Path("pkg/sub"): FileIndex.DIRECTORY,
+        Path("pkg/thin.so"): FileIndex.MACH_O,
+        Path("pkg/sub/fat.dylib"): FileIndex.MACH_O,
+        Path("pkg/unreadable.so"): FileIndex.MACH_O,
+        Path("pkg/linux.so"): FileIndex.ELF,
+        Path("pkg/windows"): FileIndex.PE,
+        Path("pkg/script"): FileIndex.OTHER,
+        Path("pkg/data.bin"): FileIndex.OTHER,
+    }
+
+    # The architectures of Mach-O files are recorded.
+    thin = entries[tree / "pkg/thin.so"]
+    assert (thin.fat, thin.architectures) == (False, ("arm64",))
+    fat = entries[tree / "pkg/sub/fat.dylib"]
+    assert (fat.fat, fat.architectures) == (True, ("x86_64", "arm64"))
+    unreadable = entries[tree / "pkg/unreadable.so"]
+    assert unreadable.architectures is None
+
+    # The size and modification time of files are recorded.
+    stat = (tree / "module.py").stat()
+    assert entries[tree / "module.py"] == FileInfo(
+        FileIndex.OTHER, stat.st_size, stat.st_mtime_ns
+    )
+
+    # Every directory appears before its content.
+    order = list(entries)
+    assert order.index(tree / "pkg") < order.index(tree / "pkg/thin.so")
+    assert order.index(tree / "pkg/sub") < order.index(tree / "pkg/sub/fat.dylib")
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_scan_symlinks(file_index, tree):
+    """Symbolic links are classified as links, and aren't followed."""
+    (tree / "link.so").symlink_to(tree / "pkg/thin.so")
+    (tree / "link").symlink_to(tree / "pkg")
+
+    entries = file_index.scan(tree)
+
+    assert entries[tree / "link.so"].kind == FileIndex.SYMLINK
+    assert entries[tree / "link"].kind == FileIndex.SYMLINK
+    assert tree / "link/thin.so" not in entries
+
+
+def test_scan_missing(file_index, tmp_path):
+    """A tree that doesn't exist is empty."""
+    assert file_index.scan(tmp_path / "missing") == {}
+
+
+def test_cached(file_index, tree, monkeypatch):
+    """Files are only classified again if they have changed."""
+    classify = mock.Mock(wraps=FileIndex.classify)
+    monkeypatch.setattr(FileIndex, "classify", classify)
+
+    file_index.scan(tree)
+    assert classify.call_count == 10
+
+    # Scanning the tree again doesn't classify any files.
+    classify.reset_mock()
+    entries = file_index.scan(tree)
+    classify.assert_not_called()
+
+    # Once a file has changed, it is classified again.
+    create_file(tree / "pkg/thin.so", mach_o_content("x86_64", b"intel"), mode="wb")
+    os.utime(tree / "pkg/thin.so", ns=(0, entries[tree / "module.py"].mtime_ns + 1))
+    entries = file_index.scan(tree)
+    classify.assert_called_once_with(tree / "pkg/thin.so", mock.ANY)
+    assert entries[tree / "pkg/thin.so"].architectures == ("x86_64",)
+
+
+def test_update(file_index, tree, monkeypatch):
+    """Files that have been written can be classified again."""
+    file_index.scan(tree)
+
+    create_file(tree / "pkg/thin.so", b"\x7fELF", mode="wb")
+    assert file_index.update(tree / "pkg/thin.so").kind == FileIndex.ELF
+
+
+def test_update_like(file_index, tree, monkeypatch):
+    """If a file is a copy of a file that has been classified, the classification
+    is reused."""
+    file_index.scan(tree)
+    classify = mock.Mock(wraps=FileIndex.classify)
+    monkeypatch.setattr(FileIndex, "classify", classify)
+
+    create_file(tree / "copy.so", mach_o_content("arm64", b"arm"), mode="wb")
+    info = file_index.update(tree / "copy.so", like=tree / "pkg/thin.so")
+
+    classify.assert_not_called()
+    assert info.architectures == ("arm64",)
+    assert info.mtime_ns == (tree / "copy.so").stat().st_mtime_ns
+
+    # If the file doesn't match the size of the original, it is classified.
+    create_file(tree / "other.so", mach_o_content("x86_64", b"intel"), mode="wb")
+    info = file_index.update(tree / "other.so", like=tree / "pkg/thin.so")
+
+    classify.assert_called_once()
+    assert info.architectures == ("x86_64",)
@@ -0,0 +1,132 @@
+import os
+import sys
+
+import pytest
+
+from briefcase.platforms.macOS import utils
+from briefcase.platforms.macOS.utils import (
+    MachOError,
+    create_fat_mach_o,
+    mach_o_architectures,
+    thin_mach_o,
+)
+
+from ...utils import create_file, fat_mach_o_content, file_content, mach_o_content
+
+
+@pytest.fixture
+def sources(tmp_path):
+    return [
+        create_file(
+            tmp_path / "arm64/file.dylib",
+            mach_o_content("arm64", b"arm"),
+            mode="wb",
+            chmod=0o755,
+        ),
+        create_file(
+            tmp_path / "x86_64/file.dylib",
+            mach_o_content("x86_64", b"intel"),
+            mode="wb",
+        ),
+    ]
+
+
+def test_create(tmp_path, sources):
+    """A fat binary can be created from thin binaries."""
+    create_fat_mach_o(tmp_path / "file.dylib", sources)
+
+    # Slices are ordered by alignment, and aligned to the page size of the
+    # architecture; this is the same layout that lipo produces.
+    assert file_content(tmp_path / "file.dylib") == fat_mach_o_content(
+        [
+            ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+            ("arm64", mach_o_content("arm64", b"arm"), 14),
+        ]
+    )
+    # The permissions of the first source are used
+    if sys.platform != "win32":  # pragma: no-cover-if-is-windows
+        assert os.stat(tmp_path / "file.dylib").st_mode & 0o777 == 0o755
+
+    # The original binaries can be extracted from the fat binary.
+    for arch, source in [("arm64", sources[0]), ("x86_64", sources[1])]:
+        thin_mach_o(tmp_path / "file.dylib", arch, tmp_path / f"file.{arch}")
+        assert file_content(tmp_path / f"file.{arch}") == file_content(source)
+
+
+def test_create_single(tmp_path, sources):
+    """A fat binary can be created from a single thin binary."""
+    create_fat_mach_o(tmp_path / "file.dylib", sources[:1])
+
+    assert mach_o_architectures(tmp_path / "file.dylib") == (True, ["arm64"])
+
+
+def test_create_from_fat(tmp_path, sources):
+    """The slices of a fat source are preserved."""
+    create_file(
+        tmp_path / "i386/file.dylib",
+        fat_mach_o_content(
+            [
+                ("i386", mach_o_content("i386", b"old"), 12),
+                ("arm64e", mach_o_content("arm64e", b"new"), 14),
+            ]
+        ),
+        mode="wb",
+    )
+
+    create_fat_mach_o(
+        tmp_path / "file.dylib",
+        [sources[1], tmp_path / "i386/file.dylib"],
+    )
+
+    assert file_content(tmp_path / "file.dylib") == fat_mach_o_content(
+        [
+            ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+            ("i386", mach_o_content("i386", b"old"), 12),
+            ("arm64e", mach_o_content("arm64e", b"new"), 14),
+        ]
+    )
+
+
+def test_create_fat_64(monkeypatch, tmp_path, sources):
+    """If the slices can't be described by a 32-bit fat header, a 64-bit header is
+    used."""
+    monkeypatch.setattr(utils, "MAX_FAT_32_OFFSET", 1024)
+
+    create_fat_mach_o(tmp_path / "file.dylib", sources)
+
+    assert file_content(tmp_path / "file.dylib") == fat_mach_o_content(
+        [
+            ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+            ("arm64", mach_o_content("arm64", b"arm"), 14),
+        ],
+        fat_64=True,
+    )
+
+
+def test_duplicate_arch(tmp_path, sources):
+    """If more than one source provides an architecture, an error is raised."""
+    create_file(
+        tmp_path / "other/file.dylib",
+        mach_o_content("arm64", b"other"),
+        mode="wb",
+    )
+
+    with pytest.raises(
+        MachOError,
+        match=r"More than one source provides the arm64 architecture",
+    ):
+        create_fat_mach_o(
+            tmp_path / "file.dylib",
+            [*sources, tmp_path / "other/file.dylib"],
+        )
+
+
+def test_not_mach_o(tmp_path, sources):
+    """If a source isn't a Mach-O binary, an error is raised."""
+    create_file(tmp_path / "other/file.dylib", b"not a binary", mode="wb")
+
+    with pytest.raises(MachOError, match=r"Not a Mach-O file"):
+        create_fat_mach_o(
+            tmp_path / "file.dylib",
+            [*sources, tmp_path / "other/file.dylib"],
+        )
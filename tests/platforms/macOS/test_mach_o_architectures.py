@@ -0,0 +1,111 @@
+import struct
+
+import pytest
+
+from briefcase.platforms.macOS.utils import (
+    MachOError,
+    MachOSlice,
+    mach_o_architectures,
+    read_mach_o,
+)
+
+from ...utils import create_file, fat_mach_o_content, mach_o_content
+
+
+@pytest.mark.parametrize(
+    ("content", "arch"),
+    [
+        (mach_o_content("x86_64", b"body"), "x86_64"),
+        (mach_o_content("arm64", b"body"), "arm64"),
+        # The capability bits of the subtype are ignored
+        (mach_o_content("arm64e", b"body"), "arm64e"),
+        (mach_o_content("i386", b"body"), "i386"),
+        # Big-endian binaries are supported
+        (mach_o_content("ppc", b"body", byte_order=">"), "ppc"),
+    ],
+)
+def test_thin(tmp_path, content, arch):
+    """The architecture of a thin binary can be determined."""
+    create_file(tmp_path / "file.dylib", content, mode="wb")
+
+    assert mach_o_architectures(tmp_path / "file.dylib") == (False, [arch])
+
+
+@pytest.mark.parametrize("fat_64", [True, False])
+def test_fat(tmp_path, fat_64):
+    """The architectures of a fat binary can be determined."""
+    create_file(
+        tmp_path / "file.dylib",
+        fat_mach_o_content(
+            [
+                ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+                ("arm64", mach_o_content("arm64", b"arm"), 14),
+            ],
+            fat_64=fat_64,
+        ),
+        mode="wb",
+    )
+
+    assert mach_o_architectures(tmp_path / "file.dylib") == (
+        True,
+        ["x86_64", "arm64"],
+    )
+
+
+def test_slices(tmp_path):
+    """The location and alignment of each slice is read from the fat header."""
+    create_file(
+        tmp_path / "file.dylib",
+        fat_mach_o_content(
+            [
+                ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+                ("arm64", mach_o_content("arm64", b"arm"), 14),
+            ]
+        ),
+        mode="wb",
+    )
+
+    with (tmp_path / "file.dylib").open("rb") as f:
+        assert read_mach_o(f) == (
+            True,
+            [
+                MachOSlice("x86_64", 0x01000007, 3, 4096, 37, 12),
+                MachOSlice("arm64", 0x0100000C, 0, 16384, 35, 14),
+            ],
+        )
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (b"", r"File is too small to be a Mach-O file"),
+        (b"#!/bin/sh\necho hello\n", r"Not a Mach-O file"),
+        # A Java class file has the same magic as a fat binary.
+        (b"\xca\xfe\xba\xbe\x00\x00\x00\x34" + b"\x00" * 32, r"Not a fat Mach-O file"),
+        # A fat header with no slices
+        (b"\xca\xfe\xba\xbe\x00\x00\x00\x00" + b"\x00" * 32, r"Not a fat Mach-O file"),
+        # A fat header that describes more slices than the file contains
+        (
+            b"\xca\xfe\xba\xbe\x00\x00\x00\x02"
+            + struct.pack(">IIIII", 0x0100000C, 0, 48, 4, 14),
+            r"Fat header is truncated",
+        ),
+        # A fat header that describes a slice past the end of the file
+        (
+            b"\xca\xfe\xba\xbe\x00\x00\x00\x01"
+            + struct.pack(">IIIII", 0x0100000C, 0, 28, 100, 14),
+            r"Fat header describes a slice past the end of file",
+        ),
+        # An architecture that isn't known
+        (
+            struct.pack("<III", 0xFEEDFACF, 0x01000042, 0),
+            r"Unknown architecture \(CPU type 16777282, subtype 0\)",
+        ),
+    ],
+)
+def test_not_mach_o(tmp_path, content, message):
+    """If a file isn't a Mach-O file that can be processed, an error is raised."""
+    create_file(tmp_path / "file.dylib", content, mode="wb")
+
+    with pytest.raises(MachOError, match=message):
+        mach_o_architectures(tmp_path / "file.dylib")
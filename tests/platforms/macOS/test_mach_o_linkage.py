@@ -0,0 +1,119 @@
+import struct
+
+import pytest
+
+from briefcase.platforms.macOS.utils import MachOError, mach_o_linkage
+
+from ...utils import create_file, fat_mach_o_content, mach_o_content
+
+
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+def test_thin(tmp_path, byte_order):
+    """The linked libraries and runpath search paths of a thin binary can be
+    read."""
+    create_file(
+        tmp_path / "file.dylib",
+        mach_o_content(
+            "arm64",
+            b"body",
+            byte_order=byte_order,
+            dylibs=["@rpath/libfirst.dylib", "/usr/lib/libSystem.B.dylib"],
+            rpaths=["@loader_path/../lib"],
+        ),
+        mode="wb",
+    )
+
+    assert mach_o_linkage(tmp_path / "file.dylib") == (
+        ["@rpath/libfirst.dylib", "/usr/lib/libSystem.B.dylib"],
+        ["@loader_path/../lib"],
+    )
+
+
+def test_32_bit(tmp_path):
+    """The linkage of a 32-bit binary can be read."""
+    name = b"@rpath/libfirst.dylib\0\0\0"
+    create_file(
+        tmp_path / "file.dylib",
+        struct.pack("<IIIIIII", 0xFEEDFACE, 0x7, 3, 6, 1, 24 + len(name), 0)
+        + struct.pack("<IIIIII", 0xC, 24 + len(name), 24, 0, 0, 0)
+        + name,
+        mode="wb",
+    )
+
+    assert mach_o_linkage(tmp_path / "file.dylib") == (["@rpath/libfirst.dylib"], [])
+
+
+def test_fat(tmp_path):
+    """The linkage of every slice of a fat binary is read, without duplicates."""
+    create_file(
+        tmp_path / "file.dylib",
+        fat_mach_o_content(
+            [
+                (
+                    "x86_64",
+                    mach_o_content(
+                        "x86_64",
+                        dylibs=["@rpath/libfirst.dylib", "@rpath/libintel.dylib"],
+                        rpaths=["@loader_path"],
+                    ),
+                    12,
+                ),
+                (
+                    "arm64",
+                    mach_o_content(
+                        "arm64",
+                        dylibs=["@rpath/libfirst.dylib", "@rpath/libarm.dylib"],
+                        rpaths=["@loader_path"],
+                    ),
+                    14,
+                ),
+            ]
+        ),
+        mode="wb",
+    )
+
+    assert mach_o_linkage(tmp_path / "file.dylib") == (
+        ["@rpath/libfirst.dylib", "@rpath/libintel.dylib", "@rpath/libarm.dylib"],
+        ["@loader_path"],
+    )
+
+
+def header(ncmds, sizeofcmds):
+    """A 64-bit Mach-O header describing load commands."""
+    return struct.pack(
+        "<IIIIIIII", 0xFEEDFACF, 0x0100000C, 0, 6, ncmds, sizeofcmds, 0, 0
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (b"not a binary", r"Not a Mach-O file"),
+        # A fat file whose slice isn't a Mach-O file
+        (
+            b"\xca\xfe\xba\xbe\x00\x00\x00\x01"
+            + struct.pack(">IIIII", 0x0100000C, 0, 28, 12, 0)
+            + b"not a binary",
+            r"Fat file contains a slice that isn't a Mach-O file",
+        ),
+        # The header describes more load command data than the file contains
+        (header(1, 64) + b"\x00" * 16, r"Load commands are truncated"),
+        # The header describes more load commands than there is data for
+        (header(2, 8) + struct.pack("<II", 0x1, 8), r"Load commands are truncated"),
+        # A load command with an invalid size
+        (
+            header(1, 8) + struct.pack("<II", 0x1, 4),
+            r"Load command has an invalid size",
+        ),
+        (
+            header(1, 8) + struct.pack("<II", 0x1, 16),
+            r"Load command has an invalid size",
+        ),
+    ],
+)
+def test_invalid(tmp_path, content, message):
+    """If the load commands can't be read, an error is raised."""
+    create_file(tmp_path / "file.dylib", content, mode="wb")
+
+    with pytest.raises(MachOError, match=message):
+        mach_o_linkage(tmp_path / "file.dylib")
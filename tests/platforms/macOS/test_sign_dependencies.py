@@ -0,0 +1,176 @@
+import sys
+
+import pytest
+
+from briefcase.platforms.macOS.utils import sign_dependencies
+
+from ...utils import create_file, mach_o_content
+
+
+@pytest.fixture
+def app_path(tmp_path):
+    app_path = tmp_path / "First App.app"
+    frameworks_path = app_path / "Contents/Frameworks"
+    pkg_path = app_path / "Contents/Resources/app_packages/pkg"
+
+    # A framework, with the usual versioning symlinks.
+    create_file(
+        frameworks_path / "Lib.framework/Versions/A/Lib",
+        mach_o_content("arm64", dylibs=["/usr/lib/libSystem.B.dylib"]),
+        mode="wb",
+    )
+    (frameworks_path / "Lib.framework/Versions/Current").symlink_to("A")
+    (frameworks_path / "Lib.framework/Lib").symlink_to("Versions/Current/Lib")
+
+    # A module that links against the framework (through an rpath, and the
+    # framework symlinks), and a library in a subfolder.
+    create_file(
+        pkg_path / "module.so",
+        mach_o_content(
+            "arm64",
+            dylibs=[
+                "@rpath/Lib.framework/Lib",
+                "@loader_path/.dylibs/libdep.dylib",
+                "/usr/lib/libSystem.B.dylib",
+                # An install name that can only be found on the library search path
+                "libbare.dylib",
+            ],
+            rpaths=["@loader_path/missing", "@loader_path/../../../Frameworks"],
+        ),
+        mode="wb",
+    )
+    create_file(
+        pkg_path / ".dylibs/libdep.dylib",
+        mach_o_content("arm64"),
+        mode="wb",
+    )
+
+    # An embedded app whose executable links against a library in the app.
+    create_file(
+        pkg_path / "Helper.app/Contents/MacOS/Helper",
+        mach_o_content(
+            "arm64",
+            dylibs=["@executable_path/../Frameworks/libhelp.dylib"],
+        ),
+        mode="wb",
+    )
+    create_file(
+        pkg_path / "Helper.app/Contents/Frameworks/libhelp.dylib",
+        mach_o_content("arm64"),
+        mode="wb",
+    )
+
+    # A file with a Mach-O magic number that isn't a Mach-O binary.
+    create_file(pkg_path / "unknown.binary", b"\xca\xfe\xba\xbeother", mode="wb")
+
+    return app_path
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Symlinks can't be reliably created on Windows",
+)
+def test_sign_dependencies(app_path):
+    """Targets depend on the targets they contain, and the libraries they link."""
+    frameworks_path = app_path / "Contents/Frameworks"
+    pkg_path = app_path / "Contents/Resources/app_packages/pkg"
+
+    assert sign_dependencies(
+        [
+            frameworks_path / "Lib.framework/Versions/A/Lib",
+            pkg_path / "module.so",
+            pkg_path / ".dylibs/libdep.dylib",
+            pkg_path / "Helper.app/Contents/MacOS/Helper",
+            pkg_path / "Helper.app/Contents/Frameworks/libhelp.dylib",
+            pkg_path / "unknown.binary",
+            frameworks_path / "Lib.framework",
+            pkg_path / "Helper.app",
+            app_path,
+        ]
+    ) == {
+        frameworks_path / "Lib.framework/Versions/A/Lib": set(),
+        # The module must be signed after the framework it links against, and
+        # the library in a subfolder.
+        pkg_path / "module.so": {
+            frameworks_path / "Lib.framework/Versions/A/Lib",
+            frameworks_path / "Lib.framework",
+            pkg_path / ".dylibs/libdep.dylib",
+        },
+        pkg_path / ".dylibs/libdep.dylib": set(),
+        # The helper must be signed after the library it uses; but the library
+        # is in the same bundle, so the bundle isn't a dependency.
+        pkg_path / "Helper.app/Contents/MacOS/Helper": {
+            pkg_path / "Helper.app/Contents/Frameworks/libhelp.dylib",
+        },
+        pkg_path / "Helper.app/Contents/Frameworks/libhelp.dylib": set(),
+        pkg_path / "unknown.binary": set(),
+        # Bundles must be signed after their content.
+        frameworks_path / "Lib.framework": {
+            frameworks_path / "Lib.framework/Versions/A/Lib",
+        },
+        pkg_path / "Helper.app": {
+            pkg_path / "Helper.app/Contents/MacOS/Helper",
+            pkg_path / "Helper.app/Contents/Frameworks/libhelp.dylib",
+        },
+        app_path: {
+            frameworks_path / "Lib.framework",
+            pkg_path / "module.so",
+            pkg_path / ".dylibs/libdep.dylib",
+            pkg_path / "unknown.binary",
+            pkg_path / "Helper.app",
+        },
+    }
+
+
+def test_executable_path_outside_app(tmp_path):
+    """If a binary isn't in an app, links relative to the executable are
+    ignored."""
+    create_file(
+        tmp_path / "Lib.framework/libfirst.dylib",
+        mach_o_content("arm64", dylibs=["@executable_path/libsecond.dylib"]),
+        mode="wb",
+    )
+    create_file(
+        tmp_path / "Lib.framework/libsecond.dylib",
+        mach_o_content("arm64"),
+        mode="wb",
+    )
+
+    assert sign_dependencies(
+        [
+            tmp_path / "Lib.framework/libfirst.dylib",
+            tmp_path / "Lib.framework/libsecond.dylib",
+        ]
+    ) == {
+        tmp_path / "Lib.framework/libfirst.dylib": set(),
+        tmp_path / "Lib.framework/libsecond.dylib": set(),
+    }
+
+
+def test_cycle(tmp_path):
+    """If libraries link each other, only containment is used."""
+    create_file(
+        tmp_path / "Lib.framework/libfirst.dylib",
+        mach_o_content("arm64", dylibs=["@loader_path/libsecond.dylib"]),
+        mode="wb",
+    )
+    create_file(
+        tmp_path / "Lib.framework/libsecond.dylib",
+        mach_o_content("arm64", dylibs=["@loader_path/libfirst.dylib"]),
+        mode="wb",
+    )
+
+    assert sign_dependencies(
+        [
+            tmp_path / "Lib.framework/libfirst.dylib",
+            tmp_path / "Lib.framework/libsecond.dylib",
+            tmp_path / "Lib.framework",
+        ]
+    ) == {
+        tmp_path / "Lib.framework/libfirst.dylib": set(),
+        tmp_path / "Lib.framework/libsecond.dylib": set(),
+        tmp_path / "Lib.framework": {
+            tmp_path / "Lib.framework/libfirst.dylib",
+            tmp_path / "Lib.framework/libsecond.dylib",
+        },
+    }
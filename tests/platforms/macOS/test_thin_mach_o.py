@@ -0,0 +1,57 @@
+import io
+import os
+import sys
+
+import pytest
+
+from briefcase.platforms.macOS.utils import MachOError, _copy_range, thin_mach_o
+
+from ...utils import create_file, fat_mach_o_content, file_content, mach_o_content
+
+
+@pytest.mark.parametrize("fat_64", [True, False])
+@pytest.mark.parametrize("arch", ["x86_64", "arm64"])
+def test_thin(tmp_path, arch, fat_64):
+    """A slice can be extracted from a fat binary."""
+    create_file(
+        tmp_path / "file.dylib",
+        fat_mach_o_content(
+            [
+                ("x86_64", mach_o_content("x86_64", b"intel"), 12),
+                ("arm64", mach_o_content("arm64", b"arm"), 14),
+            ],
+            fat_64=fat_64,
+        ),
+        mode="wb",
+        chmod=0o755,
+    )
+
+    thin_mach_o(tmp_path / "file.dylib", arch, tmp_path / "file.dylib.thin")
+
+    assert file_content(tmp_path / "file.dylib.thin") == mach_o_content(
+        arch, {"x86_64": b"intel", "arm64": b"arm"}[arch]
+    )
+    # The permissions of the original file are preserved
+    if sys.platform != "win32":  # pragma: no-cover-if-is-windows
+        assert os.stat(tmp_path / "file.dylib.thin").st_mode & 0o777 == 0o755
+
+
+def test_thin_missing_arch(tmp_path):
+    """If the binary doesn't contain the requested architecture, an error is
+    raised."""
+    create_file(
+        tmp_path / "file.dylib",
+        fat_mach_o_content([("x86_64", mach_o_content("x86_64", b"intel"), 12)]),
+        mode="wb",
+    )
+
+    with pytest.raises(MachOError, match=r"does not contain a arm64 slice"):
+        thin_mach_o(tmp_path / "file.dylib", "arm64", tmp_path / "file.dylib.thin")
+
+    assert not (tmp_path / "file.dylib.thin").exists()
+
+
+def test_truncated_copy():
+    """If the source of a copy is shorter than expected, an error is raised."""
+    with pytest.raises(MachOError, match=r"File is truncated"):
+        _copy_range(io.BytesIO(b"short"), io.BytesIO(), 2, 10)
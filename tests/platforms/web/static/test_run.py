@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.integrations.file_watcher import FileWatcher
 from briefcase.platforms.web.static import (
     HTTPHandler,
     LocalHTTPServer,
@@ -125,6 +126,68 @@ def test_run(monkeypatch, run_command, first_app_built):
     mock_server_close.assert_called_once_with()
 
 
+@pytest.fixture
+def mock_server(monkeypatch):
+    """Mock the creation and operation of the HTTP server."""
+    monkeypatch.setattr(HTTPServer, "__init__", mock.MagicMock(spec_set=HTTPServer))
+
+    socket = mock.MagicMock()
+    socket.getsockname.return_value = ("127.0.0.1", "8080")
+    monkeypatch.setattr(LocalHTTPServer, "socket", socket, raising=False)
+
+    server = mock.MagicMock()
+    for name in ["serve_forever", "handle_request", "shutdown", "server_close"]:
+        monkeypatch.setattr(HTTPServer, name, getattr(server, name))
+
+    monkeypatch.setattr(webbrowser, "open_new_tab", server.open_new_tab)
+    return server
+
+
+def test_run_watched(mock_server, run_command, first_app_built):
+    """When watching for changes, the server handles requests until the app's code
+    changes, and the browser is only opened once."""
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    run_command.file_watcher.changed.side_effect = [False, False, True, False, True]
+
+    for _ in range(2):
+        run_command.run_app(
+            first_app_built,
+            passthrough=[],
+            host="localhost",
+            port=8080,
+            open_browser=True,
+        )
+
+    # The browser was only opened the first time the server was started.
+    mock_server.open_new_tab.assert_called_once_with("http://127.0.0.1:8080")
+
+    # Requests were handled until the code changed, and the server was closed.
+    assert mock_server.handle_request.call_count == 3
+    mock_server.serve_forever.assert_not_called()
+    mock_server.shutdown.assert_not_called()
+    assert mock_server.server_close.call_count == 2
+
+
+def test_run_watched_ctrl_c(mock_server, run_command, first_app_built):
+    """When watching for changes, Ctrl-C stops the server, and is passed on so that
+    watching stops."""
+    run_command.file_watcher = mock.MagicMock(spec=FileWatcher)
+    run_command.file_watcher.changed.return_value = False
+    mock_server.handle_request.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_command.run_app(
+            first_app_built,
+            passthrough=[],
+            host="localhost",
+            port=8080,
+            open_browser=False,
+        )
+
+    mock_server.shutdown.assert_not_called()
+    mock_server.server_close.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     "exception",
     [
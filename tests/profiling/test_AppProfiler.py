@@ -0,0 +1,99 @@
+import cProfile
+
+import pytest
+
+from briefcase.profiling import AppProfiler
+
+
+@pytest.fixture
+def profile_path(tmp_path):
+    return tmp_path / "logs/first.prof"
+
+
+def test_cprofile(first_app, profile_path):
+    """In cProfile mode, the app's main module is started by cProfile."""
+    profiler = AppProfiler(AppProfiler.CPROFILE, profile_path)
+
+    assert profiler.main_module(first_app) == "cProfile"
+    assert profiler.arguments(first_app) == ["-o", str(profile_path), "-m", "first"]
+    assert profiler.environment() == {}
+
+
+def test_importtime(first_app, profile_path):
+    """In importtime mode, the app's main module is started as normal, with import
+    timing enabled."""
+    profiler = AppProfiler(AppProfiler.IMPORTTIME, profile_path)
+
+    assert profiler.main_module(first_app) == "first"
+    assert profiler.arguments(first_app) == []
+    assert profiler.environment() == {"PYTHONPROFILEIMPORTTIME": "1"}
+
+
+def test_filter(profile_path):
+    """Import timing output is recorded, and passed through to the log filter."""
+    profiler = AppProfiler(AppProfiler.IMPORTTIME, profile_path)
+
+    def log_filter(line):
+        yield line.upper()
+
+    filter_func = profiler.filter(log_filter)
+
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       145 |        145 |   _io",
+        "Hello world",
+        "import time:      1234 |      20345 |     first.app",
+    ]
+    output = [out for line in lines for out in filter_func(line)]
+
+    assert output == [line.upper() for line in lines]
+    assert profiler.import_times == [(145, 145, "_io"), (20345, 1234, "first.app")]
+
+
+def test_importtime_summary(profile_path):
+    """The slowest imports are summarized."""
+    profiler = AppProfiler(AppProfiler.IMPORTTIME, profile_path)
+    profiler.import_times = [
+        (145, 145, "_io"),
+        (20345, 1234, "first.app"),
+        (500, 400, "json"),
+    ]
+
+    assert profiler.summary() == (
+        "cumulative (ms)   self (ms)  module\n"
+        "           20.3         1.2  first.app\n"
+        "            0.5         0.4  json\n"
+        "            0.1         0.1  _io"
+    )
+
+
+def test_importtime_summary_limit(monkeypatch, profile_path):
+    """The summary is limited in length."""
+    monkeypatch.setattr(AppProfiler, "SUMMARY_LENGTH", 2)
+    profiler = AppProfiler(AppProfiler.IMPORTTIME, profile_path)
+    profiler.import_times = [(i, i, f"module{i}") for i in range(10)]
+
+    assert profiler.summary().splitlines()[1:] == [
+        "            0.0         0.0  module9",
+        "            0.0         0.0  module8",
+    ]
+
+
+def test_cprofile_summary(profile_path):
+    """The functions with the highest cumulative time are summarized."""
+    profile_path.parent.mkdir(parents=True)
+    cProfile.run("sorted(range(100))", str(profile_path))
+    profiler = AppProfiler(AppProfiler.CPROFILE, profile_path)
+
+    summary = profiler.summary()
+
+    assert "Ordered by: cumulative time" in summary
+    assert "builtins.sorted" in summary
+
+
+@pytest.mark.parametrize("mode", AppProfiler.MODES)
+def test_no_summary(mode, profile_path):
+    """If no profile information was captured, there's no summary."""
+    profiler = AppProfiler(mode, profile_path)
+
+    assert profiler.summary() is None
@@ -0,0 +1,83 @@
+import pytest
+
+from briefcase.commands.run import LogFilter
+from briefcase.integrations.subprocess import StopStreaming
+from briefcase.profiling import StartupBenchmark
+
+
+def test_startup_marker():
+    """If there is a startup marker, the app has started when the marker is seen."""
+    benchmark = StartupBenchmark(runs=1, startup_marker=r"^App \w+$", drop_caches=False)
+    exit_filter = benchmark.exit_filter(
+        LogFilter.test_filter(
+            LogFilter.DEFAULT_EXIT_REGEX,
+            marker=LogFilter.DEFAULT_EXIT_MARKER,
+        )
+    )
+    assert exit_filter.marker is None
+
+    benchmark.start()
+    assert benchmark.running
+
+    # Output that doesn't match the marker is ignored; including test results.
+    assert exit_filter("Hello world\nApp") is None
+    assert exit_filter(">>>>>>>>>> EXIT 0 <<<<<<<<<<") is None
+    assert benchmark.running
+
+    # When the marker is seen, streaming stops, and the startup time is recorded.
+    with pytest.raises(StopStreaming):
+        exit_filter("Hello world\nApp started")
+
+    assert not benchmark.running
+    assert benchmark.marker_seen
+    assert len(benchmark.durations) == 1
+    assert benchmark.durations[0] >= 0
+
+    # Starting another run resets the state of the run.
+    benchmark.start()
+    assert benchmark.running
+    assert not benchmark.marker_seen
+
+
+def test_exit_sentinel():
+    """If there's no startup marker, the app has started when it reports a test
+    result."""
+    benchmark = StartupBenchmark(runs=1, startup_marker=None, drop_caches=False)
+    exit_filter = benchmark.exit_filter(
+        LogFilter.test_filter(
+            LogFilter.DEFAULT_EXIT_REGEX,
+            marker=LogFilter.DEFAULT_EXIT_MARKER,
+        )
+    )
+    assert exit_filter.marker == ">>>>>>>>>> EXIT "
+
+    benchmark.start()
+    assert exit_filter("Hello world") is None
+    assert benchmark.running
+
+    # The test result is returned, and the startup time is recorded.
+    assert exit_filter(">>>>>>>>>> EXIT 3 <<<<<<<<<<") == 3
+    assert not benchmark.running
+    assert not benchmark.marker_seen
+    assert len(benchmark.durations) == 1
+
+
+@pytest.mark.parametrize(
+    ("durations", "expected"),
+    [
+        ([0.5], {"min": 0.5, "median": 0.5, "p95": 0.5}),
+        ([0.5, 0.1, 0.3], {"min": 0.1, "median": 0.3, "p95": 0.5}),
+        ([0.4, 0.1, 0.3, 0.2], {"min": 0.1, "median": 0.25, "p95": 0.4}),
+        (list(range(20, 0, -1)), {"min": 1, "median": 10.5, "p95": 19}),
+    ],
+)
+def test_results(durations, expected):
+    """The minimum, median and 95th percentile startup times are computed."""
+    benchmark = StartupBenchmark(
+        runs=len(durations),
+        startup_marker=None,
+        drop_caches=False,
+    )
+    benchmark.durations = durations
+
+    assert benchmark.results() == pytest.approx(expected)
@@ -0,0 +1,292 @@
+import json
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+from briefcase.pytest_plugins import briefcase_changed_tests
+from briefcase.pytest_plugins.briefcase_changed_tests import FileRecorder
+
+from ..utils import create_file
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    project_path = tmp_path / "project"
+    create_file(project_path / "src/sample/__init__.py", "")
+    create_file(project_path / "src/sample/a.py", "def a():\n    return 1\n")
+    create_file(project_path / "src/sample/b.py", "def b():\n    return 2\n")
+    create_file(project_path / "src/helper.py", "VALUE = 3\n")
+    create_file(
+        project_path / "tests/test_a.py",
+        "from sample.a import a\n\ndef test_a():\n    assert a() == 1\n",
+    )
+    create_file(
+        project_path / "tests/test_b.py",
+        "from sample import b\n"
+        "import helper\n\n"
+        "def test_b():\n    assert b.b() == 2\n\n"
+        "def test_helper():\n    assert helper.VALUE == 3\n",
+    )
+    return project_path
+
+
+@pytest.fixture
+def map_path(tmp_path):
+    return tmp_path / "map.json"
+
+
+@pytest.fixture
+def run_tests(tmp_path, project_path, map_path, monkeypatch):
+    """Run the sample project's test suite with the plugin enabled."""
+
+    def run_tests(changed, token="token"):
+        config_path = tmp_path / "config.json"
+        with config_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "map_path": os.fspath(map_path),
+                    "token": token,
+                    "roots": [
+                        os.path.realpath(project_path / "src/sample"),
+                        os.path.realpath(project_path / "src/helper.py"),
+                        os.path.realpath(project_path / "tests"),
+                    ],
+                    "changed": (
+                        None
+                        if changed is None
+                        else [os.path.realpath(project_path / path) for path in changed]
+                    ),
+                },
+                f,
+            )
+
+        modules = set(sys.modules)
+        try:
+            with monkeypatch.context() as m:
+                m.setenv(briefcase_changed_tests.CONFIG_ENV_VAR, os.fspath(config_path))
+                m.syspath_prepend(project_path / "src")
+                return pytest.main(
+                    [
+                        "-p",
+                        "no:cacheprovider",
+                        "--import-mode=importlib",
+                        "--rootdir",
+                        os.fspath(project_path),
+                        os.fspath(project_path / "tests"),
+                    ],
+                    plugins=[briefcase_changed_tests],
+                )
+        finally:
+            # Forget the sample project's modules, so each run imports them again.
+            for name in set(sys.modules) - modules:
+                del sys.modules[name]
+
+    return run_tests
+
+
+def read_map(map_path, project_path):
+    """Read the test map, with paths relative to the project."""
+    with map_path.open(encoding="utf-8") as f:
+        test_map = json.load(f)
+    project = os.path.join(os.path.realpath(project_path), "")
+    test_map["tests"] = {
+        node_id: [path.removeprefix(project).replace(os.sep, "/") for path in files]
+        for node_id, files in test_map["tests"].items()
+    }
+    return test_map
+
+
+def ran_tests(output):
+    """Find the names of the tests that were run, from pytest's output."""
+    return sorted(
+        line.split()[0].split("::")[-1]
+        for line in output.splitlines()
+        if "::test_" in line.split(" ", 1)[0]
+    )
+
+
+@pytest.fixture
+def verbose(monkeypatch):
+    monkeypatch.setenv("PYTEST_ADDOPTS", "-v")
+
+
+def test_full_run(run_tests, project_path, map_path, verbose, capsys):
+    """On a full run, every test is run, and the files used by each test are
+    recorded."""
+    assert run_tests(changed=None) == pytest.ExitCode.OK
+    assert ran_tests(capsys.readouterr().out) == ["test_a", "test_b", "test_helper"]
+
+    assert read_map(map_path, project_path) == {
+        "version": 1,
+        "token": "token",
+        "tests": {
+            "tests/test_a.py::test_a": [
+                "src/sample/__init__.py",
+                "src/sample/a.py",
+                "tests/test_a.py",
+            ],
+            "tests/test_b.py::test_b": [
+                "src/helper.py",
+                "src/sample/__init__.py",
+                "src/sample/b.py",
+                "tests/test_b.py",
+            ],
+            "tests/test_b.py::test_helper": [
+                "src/helper.py",
+                "src/sample/__init__.py",
+                "src/sample/b.py",
+                "tests/test_b.py",
+            ],
+        },
+        "failed": [],
+    }
+
+
+@pytest.mark.parametrize(
+    ("changed", "expected"),
+    [
+        (["src/sample/a.py"], ["test_a"]),
+        (["src/sample/b.py"], ["test_b", "test_helper"]),
+        (["src/sample/__init__.py"], ["test_a", "test_b", "test_helper"]),
+        (["src/sample/other.py"], []),
+    ],
+)
+def test_changed(run_tests, project_path, map_path, verbose, capsys, changed, expected):
+    """Only the tests that use a changed file are run."""
+    run_tests(changed=None)
+    full_map = read_map(map_path, project_path)
+    capsys.readouterr()
+
+    assert run_tests(changed=changed, token="new") == pytest.ExitCode.OK
+    assert ran_tests(capsys.readouterr().out) == expected
+
+    # The map was updated, and still describes every test.
+    new_map = read_map(map_path, project_path)
+    assert new_map["token"] == "new"
+    assert new_map["tests"] == full_map["tests"]
+
+
+def test_new_test(run_tests, project_path, verbose, capsys):
+    """A new test is run, even if it doesn't use a changed file."""
+    run_tests(changed=None)
+    create_file(project_path / "tests/test_c.py", "def test_c():\n    pass\n")
+    capsys.readouterr()
+
+    run_tests(changed=[])
+    assert ran_tests(capsys.readouterr().out) == ["test_c"]
+
+
+def test_failed_test(run_tests, project_path, map_path, verbose, capsys):
+    """A test that failed is run again until it passes."""
+    create_file(project_path / "src/sample/a.py", "def a():\n    return 0\n")
+    assert run_tests(changed=None) == pytest.ExitCode.TESTS_FAILED
+    assert read_map(map_path, project_path)["failed"] == ["tests/test_a.py::test_a"]
+    capsys.readouterr()
+
+    # The test fails again, even though nothing has changed.
+    assert run_tests(changed=[]) == pytest.ExitCode.TESTS_FAILED
+    assert ran_tests(capsys.readouterr().out) == ["test_a"]
+    assert read_map(map_path, project_path)["failed"] == ["tests/test_a.py::test_a"]
+
+    # Once the test passes, it isn't run again.
+    create_file(project_path / "src/sample/a.py", "def a():\n    return 1\n")
+    assert run_tests(changed=["src/sample/a.py"]) == pytest.ExitCode.OK
+    assert read_map(map_path, project_path)["failed"] == []
+    capsys.readouterr()
+
+    assert run_tests(changed=[]) == pytest.ExitCode.OK
+    assert ran_tests(capsys.readouterr().out) == []
+
+
+def test_removed_test(run_tests, project_path, map_path):
+    """Tests that no longer exist are removed from the map."""
+    run_tests(changed=None)
+    (project_path / "tests/test_a.py").unlink()
+
+    run_tests(changed=["tests/test_a.py"])
+    assert list(read_map(map_path, project_path)["tests"]) == [
+        "tests/test_b.py::test_b",
+        "tests/test_b.py::test_helper",
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        '{"version": 0, "tests": {}, "failed": []}',
+        '{"version": 1}',
+    ],
+)
+def test_unusable_map(run_tests, map_path, verbose, capsys, content):
+    """If the previous map can't be used, every test is run."""
+    create_file(map_path, content)
+
+    run_tests(changed=[])
+    assert ran_tests(capsys.readouterr().out) == ["test_a", "test_b", "test_helper"]
+
+
+def test_broken_run(run_tests, project_path, map_path):
+    """If the test suite can't be collected, the map isn't written."""
+    create_file(project_path / "tests/test_a.py", "import missing_module\n")
+
+    assert run_tests(changed=None) == pytest.ExitCode.INTERRUPTED
+    assert not map_path.exists()
+
+
+def test_recorder():
+    """The recorder reports the files containing code that was executed."""
+    recorder = FileRecorder()
+    try:
+        recorder.start()
+        json.dumps({})
+        filenames = recorder.stop()
+
+        assert json.__file__.replace(".pyc", ".py") in {
+            filename.replace(".pyc", ".py") for filename in filenames
+        }
+
+        # A second recording reports the same code again.
+        recorder.start()
+        json.dumps({})
+        assert recorder.stop() == filenames
+    finally:
+        recorder.close()
+
+
+@pytest.mark.skipif(
+    not hasattr(sys, "monitoring"), reason="sys.monitoring requires Python 3.12"
+)
+def test_recorder_tool_id_in_use():  # pragma: no-cover-if-lt-py312
+    """If a monitoring tool ID is in use, another is used."""
+    sys.monitoring.use_tool_id(FileRecorder.TOOL_IDS[0], "other")
+    try:
+        recorder = FileRecorder()
+        assert recorder.tool_id == FileRecorder.TOOL_IDS[1]
+        recorder.close()
+    finally:
+        sys.monitoring.free_tool_id(FileRecorder.TOOL_IDS[0])
+
+
+def test_recorder_profile():
+    """The profile function records the file of each function that is called."""
+    recorder = FileRecorder()
+    recorder.close()
+
+    frame = sys._getframe()
+    recorder._profile(frame, "call", None)
+    recorder._profile(frame.f_back, "return", None)
+
+    assert recorder.filenames == {frame.f_code.co_filename}
+
+
+def test_not_configured(monkeypatch):
+    """If the plugin isn't configured, it doesn't select tests."""
+    monkeypatch.delenv(briefcase_changed_tests.CONFIG_ENV_VAR, raising=False)
+    config = mock.MagicMock()
+
+    briefcase_changed_tests.pytest_configure(config)
+
+    config.pluginmanager.register.assert_not_called()
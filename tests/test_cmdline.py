@@ -486,7 +486,7 @@ def test_bare_command_help(capsys, macOS_console):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-C KEY=VALUE] [-v] [-V] [--no-input]\n"
-        "                                  [--log] [-a APP_NAME]\n"
+        "                                  [--log] [--plain] [-j JOBS] [-a APP_NAME]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -549,7 +549,7 @@ def test_command_explicit_platform_help(capsys, macOS_console):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-C KEY=VALUE] [-v] [-V] [--no-input]\n"
-        "                                  [--log] [-a APP_NAME]\n"
+        "                                  [--log] [--plain] [-j JOBS] [-a APP_NAME]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -606,7 +606,7 @@ def test_command_explicit_format_help(capsys, macOS_console):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-C KEY=VALUE] [-v] [-V] [--no-input]\n"
-        "                                  [--log] [-a APP_NAME]\n"
+        "                                  [--log] [--plain] [-j JOBS] [-a APP_NAME]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -669,8 +669,10 @@ def test_unknown_command_options(capsys, macOS_console):
 
     assert output.startswith(
         "usage: briefcase publish macOS Xcode [-h] [-C KEY=VALUE] [-v] [-V]\n"
-        "                                     [--no-input] [--log] [-a APP_NAME] [-u]\n"
-        "                                     [-p {Xcode}] [-c CHANNEL]\n"
+        "                                     [--no-input] [--log] [--plain]"
+        " [-j JOBS]\n"
+        "                                     [-a APP_NAME] [-u] [-p {Xcode}]\n"
+        "                                     [-c CHANNEL]\n"
         "briefcase publish macOS Xcode: error: unrecognized arguments: -x foobar"
     )
 
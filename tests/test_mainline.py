@@ -192,6 +192,31 @@ def test_interrupted_command_with_log(monkeypatch, pyproject_toml, tmp_path, cap
     assert len(list(tmp_path.glob(f"{Console.LOG_DIR}/briefcase.*.create.log"))) == 1
 
 
+def test_log_environment(monkeypatch, pyproject_toml, tmp_path, capsys):
+    """The size of the log can be limited with an environment variable."""
+    monkeypatch.setenv("BRIEFCASE_LOG_MAX_SIZE", "100000")
+    monkeypatch.setattr(sys, "argv", ["briefcase", "create", "--log"])
+
+    # Monkeypatch a keyboard interrupt into the create command
+    def interrupted_generate_app_template(self, app):
+        for i in range(2000):
+            self.console.debug(f"Generating part {i}")
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(
+        CreateCommand, "generate_app_template", interrupted_generate_app_template
+    )
+
+    assert main() == -42
+
+    # The log file only contains the most recent log content.
+    [log_file] = tmp_path.glob(f"{Console.LOG_DIR}/briefcase.*.create.log")
+    log = log_file.read_text(encoding="utf-8")
+    assert "bytes of earlier log output discarded" in log
+    assert "Generating part 0\n" not in log
+    assert "Generating part 1999" in log
+
+
 def test_test_failure(monkeypatch, pyproject_toml, tmp_path, capsys):
     """A test suite failure can be reported."""
     monkeypatch.setattr(sys, "argv", ["briefcase", "run", "--test"])
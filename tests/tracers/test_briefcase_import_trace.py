@@ -0,0 +1,175 @@
+import json
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from briefcase.commands.build import BuildCommand
+from briefcase.tracers import briefcase_import_trace
+from briefcase.tracers.briefcase_import_trace import UsageRecorder
+
+from ..utils import create_file
+
+
+@pytest.fixture
+def app_path(tmp_path):
+    app_path = tmp_path / "app"
+    create_file(app_path / "first/__init__.py", "")
+    create_file(app_path / "first/app.py", "import dep\n")
+    create_file(app_path / "first/widgets/__init__.py", "")
+    create_file(app_path / "first/widgets/button.py", "import widgetlib\n")
+    # A module that can't be imported on this platform
+    create_file(app_path / "first/broken.py", "raise ImportError('wrong platform')\n")
+    # The main module would start the app; it isn't imported
+    create_file(app_path / "first/__main__.py", "import notused\n")
+    create_file(
+        app_path / "first/smoke.py",
+        # Exits with an error if arguments are passed to the module
+        "import sys\nimport first.app\nsys.exit(len(sys.argv) - 1)\n",
+    )
+    return app_path
+
+
+@pytest.fixture
+def app_packages_path(tmp_path):
+    app_packages_path = tmp_path / "app_packages"
+    create_file(
+        app_packages_path / "dep/__init__.py",
+        "import os\n"
+        "with open(os.path.join(os.path.dirname(__file__), 'data/values.txt')) as f:\n"
+        "    VALUE = f.read()\n",
+    )
+    create_file(app_packages_path / "dep/data/values.txt", "42")
+    create_file(app_packages_path / "widgetlib.py", "")
+    create_file(app_packages_path / "notused/__init__.py", "")
+    create_file(app_packages_path / "viapth.py", "")
+    create_file(app_packages_path / "hook.pth", "import viapth\n")
+    return app_packages_path
+
+
+@pytest.fixture
+def isolated(monkeypatch):
+    """Run the script in this process, without installing an audit hook, and
+    without keeping the modules it imports."""
+    monkeypatch.setattr(sys, "path", sys.path.copy())
+    monkeypatch.setattr(sys, "argv", ["-c", "extra", "args"])
+    addaudithook = mock.Mock()
+    monkeypatch.setattr(sys, "addaudithook", addaudithook)
+    modules = set(sys.modules)
+    yield addaudithook
+    for name in set(sys.modules) - modules:
+        del sys.modules[name]
+
+
+def run_main(tmp_path, app_path, app_packages_path, entry_point=""):
+    output = tmp_path / "trace.json"
+    sys.argv.extend(
+        [str(output), "first", entry_point, str(app_path), str(app_packages_path)]
+    )
+    result = briefcase_import_trace.main(sys.argv[3:])
+    with output.open(encoding="utf-8") as f:
+        return result, json.load(f)
+
+
+def test_record(tmp_path):
+    """The imports, and the files opened in the recorded folders, are recorded."""
+    recorder = UsageRecorder([str(tmp_path / "first"), str(tmp_path / "second")])
+
+    recorder("import", ("first.module", None, [], [], []))
+    recorder("open", (str(tmp_path / "first/pkg/data.txt"), "r", 0))
+    recorder("ctypes.dlopen", (str(tmp_path / "second/libs/lib.so"),))
+    # Files outside the folders, and files opened by descriptor, are ignored.
+    recorder("open", (str(tmp_path / "other.txt"), "r", 0))
+    recorder("open", (3, "r", 0))
+    # Other events are ignored.
+    recorder("os.listdir", (str(tmp_path / "first/pkg"),))
+
+    # Once recording is complete, events are ignored.
+    recorder.active = False
+    recorder("import", ("ignored", None, [], [], []))
+    recorder("open", (str(tmp_path / "first/ignored.txt"), "r", 0))
+
+    assert recorder.modules == {"first.module"}
+    assert recorder.files == [{"pkg/data.txt"}, {"libs/lib.so"}]
+
+
+def test_import_app(tmp_path, app_path, app_packages_path, isolated, capsys):
+    """By default, every module of the app is imported."""
+    result, data = run_main(tmp_path, app_path, app_packages_path)
+
+    assert result == 0
+    # The recorder was installed as an audit hook.
+    assert isinstance(isolated.mock_calls[0].args[0], UsageRecorder)
+    # The modules that couldn't be imported are reported.
+    stderr = capsys.readouterr().err
+    assert "Unable to import first.broken: wrong platform" in stderr
+    assert "Unable to import first.smoke:" in stderr
+
+    modules = set(data["modules"])
+    assert {
+        "first",
+        "first.app",
+        "first.widgets.button",
+        "dep",
+        "widgetlib",
+        # Imported by a .pth file
+        "viapth",
+    } <= modules
+    assert "first.__main__" not in modules
+    assert "notused" not in modules
+
+
+def test_entry_point(tmp_path, app_path, app_packages_path, isolated):
+    """If an entry point is provided, it is run as the main module."""
+    result, data = run_main(tmp_path, app_path, app_packages_path, "first.smoke")
+
+    assert result == 0
+
+    modules = set(data["modules"])
+    assert {"first.app", "dep", "viapth"} <= modules
+    # Modules the entry point doesn't use aren't imported.
+    assert "first.widgets.button" not in modules
+    assert "widgetlib" not in modules
+
+
+def test_entry_point_failure(tmp_path, app_path, app_packages_path, isolated):
+    """If the entry point fails, nothing is recorded."""
+    create_file(app_path / "first/failing.py", "raise SystemExit(3)\n")
+
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(tmp_path, app_path, app_packages_path, "first.failing")
+
+    assert excinfo.value.code == 3
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_script(tmp_path, app_path, app_packages_path):
+    """The script can be run the way Briefcase runs it."""
+    output = tmp_path / "trace.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-I",
+            "-S",
+            "-B",
+            "-c",
+            BuildCommand.IMPORT_TRACE_SCRIPT.read_text(encoding="utf-8"),
+            output,
+            "first",
+            "",
+            app_path,
+            app_packages_path,
+        ],
+        capture_output=True,
+        check=True,
+    )
+
+    with output.open(encoding="utf-8") as f:
+        data = json.load(f)
+
+    assert {"first.app", "dep", "widgetlib", "viapth"} <= set(data["modules"])
+    # The files that were opened in the requirements folder are recorded.
+    [files] = data["files"]
+    assert "dep/data/values.txt" in files
+    assert not any(file.startswith("notused/") for file in files)
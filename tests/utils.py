@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import os
 import plistlib
+import struct
 import tarfile
 import zipfile
 from email.message import EmailMessage
@@ -356,6 +357,87 @@ def create_wheel(
     return wheel_filename
 
 
+# The (CPU type, CPU subtype) of the architectures used in synthetic Mach-O files.
+MACH_O_CPU_TYPES = {
+    "i386": (0x00000007, 3),
+    "x86_64": (0x01000007, 3),
+    "arm64": (0x0100000C, 0),
+    "arm64e": (0x0100000C, 0x80000002),
+    "ppc": (0x00000012, 0),
+}
+
+
+def mach_o_content(
+    arch: str,
+    body: bytes = b"",
+    byte_order: str = "<",
+    dylibs: list[str] = (),
+    rpaths: list[str] = (),
+) -> bytes:
+    """Synthetic content for a thin (64-bit) Mach-O binary.
+
+    Only the header fields that identify the file and describe its load commands are
+    populated; the rest of the file is the provided body.
+
+    :param arch: The architecture of the binary.
+    :param body: The content that follows the header and load commands.
+    :param byte_order: The byte order of the header, as a struct format character.
+    :param dylibs: The install names of the libraries the binary links against.
+    :param rpaths: The runpath search paths of the binary.
+    :returns: The content of the binary.
+    """
+
+    def load_command(cmd, header_format, name):
+        # Load commands are padded to a multiple of 8 bytes.
+        header_size = struct.calcsize(f"{byte_order}{header_format}")
+        name = name.encode() + b"\0"
+        size = -(-(header_size + len(name)) // 8) * 8
+        fields = [0] * (len(header_format) - 3)
+        return struct.pack(
+            f"{byte_order}{header_format}", cmd, size, header_size, *fields
+        ) + name.ljust(size - header_size, b"\0")
+
+    commands = [load_command(0xC, "IIIIII", dylib) for dylib in dylibs] + [
+        load_command(0x8000001C, "III", rpath) for rpath in rpaths
+    ]
+    cputype, cpusubtype = MACH_O_CPU_TYPES[arch]
+    header = struct.pack(
+        f"{byte_order}IIIIIIII",
+        0xFEEDFACF,
+        cputype,
+        cpusubtype,
+        0x6,  # MH_DYLIB
+        len(commands),
+        sum(len(command) for command in commands),
+        0,
+        0,
+    )
+    return header + b"".join(commands) + body
+
+
+def fat_mach_o_content(slices: list[tuple[str, bytes, int]], fat_64=False) -> bytes:
+    """Synthetic content for a fat Mach-O binary.
+
+    :param slices: A list of (architecture, thin content, alignment) tuples for the
+        slices in the binary. The alignment is a power of 2.
+    :param fat_64: Should the 64-bit fat header format be used?
+    :returns: The content of the binary.
+    """
+    magic, arch_format = (0xCAFEBABF, ">IIQQII") if fat_64 else (0xCAFEBABE, ">IIIII")
+    header = struct.pack(">II", magic, len(slices))
+    data = b""
+    offset = 8 + struct.calcsize(arch_format) * len(slices)
+    for arch, content, align in slices:
+        padding = -offset % (1 << align)
+        data += b"\0" * padding
+        offset += padding
+        fields = [*MACH_O_CPU_TYPES[arch], offset, len(content), align]
+        header += struct.pack(arch_format, *fields, *([0] if fat_64 else []))
+        data += content
+        offset += len(content)
+    return header + data
+
+
 def file_content(path: Path) -> str | bytes | None:
     """Return the content of a file, or None if the path is a directory."""
     if path.is_dir():